@@ -0,0 +1,114 @@
+"""Benchmark activity type search latency: Chroma vs. the in-process NumPy index."""
+
+import os
+import sys
+import glob
+import time
+import argparse
+import statistics
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_chroma import Chroma
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from rag.parse_cache import parse_activity_types
+from rag.vector_index import NumpyVectorIndex
+from vector_db.chroma_store import build_chroma_where
+
+QUERIES = [
+    ("something gentle for my knees", {}),
+    ("swimming lessons for kids", {"intensity": "low"}),
+    ("evening dance class", {"intensity": "moderate", "activity_heading": "dancing"}),
+    ("drawing and sketching", {"activity_heading": ["drawing", "cooking"]}),
+]
+
+
+def catalog_documents(activity_dir: str, copies: int):
+    """The activity type chunks, repeated `copies` times under distinct headings."""
+    base = parse_activity_types(sorted(glob.glob(os.path.join(activity_dir, "*.md")))).activity_documents
+    documents = []
+    for copy in range(copies):
+        for i, doc in enumerate(base):
+            metadata = {k: v for k, v in doc.metadata.items() if v is not None}
+            metadata["intensity"] = ("low", "moderate", "high")[(i + copy) % 3]
+            metadata["activity_heading_norm"] = f"{metadata['activity_heading_norm']} {copy}"
+            documents.append(Document(page_content=f"{doc.page_content}\n(variant {copy})", metadata=metadata))
+    return documents
+
+
+def _latency(label: str, store, k: int, repeat: int):
+    """Median per-query latency over QUERIES; returns the last results per query."""
+    samples, results = [], []
+    for query, input_filter in QUERIES:
+        where = build_chroma_where(input_filter)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            docs = store.similarity_search(query, k=k, filter=where)
+            samples.append(time.perf_counter() - start)
+        results.append([d.page_content for d in docs])
+    print(f"{label:<14} median {statistics.median(samples) * 1000:8.3f} ms  "
+          f"p95 {sorted(samples)[int(len(samples) * 0.95)] * 1000:8.3f} ms")
+    return results
+
+
+def _headings(store, k: int, raw_k: int, repeat: int):
+    """Median latency of fetching raw_k chunks and keeping the first k distinct headings."""
+    samples, results = [], []
+    for query, input_filter in QUERIES:
+        where = build_chroma_where(input_filter)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            headings = []
+            for d in store.similarity_search(query, k=raw_k, filter=where):
+                heading = d.metadata.get("activity_heading_norm")
+                if heading and heading not in headings:
+                    headings.append(heading)
+            samples.append(time.perf_counter() - start)
+        results.append(headings[:k])
+    return statistics.median(samples), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Chroma vs. NumPy activity type search")
+    parser.add_argument("--activity-dir", default="documents/activityType")
+    parser.add_argument("--copies", type=int, default=5, help="Catalog copies (54 chunks each)")
+    parser.add_argument("--dim", type=int, default=1536, help="Embedding size (default: 1536)")
+    parser.add_argument("--k", type=int, default=40, help="Raw k as used by retrieve_activity_types")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    documents = catalog_documents(args.activity_dir, args.copies)
+    embedding = DeterministicFakeEmbedding(size=args.dim)
+    chroma = Chroma(
+        collection_name="bench_activity_index",
+        embedding_function=embedding,
+        collection_metadata={"hnsw:space": "cosine"},
+    )
+    try:
+        chroma.add_documents(documents)
+        index = NumpyVectorIndex.from_chroma(chroma)
+        print(f"{len(documents)} activity type chunks, {args.dim} dims, k={args.k}")
+        expected = _latency("Chroma", chroma, args.k, args.repeat)
+        actual = _latency("NumPy index", index, args.k, args.repeat)
+        same = sum(a == e for a, e in zip(actual, expected))
+        print(f"Identical top-k on {same}/{len(QUERIES)} queries")
+
+        # Distinct headings: oversample-and-dedupe vs. an index grouped by heading
+        grouped = NumpyVectorIndex.from_chroma(chroma, group_by="activity_heading_norm")
+        k = max(args.k // 8, 1)
+        chroma_seconds, _ = _headings(chroma, k, args.k, args.repeat)
+        flat_seconds, expected = _headings(index, k, args.k, args.repeat)
+        grouped_seconds, actual = _headings(grouped, k, k, args.repeat)
+        same = sum(a == e for a, e in zip(actual, expected))
+        print(f"{k} headings: Chroma oversampled {chroma_seconds * 1000:.3f} ms, NumPy oversampled "
+              f"{flat_seconds * 1000:.3f} ms, NumPy grouped {grouped_seconds * 1000:.3f} ms "
+              f"(grouped identical on {same}/{len(QUERIES)} queries)")
+    finally:
+        chroma.delete_collection()
+
+
+if __name__ == "__main__":
+    main()
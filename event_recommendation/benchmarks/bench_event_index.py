@@ -0,0 +1,90 @@
+"""Benchmark semantic and BM25 ranking of SQL event candidates at scale."""
+
+import os
+import sys
+import glob
+import time
+import argparse
+import tempfile
+import statistics
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from rag.event_index import EventEmbeddingIndex
+from rag.fusion import reciprocal_rank_fusion
+from rag.hybrid import lexical_order, run_legs
+from rag.lexical_index import BM25Index, tokenize
+
+QUERIES = ["zumba", "something gentle for my knees", "beginner drawing class for teens", "salsa"]
+
+
+def _rank(index: EventEmbeddingIndex, lexical: BM25Index, query_text: str, query: np.ndarray,
+          content_ids, structured_order):
+    """The work retrieve_events_for_activity_type adds on top of the SQL query."""
+    scores, timings = run_legs({
+        "semantic": lambda: index.score(query, content_ids),
+        "lexical": lambda: lexical.score_rows(query_text, content_ids),
+    })
+    semantic_order = np.argsort(-scores["semantic"], kind="stable").tolist()
+    reciprocal_rank_fusion([structured_order, semantic_order, lexical_order(scores["lexical"])])
+    return timings
+
+
+def _synthetic_bodies(events_dir: str, count: int, rng) -> list:
+    """Bodies of 40-120 tokens drawn from the sample brochures' vocabulary."""
+    vocabulary = sorted({
+        token for path in glob.glob(os.path.join(events_dir, "*.md"))
+        for token in tokenize(open(path, encoding="utf-8").read())
+    })
+    words = np.array(vocabulary)
+    return [" ".join(words[rng.integers(0, len(words), size=rng.integers(40, 120))]) for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark semantic and BM25 ranking of event candidates")
+    parser.add_argument("--events", type=int, default=100000, help="Events in the index")
+    parser.add_argument("--distinct", type=float, default=0.8, help="Share of events with a distinct body")
+    parser.add_argument("--dim", type=int, default=1536, help="Embedding size (default: 1536)")
+    parser.add_argument("--candidates", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--events-dir", default="documents/Events")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    bodies = max(int(args.events * args.distinct), 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "events.vectors.npy")
+        matrix = rng.standard_normal((bodies, args.dim), dtype=np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.save(path, matrix)
+        del matrix
+        index = EventEmbeddingIndex(path)
+        start = time.perf_counter()
+        lexical = BM25Index.from_texts(_synthetic_bodies(args.events_dir, bodies, rng))
+        print(f"{args.events:,} events, {bodies:,} distinct bodies, {args.dim} dims, "
+              f"index {os.path.getsize(path) / 1e6:.0f} MB (memory-mapped), "
+              f"BM25 over {len(lexical.terms):,} terms built in {time.perf_counter() - start:.1f}s")
+
+        # Each event points at a body; SQL candidates are a random subset of events
+        event_contents = rng.integers(0, bodies, size=args.events)
+        for count in args.candidates:
+            samples, legs = [], {}
+            for i in range(args.repeat):
+                content_ids = event_contents[rng.choice(args.events, size=count, replace=False)].tolist()
+                query = rng.standard_normal(args.dim).astype(np.float32)
+                start = time.perf_counter()
+                timings = _rank(index, lexical, QUERIES[i % len(QUERIES)], query, content_ids, range(count))
+                samples.append(time.perf_counter() - start)
+                for name, ms in timings.items():
+                    legs.setdefault(name, []).append(ms)
+            leg_text = ", ".join(f"{name[:-3]} {statistics.median(ms):.3f}" for name, ms in legs.items())
+            print(f"{count:>6} candidates: median {statistics.median(samples) * 1000:7.3f} ms  "
+                  f"p95 {sorted(samples)[int(len(samples) * 0.95)] * 1000:7.3f} ms  (legs, ms: {leg_text})")
+        del index
+
+
+if __name__ == "__main__":
+    main()
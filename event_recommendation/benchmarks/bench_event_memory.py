@@ -0,0 +1,95 @@
+"""Benchmark the memory held by an in-memory event catalog (tracemalloc).
+
+Compares the previous EventRecord (regular dataclass, per-record strings),
+the slotted / interned EventRecord and the columnar EventCatalog, each
+built by parsing the same synthetic corpus.
+"""
+
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from typing import Callable, List, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.event_db import EventRecord
+from database.event_catalog import EventCatalog
+from rag.document_processing import parse_brochure
+from benchmarks.bench_parse import synthetic_brochures
+
+# Previous EventRecord: same fields, per-instance __dict__, no interning
+LegacyEventRecord = make_dataclass("LegacyEventRecord", [(f.name, f.type) for f in fields(EventRecord)])
+
+
+def _iter_records(brochures: List[Tuple[str, str]], record_cls=EventRecord):
+    """Parse brochures and yield one record per event block (blocks are not kept)."""
+    for source, md in brochures:
+        brochure = parse_brochure(md, source)
+        center = brochure.center
+        for block in brochure.blocks:
+            yield record_cls(
+                event_name=block.event_name,
+                event_type=block.event_type,
+                event_type_raw=block.event_type_raw,
+                source=source,
+                city=center["city"],
+                state=center["state"],
+                age_min=block.age_min,
+                age_max=block.age_max,
+                age_contains=block.age_contains,
+                intensity=block.intensity,
+                instructor=block.instructor,
+                date_range=block.date_range,
+                time_slots=block.time_slots,
+                duration=block.duration,
+                spots=block.spots,
+                center_name=center["center_name"],
+                center_type=center["center_type"],
+                page_content=block.page_content,
+            )
+
+
+def build_legacy(brochures):
+    return list(_iter_records(brochures, LegacyEventRecord))
+
+
+def build_slotted(brochures):
+    return list(_iter_records(brochures))
+
+
+def build_catalog(brochures):
+    return EventCatalog(_iter_records(brochures))
+
+
+def _measure(label: str, build: Callable, brochures) -> int:
+    tracemalloc.start()
+    start = time.perf_counter()
+    held = build(brochures)
+    seconds = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {len(held):>9} events  held {current / 2**20:8.1f} MB  "
+          f"peak {peak / 2**20:8.1f} MB  {current / len(held):7.0f} B/event  {seconds:6.1f}s")
+    del held
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark in-memory event catalog footprint")
+    parser.add_argument("--events-dir", default="documents/Events")
+    parser.add_argument("--events", type=int, default=1_000_000, help="Synthetic corpus size (default: 1000000)")
+    args = parser.parse_args()
+
+    brochures = synthetic_brochures(args.events_dir, args.events)
+    legacy = _measure("dataclass EventRecord", build_legacy, brochures)
+    slotted = _measure("slotted + interned", build_slotted, brochures)
+    catalog = _measure("EventCatalog", build_catalog, brochures)
+    print(f"Footprint vs dataclass: slotted {slotted / legacy:.0%}, catalog {catalog / legacy:.0%}")
+
+
+if __name__ == "__main__":
+    main()
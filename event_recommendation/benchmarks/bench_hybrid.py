@@ -0,0 +1,191 @@
+"""Evaluate hybrid BM25 + vector retrieval: recall and per-leg latency on labeled queries.
+
+Exact-name and fuzzy queries are labeled with the activity type headings
+(stage 1) and event types (stage 2) a good answer should contain. Each
+query is run vector-only, BM25-only and hybrid (RRF of both), and
+recall@k is the share of relevant results in the top k (out of at most k).
+
+Vector recall is only meaningful with real embeddings: OPENAI_API_KEY
+selects text-embedding-3-small, otherwise a deterministic fake embedding
+is used and only the lexical leg and latencies are informative.
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+import tempfile
+import statistics
+from typing import Callable, Dict, Hashable, List, Sequence, Set, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from database.event_db import EventDB
+from rag.document_processing import parse_brochure
+from rag.event_index import build_event_index, open_event_index, open_event_lexical_index
+from rag.fusion import reciprocal_rank_fusion
+from rag.hybrid import HybridVectorIndex, lexical_order, run_legs
+from rag.parse_cache import parse_activity_types
+from rag.query_cache import CachedQueryEmbeddings, QueryEmbeddingCache
+from rag.vector_index import NumpyVectorIndex
+
+# (query, activity_heading_norm values a good answer contains)
+ACTIVITY_QUERIES = [
+    ("Zumba", {"AQUA ZUMBA"}),
+    ("Aqua Rumba", {"AQUA RUMBA"}),
+    ("salsa night", {"SALSA / LATIN DANCE"}),
+    ("hip hop", {"HIP HOP DANCE"}),
+    ("spin class", {"CYCLING"}),
+    ("bake bread", {"BAKING"}),
+    ("charcoal portraits", {"CHARCOAL DRAWING", "FIGURE DRAWING"}),
+    ("something gentle for my knees", {"ARTHRITIS AQUA FITNESS", "AQUA FIT", "AQUA CARDIO", "AQUA RUMBA"}),
+    ("plant-based recipes", {"VEGETARIAN / VEGAN COOKING"}),
+    ("films in other languages", {"FOREIGN FILMS"}),
+    ("cooking with my children", {"COOKING FOR KIDS"}),
+    ("make my own short film", {"FILMMAKING BASICS"}),
+    ("ballet in the pool", {"WATER BARRE"}),
+    ("lifting weights", {"DUMBBELL / SURGE / UPBEAT STRENGTH", "CARDIO STRENGTH"}),
+]
+
+# (query, event_type values a good answer contains)
+EVENT_QUERIES = [
+    ("Zumba", {"AQUA ZUMBA"}),
+    ("Aqua Pilates", {"AQUA PILATES"}),
+    ("salsa lessons", {"SALSA / LATIN DANCE"}),
+    ("line dancing", {"LINE DANCING"}),
+    ("something gentle for my knees", {"ARTHRITIS AQUA FITNESS", "AQUA FIT", "AQUA PILATES"}),
+    ("learn to draw", {"BEGINNER DRAWING", "SKETCHING"}),
+    ("cook healthier meals", {"HEALTHY COOKING", "BEGINNER COOKING"}),
+    ("tough outdoor workout", {"BOOT CAMP", "BOOT CAMP BURN"}),
+    ("strength class for older adults", {"SENIOR CIRCUITS"}),
+    ("interval training in the pool", {"AQUA INTERVALS", "AQUA CARDIO"}),
+]
+
+
+def _embeddings(dim: int, cache_path: str):
+    """text-embedding-3-small if OPENAI_API_KEY is set, else a fake; query embeddings cached."""
+    if os.getenv("OPENAI_API_KEY"):
+        from langchain_openai import OpenAIEmbeddings
+        embeddings, label = OpenAIEmbeddings(model="text-embedding-3-small"), "text-embedding-3-small"
+    else:
+        embeddings, label = DeterministicFakeEmbedding(size=dim), f"fake {dim}-dim (vector recall not meaningful)"
+    return CachedQueryEmbeddings(embeddings, QueryEmbeddingCache(cache_path)), label
+
+
+def _recall(results: Sequence[Hashable], relevant: Set[Hashable], k: int) -> float:
+    return sum(r in relevant for r in results[:k]) / min(k, len(relevant))
+
+
+def _report(
+    label: str,
+    queries: List[Tuple[str, Set[Hashable]]],
+    modes: Dict[str, Callable[[str], Tuple[List[Hashable], Dict[str, float]]]],
+    k: int,
+    repeat: int,
+) -> None:
+    """Print recall@k, latency and per-leg medians of each mode over the labeled queries."""
+    print(f"\n{label}: {len(queries)} labeled queries, recall@{k}")
+    for mode, search in modes.items():
+        recalls, samples, legs = [], [], {}
+        for query, relevant in queries:
+            search(query)  # warm up (query embedding cache)
+            for _ in range(repeat):
+                start = time.perf_counter()
+                results, timings = search(query)
+                samples.append(time.perf_counter() - start)
+                for name, ms in timings.items():
+                    legs.setdefault(name, []).append(ms)
+            recalls.append(_recall(results, relevant, k))
+        leg_text = ", ".join(f"{name[:-3]} {statistics.median(ms):.3f}" for name, ms in legs.items())
+        print(f"  {mode:<8} recall {statistics.mean(recalls):.2f}  median {statistics.median(samples) * 1000:7.3f} ms"
+              + (f"  (legs, ms: {leg_text})" if leg_text else ""))
+        misses = [query for (query, relevant), r in zip(queries, recalls) if r == 0]
+        if misses:
+            print(f"           no hit: {misses}")
+
+
+def evaluate_activity_types(embeddings, k: int, repeat: int) -> None:
+    documents = parse_activity_types(sorted(glob.glob("documents/activityType/*.md"))).activity_documents
+    vector_index = NumpyVectorIndex(embeddings, documents, group_by="activity_heading_norm")
+    hybrid = HybridVectorIndex(vector_index)
+
+    def headings(docs):
+        return [d.metadata["activity_heading_norm"] for d in docs]
+
+    def run_hybrid(query):
+        results = headings(hybrid.similarity_search(query, k=k))
+        return results, hybrid.timings
+
+    _report("Activity types", ACTIVITY_QUERIES, {
+        "vector": lambda q: (headings(vector_index.similarity_search(q, k=k)), {}),
+        "lexical": lambda q: (headings(hybrid.lexical_search(q, k)), {}),
+        "hybrid": run_hybrid,
+    }, k, repeat)
+
+
+def evaluate_events(embeddings, tmp: str, k: int, repeat: int) -> None:
+    records = []
+    for path in sorted(glob.glob("documents/Events/*.md")):
+        with open(path, "r", encoding="utf-8") as f:
+            records.extend(parse_brochure(f.read(), os.path.basename(path)).records())
+    db = EventDB(os.path.join(tmp, "events.db"))
+    db.insert_events(records)
+    build_event_index(db, embeddings.embed_documents)
+    index, lexical = open_event_index(db.db_path), open_event_lexical_index(db.db_path)
+    # No filters: every event is a candidate, in SQL order
+    candidates = db.query_events(limit=len(records), include_content=False)
+    content_ids = [d.metadata["content_id"] for d in candidates]
+    structured = list(range(len(candidates)))
+
+    # An event is relevant if its event type is one of the query's labels
+    queries = [
+        (query, {i for i, d in enumerate(candidates) if d.metadata["event_type"] in types})
+        for query, types in EVENT_QUERIES
+    ]
+
+    def run(query, use_semantic, use_lexical):
+        legs = {}
+        if use_semantic:
+            legs["semantic"] = lambda: index.score(embeddings.embed_query(query), content_ids)
+        if use_lexical:
+            legs["lexical"] = lambda: lexical.score_rows(query, content_ids)
+        scores, timings = run_legs(legs)
+        start = time.perf_counter()
+        rankings = [structured]
+        if use_semantic:
+            rankings.append(np.argsort(-scores["semantic"], kind="stable").tolist())
+        if use_lexical:
+            rankings.append(lexical_order(scores["lexical"]))
+        fused = reciprocal_rank_fusion(rankings)
+        timings["fusion_ms"] = (time.perf_counter() - start) * 1000
+        return fused, timings
+
+    _report(f"Events ({len(candidates)} candidates, fused with SQL order)", queries, {
+        "sql": lambda q: (structured, {}),
+        "vector": lambda q: run(q, True, False),
+        "lexical": lambda q: run(q, False, True),
+        "hybrid": lambda q: run(q, True, True),
+    }, k, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate hybrid BM25 + vector retrieval on labeled queries")
+    parser.add_argument("--dim", type=int, default=1536, help="Fake embedding size (default: 1536)")
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        embeddings, label = _embeddings(args.dim, os.path.join(tmp, "query_cache.db"))
+        print(f"Embeddings: {label}")
+        evaluate_activity_types(embeddings, args.k, args.repeat)
+        evaluate_events(embeddings, tmp, args.k, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
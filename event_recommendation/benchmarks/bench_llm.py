@@ -0,0 +1,127 @@
+"""Offline LLM benchmarks against the local stub server (no API keys needed)."""
+
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm import GroqLLMClient, OllamaLLMClient, RetryPolicy, LLMCallRecord
+from llm.client import DEFAULT_RETRY_EXCEPTIONS, OLLAMA_RETRY_EXCEPTIONS, is_transient_ollama_error
+from llm.stub_server import StubConfig, StubLLMServer
+from rag.reviews_processing import extract_metadata_adaptive
+from chat_ui.profile import PROFILE_SYSTEM_PROMPT, PROFILE_USER_PROMPT_TEMPLATE, llm_call_profile
+from chat_ui.chat_interface import ANSWER_SYSTEM_PROMPT, llm_call_answer
+
+CHAT_MESSAGES = [
+    "I'm a senior in Boston looking for low-impact aquatics in the mornings",
+    "Any dancing classes for teens on weekends?",
+    "My kids like cooking and drawing, what's nearby in Lexington?",
+]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))] if ordered else 0.0
+
+
+def _make_client(server: StubLLMServer, backend: str, concurrency: int, records: List[LLMCallRecord]):
+    # Short backoff so injected 429s cost retries, not wall-clock minutes
+    if backend == "groq":
+        policy = RetryPolicy(max_attempts=5, min_wait=0.05, max_wait=0.5, retry_on=DEFAULT_RETRY_EXCEPTIONS)
+        client = GroqLLMClient(server.groq_client(), max_concurrency=concurrency, retry_policy=policy)
+    else:
+        policy = RetryPolicy(
+            max_attempts=5, min_wait=0.05, max_wait=0.5,
+            retry_on=OLLAMA_RETRY_EXCEPTIONS, retry_if=is_transient_ollama_error,
+        )
+        client = OllamaLLMClient(server.ollama_client(), max_concurrency=concurrency, retry_policy=policy)
+    client.add_hook(records.append)
+    return client
+
+
+def _report(label: str, units: int, unit: str, seconds: float, records: List[LLMCallRecord]) -> None:
+    latencies = [r.seconds * 1000 for r in records]
+    retries = sum(r.attempts - 1 for r in records)
+    print(
+        f"{label:<22} {units:>6} {unit} {seconds:7.2f}s {units / seconds:>9,.1f} {unit}/sec  "
+        f"calls {len(records):>5}  retries {retries:>4}  "
+        f"p50 {_percentile(latencies, 0.5):7.1f} ms  p95 {_percentile(latencies, 0.95):7.1f} ms"
+    )
+
+
+def bench_ingest(server: StubLLMServer, backend: str, concurrency: int, texts: List[str], batch_size: int) -> None:
+    records: List[LLMCallRecord] = []
+    client = _make_client(server, backend, concurrency, records)
+    start = time.perf_counter()
+    extract_metadata_adaptive(texts, client, client.model, max_batch_size=batch_size)
+    _report(f"ingest {backend} x{concurrency}", len(texts), "reviews", time.perf_counter() - start, records)
+
+
+def bench_chat(server: StubLLMServer, backend: str, concurrency: int, turns: int) -> None:
+    """Profile extraction + answer per turn, with `concurrency` users in parallel."""
+    records: List[LLMCallRecord] = []
+    client = _make_client(server, backend, concurrency, records)
+
+    def turn(i: int) -> str:
+        message = CHAT_MESSAGES[i % len(CHAT_MESSAGES)]
+        profile_prompt = PROFILE_USER_PROMPT_TEMPLATE.format(
+            existing_profile_json="{}", recent_user_messages="(none)", user_message=message
+        )
+        profile = json.loads(llm_call_profile(PROFILE_SYSTEM_PROMPT, profile_prompt, groq_client=client))
+        return llm_call_answer(ANSWER_SYSTEM_PROMPT, f"{message}\n{json.dumps(profile)}", groq_client=client)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(turn, range(turns)))
+    _report(f"chat {backend} x{concurrency}", turns, "turns", time.perf_counter() - start, records)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LLM ingestion and chat paths against the stub server")
+    parser.add_argument("--mode", choices=["ingest", "chat", "both"], default="both")
+    parser.add_argument("--backend", choices=["groq", "ollama", "both"], default="both")
+    parser.add_argument("--csv-path", default="documents/Reviews/reviews_rag_2000.csv")
+    parser.add_argument("--reviews", type=int, default=500, help="Reviews to extract (default: 500)")
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=40, help="Chat turns (default: 40)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--tokens-per-second", type=float, default=2000.0)
+    parser.add_argument("--rate-limit", type=float, default=0.02, help="Probability of a 429 per request")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with open(args.csv_path, "r", encoding="utf-8") as f:
+        texts = [row["review_text"] for row in csv.DictReader(f) if row.get("review_text", "").strip()]
+    texts = (texts * (args.reviews // max(1, len(texts)) + 1))[:args.reviews]
+
+    config = StubConfig(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        tokens_per_second=args.tokens_per_second,
+        rate_limit_probability=args.rate_limit,
+        seed=args.seed,
+    )
+    backends = ["groq", "ollama"] if args.backend == "both" else [args.backend]
+    with StubLLMServer(config) as server:
+        print(f"Stub server {server.url}: {args.latency} {args.latency_ms} ms, "
+              f"{args.tokens_per_second:g} tok/s, 429 rate {args.rate_limit:.0%}")
+        for backend in backends:
+            for concurrency in args.concurrency:
+                if args.mode in ("ingest", "both"):
+                    bench_ingest(server, backend, concurrency, texts, args.batch_size)
+                if args.mode in ("chat", "both"):
+                    bench_chat(server, backend, concurrency, args.turns)
+        print(f"Server stats: {server.snapshot_stats()}")
+
+
+if __name__ == "__main__":
+    main()
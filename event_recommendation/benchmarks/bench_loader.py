@@ -0,0 +1,77 @@
+"""Benchmark document discovery: DirectoryLoader full reads vs. os.scandir paths."""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_community.document_loaders import DirectoryLoader, TextLoader
+
+from rag.input_documents.loader import discover_documents
+from benchmarks.bench_parse import synthetic_brochures
+
+
+def directory_loader_paths(documents_path: str) -> int:
+    """Previous discovery: read every file through TextLoader just to get its path."""
+    count = 0
+    for folder in sorted(os.listdir(documents_path)):
+        loader = DirectoryLoader(
+            os.path.join(documents_path, folder),
+            glob="**/*.md",
+            loader_cls=TextLoader,
+            loader_kwargs={"encoding": "utf-8"},
+        )
+        count += len([doc.metadata["source"] for doc in loader.load()])
+    return count
+
+
+def scandir_paths(documents_path: str) -> int:
+    return sum(len(files) for files in discover_documents(documents_path).values())
+
+
+def read_all(documents_path: str) -> int:
+    """Content read the parsers perform afterwards either way."""
+    total = 0
+    for files in discover_documents(documents_path).values():
+        for doc in files:
+            total += len(doc.read_text())
+    return total
+
+
+def _measure(label: str, fn, documents_path: str) -> float:
+    start = time.perf_counter()
+    fn(documents_path)
+    seconds = time.perf_counter() - start
+    print(f"{label:<28} {seconds * 1000:9.1f} ms")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark document discovery I/O")
+    parser.add_argument("--events-dir", default="documents/Events")
+    parser.add_argument("--files", type=int, default=2000, help="Synthetic brochure files (default: 2000)")
+    parser.add_argument("--events-per-file", type=int, default=50)
+    args = parser.parse_args()
+
+    brochures = synthetic_brochures(args.events_dir, args.files * args.events_per_file, args.events_per_file)
+    with tempfile.TemporaryDirectory() as tmp:
+        events_dir = os.path.join(tmp, "Events")
+        os.makedirs(events_dir)
+        for source, md in brochures:
+            with open(os.path.join(events_dir, source), "w", encoding="utf-8") as f:
+                f.write(md)
+        print(f"Corpus: {len(brochures)} files")
+
+        loader = _measure("DirectoryLoader discovery", directory_loader_paths, tmp)
+        scandir = _measure("scandir discovery", scandir_paths, tmp)
+        content = _measure("content read (parsers)", read_all, tmp)
+        print(f"Discovery speedup: {loader / scandir:.1f}x")
+        print(f"Startup I/O (discovery + read): {(loader + content) / (scandir + content):.2f}x faster")
+
+
+if __name__ == "__main__":
+    main()
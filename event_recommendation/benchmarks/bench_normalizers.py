@@ -0,0 +1,104 @@
+"""Micro-benchmarks for the normalizers and extractors in utils/.
+
+Compares the previous implementations (uncompiled patterns, no memoization)
+with the precompiled / memoized ones and the batch column API.
+"""
+
+import os
+import re
+import sys
+import glob
+import time
+import argparse
+from typing import Callable, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rag.document_processing import split_event_blocks, parse_event_metadata
+from utils.normalizers import _normalize_label, normalize_column, normalize_event_type, normalize_intensity
+from utils.extractors import extract_age_range, extract_age_ranges
+
+
+def legacy_normalize_event_type(s: Optional[str]) -> Optional[str]:
+    """Previous normalize_event_type / normalize_activity_heading body."""
+    if not s:
+        return None
+    s = s.strip().upper()
+    s = s.replace("®", "").replace("™", "")
+    s = re.sub(r"\s+", " ", s)
+    s = re.sub(r"[^A-Z0-9 /&\-+]", "", s)
+    s = re.sub(r"\s+", " ", s).strip()
+    return s or None
+
+
+def legacy_extract_age_range(text: str) -> Tuple[Optional[int], Optional[int]]:
+    """Previous extract_age_range: four patterns compiled through the re cache."""
+    m = re.search(r"(?i)\bages?\s*[:–-]?\s*(\d{1,2})\s*[–—-]\s*(\d{1,2})\b", text)
+    if m:
+        return int(m.group(1)), int(m.group(2))
+    m = re.search(r"(?i)\bage\s*[:–-]?\s*(\d{1,2})\s*[–—-]\s*(\d{1,2})\b", text)
+    if m:
+        return int(m.group(1)), int(m.group(2))
+    m = re.search(r"(?i)\bages?\s*[:–-]?\s*(\d{1,2})\s*\+\b", text)
+    if m:
+        return int(m.group(1)), None
+    m = re.search(r"(?i)\b(\d{2})\s*\+\b", text)
+    if m:
+        return int(m.group(1)), None
+    return None, None
+
+
+def _measure(label: str, fn: Callable[[], object], repeat: int, items: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    seconds = time.perf_counter() - start
+    print(f"{label:<34} {seconds * 1000:8.1f} ms  {items * repeat / seconds:>12,.0f} items/sec")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmark normalizers and extractors")
+    parser.add_argument("--events-dir", default="documents/Events")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    blocks: List[str] = []
+    event_types: List[Optional[str]] = []
+    for path in sorted(glob.glob(os.path.join(args.events_dir, "*.md"))):
+        with open(path, "r", encoding="utf-8") as f:
+            for title, block in split_event_blocks(f.read()):
+                blocks.append(block)
+                event_types.append(parse_event_metadata(title, block)["event_type"])
+    intensities = ["Low", "Low–Moderate", "Moderate", "Level 2/3", "High", "Challenging"] * 20
+    print(f"{len(blocks)} blocks, {len(set(event_types))} distinct event types")
+
+    assert [legacy_normalize_event_type(v) for v in event_types] == normalize_column(event_types)
+    assert [legacy_extract_age_range(b) for b in blocks] == [extract_age_range(b) for b in blocks]
+
+    n = len(event_types)
+    before = _measure("event type (legacy)", lambda: [legacy_normalize_event_type(v) for v in event_types], args.repeat, n)
+    _measure(
+        "event type (precompiled, no cache)",
+        lambda: [_normalize_label.__wrapped__(v) if v else None for v in event_types],
+        args.repeat, n,
+    )
+    after = _measure("event type (memoized)", lambda: [normalize_event_type(v) for v in event_types], args.repeat, n)
+    batch = _measure("event type (normalize_column)", lambda: normalize_column(event_types), args.repeat, n)
+    print(f"Speedup: memoized {before / after:.1f}x, column {before / batch:.1f}x")
+
+    n = len(intensities)
+    before = _measure("intensity (uncached)", lambda: [normalize_intensity.__wrapped__(v) for v in intensities], args.repeat, n)
+    after = _measure("intensity (memoized)", lambda: [normalize_intensity(v) for v in intensities], args.repeat, n)
+    print(f"Speedup: {before / after:.1f}x")
+
+    n = len(blocks)
+    before = _measure("age range (legacy)", lambda: [legacy_extract_age_range(b) for b in blocks], args.repeat, n)
+    after = _measure("age range (precompiled)", lambda: [extract_age_range(b) for b in blocks], args.repeat, n)
+    batch = _measure("age range (extract_age_ranges)", lambda: extract_age_ranges(blocks), args.repeat, n)
+    print(f"Speedup: precompiled {before / after:.1f}x, batch {before / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
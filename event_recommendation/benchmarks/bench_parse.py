@@ -0,0 +1,165 @@
+"""Benchmark brochure parsing throughput.
+
+Compares one parse per consumer vs. a single shared parse, per-field
+regex scans vs. the single-sweep line tokenizer, and serial vs. process-pool
+ingestion into the events table.
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+import tempfile
+from typing import List, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rag.document_processing import (
+    _finish_event_block,
+    _iter_event_spans,
+    _parse_event_fields_regex,
+    _tokenize_brochure,
+    build_event_documents,
+    build_event_records,
+    parse_brochure,
+    parse_center_metadata,
+    parse_event_blocks,
+    split_event_blocks,
+)
+from rag.parallel_ingest import ingest_events_parallel
+from database.event_db import EventDB
+
+
+def synthetic_brochures(events_dir: str, events: int, events_per_file: int = 200) -> List[Tuple[str, str]]:
+    """
+    Build (source, markdown) brochures totalling `events` event blocks.
+
+    Each brochure keeps a real file's center header and replays event blocks
+    from all sample brochures, so field and age patterns match real data.
+    """
+    headers, blocks = [], []
+    for path in sorted(glob.glob(os.path.join(events_dir, "*.md"))):
+        with open(path, "r", encoding="utf-8") as f:
+            md = f.read()
+        spans = split_event_blocks(md)
+        first = md.find("### ")
+        headers.append(md[:first] if first >= 0 else md)
+        blocks.extend(block for _title, block in spans)
+
+    brochures = []
+    emitted = 0
+    while emitted < events:
+        count = min(events_per_file, events - emitted)
+        body = "\n\n".join(blocks[(emitted + i) % len(blocks)] for i in range(count))
+        header = headers[len(brochures) % len(headers)]
+        brochures.append((f"synthetic_{len(brochures):05d}.md", header + body + "\n"))
+        emitted += count
+    return brochures
+
+
+def parse_per_consumer(brochures: List[Tuple[str, str]]) -> int:
+    """Previous ingestion shape: documents and records each parse the brochure."""
+    count = 0
+    for source, md in brochures:
+        center = parse_center_metadata(md, source)
+        docs = build_event_documents(md, source, None, center["city"], center["state"])
+        build_event_records(
+            md, source, None, center["city"], center["state"], center["center_name"], center["center_type"]
+        )
+        count += len(docs)
+    return count
+
+
+def parse_shared(brochures: List[Tuple[str, str]]) -> int:
+    """Single parse per brochure, documents and records projected from it."""
+    count = 0
+    for source, md in brochures:
+        brochure = parse_brochure(md, source)
+        docs = brochure.documents()
+        brochure.records()
+        count += len(docs)
+    return count
+
+
+def fields_regex(brochures: List[Tuple[str, str]], finish: bool = True) -> int:
+    """Block parse with one FIELD_RE scan per field (reference implementation)."""
+    count = 0
+    for _source, md in brochures:
+        for title, block in _iter_event_spans(md):
+            parsed = _parse_event_fields_regex(title, block)
+            if finish:
+                _finish_event_block(parsed)
+            count += 1
+    return count
+
+
+def fields_tokenizer(brochures: List[Tuple[str, str]], finish: bool = True) -> int:
+    """Block parse with the single-sweep line tokenizer."""
+    if finish:
+        return sum(len(parse_event_blocks(md)) for _source, md in brochures)
+    return sum(len(_tokenize_brochure(md)[1]) for _source, md in brochures)
+
+
+def ingest_parallel(brochures: List[Tuple[str, str]], workers: List[int]) -> None:
+    """Write brochures to disk and ingest them into a fresh events DB per worker count."""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for source, md in brochures:
+            path = os.path.join(tmp, source)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(md)
+            paths.append(path)
+
+        baseline = None
+        for count in workers:
+            db = EventDB(os.path.join(tmp, f"events_{count}.db"))
+            start = time.perf_counter()
+            events = ingest_events_parallel(paths, db, max_workers=count, batch_size=20_000)
+            seconds = time.perf_counter() - start
+            baseline = baseline or seconds
+            print(f"ingest x{count:<3} {events:>8} events  {seconds:7.2f}s  "
+                  f"{events / seconds:>10,.0f} events/sec  speedup {baseline / seconds:.2f}x")
+
+
+def _measure(label: str, fn, brochures: List[Tuple[str, str]], megabytes: float) -> float:
+    start = time.perf_counter()
+    count = fn(brochures)
+    seconds = time.perf_counter() - start
+    print(f"{label:<16} {count:>8} events  {seconds:7.2f}s  {count / seconds:>10,.0f} events/sec  "
+          f"{megabytes / seconds:6.1f} MB/s")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark brochure parse throughput")
+    parser.add_argument("--events-dir", default="documents/Events")
+    parser.add_argument("--events", type=int, default=100_000, help="Synthetic corpus size (default: 100000)")
+    parser.add_argument("--mode", choices=["shared", "tokenizer", "parallel", "all"], default="all")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1],
+                        help="Process counts for --mode parallel")
+    args = parser.parse_args()
+
+    brochures = synthetic_brochures(args.events_dir, args.events)
+    megabytes = sum(len(md.encode("utf-8")) for _source, md in brochures) / 2**20
+    print(f"Corpus: {len(brochures)} brochures, {args.events} events, {megabytes:.1f} MB")
+
+    if args.mode in ("shared", "all"):
+        before = _measure("per-consumer", parse_per_consumer, brochures, megabytes)
+        after = _measure("shared parse", parse_shared, brochures, megabytes)
+        print(f"Speedup: {before / after:.2f}x")
+    if args.mode in ("tokenizer", "all"):
+        # Field extraction alone, then including age/intensity inference
+        before = _measure("regex fields", lambda b: fields_regex(b, finish=False), brochures, megabytes)
+        after = _measure("tokenizer", lambda b: fields_tokenizer(b, finish=False), brochures, megabytes)
+        print(f"Speedup (fields only): {before / after:.2f}x")
+        before = _measure("regex blocks", fields_regex, brochures, megabytes)
+        after = _measure("tokenizer blocks", fields_tokenizer, brochures, megabytes)
+        print(f"Speedup (full block parse): {before / after:.2f}x")
+    if args.mode in ("parallel", "all"):
+        ingest_parallel(brochures, sorted(set(args.workers)))
+
+
+if __name__ == "__main__":
+    main()
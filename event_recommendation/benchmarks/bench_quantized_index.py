@@ -0,0 +1,159 @@
+"""Benchmark int8-quantized vs. float32 memory-mapped embedding search.
+
+Reports recall@k of the quantized search (int8 scan + float32 re-scoring)
+against exact float32 search, latency, and the resident memory of each
+index's mappings after the queries (Rss from /proc/self/smaps, Linux only;
+re-scoring faults in whole pages or folios around each float32 row read,
+so its share depends on the filesystem).
+Vectors are clustered so neighbourhoods look like real embeddings rather
+than uniform noise.
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import statistics
+from typing import Optional
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from rag.quantized_index import SCAN_ROWS, QuantizedVectorIndex, quantized_paths, write_quantized
+from rag.vector_index import top_k
+
+
+def _mapped_rss(*paths: str) -> Optional[int]:
+    """Resident bytes of this process's mappings of some files (None where /proc is unavailable)."""
+    try:
+        with open("/proc/self/smaps", "r") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+    wanted = {os.path.realpath(p) for p in paths}
+    total, current = 0, None
+    for line in lines:
+        fields = line.split()
+        if len(fields) >= 6 and "-" in fields[0]:
+            current = fields[5]
+        elif fields and fields[0] == "Rss:" and current in wanted:
+            total += int(fields[1]) * 1024
+    return total
+
+
+def _write_clustered(path: str, rows: int, dim: int, clusters: int, rng) -> None:
+    """Normalized vectors around random centres, written in chunks."""
+    centres = rng.standard_normal((clusters, dim)).astype(np.float32)
+    matrix = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=(rows, dim))
+    for start in range(0, rows, 10000):
+        end = min(start + 10000, rows)
+        chunk = centres[rng.integers(0, clusters, size=end - start)]
+        chunk += 0.8 * rng.standard_normal(chunk.shape).astype(np.float32)
+        matrix[start:end] = chunk / np.linalg.norm(chunk, axis=1, keepdims=True)
+    matrix.flush()
+    del matrix
+
+
+def _exact_search(matrix: np.ndarray, query: np.ndarray, k: int) -> np.ndarray:
+    """Exact top-k over a memory-mapped float32 matrix, scanned in the same chunks as the codes."""
+    scores = np.empty(len(matrix), dtype=np.float32)
+    for start in range(0, len(matrix), SCAN_ROWS):
+        scores[start:start + SCAN_ROWS] = matrix[start:start + SCAN_ROWS] @ query
+    return top_k(scores, k)
+
+
+def _evict(path: str) -> None:
+    """Drop a file from the page cache where supported, so later reads fault in only what they touch."""
+    if hasattr(os, "posix_fadvise"):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def _format_bytes(value: Optional[int]) -> str:
+    return "n/a" if value is None else f"{value / 1e6:8.1f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark int8-quantized vs. float32 embedding search")
+    parser.add_argument("--rows", type=int, default=100000, help="Embedded rows (e.g. distinct event bodies)")
+    parser.add_argument("--dim", type=int, default=1536, help="Embedding size (default: 1536)")
+    parser.add_argument("--clusters", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--rescore-factors", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--candidates", type=int, default=1000, help="SQL candidates scored per query")
+    parser.add_argument("--queries", type=int, default=30)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "events.vectors.npy")
+        _write_clustered(path, args.rows, args.dim, args.clusters, rng)
+        start = time.perf_counter()
+        write_quantized(path)
+        codes_path, scales_path = quantized_paths(path)
+        print(f"{args.rows:,} rows x {args.dim} dims: float32 {os.path.getsize(path) / 1e6:.0f} MB, "
+              f"int8 codes + scales {(os.path.getsize(codes_path) + os.path.getsize(scales_path)) / 1e6:.0f} MB "
+              f"(quantized in {time.perf_counter() - start:.1f}s)")
+
+        # Queries: perturbed stored vectors, so each has real neighbours
+        probe = np.load(path, mmap_mode="r")
+        queries = probe[rng.integers(0, args.rows, size=args.queries)] \
+            + 0.3 * rng.standard_normal((args.queries, args.dim)).astype(np.float32)
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+        del probe
+
+        matrix = np.load(path, mmap_mode="r")
+        samples, exact_results = [], []
+        for query in queries:
+            start = time.perf_counter()
+            exact_results.append(set(_exact_search(matrix, query, args.k).tolist()))
+            samples.append(time.perf_counter() - start)
+        print(f"\nFull search, top {args.k}")
+        print(f"  exact float32      recall 1.000  median {statistics.median(samples) * 1000:8.2f} ms  "
+              f"resident {_format_bytes(_mapped_rss(path))}")
+        del matrix
+
+        for factor in args.rescore_factors:
+            _evict(path)
+            index = QuantizedVectorIndex(path, rescore_factor=factor)
+            samples, recalls = [], []
+            for query, expected in zip(queries, exact_results):
+                start = time.perf_counter()
+                results = index.search(query, args.k)
+                samples.append(time.perf_counter() - start)
+                recalls.append(len(expected & {row for row, _ in results}) / args.k)
+            print(f"  int8, rescore x{factor:<3} recall {statistics.mean(recalls):.3f}  "
+                  f"median {statistics.median(samples) * 1000:8.2f} ms  "
+                  f"resident {_format_bytes(_mapped_rss(codes_path, scales_path))} codes "
+                  f"+ {_format_bytes(_mapped_rss(path))} re-scored float32")
+            del index
+
+        # Event retrieval path: score SQL candidates, exact head
+        float_matrix = np.load(path, mmap_mode="r")
+        index = QuantizedVectorIndex(path)
+        errors, overlaps, float_samples, int8_samples = [], [], [], []
+        for query in queries:
+            ids = np.sort(rng.choice(args.rows, size=args.candidates, replace=False))
+            start = time.perf_counter()
+            exact = float_matrix[ids] @ query
+            float_samples.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            approximate = index.score(query, ids.tolist())
+            int8_samples.append(time.perf_counter() - start)
+            errors.append(float(np.abs(approximate - exact).max()))
+            head = 50
+            overlaps.append(len(set(top_k(exact, head).tolist()) & set(top_k(approximate, head).tolist())) / head)
+        print(f"\n{args.candidates} candidates per query: float32 median {statistics.median(float_samples) * 1000:.2f} ms, "
+              f"int8 + re-scoring median {statistics.median(int8_samples) * 1000:.2f} ms, "
+              f"max score error {max(errors):.4f}, top-50 overlap {statistics.mean(overlaps):.3f}")
+        del index, float_matrix
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark review ingestion: row-by-row Document path vs. vectorized bulk path."""
+
+import os
+import sys
+import csv
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.review_db import ReviewDB, ReviewRecord, init_reviews_database
+from rag.reviews_processing import build_review_documents, bulk_store_reviews
+
+
+def write_synthetic_csv(sample_csv: str, out_csv: str, rows: int) -> None:
+    """Replay the sample CSV until it has the requested number of rows."""
+    with open(sample_csv, "r", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        sample = list(reader)
+    with open(out_csv, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for i in range(rows):
+            writer.writerow(sample[i % len(sample)])
+
+
+def ingest_row_by_row(csv_path: str, db_path: str) -> int:
+    """Existing path: DictReader -> Document -> ReviewRecord -> insert_reviews."""
+    init_reviews_database(db_path)
+    reviews_db = ReviewDB(db_path)
+    records = [
+        ReviewRecord(
+            review_text=doc.page_content,
+            rating=doc.metadata.get("rating"),
+            created_at=doc.metadata.get("created_at"),
+            event_type=doc.metadata.get("event_type"),
+            location=doc.metadata.get("location"),
+            sentiment=doc.metadata.get("sentiment"),
+            source=doc.metadata.get("source"),
+        )
+        for doc in build_review_documents(csv_path)
+    ]
+    reviews_db.insert_reviews(records)
+    return len(records)
+
+
+def ingest_bulk(csv_path: str, db_path: str, chunksize: int) -> int:
+    return bulk_store_reviews(csv_path, db_path, chunksize=chunksize).count_reviews()
+
+
+def _measure(label: str, fn, memory: bool) -> None:
+    # tracemalloc slows allocation-heavy code, so timings are only comparable
+    # between runs with the same --memory setting
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    count = fn()
+    seconds = time.perf_counter() - start
+    line = f"{label:<12} {count:>9} rows  {seconds:7.2f}s  {count / seconds:>10,.0f} rows/sec"
+    if memory:
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        line += f"  peak {peak / 2**20:7.1f} MiB"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark reviews CSV ingestion")
+    parser.add_argument("--csv-path", default="documents/Reviews/reviews_rag_2000.csv")
+    parser.add_argument("--rows", type=int, default=200_000, help="Synthetic CSV size (default: 200000)")
+    parser.add_argument("--chunksize", type=int, default=50_000, help="Bulk path chunk size (default: 50000)")
+    parser.add_argument("--memory", action="store_true", help="Also report peak Python memory (tracemalloc)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        csv_path = os.path.join(tmpdir, "reviews.csv")
+        write_synthetic_csv(args.csv_path, csv_path, args.rows)
+
+        _measure("row-by-row", lambda: ingest_row_by_row(csv_path, os.path.join(tmpdir, "rows.db")), args.memory)
+        _measure("bulk", lambda: ingest_bulk(csv_path, os.path.join(tmpdir, "bulk.db"), args.chunksize), args.memory)
+
+
+if __name__ == "__main__":
+    main()
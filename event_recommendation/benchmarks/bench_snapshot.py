@@ -0,0 +1,133 @@
+"""Benchmark time to the first answers: SQLite databases vs. the mmap snapshot.
+
+Also times the server's snapshot fast path from nothing loaded to the first
+answer: open the snapshot, build the serving stores (activity type index
+from the snapshot's embeddings, no Chroma) and answer one turn.
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from database.activity_db import ActivityTypeDB
+from database.event_db import EventDB
+from database.review_db import ReviewDB
+from database.snapshot import SnapshotEventStore, SnapshotReviewStore, open_snapshot, write_snapshot
+from rag.parallel_ingest import ingest_events_parallel
+from rag.parse_cache import parse_activity_types
+from rag.retrieval import get_activity_definitions, route_activity_types
+from rag.reviews_processing import bulk_store_reviews
+from rag.serving import serving_stores
+from benchmarks.bench_parse import synthetic_brochures
+
+# Filters of a few answer_user turns: selective, late-matching and no-match queries
+QUERIES = [
+    {"event_types": ["AQUA FIT", "AQUA CARDIO"], "city": "Framingham", "age_contains": "kids", "limit": 10},
+    {"event_types": ["LINE DANCING"], "city": "Plymouth", "limit": 10},
+    {"intensity": "high", "age_contains": "seniors", "limit": 10},
+    {"event_types": ["SKETCHING"], "city": "Boston", "limit": 10},
+]
+
+
+def answer_from_sqlite(db_path: str, reviews_db_path: str) -> int:
+    """Open the databases and run the queries of a few answer_user turns."""
+    events = EventDB(db_path)
+    reviews = ReviewDB(reviews_db_path)
+    catalog = ActivityTypeDB(db_path)
+    count = 0
+    for query in QUERIES:
+        count += len(events.query_events(**query))
+        reviews.get_review_scores(event_types=query.get("event_types"))
+        catalog.get_activity_documents(query.get("event_types") or [])
+    return count
+
+
+def answer_from_snapshot(snapshot_path: str, db_path: str, reviews_db_path: str) -> int:
+    """Open (and validate) the snapshot and run the same queries."""
+    snapshot = open_snapshot(snapshot_path, db_path, reviews_db_path)
+    events = SnapshotEventStore(snapshot, db_path)
+    reviews = SnapshotReviewStore(snapshot, ReviewDB(reviews_db_path))
+    count = 0
+    for query in QUERIES:
+        count += len(events.query_events(**query))
+        reviews.get_review_scores(event_types=query.get("event_types"))
+        snapshot.get_activity_documents(query.get("event_types") or [])
+    return count
+
+
+def first_answer_from_snapshot(snapshot_path: str, db_path: str, reviews_db_path: str, dim: int) -> int:
+    """Server fast path: open the snapshot, build the serving stores and answer one turn."""
+    snapshot = open_snapshot(snapshot_path, db_path, reviews_db_path)
+    stores = serving_stores(snapshot, db_path, ReviewDB(reviews_db_path), DeterministicFakeEmbedding(size=dim))
+    activity_docs = route_activity_types(stores, {"interests": ["aquatics"], "age_focus": "seniors"})
+    if activity_docs is None:
+        activity_docs = stores.activity_types.similarity_search("gentle water exercise for seniors", k=5)
+    headings = [d.metadata["activity_heading_norm"] for d in activity_docs]
+    events = stores.events.query_events(event_types=headings, age_contains="seniors", limit=10)
+    stores.reviews.get_review_scores(event_types=headings)
+    get_activity_definitions(stores, headings, activity_docs)
+    return len(events)
+
+
+def _measure(label: str, fn, *args) -> float:
+    start = time.perf_counter()
+    count = fn(*args)
+    seconds = time.perf_counter() - start
+    print(f"{label:<28} {seconds * 1000:9.1f} ms  ({count} events)")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold start from SQLite vs. snapshot")
+    parser.add_argument("--events-dir", default="documents/Events")
+    parser.add_argument("--activity-dir", default="documents/activityType")
+    parser.add_argument("--reviews-csv", default="documents/Reviews/reviews_rag_2000.csv")
+    parser.add_argument("--events", type=int, default=200_000, help="Synthetic corpus size (default: 200000)")
+    parser.add_argument("--dim", type=int, default=1536, help="Activity type embedding size (default: 1536)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "events.db")
+        reviews_db_path = os.path.join(tmp, "reviews.db")
+        snapshot_path = os.path.join(tmp, "serving.snapshot")
+
+        catalog = ActivityTypeDB(db_path)
+        catalog.replace_activity_types(
+            parse_activity_types(sorted(glob.glob(os.path.join(args.activity_dir, "*.md")))).activity_records()
+        )
+        paths = []
+        for source, md in synthetic_brochures(args.events_dir, args.events):
+            paths.append(os.path.join(tmp, source))
+            with open(paths[-1], "w", encoding="utf-8") as f:
+                f.write(md)
+        event_db = EventDB(db_path)
+        ingest_events_parallel(paths, event_db, batch_size=50_000)
+        review_db = bulk_store_reviews(args.reviews_csv, reviews_db_path)
+
+        catalog.rebuild_routes()
+        records = catalog.get_activity_types()
+        matrix = np.random.default_rng(0).standard_normal((len(records), args.dim)).astype(np.float32)
+        embeddings = ([f"activity-{i}" for i in range(len(records))], matrix)
+
+        start = time.perf_counter()
+        stats = write_snapshot(snapshot_path, event_db, review_db, catalog, embeddings, "fake")
+        print(f"Snapshot written in {time.perf_counter() - start:.2f}s: "
+              f"{stats['bytes'] / 2**20:.1f} MB vs events.db {os.path.getsize(db_path) / 2**20:.1f} MB")
+
+        sqlite = _measure("answers (SQLite)", answer_from_sqlite, db_path, reviews_db_path)
+        snapshot = _measure("answers (snapshot)", answer_from_snapshot, snapshot_path, db_path, reviews_db_path)
+        print(f"Speedup: {sqlite / snapshot:.1f}x")
+        _measure("time to first answer", first_answer_from_snapshot, snapshot_path, db_path, reviews_db_path, args.dim)
+
+
+if __name__ == "__main__":
+    main()
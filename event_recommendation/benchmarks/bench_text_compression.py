@@ -0,0 +1,71 @@
+"""Benchmark events.db size and query time with plain vs. dictionary-compressed page_content."""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import text_codec
+from database.event_db import EventDB
+from rag.parallel_ingest import ingest_events_parallel
+from benchmarks.bench_parse import synthetic_brochures
+
+QUERIES = [
+    {"event_types": ["AQUA FIT", "AQUA CARDIO"], "city": "Framingham", "limit": 200},
+    {"intensity": "high", "age_contains": "seniors", "limit": 200},
+    {"limit": 5000},
+]
+
+
+def _query(db: EventDB, include_content: bool, repeat: int = 3) -> float:
+    """Best-of-repeat seconds to run QUERIES (rendering the top 10 when content is lazy)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for query in QUERIES:
+            events = db.query_events(include_content=include_content, **query)
+            if not include_content:
+                db.get_page_contents([e.metadata["event_id"] for e in events[:10]])
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dictionary compression of page_content")
+    parser.add_argument("--events-dir", default="documents/Events")
+    parser.add_argument("--events", type=int, default=200_000, help="Synthetic corpus size (default: 200000)")
+    args = parser.parse_args()
+
+    methods = ["zlib"] + (["zstd"] if text_codec.zstandard is not None else [])
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for source, md in synthetic_brochures(args.events_dir, args.events):
+            paths.append(os.path.join(tmp, source))
+            with open(paths[-1], "w", encoding="utf-8") as f:
+                f.write(md)
+        plain_path = os.path.join(tmp, "plain.db")
+        ingest_events_parallel(paths, EventDB(plain_path), batch_size=50_000)
+
+        print(f"{'storage':<10} {'file MB':>9} {'full rows ms':>13} {'lazy rows ms':>13}")
+        plain = EventDB(plain_path)
+        print(f"{'plain':<10} {os.path.getsize(plain_path) / 2**20:9.1f} "
+              f"{_query(plain, True) * 1000:13.1f} {_query(plain, False) * 1000:13.1f}")
+        for method in methods:
+            db_path = os.path.join(tmp, f"{method}.db")
+            shutil.copy(plain_path, db_path)
+            db = EventDB(db_path)
+            start = time.perf_counter()
+            db.compress_text(method)
+            seconds = time.perf_counter() - start
+            print(f"{method:<10} {os.path.getsize(db_path) / 2**20:9.1f} "
+                  f"{_query(db, True) * 1000:13.1f} {_query(db, False) * 1000:13.1f}  "
+                  f"(compressed in {seconds:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
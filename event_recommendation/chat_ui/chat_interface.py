@@ -14,14 +14,7 @@ from .profile import (
     build_retrieval_query,
 )
 
-import groq
-import os
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-)
+from llm import LLMClient, as_llm_client
 
 ANSWER_SYSTEM_PROMPT = """You are an Activity Recommendation Assistant. 
 
@@ -47,23 +40,10 @@ Your tone should be friendly, practical, and encouraging.
 """
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_exception_type((
-        groq.RateLimitError,          # Rate limit exceeded
-        groq.APIConnectionError,       # Connection issues
-        groq.APITimeoutError,          # Request timeout
-        groq.InternalServerError,      # Server errors (5xx)
-        ConnectionError,               # Python connection errors
-        TimeoutError,                  # Python timeout errors
-    )),
-    reraise=True,
-)
 def llm_call_answer(
     system_prompt: str, 
     user_prompt: str,
-    groq_client: groq.Groq,
+    groq_client: LLMClient,
     model: str = "openai/gpt-oss-120b"
 ) -> str:
     """
@@ -72,7 +52,7 @@ def llm_call_answer(
     Args:
         system_prompt: System prompt for the LLM
         user_prompt: User prompt for the LLM
-        groq_client: Groq client instance
+        groq_client: LLMClient, groq.Groq or ollama.Client instance
         model: Model name to use (default: "openai/gpt-oss-120b")
         
     Returns:
@@ -85,15 +65,8 @@ def llm_call_answer(
         groq.InternalServerError: If server error occurs after retries
         groq.APIError: If API returns a non-retryable error
     """
-    resp = groq_client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-        temperature=0,
-    )
-    return resp.choices[0].message.content
+    # Retries and concurrency limits are applied by the LLMClient
+    return as_llm_client(groq_client, model=model).complete(system_prompt, user_prompt, model=model)
 
 
 def convert_gradio_history(history):
@@ -135,7 +108,7 @@ def chat(
     message: str, 
     history, 
     stores: RagStores,
-    groq_client: groq.Groq,
+    groq_client: LLMClient,
     model: str = "openai/gpt-oss-120b"
 ):
     """
@@ -145,7 +118,7 @@ def chat(
         message: Current user message
         history: Gradio history format
         stores: RagStores containing vector stores
-        groq_client: Groq client instance
+        groq_client: LLMClient, groq.Groq or ollama.Client instance
         model: Model name to use
         
     Returns:
@@ -153,6 +126,9 @@ def chat(
     """
     global _user_profile_state
 
+    # Wrap once so profile extraction and answering share retries and limits
+    groq_client = as_llm_client(groq_client, model=model)
+
     # Convert Gradio history format to tuple format for internal use
     history_tuples = convert_gradio_history(history)
 
@@ -226,15 +202,16 @@ def chat(
     return assistant_text
 
 
-def launch_chat_interface(stores: RagStores, groq_client: groq.Groq, model: str = "openai/gpt-oss-120b"):
+def launch_chat_interface(stores: RagStores, groq_client: LLMClient, model: str = "openai/gpt-oss-120b"):
     """
     Launch Gradio chat interface.
     
     Args:
         stores: RagStores containing vector stores
-        groq_client: Groq client instance
+        groq_client: LLMClient, groq.Groq or ollama.Client instance
         model: Model name to use
     """
+    groq_client = as_llm_client(groq_client, model=model)
     # Create a wrapper function that includes stores and client
     def chat_wrapper(message: str, history):
         return chat(message, history, stores, groq_client=groq_client, model=model)
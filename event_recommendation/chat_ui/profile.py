@@ -4,16 +4,7 @@ import json
 from typing import Dict, Any, List, Tuple
 from pydantic import BaseModel
 
-import groq
-import os
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    retry_if_exception,
-    retry_if_not_exception_type,
-)
+from llm import as_llm_client
 
 groq_client = None
 OPENSOURCE_OSS_MODEL = None
@@ -69,19 +60,6 @@ If nothing can be updated, return:
 """.strip()
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_exception_type((
-        groq.RateLimitError,          # Rate limit exceeded
-        groq.APIConnectionError,       # Connection issues
-        groq.APITimeoutError,          # Request timeout
-        groq.InternalServerError,      # Server errors (5xx)
-        ConnectionError,               # Python connection errors
-        TimeoutError,                  # Python timeout errors
-    )),
-    reraise=True,
-)
 def llm_call_profile(
     system_prompt: str, 
     user_prompt: str, 
@@ -95,7 +73,7 @@ def llm_call_profile(
     Args:
         system_prompt: System prompt for the LLM
         user_prompt: User prompt for the LLM
-        groq_client: Groq client instance (if None, will be created)
+        groq_client: LLMClient, groq.Groq or ollama.Client (if None, a Groq client will be created)
         model: Model name to use (default: "openai/gpt-oss-120b")
         
     Returns:
@@ -108,19 +86,8 @@ def llm_call_profile(
         groq.InternalServerError: If server error occurs after retries
         groq.APIError: If API returns a non-retryable error
     """
-    # Initialize Groq client if not provided
-    if groq_client is None:
-        groq_client = groq.Groq(api_key=os.getenv("GROQ_API_KEY"))
-    
-    resp = groq_client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-        temperature=0,
-    )
-    return resp.choices[0].message.content
+    # Retries and concurrency limits are applied by the LLMClient
+    return as_llm_client(groq_client, model=model).complete(system_prompt, user_prompt, model=model)
 
 
 def merge_profiles(
@@ -5,10 +5,36 @@ from .event_db import (
     init_database,
     get_database_connection,
 )
+from .event_catalog import EventCatalog, EventView
+from .text_codec import TextCodec, TextDictionaries
+from .activity_db import (
+    ActivityTypeDB,
+    ActivityTypeRecord,
+    init_activity_types_table,
+)
+from .snapshot import (
+    Snapshot,
+    SnapshotEventStore,
+    SnapshotReviewStore,
+    open_snapshot,
+    write_snapshot,
+)
 
 __all__ = [
     "EventDB",
     "init_database",
     "get_database_connection",
+    "EventCatalog",
+    "EventView",
+    "TextCodec",
+    "TextDictionaries",
+    "ActivityTypeDB",
+    "ActivityTypeRecord",
+    "init_activity_types_table",
+    "Snapshot",
+    "SnapshotEventStore",
+    "SnapshotReviewStore",
+    "open_snapshot",
+    "write_snapshot",
 ]
 
@@ -0,0 +1,353 @@
+"""SQL storage for the activity type catalog."""
+
+import os
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+from .event_db import db_connection, init_database
+
+# Profile values the routing table is keyed by (merge_profiles() enums); NULL means any
+ROUTE_INTENSITIES = ("low", "moderate", "high")
+ROUTE_AGE_BUCKETS = ("kids", "teens", "young_adults", "adults", "seniors")
+
+RouteKey = Tuple[str, Optional[str], Optional[str]]
+
+
+@dataclass
+class ActivityTypeRecord:
+    """One activity type definition ('## HEADING' section of an activityType file)."""
+    heading_norm: str
+    source: str
+    activity_heading: Optional[str] = None  # display heading as stored on Chroma documents
+    intensity: Optional[str] = None  # low/moderate/high
+    session_length: Optional[str] = None  # "**Session:**" value, e.g. "45–60 min"
+    frequency: Optional[str] = None  # "**Frequency:**" value, e.g. "2–4/week"
+    benefits: Optional[str] = None
+    ailments: Optional[str] = None
+    page_content: str = ""
+
+
+def init_activity_types_table(db_path: str = "./events.db") -> None:
+    """
+    Create the activity_types table (and the events join view) if missing.
+
+    The catalog lives next to the events table so events join it on
+    events.event_type = activity_types.heading_norm.
+
+    Args:
+        db_path: Path to SQLite database file
+    """
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS activity_types (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            heading_norm TEXT NOT NULL,
+            activity_heading TEXT,
+            intensity TEXT,
+            session_length TEXT,
+            frequency TEXT,
+            benefits TEXT,
+            ailments TEXT,
+            source TEXT NOT NULL,
+            page_content TEXT NOT NULL
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_activity_heading_norm ON activity_types(heading_norm)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_activity_source ON activity_types(source)")
+    cursor.execute("""
+        CREATE VIEW IF NOT EXISTS events_with_activity AS
+        SELECT e.*,
+               a.intensity AS activity_intensity,
+               a.session_length, a.frequency, a.benefits, a.ailments
+        FROM events e
+        LEFT JOIN activity_types a ON a.heading_norm = e.event_type
+    """)
+    # Precomputed stage-1 answers: (interest, intensity, age bucket) -> ranked headings
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS activity_routes (
+            interest TEXT NOT NULL,  -- activityType file stem, e.g. 'aquatics'
+            intensity TEXT,
+            age_bucket TEXT,
+            rank INTEGER NOT NULL,
+            heading_norm TEXT NOT NULL,
+            event_count INTEGER NOT NULL  -- events of the heading for that age bucket
+        )
+    """)
+
+    conn.commit()
+    conn.close()
+
+
+_INSERT_ACTIVITY_SQL = """
+    INSERT INTO activity_types (
+        heading_norm, activity_heading, intensity, session_length,
+        frequency, benefits, ailments, source, page_content
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_ACTIVITY_COLUMNS = (
+    "heading_norm, source, activity_heading, intensity, session_length, "
+    "frequency, benefits, ailments, page_content"
+)
+
+
+def _activity_row(record: ActivityTypeRecord) -> tuple:
+    return (
+        record.heading_norm,
+        record.activity_heading,
+        record.intensity,
+        record.session_length,
+        record.frequency,
+        record.benefits,
+        record.ailments,
+        record.source,
+        record.page_content,
+    )
+
+
+class ActivityTypeDB:
+    """SQL interface for the activity type catalog."""
+
+    def __init__(self, db_path: str = "./events.db"):
+        """
+        Initialize ActivityTypeDB.
+
+        Args:
+            db_path: Path to SQLite database file (normally the events database)
+        """
+        self.db_path = db_path
+        # EventDB only creates its schema for a new file, so create it here too
+        if not os.path.exists(db_path):
+            init_database(db_path)
+        init_activity_types_table(db_path)
+        # (database mtime, routes) of the last get_routes() read
+        self._routes: Optional[Tuple[int, Dict[RouteKey, List[Tuple[str, int]]]]] = None
+
+    def replace_activity_types(self, records: List[ActivityTypeRecord]) -> None:
+        """
+        Replace the whole catalog in a single transaction.
+
+        Args:
+            records: ActivityTypeRecords in file order
+        """
+        with db_connection(self.db_path) as conn:
+            conn.execute("DELETE FROM activity_types")
+            conn.executemany(_INSERT_ACTIVITY_SQL, [_activity_row(r) for r in records])
+        print(f"Stored {len(records)} activity types in catalog")
+
+    def replace_source_activity_types(self, source: str, records: List[ActivityTypeRecord]) -> None:
+        """
+        Replace the catalog entries of one activityType file in a single transaction.
+
+        Args:
+            source: Source file name
+            records: New ActivityTypeRecords for that source (empty removes it)
+        """
+        with db_connection(self.db_path) as conn:
+            conn.execute("DELETE FROM activity_types WHERE source = ?", (source,))
+            conn.executemany(_INSERT_ACTIVITY_SQL, [_activity_row(r) for r in records])
+
+    def count_activity_types(self) -> int:
+        """Get total number of activity types in the catalog."""
+        with db_connection(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM activity_types").fetchone()[0]
+
+    def get_activity_types(self, heading_norms: Optional[List[str]] = None) -> List[ActivityTypeRecord]:
+        """
+        Get catalog entries, optionally only for some normalized headings / event types.
+
+        Args:
+            heading_norms: Normalized headings (same values as events.event_type)
+
+        Returns:
+            ActivityTypeRecords ordered by source file, then position in the file
+        """
+        query = f"SELECT {_ACTIVITY_COLUMNS} FROM activity_types"
+        params: List[str] = []
+        if heading_norms is not None:
+            if not heading_norms:
+                return []
+            query += f" WHERE heading_norm IN ({','.join(['?'] * len(heading_norms))})"
+            params = list(heading_norms)
+        query += " ORDER BY source, id"
+        with db_connection(self.db_path) as conn:
+            return [ActivityTypeRecord(*row) for row in conn.execute(query, params)]
+
+    def get_intensity_map(self) -> Dict[str, str]:
+        """
+        Map normalized heading -> intensity, as event ingestion expects.
+
+        Returns:
+            Dict of heading_norm -> 'low'|'moderate'|'high'
+        """
+        with db_connection(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT source, heading_norm, intensity FROM activity_types ORDER BY source, id"
+            ).fetchall()
+        return merge_intensity_map(rows)
+
+    def rebuild_routes(self) -> int:
+        """
+        Recompute the activity_routes table from the catalog and the events table.
+
+        For every interest (activityType file), intensity (or any) and age
+        bucket (or any), the file's headings with that intensity are ranked
+        by how many events of that event type match the age bucket (as
+        EventDB.query_events matches age_contains), then by file order.
+
+        Returns:
+            Number of route rows stored
+        """
+        with db_connection(self.db_path) as conn:
+            catalog = conn.execute(
+                "SELECT source, heading_norm, intensity FROM activity_types ORDER BY source, id"
+            ).fetchall()
+            counts = conn.execute(
+                "SELECT LOWER(event_type), LOWER(COALESCE(age_contains, '')), COUNT(*) FROM events "
+                "WHERE event_type IS NOT NULL GROUP BY 1, 2"
+            ).fetchall()
+
+            event_counts: Dict[Tuple[str, Optional[str]], int] = {}
+            for event_type, age_contains, count in counts:
+                for age in (None,) + ROUTE_AGE_BUCKETS:
+                    if age is None or age in age_contains:
+                        event_counts[(event_type, age)] = event_counts.get((event_type, age), 0) + count
+
+            routes: Dict[RouteKey, List[Tuple[int, int, str]]] = {}
+            seen = set()
+            for position, (source, heading_norm, intensity) in enumerate(catalog):
+                interest = os.path.splitext(source)[0].lower()
+                if (interest, heading_norm) in seen:
+                    continue
+                seen.add((interest, heading_norm))
+                for route_intensity in (None,) + ROUTE_INTENSITIES:
+                    if route_intensity is not None and intensity != route_intensity:
+                        continue
+                    for age in (None,) + ROUTE_AGE_BUCKETS:
+                        count = event_counts.get((heading_norm.lower(), age), 0)
+                        routes.setdefault((interest, route_intensity, age), []).append((-count, position, heading_norm))
+
+            rows = [
+                key + (rank, heading_norm, -neg_count)
+                for key, entries in routes.items()
+                for rank, (neg_count, _, heading_norm) in enumerate(sorted(entries))
+            ]
+            conn.execute("DELETE FROM activity_routes")
+            conn.executemany(
+                "INSERT INTO activity_routes (interest, intensity, age_bucket, rank, heading_norm, event_count) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        self._routes = None
+        print(f"Stored {len(rows)} activity routes")
+        return len(rows)
+
+    def count_routes(self) -> int:
+        """Get the number of rows in the routing table."""
+        with db_connection(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM activity_routes").fetchone()[0]
+
+    def get_routes(self) -> Dict[RouteKey, List[Tuple[str, int]]]:
+        """
+        The routing table, re-read only when the database file changed.
+
+        Returns:
+            Dict of (interest, intensity, age bucket) -> [(heading_norm, event_count)] best first
+        """
+        mtime = os.stat(self.db_path).st_mtime_ns
+        if self._routes is None or self._routes[0] != mtime:
+            routes: Dict[RouteKey, List[Tuple[str, int]]] = {}
+            with db_connection(self.db_path) as conn:
+                for interest, intensity, age, heading_norm, count in conn.execute(
+                    "SELECT interest, intensity, age_bucket, heading_norm, event_count FROM activity_routes "
+                    "ORDER BY interest, intensity, age_bucket, rank"
+                ):
+                    routes.setdefault((interest, intensity, age), []).append((heading_norm, count))
+            self._routes = (mtime, routes)
+        return self._routes[1]
+
+    def get_activity_documents(self, heading_norms: List[str]) -> List[Document]:
+        """
+        Catalog entries as Documents shaped like the activity type store's.
+
+        Args:
+            heading_norms: Normalized headings to fetch
+
+        Returns:
+            One Document per heading (first catalog entry), in the order requested
+        """
+        return activity_records_to_documents(self.get_activity_types(heading_norms), heading_norms)
+
+
+def merge_intensity_map(rows: Iterable[Tuple[str, str, Optional[str]]]) -> Dict[str, str]:
+    """
+    Merge (source, heading_norm, intensity) rows into one intensity map.
+
+    Matches merging per-file maps in (sorted) file order: the first
+    intensity of a heading within a file wins, and later files override
+    earlier ones.
+
+    Args:
+        rows: Catalog rows ordered by source, then position in the file
+
+    Returns:
+        Dict of heading_norm -> intensity
+    """
+    intensity_map: Dict[str, str] = {}
+    file_map: Dict[str, str] = {}
+    current_source = None
+    for source, heading_norm, intensity in rows:
+        if source != current_source:
+            intensity_map.update(file_map)
+            file_map, current_source = {}, source
+        if intensity and heading_norm not in file_map:
+            file_map[heading_norm] = intensity
+    intensity_map.update(file_map)
+    return intensity_map
+
+
+def activity_record_to_document(record: ActivityTypeRecord, doc_id: Optional[str] = None) -> Document:
+    """
+    The activity type store Document a catalog record was projected from.
+
+    Args:
+        record: Catalog record
+        doc_id: Document id (e.g. the store id of its embedding)
+
+    Returns:
+        Document with the store's page_content and metadata
+    """
+    return Document(
+        id=doc_id,
+        page_content=record.page_content,
+        metadata={
+            "source": record.source,
+            "activity_heading": record.activity_heading,
+            "activity_heading_norm": record.heading_norm,
+            "intensity": record.intensity,
+        },
+    )
+
+
+def activity_records_to_documents(
+    records: Iterable[ActivityTypeRecord], heading_norms: List[str]
+) -> List[Document]:
+    """
+    One store-shaped Document per requested heading (its first record), in request order.
+
+    Args:
+        records: Catalog records ordered by source, then position in the file
+        heading_norms: Normalized headings requested
+
+    Returns:
+        Documents for the headings that have a record
+    """
+    first: Dict[str, ActivityTypeRecord] = {}
+    for record in records:
+        first.setdefault(record.heading_norm, record)
+    return [activity_record_to_document(first[h]) for h in heading_norms if h in first]
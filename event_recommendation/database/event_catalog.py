@@ -0,0 +1,172 @@
+"""Compact in-memory event catalog.
+
+EventCatalog holds events column-wise: categorical fields as integer codes
+into per-field dictionaries, ages in an int array, and event names / page
+contents as UTF-8 in shared immutable byte chunks. Rows are exposed as
+EventView objects (two slots) that decode fields on access, or as
+zero-copy memoryviews of their text.
+"""
+
+from array import array
+from dataclasses import fields
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .event_db import CATEGORICAL_FIELDS, EventRecord
+
+EVENT_FIELDS = tuple(f.name for f in fields(EventRecord))
+INT_FIELDS = ("age_min", "age_max")
+TEXT_FIELDS = ("event_name", "page_content")
+
+# Text chunks are sealed (made immutable) at this size
+CHUNK_BYTES = 1 << 20
+
+_NULL_INT = -(2**31)
+
+
+class EventCatalog:
+    """Columnar, dictionary-encoded store of EventRecords."""
+
+    def __init__(self, records: Optional[Iterable[EventRecord]] = None):
+        """
+        Create a catalog, optionally filled from records.
+
+        Args:
+            records: EventRecords to append
+        """
+        # Code 0 is None in every dictionary
+        self._values: Dict[str, List[Optional[str]]] = {name: [None] for name in CATEGORICAL_FIELDS}
+        self._codes_by_value: Dict[str, Dict[str, int]] = {name: {} for name in CATEGORICAL_FIELDS}
+        self._codes: Dict[str, array] = {name: array("I") for name in CATEGORICAL_FIELDS}
+        self._ints: Dict[str, array] = {name: array("i") for name in INT_FIELDS}
+        # Each row's text lives in one chunk: event_name at [start, mid), page_content at [mid, end)
+        self._chunks: List[bytes] = []
+        self._pending = bytearray()
+        self._chunk_ids = array("I")
+        self._offsets = array("I")
+        if records is not None:
+            self.extend(records)
+
+    def __len__(self) -> int:
+        return len(self._chunk_ids)
+
+    def __getitem__(self, index: int) -> "EventView":
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("event index out of range")
+        return EventView(self, index)
+
+    def __iter__(self) -> Iterator["EventView"]:
+        for index in range(len(self)):
+            yield EventView(self, index)
+
+    def append(self, record: EventRecord) -> None:
+        """Append one record."""
+        for name in CATEGORICAL_FIELDS:
+            value = getattr(record, name)
+            if value is None:
+                code = 0
+            else:
+                codes = self._codes_by_value[name]
+                code = codes.get(value)
+                if code is None:
+                    code = codes[value] = len(self._values[name])
+                    self._values[name].append(value)
+            self._codes[name].append(code)
+        for name in INT_FIELDS:
+            value = getattr(record, name)
+            self._ints[name].append(_NULL_INT if value is None else value)
+
+        name_bytes = (record.event_name or "").encode("utf-8")
+        content_bytes = (record.page_content or "").encode("utf-8")
+        if self._pending and len(self._pending) + len(name_bytes) + len(content_bytes) > CHUNK_BYTES:
+            self._seal()
+        start = len(self._pending)
+        self._pending += name_bytes
+        self._pending += content_bytes
+        self._chunk_ids.append(len(self._chunks))
+        self._offsets.extend((start, start + len(name_bytes), len(self._pending)))
+
+    def extend(self, records: Iterable[EventRecord]) -> None:
+        """Append records in order."""
+        for record in records:
+            self.append(record)
+
+    def _seal(self) -> None:
+        """Freeze the pending text into an immutable chunk (safe to hand out views of)."""
+        self._chunks.append(bytes(self._pending))
+        self._pending = bytearray()
+
+    def text_view(self, index: int, name: str) -> memoryview:
+        """
+        Zero-copy UTF-8 bytes of one text field.
+
+        Args:
+            index: Row index
+            name: 'event_name' or 'page_content'
+
+        Returns:
+            Read-only memoryview into the shared text chunk
+        """
+        chunk_id = self._chunk_ids[index]
+        if chunk_id == len(self._chunks):
+            self._seal()
+        start, mid, end = self._offsets[3 * index:3 * index + 3]
+        if name == "event_name":
+            return memoryview(self._chunks[chunk_id])[start:mid]
+        if name == "page_content":
+            return memoryview(self._chunks[chunk_id])[mid:end]
+        raise KeyError(name)
+
+    def value(self, index: int, name: str):
+        """Decoded value of one field."""
+        if name in self._codes:
+            return self._values[name][self._codes[name][index]]
+        if name in self._ints:
+            value = self._ints[name][index]
+            return None if value == _NULL_INT else value
+        chunk_id = self._chunk_ids[index]
+        chunk = self._chunks[chunk_id] if chunk_id < len(self._chunks) else self._pending
+        start, mid, end = self._offsets[3 * index:3 * index + 3]
+        if name == "event_name":
+            return chunk[start:mid].decode("utf-8")
+        if name == "page_content":
+            return chunk[mid:end].decode("utf-8")
+        raise KeyError(name)
+
+    def record(self, index: int) -> EventRecord:
+        """Materialize one row as an EventRecord."""
+        return EventRecord(*(self.value(index, name) for name in EVENT_FIELDS))
+
+    def records(self) -> List[EventRecord]:
+        """Materialize every row."""
+        return [self.record(index) for index in range(len(self))]
+
+    def distinct(self, name: str) -> List[str]:
+        """Distinct non-null values of a categorical field, in first-seen order."""
+        return self._values[name][1:]
+
+
+class EventView:
+    """One catalog row; fields are decoded from the catalog on access."""
+
+    __slots__ = ("_catalog", "_index")
+
+    def __init__(self, catalog: EventCatalog, index: int):
+        self._catalog = catalog
+        self._index = index
+
+    def __getattr__(self, name: str):
+        if name not in EVENT_FIELDS:
+            raise AttributeError(name)
+        return self._catalog.value(self._index, name)
+
+    def __repr__(self) -> str:
+        return f"EventView({self._index}, {self.event_name!r})"
+
+    def text_view(self, name: str = "page_content") -> memoryview:
+        """Zero-copy UTF-8 bytes of 'event_name' or 'page_content'."""
+        return self._catalog.text_view(self._index, name)
+
+    def to_record(self) -> EventRecord:
+        return self._catalog.record(self._index)
@@ -2,16 +2,44 @@
 
 import sqlite3
 import os
-from typing import List, Dict, Any, Optional, Tuple
+import re
+import sys
+import hashlib
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from contextlib import contextmanager
 
+import numpy as np
 from langchain_core.documents import Document
 
+from .text_codec import TextDictionaries, add_compressed_columns, compress_column_in_place, resolve_method
+
+
+# Low-cardinality EventRecord fields, repeated across most records of a corpus
+CATEGORICAL_FIELDS = (
+    "event_type", "event_type_raw", "source", "city", "state", "age_contains", "intensity",
+    "instructor", "date_range", "time_slots", "duration", "spots", "center_name", "center_type",
+)
+
+_BODY_WHITESPACE_RE = re.compile(r"[ \t]+")
+# Content hashes looked up per query (SQLite's default variable limit is 999)
+_HASH_LOOKUP_BATCH = 500
+
 
 @dataclass
 class EventRecord:
-    """Event record structure."""
+    """
+    Event record structure.
+
+    Slotted (no per-instance __dict__), and categorical values are interned
+    so records of the same center / event type share one string each.
+    """
+    __slots__ = (
+        "event_name", "event_type", "event_type_raw", "source", "city", "state",
+        "age_min", "age_max", "age_contains", "intensity", "instructor", "date_range",
+        "time_slots", "duration", "spots", "center_name", "center_type", "page_content",
+    )
+
     event_name: str
     event_type: Optional[str]
     event_type_raw: Optional[str]
@@ -31,6 +59,12 @@ class EventRecord:
     center_type: Optional[str]
     page_content: str  # Full event block text
 
+    def __post_init__(self):
+        for name in CATEGORICAL_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+
 
 def init_database(db_path: str = "./events.db") -> None:
     """
@@ -63,9 +97,13 @@ def init_database(db_path: str = "./events.db") -> None:
             center_name TEXT,
             center_type TEXT,
             page_content TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            page_content_z BLOB,  -- compressed page_content (page_content is '' then)
+            text_dict_id INTEGER,  -- text_dictionaries.id used for page_content_z
+            content_id INTEGER  -- event_contents.id holding the block text (page_content is '' then)
         )
     """)
+    init_event_contents_table(conn)
     
     # Create indexes for common queries
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_event_type ON events(event_type)")
@@ -74,12 +112,49 @@ def init_database(db_path: str = "./events.db") -> None:
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_age_contains ON events(age_contains)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_intensity ON events(intensity)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_city_state ON events(city, state)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_source ON events(source)")
     
     conn.commit()
     conn.close()
     print(f"Database initialized at {db_path}")
 
 
+def init_event_contents_table(conn: sqlite3.Connection) -> None:
+    """
+    Create the event_contents table (one row per distinct event block body) if missing.
+    
+    Also adds events.content_id to databases created before content dedup.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS event_contents (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            content_hash TEXT NOT NULL UNIQUE,  -- sha256 of the normalized block body
+            page_content TEXT NOT NULL,
+            page_content_z BLOB,
+            text_dict_id INTEGER,
+            embedding BLOB  -- float32 vector, filled by EventDB.embed_contents()
+        )
+    """)
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(events)")}
+    if "content_id" not in existing:
+        conn.execute("ALTER TABLE events ADD COLUMN content_id INTEGER")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_content_id ON events(content_id)")
+
+
+def content_hash(page_content: str) -> str:
+    """
+    Hash of an event block body, insensitive to case and whitespace.
+    
+    Args:
+        page_content: Event block text
+        
+    Returns:
+        Hex sha256 of the normalized text
+    """
+    lines = (_BODY_WHITESPACE_RE.sub(" ", line).strip() for line in page_content.casefold().splitlines())
+    return hashlib.sha256("\n".join(line for line in lines if line).encode("utf-8")).hexdigest()
+
+
 def get_database_connection(db_path: str = "./events.db"):
     """Get a database connection."""
     return sqlite3.connect(db_path)
@@ -99,20 +174,124 @@ def db_connection(db_path: str = "./events.db"):
         conn.close()
 
 
+_INSERT_EVENT_SQL = """
+    INSERT INTO events (
+        event_name, event_type, event_type_raw, source,
+        city, state, age_min, age_max, age_contains,
+        intensity, instructor, date_range, time_slots,
+        duration, spots, center_name, center_type, page_content,
+        page_content_z, text_dict_id, content_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Block text of a row: its own columns (rows stored before content dedup) or its event_contents row
+_CONTENT_SELECT = (
+    "events.page_content, events.page_content_z, events.text_dict_id, "
+    "c.page_content, c.page_content_z, c.text_dict_id"
+)
+_CONTENT_JOIN = "LEFT JOIN event_contents c ON c.id = events.content_id"
+
+
+def _event_row(event: EventRecord) -> tuple:
+    """Column values of an EventRecord in _INSERT_EVENT_SQL order."""
+    return (
+        event.event_name,
+        event.event_type,
+        event.event_type_raw,
+        event.source,
+        event.city,
+        event.state,
+        event.age_min,
+        event.age_max,
+        event.age_contains,
+        event.intensity,
+        event.instructor,
+        event.date_range,
+        event.time_slots,
+        event.duration,
+        event.spots,
+        event.center_name,
+        event.center_type,
+        event.page_content,
+    )
+
+
+def _prune_contents(conn: sqlite3.Connection) -> None:
+    """Delete event_contents rows no event references anymore."""
+    conn.execute(
+        "DELETE FROM event_contents WHERE id NOT IN "
+        "(SELECT content_id FROM events WHERE content_id IS NOT NULL)"
+    )
+
+
 class EventDB:
     """SQL database interface for events."""
     
-    def __init__(self, db_path: str = "./events.db"):
+    def __init__(self, db_path: str = "./events.db", compression: Optional[str] = None):
         """
         Initialize EventDB.
         
         Args:
             db_path: Path to SQLite database file
+            compression: Store page_content of new rows compressed with a shared
+                dictionary ('auto', 'zstd' or 'zlib'); None stores plain text
         """
         self.db_path = db_path
+        self.compression = resolve_method(compression) if compression else None
+        self.text_dictionaries = TextDictionaries(db_path)
         # Ensure database is initialized
         if not os.path.exists(db_path):
             init_database(db_path)
+        else:
+            with db_connection(db_path) as conn:
+                add_compressed_columns(conn, "events", "page_content")
+                init_event_contents_table(conn)
+    
+    def _content_ids(self, conn: sqlite3.Connection, events: List[EventRecord]) -> List[int]:
+        """
+        event_contents ids of the events' block bodies, storing bodies not seen before.
+        
+        New bodies are compressed if enabled; the first copy's text is kept.
+        """
+        hashes = [content_hash(event.page_content) for event in events]
+        ids: Dict[str, int] = {}
+        distinct = list(dict.fromkeys(hashes))
+        for start in range(0, len(distinct), _HASH_LOOKUP_BATCH):
+            batch = distinct[start:start + _HASH_LOOKUP_BATCH]
+            ids.update(conn.execute(
+                f"SELECT content_hash, id FROM event_contents "
+                f"WHERE content_hash IN ({','.join(['?'] * len(batch))})",
+                batch,
+            ).fetchall())
+        
+        new: Dict[str, str] = {}
+        for digest, event in zip(hashes, events):
+            if digest not in ids and digest not in new:
+                new[digest] = event.page_content
+        if new:
+            if self.compression is None:
+                values = [(text, None, None) for text in new.values()]
+            else:
+                values = self.text_dictionaries.compress_rows(conn, self.compression, list(new.values()))
+            for digest, value in zip(new, values):
+                ids[digest] = conn.execute(
+                    "INSERT INTO event_contents (content_hash, page_content, page_content_z, text_dict_id) "
+                    "VALUES (?, ?, ?, ?)",
+                    (digest,) + value,
+                ).lastrowid
+        return [ids[digest] for digest in hashes]
+    
+    def _rows(self, conn: sqlite3.Connection, events: List[EventRecord]) -> List[tuple]:
+        """_INSERT_EVENT_SQL parameters; the block text goes to event_contents."""
+        content_ids = self._content_ids(conn, events)
+        return [_event_row(event)[:17] + ("", None, None, content_id)
+                for event, content_id in zip(events, content_ids)]
+    
+    def _decode_content(self, values: tuple) -> str:
+        """page_content from the six _CONTENT_SELECT values."""
+        if values[3] is not None:
+            return self.text_dictionaries.decode(*values[3:6])
+        return self.text_dictionaries.decode(*values[:3])
     
     def insert_event(self, event: EventRecord) -> int:
         """
@@ -126,33 +305,7 @@ class EventDB:
         """
         with db_connection(self.db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO events (
-                    event_name, event_type, event_type_raw, source,
-                    city, state, age_min, age_max, age_contains,
-                    intensity, instructor, date_range, time_slots,
-                    duration, spots, center_name, center_type, page_content
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                event.event_name,
-                event.event_type,
-                event.event_type_raw,
-                event.source,
-                event.city,
-                event.state,
-                event.age_min,
-                event.age_max,
-                event.age_contains,
-                event.intensity,
-                event.instructor,
-                event.date_range,
-                event.time_slots,
-                event.duration,
-                event.spots,
-                event.center_name,
-                event.center_type,
-                event.page_content,
-            ))
+            cursor.execute(_INSERT_EVENT_SQL, self._rows(conn, [event])[0])
             return cursor.lastrowid
     
     def insert_events(self, events: List[EventRecord]) -> None:
@@ -163,44 +316,32 @@ class EventDB:
             events: List of EventRecord objects to insert
         """
         with db_connection(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.executemany("""
-                INSERT INTO events (
-                    event_name, event_type, event_type_raw, source,
-                    city, state, age_min, age_max, age_contains,
-                    intensity, instructor, date_range, time_slots,
-                    duration, spots, center_name, center_type, page_content
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
-                (
-                    event.event_name,
-                    event.event_type,
-                    event.event_type_raw,
-                    event.source,
-                    event.city,
-                    event.state,
-                    event.age_min,
-                    event.age_max,
-                    event.age_contains,
-                    event.intensity,
-                    event.instructor,
-                    event.date_range,
-                    event.time_slots,
-                    event.duration,
-                    event.spots,
-                    event.center_name,
-                    event.center_type,
-                    event.page_content,
-                )
-                for event in events
-            ])
+            conn.executemany(_INSERT_EVENT_SQL, self._rows(conn, events))
         print(f"Inserted {len(events)} events into database")
     
+    def replace_source_events(self, source: str, events: List[EventRecord]) -> None:
+        """
+        Replace every event of one source file in a single transaction.
+        
+        Readers see either the previous or the new events of the source,
+        never a partial update. An empty list removes the source.
+        
+        Args:
+            source: Source file name (EventRecord.source)
+            events: New EventRecords for that source
+        """
+        with db_connection(self.db_path) as conn:
+            deleted = conn.execute("DELETE FROM events WHERE source = ?", (source,)).rowcount
+            conn.executemany(_INSERT_EVENT_SQL, self._rows(conn, events))
+            _prune_contents(conn)
+        print(f"Replaced {deleted} events from {source} with {len(events)}")
+    
     def clear_events(self) -> None:
         """Clear all events from the database."""
         with db_connection(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM events")
+            _prune_contents(conn)
         print("Cleared all events from database")
     
     def query_events(
@@ -211,6 +352,7 @@ class EventDB:
         age_contains: Optional[str] = None,
         intensity: Optional[str] = None,
         limit: int = 10,
+        include_content: bool = True,
     ) -> List[Document]:
         """
         Query events from the database with filters.
@@ -222,6 +364,8 @@ class EventDB:
             age_contains: Age group filter (checks if age_contains contains this value)
             intensity: Intensity filter (exact match)
             limit: Maximum number of results
+            include_content: Read (and decompress) page_content. If False, documents
+                get an empty page_content, an 'event_id' for get_page_contents() and a 'content_id'
             
         Returns:
             List of Document objects (compatible with existing code)
@@ -275,8 +419,9 @@ class EventDB:
                     event_name, event_type, event_type_raw, source,
                     city, state, age_min, age_max, age_contains,
                     intensity, instructor, date_range, time_slots,
-                    duration, spots, center_name, center_type, page_content
-                FROM events
+                    duration, spots, center_name, center_type,
+                    {_CONTENT_SELECT if include_content else "events.id, events.content_id"}
+                FROM events {_CONTENT_JOIN if include_content else ""}
                 WHERE {where_clause}
                 LIMIT ?
             """
@@ -289,7 +434,7 @@ class EventDB:
             documents = []
             for row in rows:
                 doc = Document(
-                    page_content=row[17],  # page_content
+                    page_content=self._decode_content(row[17:23]) if include_content else "",
                     metadata={
                         "event_name": row[0],
                         "event_type": row[1],
@@ -310,10 +455,155 @@ class EventDB:
                         "center_type": row[16],
                     }
                 )
+                if not include_content:
+                    doc.metadata["event_id"] = row[17]
+                    doc.metadata["content_id"] = row[18]
                 documents.append(doc)
             
             return documents
     
+    def get_page_contents(self, event_ids: List[int]) -> Dict[int, str]:
+        """
+        Read (and decompress) page_content for some events only.
+        
+        Args:
+            event_ids: 'event_id' values from query_events(include_content=False)
+            
+        Returns:
+            Dictionary of event id -> page_content
+        """
+        if not event_ids:
+            return {}
+        with db_connection(self.db_path) as conn:
+            rows = conn.execute(
+                f"SELECT events.id, {_CONTENT_SELECT} FROM events {_CONTENT_JOIN} "
+                f"WHERE events.id IN ({','.join(['?'] * len(event_ids))})",
+                list(event_ids),
+            ).fetchall()
+        return {row[0]: self._decode_content(row[1:]) for row in rows}
+    
+    def count_contents(self) -> int:
+        """Get the number of distinct event block bodies stored."""
+        with db_connection(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM event_contents").fetchone()[0]
+    
+    def iter_contents(self, batch_size: int = 1000) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (event_contents id, block body) for every stored body, in id order.
+        
+        Args:
+            batch_size: Rows read (and decompressed) per query
+        """
+        last_id = 0
+        while True:
+            with db_connection(self.db_path) as conn:
+                rows = conn.execute(
+                    "SELECT id, page_content, page_content_z, text_dict_id FROM event_contents "
+                    "WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield row[0], self.text_dictionaries.decode(*row[1:])
+            last_id = rows[-1][0]
+    
+    def embed_contents(
+        self, embed_documents: Callable[[List[str]], List[List[float]]], batch_size: int = 256
+    ) -> int:
+        """
+        Embed every stored block body that has no embedding yet.
+        
+        Each distinct body is embedded once, however many events share it.
+        
+        Args:
+            embed_documents: Batch embedding function (e.g. Embeddings.embed_documents)
+            batch_size: Bodies per embedding call
+            
+        Returns:
+            Number of bodies embedded
+        """
+        with db_connection(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT id, page_content, page_content_z, text_dict_id FROM event_contents "
+                "WHERE embedding IS NULL ORDER BY id"
+            ).fetchall()
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            vectors = embed_documents([self.text_dictionaries.decode(*row[1:]) for row in batch])
+            with db_connection(self.db_path) as conn:
+                conn.executemany(
+                    "UPDATE event_contents SET embedding = ? WHERE id = ?",
+                    [(np.asarray(vector, dtype=np.float32).tobytes(), row[0]) for row, vector in zip(batch, vectors)],
+                )
+        if rows:
+            print(f"Embedded {len(rows)} event contents")
+        return len(rows)
+    
+    def get_content_embeddings(self) -> Tuple[List[int], np.ndarray]:
+        """
+        Stored block body embeddings.
+        
+        Returns:
+            (event_contents ids, float32 matrix with one row per id)
+        """
+        with db_connection(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT id, embedding FROM event_contents WHERE embedding IS NOT NULL ORDER BY id"
+            ).fetchall()
+        if not rows:
+            return [], np.zeros((0, 0), dtype=np.float32)
+        return [row[0] for row in rows], np.vstack([np.frombuffer(row[1], dtype=np.float32) for row in rows])
+    
+    def compress_text(self, method: str = "auto") -> Dict[str, int]:
+        """
+        Compress the page_content of every plain-text row in place and shrink the file.
+        
+        New rows are compressed from then on. A dictionary is trained from the
+        existing rows unless one is already stored for the method.
+        
+        Args:
+            method: 'auto', 'zstd' or 'zlib'
+            
+        Returns:
+            Dictionary with 'rows' compressed and file 'bytes_before' / 'bytes_after'
+        """
+        self.compression = resolve_method(method)
+        legacy = compress_column_in_place(
+            self.db_path, "events", "page_content", self.text_dictionaries, self.compression,
+            where="content_id IS NULL",
+        )
+        stats = compress_column_in_place(
+            self.db_path, "event_contents", "page_content", self.text_dictionaries, self.compression
+        )
+        stats["rows"] += legacy["rows"]
+        stats["bytes_before"] = legacy["bytes_before"]
+        print(f"Compressed {stats['rows']} event block bodies "
+              f"({stats['bytes_before']:,} -> {stats['bytes_after']:,} bytes)")
+        return stats
+    
+    def get_catalog_vocabulary(self) -> Dict[str, List[str]]:
+        """
+        Get the distinct catalog terms used for gazetteer matching.
+
+        Returns:
+            Dictionary with sorted 'event_types', 'venues' and 'cities' lists
+        """
+        vocabulary: Dict[str, List[str]] = {}
+        with db_connection(self.db_path) as conn:
+            cursor = conn.cursor()
+            for key, column in (
+                ("event_types", "event_type"),
+                ("venues", "center_name"),
+                ("cities", "city"),
+            ):
+                cursor.execute(
+                    f"SELECT DISTINCT {column} FROM events "
+                    f"WHERE {column} IS NOT NULL AND {column} != '' ORDER BY {column}"
+                )
+                vocabulary[key] = [row[0] for row in cursor.fetchall()]
+        return vocabulary
+
     def count_events(self) -> int:
         """Get total number of events in database."""
         with db_connection(self.db_path) as conn:
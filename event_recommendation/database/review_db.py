@@ -2,12 +2,14 @@
 
 import sqlite3
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Sequence
 from dataclasses import dataclass
 from contextlib import contextmanager
 
 from langchain_core.documents import Document
 
+from .text_codec import TextDictionaries, add_compressed_columns, compress_column_in_place, resolve_method
+
 
 @dataclass
 class ReviewRecord:
@@ -41,7 +43,9 @@ def init_reviews_database(db_path: str = "./reviews.db") -> None:
             location TEXT,
             sentiment TEXT,
             source TEXT NOT NULL,
-            created_at_db TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            created_at_db TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            review_text_z BLOB,  -- compressed review_text (review_text is '' then)
+            text_dict_id INTEGER  -- text_dictionaries.id used for review_text_z
         )
     """)
     
@@ -71,20 +75,54 @@ def db_connection(db_path: str = "./reviews.db"):
         conn.close()
 
 
+_INSERT_REVIEW_SQL = """
+    INSERT INTO reviews (
+        review_text, rating, created_at, event_type, location, sentiment, source,
+        review_text_z, text_dict_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _review_row(review: ReviewRecord) -> tuple:
+    return (
+        review.review_text,
+        review.rating,
+        review.created_at,
+        review.event_type,
+        review.location,
+        review.sentiment,
+        review.source,
+    )
+
+
 class ReviewDB:
     """SQL database interface for reviews."""
     
-    def __init__(self, db_path: str = "./reviews.db"):
+    def __init__(self, db_path: str = "./reviews.db", compression: Optional[str] = None):
         """
         Initialize ReviewDB.
         
         Args:
             db_path: Path to SQLite database file
+            compression: Store review_text of new rows compressed with a shared
+                dictionary ('auto', 'zstd' or 'zlib'); None stores plain text
         """
         self.db_path = db_path
+        self.compression = resolve_method(compression) if compression else None
+        self.text_dictionaries = TextDictionaries(db_path)
         # Ensure database is initialized
         if not os.path.exists(db_path):
             init_reviews_database(db_path)
+        else:
+            with db_connection(db_path) as conn:
+                add_compressed_columns(conn, "reviews", "review_text")
+    
+    def _rows(self, conn: sqlite3.Connection, rows: Sequence[tuple]) -> List[tuple]:
+        """_INSERT_REVIEW_SQL parameters, with review_text compressed if enabled."""
+        if self.compression is None or not rows:
+            return [tuple(row) + (None, None) for row in rows]
+        compressed = self.text_dictionaries.compress_rows(conn, self.compression, [row[0] for row in rows])
+        return [(values[0],) + tuple(row[1:]) + values[1:] for row, values in zip(rows, compressed)]
     
     def insert_review(self, review: ReviewRecord) -> int:
         """
@@ -98,19 +136,7 @@ class ReviewDB:
         """
         with db_connection(self.db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO reviews (
-                    review_text, rating, created_at, event_type, location, sentiment, source
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                review.review_text,
-                review.rating,
-                review.created_at,
-                review.event_type,
-                review.location,
-                review.sentiment,
-                review.source,
-            ))
+            cursor.execute(_INSERT_REVIEW_SQL, self._rows(conn, [_review_row(review)])[0])
             return cursor.lastrowid
     
     def insert_reviews(self, reviews: List[ReviewRecord]) -> None:
@@ -122,24 +148,77 @@ class ReviewDB:
         """
         with db_connection(self.db_path) as conn:
             cursor = conn.cursor()
-            cursor.executemany("""
-                INSERT INTO reviews (
-                    review_text, rating, created_at, event_type, location, sentiment, source
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, [
-                (
-                    review.review_text,
-                    review.rating,
-                    review.created_at,
-                    review.event_type,
-                    review.location,
-                    review.sentiment,
-                    review.source,
-                )
-                for review in reviews
-            ])
+            cursor.executemany(_INSERT_REVIEW_SQL, self._rows(conn, [_review_row(review) for review in reviews]))
         print(f"Inserted {len(reviews)} reviews into database")
     
+    def insert_review_rows(self, row_chunks: Iterable[Sequence[tuple]]) -> int:
+        """
+        Stream pre-built row tuples into the database in a single transaction.
+        
+        Used by the bulk ingestion path to skip Document/ReviewRecord objects.
+        Chunks are consumed lazily, so only one chunk is held in memory.
+        
+        Args:
+            row_chunks: Iterable of row lists; each row is
+                (review_text, rating, created_at, event_type, location, sentiment, source)
+                
+        Returns:
+            Number of rows inserted
+        """
+        total = 0
+        with db_connection(self.db_path) as conn:
+            cursor = conn.cursor()
+            for rows in row_chunks:
+                cursor.executemany(_INSERT_REVIEW_SQL, self._rows(conn, rows))
+                total += len(rows)
+        print(f"Inserted {total} reviews into database")
+        return total
+    
+    def replace_source_review_rows(self, source: str, row_chunks: Iterable[Sequence[tuple]]) -> int:
+        """
+        Replace every review of one source file in a single transaction.
+        
+        Readers see either the previous or the new reviews of the source,
+        never a partial update.
+        
+        Args:
+            source: Source file name (the `source` column)
+            row_chunks: Iterable of row lists, as for insert_review_rows
+                
+        Returns:
+            Number of rows inserted
+        """
+        total = 0
+        with db_connection(self.db_path) as conn:
+            cursor = conn.cursor()
+            deleted = cursor.execute("DELETE FROM reviews WHERE source = ?", (source,)).rowcount
+            for rows in row_chunks:
+                cursor.executemany(_INSERT_REVIEW_SQL, self._rows(conn, rows))
+                total += len(rows)
+        print(f"Replaced {deleted} reviews from {source} with {total}")
+        return total
+    
+    def compress_text(self, method: str = "auto") -> Dict[str, int]:
+        """
+        Compress the review_text of every plain-text row in place and shrink the file.
+        
+        New rows are compressed from then on. A dictionary is trained from the
+        existing rows unless one is already stored for the method.
+        
+        Args:
+            method: 'auto', 'zstd' or 'zlib'
+            
+        Returns:
+            Dictionary with 'rows' compressed and file 'bytes_before' / 'bytes_after'
+        """
+        self.compression = resolve_method(method)
+        stats = compress_column_in_place(
+            self.db_path, "reviews", "review_text", self.text_dictionaries, self.compression
+        )
+        print(f"Compressed review_text of {stats['rows']} reviews "
+              f"({stats['bytes_before']:,} -> {stats['bytes_after']:,} bytes)")
+        return stats
+    
     def clear_reviews(self) -> None:
         """Clear all reviews from the database."""
         with db_connection(self.db_path) as conn:
@@ -199,7 +278,8 @@ class ReviewDB:
             
             query = f"""
                 SELECT 
-                    review_text, rating, created_at, event_type, location, sentiment, source
+                    review_text, rating, created_at, event_type, location, sentiment, source,
+                    review_text_z, text_dict_id
                 FROM reviews
                 WHERE {where_clause}
                 LIMIT ?
@@ -213,7 +293,7 @@ class ReviewDB:
             documents = []
             for row in rows:
                 doc = Document(
-                    page_content=row[0],  # review_text
+                    page_content=self.text_dictionaries.decode(row[0], row[7], row[8]),  # review_text
                     metadata={
                         "rating": row[1],
                         "created_at": row[2],
@@ -0,0 +1,686 @@
+"""Versioned, memory-mappable snapshot of the serving data.
+
+One file holds the events table, review rating aggregates per
+(event_type, location), the activity type catalog with its routing table
+and, optionally, the activity type embedding of every catalog row, so the
+server can answer from it (and build its activity type search index)
+without opening SQLite cold or reading the whole Chroma collection.
+
+Layout::
+
+    b"EVSNAP\\0\\0" | u32 version | u32 header length | JSON header | pad | buffers
+
+Every buffer is 64-byte aligned and described in the header by its offset
+from the start of the data section. Opening a snapshot parses only the
+header; columns are numpy views over the mmap, so pages are read lazily
+the first time a column is touched.
+
+Text columns are stored either as offsets + UTF-8 bytes or, when values
+repeat (event_type, city, state, intensity, ...), as int32 codes into a
+small dictionary.
+"""
+
+import json
+import mmap
+import os
+import struct
+from dataclasses import fields
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+
+from .activity_db import (
+    ActivityTypeDB,
+    ActivityTypeRecord,
+    RouteKey,
+    activity_record_to_document,
+    activity_records_to_documents,
+    merge_intensity_map,
+)
+from .event_db import _CONTENT_JOIN, _CONTENT_SELECT, EventDB, EventRecord, db_connection
+from .review_db import ReviewDB
+
+SNAPSHOT_MAGIC = b"EVSNAP\0\0"
+# Bump when the layout or any table's columns change
+SNAPSHOT_VERSION = 4
+
+_PREFIX = struct.Struct("<8sII")
+_ALIGN = 64
+
+EVENT_COLUMNS = [f.name for f in fields(EventRecord)]
+# events.id / content_id are kept so lazily loaded documents can fetch their page_content later
+EVENT_TABLE_COLUMNS = ["id", "content_id"] + EVENT_COLUMNS
+ACTIVITY_COLUMNS = [f.name for f in fields(ActivityTypeRecord)]
+REVIEW_SCORE_COLUMNS = ["event_type", "location", "count", "total"]
+# activity_routes rows, best heading first within each key
+ROUTE_COLUMNS = ["interest", "intensity", "age_bucket", "heading_norm", "event_count"]
+
+
+def _align(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def source_fingerprint(paths: Sequence[Optional[str]]) -> List[Optional[List[int]]]:
+    """(size, mtime_ns) of each source database, None for missing paths."""
+    result = []
+    for path in paths:
+        if path and os.path.exists(path):
+            st = os.stat(path)
+            result.append([st.st_size, st.st_mtime_ns])
+        else:
+            result.append(None)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+class _BufferWriter:
+    """Collects aligned buffers for the data section."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.size = 0
+
+    def add(self, array: np.ndarray) -> Dict[str, Any]:
+        pad = _align(self.size) - self.size
+        if pad:
+            self.chunks.append(b"\0" * pad)
+        spec = {"offset": self.size + pad, "dtype": array.dtype.str, "shape": list(array.shape)}
+        data = np.ascontiguousarray(array).tobytes()
+        self.chunks.append(data)
+        self.size += pad + len(data)
+        return spec
+
+
+def _encode_strings(writer: _BufferWriter, values: Sequence[Optional[str]]) -> Dict[str, Any]:
+    encoded = [(v or "").encode("utf-8") for v in values]
+    offsets = np.zeros(len(values) + 1, dtype="<i8")
+    np.cumsum(np.fromiter((len(b) for b in encoded), dtype="<i8", count=len(encoded)), out=offsets[1:])
+    nulls = np.fromiter((v is None for v in values), dtype="u1", count=len(values))
+    return {
+        "kind": "str",
+        "offsets": writer.add(offsets),
+        "data": writer.add(np.frombuffer(b"".join(encoded), dtype="u1")),
+        "nulls": writer.add(nulls) if nulls.any() else None,
+    }
+
+
+def _encode_text(writer: _BufferWriter, values: Sequence[Optional[str]]) -> Dict[str, Any]:
+    """Dictionary-encode repetitive text columns, store the rest as plain strings."""
+    distinct: Dict[str, int] = {}
+    codes = np.empty(len(values), dtype="<i4")
+    for i, value in enumerate(values):
+        codes[i] = -1 if value is None else distinct.setdefault(value, len(distinct))
+    if len(distinct) * 2 > len(values):
+        return _encode_strings(writer, values)
+    return {"kind": "dict", "codes": writer.add(codes), "dictionary": _encode_strings(writer, list(distinct))}
+
+
+def _encode_column(writer: _BufferWriter, values: Sequence[Any]) -> Dict[str, Any]:
+    sample = next((v for v in values if v is not None), "")
+    if isinstance(sample, bool) or not isinstance(sample, (int, float)):
+        return _encode_text(writer, values)
+    if isinstance(sample, float):
+        return {"kind": "float", "values": writer.add(np.array(values, dtype="<f8"))}
+    nulls = np.fromiter((v is None for v in values), dtype="u1", count=len(values))
+    return {
+        "kind": "int",
+        "values": writer.add(np.array([0 if v is None else v for v in values], dtype="<i8")),
+        "nulls": writer.add(nulls) if nulls.any() else None,
+    }
+
+
+def _encode_table(writer: _BufferWriter, columns: List[str], rows: List[tuple]) -> Dict[str, Any]:
+    return {
+        "rows": len(rows),
+        "columns": {
+            name: _encode_column(writer, [row[i] for row in rows])
+            for i, name in enumerate(columns)
+        },
+    }
+
+
+def _review_score_rows(review_db: ReviewDB) -> List[tuple]:
+    """Rating count and total per raw (event_type, location), as get_review_scores parses them."""
+    groups: Dict[Tuple[Optional[str], Optional[str]], List[float]] = {}
+    with db_connection(review_db.db_path) as conn:
+        rows = conn.execute(
+            "SELECT event_type, location, rating FROM reviews "
+            "WHERE rating IS NOT NULL AND rating != ''"
+        ).fetchall()
+    for event_type, location, rating_str in rows:
+        try:
+            rating = float(rating_str) if rating_str else None
+        except (ValueError, TypeError):
+            rating = None
+        if rating is None:
+            continue
+        group = groups.setdefault((event_type, location), [0, 0.0])
+        group[0] += 1
+        group[1] += rating
+    return [(event_type, location, int(count), float(total)) for (event_type, location), (count, total) in groups.items()]
+
+
+def _activity_key(source: Any, heading_norm: Any, page_content: Any) -> tuple:
+    return source, heading_norm, (page_content or "").strip()
+
+
+def chroma_embeddings(
+    store: Any, records: Sequence[ActivityTypeRecord]
+) -> Optional[Tuple[List[str], np.ndarray]]:
+    """
+    Ids and embeddings of a Chroma store's documents, aligned with catalog records.
+
+    Documents are matched to records on (source, heading, text), the fields
+    a record is projected from.
+
+    Args:
+        store: LangChain Chroma store (e.g. RagStores.activity_types)
+        records: Catalog records, in snapshot order (ActivityTypeDB.get_activity_types())
+
+    Returns:
+        (ids, float32 matrix) with row i the embedding of records[i], or None
+        when the store has no embeddings or some record has no document
+    """
+    result = store.get(include=["embeddings", "documents", "metadatas"])
+    embeddings = result.get("embeddings")
+    if embeddings is None or len(embeddings) == 0 or not records:
+        return None
+    rows: Dict[tuple, int] = {}
+    for i, (text, metadata) in enumerate(zip(result["documents"], result["metadatas"])):
+        metadata = metadata or {}
+        rows.setdefault(
+            _activity_key(metadata.get("source"), metadata.get("activity_heading_norm"), text), i
+        )
+    order = [rows.get(_activity_key(r.source, r.heading_norm, r.page_content)) for r in records]
+    if any(i is None for i in order):
+        print("Activity type store and catalog differ; not storing embeddings in the snapshot")
+        return None
+    return [result["ids"][i] for i in order], np.asarray(embeddings, dtype="<f4")[order]
+
+
+def write_snapshot(
+    path: str,
+    event_db: EventDB,
+    review_db: Optional[ReviewDB] = None,
+    activity_db: Optional[ActivityTypeDB] = None,
+    embeddings: Optional[Tuple[List[str], np.ndarray]] = None,
+    embedding_model: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    Write a snapshot of the serving data (atomically replaces `path`).
+
+    Args:
+        path: Snapshot file to write
+        event_db: Events database
+        review_db: Reviews database (review score aggregates)
+        activity_db: Activity type catalog (default: the one in the events database)
+        embeddings: (ids, matrix) of the activity type embeddings, one row per
+            catalog record, see chroma_embeddings()
+        embedding_model: Model that computed them (embeddings_model_name()), so a
+            server starting from the snapshot can embed queries without the store
+
+    Returns:
+        Dictionary with row counts per section and the file size in bytes
+
+    Raises:
+        ValueError: If embeddings do not have one row per catalog record
+    """
+    activity_db = activity_db or ActivityTypeDB(event_db.db_path)
+    with db_connection(event_db.db_path) as conn:
+        # page_content is the last column; shared and compressed bodies are decoded here
+        columns = ", ".join(f"events.{c}" for c in EVENT_TABLE_COLUMNS[:-1])
+        event_rows = [
+            row[:-6] + (event_db._decode_content(row[-6:]),)
+            for row in conn.execute(
+                f"SELECT {columns}, {_CONTENT_SELECT} FROM events {_CONTENT_JOIN} ORDER BY events.id"
+            )
+        ]
+    activity_rows = [tuple(getattr(r, c) for c in ACTIVITY_COLUMNS) for r in activity_db.get_activity_types()]
+    route_rows = [
+        key + route
+        for key, routes in activity_db.get_routes().items()
+        for route in routes
+    ]
+    if embeddings is not None and len(embeddings[0]) != len(activity_rows):
+        raise ValueError(
+            f"{len(embeddings[0])} activity type embeddings for {len(activity_rows)} catalog records"
+        )
+    review_rows = _review_score_rows(review_db) if review_db is not None else []
+
+    writer = _BufferWriter()
+    header: Dict[str, Any] = {
+        "version": SNAPSHOT_VERSION,
+        "sources": source_fingerprint([event_db.db_path, review_db.db_path if review_db else None]),
+        "tables": {
+            "events": _encode_table(writer, EVENT_TABLE_COLUMNS, event_rows),
+            "review_scores": _encode_table(writer, REVIEW_SCORE_COLUMNS, review_rows),
+            "activity_types": _encode_table(writer, ACTIVITY_COLUMNS, activity_rows),
+            "activity_routes": _encode_table(writer, ROUTE_COLUMNS, route_rows),
+        },
+        "embeddings": None,
+    }
+    if embeddings is not None:
+        ids, matrix = embeddings
+        header["embeddings"] = {
+            "ids": _encode_strings(writer, ids),
+            "matrix": writer.add(np.asarray(matrix, dtype="<f4")),
+            "model": embedding_model,
+        }
+
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    prefix = _PREFIX.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(header_bytes))
+    data_start = _align(len(prefix) + len(header_bytes))
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(prefix)
+        f.write(header_bytes)
+        f.write(b"\0" * (data_start - len(prefix) - len(header_bytes)))
+        for chunk in writer.chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+
+    stats = {
+        "events": len(event_rows),
+        "review_groups": len(review_rows),
+        "activity_types": len(activity_rows),
+        "activity_routes": len(route_rows),
+        "embeddings": len(embeddings[0]) if embeddings is not None else 0,
+        "bytes": os.path.getsize(path),
+    }
+    print(f"✓ Wrote snapshot {path}: {stats}")
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+class _StrColumn:
+    def __init__(self, snapshot: "Snapshot", spec: Dict[str, Any]):
+        self.offsets = snapshot._array(spec["offsets"])
+        self.data = snapshot._array(spec["data"])
+        self.nulls = snapshot._array(spec["nulls"]) if spec["nulls"] else None
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        if self.nulls is not None and self.nulls[i]:
+            return None
+        return self.data[self.offsets[i]:self.offsets[i + 1]].tobytes().decode("utf-8")
+
+    def to_list(self) -> List[Optional[str]]:
+        data = self.data.tobytes()
+        offsets = self.offsets.tolist()
+        values = [data[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(self))]
+        if self.nulls is not None:
+            values = [None if null else v for v, null in zip(values, self.nulls.tolist())]
+        return values
+
+    def match(self, predicate: Callable[[str], bool]) -> np.ndarray:
+        return np.fromiter(
+            (v is not None and predicate(v) for v in self.to_list()), dtype=bool, count=len(self)
+        )
+
+
+class _DictColumn:
+    def __init__(self, snapshot: "Snapshot", spec: Dict[str, Any]):
+        self.codes = snapshot._array(spec["codes"])
+        self._strings = _StrColumn(snapshot, spec["dictionary"])
+        self._dictionary: Optional[List[str]] = None
+
+    @property
+    def dictionary(self) -> List[str]:
+        """Distinct values, decoded on first use (row lookups decode single entries)."""
+        if self._dictionary is None:
+            self._dictionary = self._strings.to_list()
+        return self._dictionary
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        code = self.codes[i]
+        if code < 0:
+            return None
+        return self._dictionary[code] if self._dictionary is not None else self._strings[code]
+
+    def to_list(self) -> List[Optional[str]]:
+        values = [None] + self.dictionary
+        return [values[c + 1] for c in self.codes.tolist()]
+
+    def match(self, predicate: Callable[[str], bool]) -> np.ndarray:
+        # Evaluate once per distinct value; slot 0 is NULL (code -1)
+        lookup = np.array([False] + [predicate(v) for v in self.dictionary], dtype=bool)
+        return lookup[self.codes.astype(np.int64) + 1]
+
+
+class _NumberColumn:
+    def __init__(self, snapshot: "Snapshot", spec: Dict[str, Any]):
+        self.values = snapshot._array(spec["values"])
+        self.nulls = snapshot._array(spec["nulls"]) if spec.get("nulls") else None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, i: int):
+        if self.nulls is not None and self.nulls[i]:
+            return None
+        return self.values[i].item()
+
+    def to_list(self) -> list:
+        values = self.values.tolist()
+        if self.nulls is not None:
+            values = [None if null else v for v, null in zip(values, self.nulls.tolist())]
+        return values
+
+
+_COLUMN_KINDS = {"str": _StrColumn, "dict": _DictColumn, "int": _NumberColumn, "float": _NumberColumn}
+
+
+class SnapshotTable:
+    """Columnar table inside a snapshot; columns are opened on first access."""
+
+    def __init__(self, snapshot: "Snapshot", spec: Dict[str, Any]):
+        self._snapshot = snapshot
+        self._spec = spec
+        self._columns: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return self._spec["rows"]
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self._spec["columns"])
+
+    def column(self, name: str):
+        if name not in self._columns:
+            spec = self._spec["columns"][name]
+            self._columns[name] = _COLUMN_KINDS[spec["kind"]](self._snapshot, spec)
+        return self._columns[name]
+
+    def row(self, i: int) -> tuple:
+        return tuple(self.column(name)[i] for name in self.column_names)
+
+
+class Snapshot:
+    """Read-only view of a snapshot file."""
+
+    def __init__(self, path: str):
+        """
+        Map a snapshot file and parse its header.
+
+        Args:
+            path: Snapshot file written by write_snapshot()
+
+        Raises:
+            ValueError: If the file is not a snapshot or has another version
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _PREFIX.size:
+                raise ValueError(f"{path} is not a snapshot file")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, header_len = _PREFIX.unpack_from(self._mm, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a snapshot file")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"{path} has snapshot version {version}, expected {SNAPSHOT_VERSION}")
+        self.header = json.loads(self._mm[_PREFIX.size:_PREFIX.size + header_len])
+        self._data_start = _align(_PREFIX.size + header_len)
+
+        tables = self.header["tables"]
+        self.events = SnapshotTable(self, tables["events"])
+        self.review_scores = SnapshotTable(self, tables["review_scores"])
+        self.activity_types = SnapshotTable(self, tables["activity_types"])
+        self.activity_routes = SnapshotTable(self, tables["activity_routes"])
+        # Decoded on first use; the catalog is small and the file immutable
+        self._activity_records: Optional[List[ActivityTypeRecord]] = None
+        self._routes: Optional[Dict[RouteKey, List[Tuple[str, int]]]] = None
+
+    def _array(self, spec: Dict[str, Any]) -> np.ndarray:
+        """Zero-copy numpy view of one buffer."""
+        count = int(np.prod(spec["shape"])) if spec["shape"] else 1
+        return np.frombuffer(
+            self._mm, dtype=spec["dtype"], count=count, offset=self._data_start + spec["offset"]
+        ).reshape(spec["shape"])
+
+    def is_current(self, *db_paths: Optional[str]) -> bool:
+        """True if the source databases are unchanged since the snapshot was written."""
+        return self.header["sources"] == source_fingerprint(db_paths)
+
+    @property
+    def embeddings(self) -> Optional[Tuple[List[str], np.ndarray]]:
+        """(ids, float32 matrix view) of the activity type embeddings (row i = activity_records()[i]), if stored."""
+        spec = self.header["embeddings"]
+        if spec is None:
+            return None
+        return _StrColumn(self, spec["ids"]).to_list(), self._array(spec["matrix"])
+
+    @property
+    def embedding_model(self) -> Optional[str]:
+        """Model of the activity type embeddings, if stored with them."""
+        spec = self.header["embeddings"]
+        return spec.get("model") if spec is not None else None
+
+    def event_record(self, i: int) -> EventRecord:
+        return EventRecord(*self.events.row(i)[2:])
+
+    def activity_records(self) -> List[ActivityTypeRecord]:
+        if self._activity_records is None:
+            self._activity_records = [
+                ActivityTypeRecord(*self.activity_types.row(i)) for i in range(len(self.activity_types))
+            ]
+        return list(self._activity_records)
+
+    def activity_embedding_documents(self) -> Optional[Tuple[List[Document], np.ndarray]]:
+        """
+        Activity type store documents and their embeddings, rebuilt from the snapshot.
+
+        Returns:
+            (Documents with their store ids, float32 matrix view), or None
+            when the snapshot has no embeddings
+        """
+        embeddings = self.embeddings
+        if embeddings is None:
+            return None
+        ids, matrix = embeddings
+        documents = [
+            activity_record_to_document(record, doc_id)
+            for record, doc_id in zip(self.activity_records(), ids)
+        ]
+        return documents, matrix
+
+    def get_routes(self) -> Dict[RouteKey, List[Tuple[str, int]]]:
+        """Same result as ActivityTypeDB.get_routes()."""
+        if self._routes is None:
+            routes: Dict[RouteKey, List[Tuple[str, int]]] = {}
+            for i in range(len(self.activity_routes)):
+                interest, intensity, age, heading_norm, count = self.activity_routes.row(i)
+                routes.setdefault((interest, intensity, age), []).append((heading_norm, count))
+            self._routes = routes
+        return self._routes
+
+    def get_intensity_map(self) -> Dict[str, str]:
+        """Same result as ActivityTypeDB.get_intensity_map()."""
+        return merge_intensity_map((r.source, r.heading_norm, r.intensity) for r in self.activity_records())
+
+    def get_activity_documents(self, heading_norms: List[str]) -> List[Document]:
+        """Same result as ActivityTypeDB.get_activity_documents()."""
+        return activity_records_to_documents(self.activity_records(), heading_norms)
+
+
+def open_snapshot(path: str, *db_paths: Optional[str]) -> Optional[Snapshot]:
+    """
+    Open a snapshot if it exists, has the current version and matches its sources.
+
+    Args:
+        path: Snapshot file
+        *db_paths: Source database paths, in write_snapshot order (events, reviews)
+
+    Returns:
+        Snapshot, or None if it has to be (re)written
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        snapshot = Snapshot(path)
+    except ValueError as e:
+        print(f"Ignoring snapshot: {e}")
+        return None
+    if db_paths and not snapshot.is_current(*db_paths):
+        print(f"Snapshot {path} is older than its databases")
+        return None
+    return snapshot
+
+
+# ---------------------------------------------------------------------------
+# Store adapters
+# ---------------------------------------------------------------------------
+
+class SnapshotEventStore:
+    """EventDB query interface answered from a snapshot."""
+
+    def __init__(self, snapshot: Snapshot, db_path: Optional[str] = None):
+        """
+        Args:
+            snapshot: Open snapshot
+            db_path: Events database the snapshot was written from (kept for catalog lookups)
+        """
+        self.snapshot = snapshot
+        self.db_path = db_path
+
+    def query_events(
+        self,
+        event_types: Optional[List[str]] = None,
+        city: Optional[str] = None,
+        state: Optional[str] = None,
+        age_contains: Optional[str] = None,
+        intensity: Optional[str] = None,
+        limit: int = 10,
+        include_content: bool = True,
+    ) -> List[Document]:
+        """
+        Query events with the same filters and row order as EventDB.query_events.
+
+        Args:
+            event_types: List of event types to match (OR clause)
+            city: City filter (exact match, case-insensitive)
+            state: State filter (exact match, case-insensitive)
+            age_contains: Age group filter (checks if age_contains contains this value)
+            intensity: Intensity filter (exact match)
+            limit: Maximum number of results
+            include_content: Read page_content. If False, documents get an empty
+                page_content, an 'event_id' for get_page_contents() and a 'content_id'
+
+        Returns:
+            List of Document objects
+        """
+        events = self.snapshot.events
+        mask = np.ones(len(events), dtype=bool)
+
+        if event_types:
+            wanted = {et.lower() for et in event_types}
+            mask &= events.column("event_type").match(lambda v: v.lower() in wanted)
+        for name, value in (("city", city), ("state", state), ("intensity", intensity)):
+            if value:
+                value = value.lower()
+                mask &= events.column(name).match(lambda v, value=value: v.lower() == value)
+        if age_contains:
+            if isinstance(age_contains, str):
+                age_groups = [a.strip().lower() for a in age_contains.split(",") if a.strip()]
+            else:
+                age_groups = [a.lower() for a in age_contains]
+            if age_groups:
+                mask &= events.column("age_contains").match(
+                    lambda v: any(g in v.lower() for g in age_groups)
+                )
+
+        metadata_columns = EVENT_COLUMNS[:-1]
+        documents = []
+        for i in np.flatnonzero(mask)[:max(limit, 0)].tolist():
+            metadata = {name: events.column(name)[i] for name in metadata_columns}
+            if include_content:
+                page_content = events.column("page_content")[i]
+            else:
+                page_content = ""
+                metadata["event_id"] = events.column("id")[i]
+                metadata["content_id"] = events.column("content_id")[i]
+            documents.append(Document(page_content=page_content, metadata=metadata))
+        return documents
+
+    def get_page_contents(self, event_ids: List[int]) -> Dict[int, str]:
+        """page_content for some events only, as EventDB.get_page_contents."""
+        if not len(self.snapshot.events):
+            return {}
+        ids = self.snapshot.events.column("id").values
+        contents = self.snapshot.events.column("page_content")
+        result = {}
+        for event_id in event_ids:
+            i = int(np.searchsorted(ids, event_id))
+            if i < len(ids) and ids[i] == event_id:
+                result[event_id] = contents[i]
+        return result
+
+    def get_catalog_vocabulary(self) -> Dict[str, List[str]]:
+        """Distinct catalog terms, as EventDB.get_catalog_vocabulary."""
+        events = self.snapshot.events
+        return {
+            key: sorted({v for v in events.column(column).to_list() if v})
+            for key, column in (("event_types", "event_type"), ("venues", "center_name"), ("cities", "city"))
+        }
+
+    def count_events(self) -> int:
+        return len(self.snapshot.events)
+
+
+class SnapshotReviewStore:
+    """ReviewDB whose rating aggregates come from a snapshot; other calls go to the database."""
+
+    def __init__(self, snapshot: Snapshot, review_db: ReviewDB):
+        self.snapshot = snapshot
+        self.review_db = review_db
+
+    def __getattr__(self, name: str):
+        return getattr(self.review_db, name)
+
+    def get_review_scores(
+        self,
+        event_types: Optional[List[str]] = None,
+        locations: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Average ratings per event type and venue, as ReviewDB.get_review_scores.
+
+        Args:
+            event_types: Optional list of event types to filter reviews
+            locations: Optional list of locations/venues to filter reviews
+
+        Returns:
+            Dictionary with 'activity_scores' and 'venue_scores'
+        """
+        wanted_types = {et.lower() for et in event_types} if event_types else None
+        wanted_locations = {loc.lower() for loc in locations} if locations else None
+        table = self.snapshot.review_scores
+        activity: Dict[str, List[float]] = {}
+        venue: Dict[str, List[float]] = {}
+        for event_type, location, count, total in zip(*(table.column(c).to_list() for c in REVIEW_SCORE_COLUMNS)):
+            if wanted_types is not None and (event_type is None or event_type.lower() not in wanted_types):
+                continue
+            if wanted_locations is not None and (location is None or location.lower() not in wanted_locations):
+                continue
+            for key, scores in ((event_type, activity), (location, venue)):
+                key = key.strip() if key else None
+                if key:
+                    acc = scores.setdefault(key, [0, 0.0])
+                    acc[0] += count
+                    acc[1] += total
+        return {
+            "activity_scores": {k: total / count for k, (count, total) in activity.items()},
+            "venue_scores": {k: total / count for k, (count, total) in venue.items()},
+        }
@@ -0,0 +1,250 @@
+"""Dictionary compression for the large text columns (events.page_content, reviews.review_text).
+
+Rows of a column share one trained dictionary stored in the same database
+(text_dictionaries table), so even short blocks compress well: the
+repeated brochure boilerplate lives in the dictionary instead of in every
+row. zstd is used when the `zstandard` package is installed, otherwise
+zlib with a preset dictionary.
+"""
+
+import os
+import sqlite3
+import threading
+import zlib
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional; zlib is always available
+    zstandard = None
+
+COMPRESSION_METHODS = ("auto", "zstd", "zlib")
+# zlib can only reference the last 32 KB, so its dictionaries are capped there
+DICTIONARY_BYTES = {"zstd": 64 * 1024, "zlib": 32 * 1024}
+# Rows sampled when training a dictionary
+TRAINING_SAMPLES = 5000
+
+
+def resolve_method(method: str) -> str:
+    """
+    Map a compression setting to a concrete method.
+
+    Args:
+        method: 'auto', 'zstd' or 'zlib'
+
+    Returns:
+        'zstd' or 'zlib' ('auto' picks zstd when zstandard is installed)
+    """
+    if method not in COMPRESSION_METHODS:
+        raise ValueError(f"Unknown text compression {method!r}; expected one of {COMPRESSION_METHODS}")
+    if method == "auto":
+        return "zstd" if zstandard is not None else "zlib"
+    if method == "zstd" and zstandard is None:
+        raise ValueError("zstd text compression requires the zstandard package")
+    return method
+
+
+def _frequent_lines_dictionary(samples: Sequence[str], size: int) -> bytes:
+    """Raw-content dictionary of lines repeated across samples, most frequent last."""
+    counts = Counter(line for text in samples for line in set(text.splitlines()) if line.strip())
+    repeated = [line for line, count in sorted(counts.items(), key=lambda item: (item[1], item[0])) if count > 1]
+    return "\n".join(repeated).encode("utf-8")[-size:]
+
+
+def train_dictionary(samples: Sequence[str], method: str) -> bytes:
+    """
+    Train a shared dictionary from sample texts.
+
+    Args:
+        samples: Column values to learn from
+        method: 'zstd' or 'zlib'
+
+    Returns:
+        Dictionary bytes (zstd dictionary, or raw content for zlib / small samples)
+    """
+    size = DICTIONARY_BYTES[method]
+    if method == "zstd":
+        try:
+            return zstandard.train_dictionary(size, [s.encode("utf-8") for s in samples if s]).as_bytes()
+        except zstandard.ZstdError:
+            pass  # too few samples to train; use raw content instead
+    return _frequent_lines_dictionary(samples, size)
+
+
+class TextCodec:
+    """Compress / decompress text with one shared dictionary."""
+
+    def __init__(self, method: str, dictionary: bytes = b"", level: Optional[int] = None):
+        """
+        Args:
+            method: 'zstd' or 'zlib'
+            dictionary: Dictionary bytes from train_dictionary()
+            level: Compression level (default: 6 for zstd, 9 for zlib)
+        """
+        self.method = resolve_method(method)
+        self.dictionary = dictionary
+        self.level = level if level is not None else (6 if self.method == "zstd" else 9)
+        # zstandard (de)compressors must not be shared between threads
+        self._local = threading.local()
+        if self.method == "zstd":
+            self._zstd_dict = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+
+    def _compressor(self):
+        if not hasattr(self._local, "compressor"):
+            self._local.compressor = zstandard.ZstdCompressor(
+                level=self.level, dict_data=self._zstd_dict, write_content_size=True
+            )
+        return self._local.compressor
+
+    def _decompressor(self):
+        if not hasattr(self._local, "decompressor"):
+            self._local.decompressor = zstandard.ZstdDecompressor(dict_data=self._zstd_dict)
+        return self._local.decompressor
+
+    def compress(self, text: str) -> bytes:
+        data = text.encode("utf-8")
+        if self.method == "zstd":
+            return self._compressor().compress(data)
+        if self.dictionary:
+            c = zlib.compressobj(self.level, zlib.DEFLATED, -15, zdict=self.dictionary)
+        else:
+            c = zlib.compressobj(self.level, zlib.DEFLATED, -15)
+        return c.compress(data) + c.flush()
+
+    def decompress(self, blob: bytes) -> str:
+        if self.method == "zstd":
+            return self._decompressor().decompress(blob).decode("utf-8")
+        if self.dictionary:
+            d = zlib.decompressobj(-15, zdict=self.dictionary)
+        else:
+            d = zlib.decompressobj(-15)
+        return (d.decompress(blob) + d.flush()).decode("utf-8")
+
+
+def init_text_dictionaries_table(conn: sqlite3.Connection) -> None:
+    """Create the text_dictionaries table if missing."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS text_dictionaries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            method TEXT NOT NULL,
+            dictionary BLOB NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def add_compressed_columns(conn: sqlite3.Connection, table: str, column: str) -> None:
+    """
+    Add `<column>_z` (compressed BLOB) and text_dict_id to an existing table if missing.
+
+    Compressed rows keep '' in the plain column, so the NOT NULL schema and
+    uncompressed rows stay valid.
+    """
+    existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    if f"{column}_z" not in existing:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column}_z BLOB")
+    if "text_dict_id" not in existing:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN text_dict_id INTEGER")
+
+
+class TextDictionaries:
+    """Dictionaries stored in one database, with their codecs cached."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._codecs: Dict[int, TextCodec] = {}
+        self._lock = threading.Lock()
+
+    def get(self, dict_id: int) -> TextCodec:
+        """Codec of a stored dictionary."""
+        codec = self._codecs.get(dict_id)
+        if codec is None:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                codec = self._load(conn, dict_id)
+            finally:
+                conn.close()
+        return codec
+
+    def current(self, conn: sqlite3.Connection, method: str, samples: Sequence[str]) -> Tuple[int, TextCodec]:
+        """
+        Latest dictionary of a method, training and storing one from samples if there is none.
+
+        Args:
+            conn: Open connection (the new dictionary commits with the caller's rows)
+            method: 'zstd' or 'zlib'
+            samples: Texts to train on when no dictionary exists yet
+
+        Returns:
+            (dictionary id, codec)
+        """
+        init_text_dictionaries_table(conn)
+        row = conn.execute(
+            "SELECT id FROM text_dictionaries WHERE method = ? ORDER BY id DESC LIMIT 1", (method,)
+        ).fetchone()
+        if row is not None:
+            return row[0], self._codecs.get(row[0]) or self._load(conn, row[0])
+        codec = TextCodec(method, train_dictionary(list(samples)[:TRAINING_SAMPLES], method))
+        dict_id = conn.execute(
+            "INSERT INTO text_dictionaries (method, dictionary) VALUES (?, ?)", (method, codec.dictionary)
+        ).lastrowid
+        with self._lock:
+            self._codecs[dict_id] = codec
+        return dict_id, codec
+
+    def _load(self, conn: sqlite3.Connection, dict_id: int) -> TextCodec:
+        method, dictionary = conn.execute(
+            "SELECT method, dictionary FROM text_dictionaries WHERE id = ?", (dict_id,)
+        ).fetchone()
+        with self._lock:
+            return self._codecs.setdefault(dict_id, TextCodec(method, dictionary))
+
+    def decode(self, text: Optional[str], blob: Optional[bytes], dict_id: Optional[int]) -> str:
+        """Plain column value, decompressing the blob if the row is compressed."""
+        if blob is None:
+            return text
+        return self.get(dict_id).decompress(blob)
+
+    def compress_rows(
+        self, conn: sqlite3.Connection, method: str, texts: List[str]
+    ) -> List[Tuple[str, bytes, int]]:
+        """(plain value, blob, dictionary id) triples for compressed storage."""
+        dict_id, codec = self.current(conn, method, texts)
+        return [("", codec.compress(text), dict_id) for text in texts]
+
+
+def compress_column_in_place(
+    db_path: str, table: str, column: str, dictionaries: TextDictionaries, method: str,
+    where: str = "1=1",
+) -> Dict[str, int]:
+    """
+    Compress every plain-text row of `table.column` and VACUUM the file.
+
+    Args:
+        db_path: SQLite database file
+        table: Table name ('events' or 'reviews')
+        column: Text column ('page_content' or 'review_text')
+        dictionaries: TextDictionaries of the database
+        method: 'zstd' or 'zlib'
+        where: Extra SQL condition on the rows to compress
+
+    Returns:
+        Dictionary with 'rows' compressed and file 'bytes_before' / 'bytes_after'
+    """
+    bytes_before = os.path.getsize(db_path)
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            rows = conn.execute(f"SELECT id, {column} FROM {table} WHERE {column}_z IS NULL AND ({where})").fetchall()
+            if rows:
+                compressed = dictionaries.compress_rows(conn, method, [row[1] for row in rows])
+                conn.executemany(
+                    f"UPDATE {table} SET {column} = ?, {column}_z = ?, text_dict_id = ? WHERE id = ?",
+                    [values + (row[0],) for row, values in zip(rows, compressed)],
+                )
+        if rows:
+            conn.execute("VACUUM")
+    finally:
+        conn.close()
+    return {"rows": len(rows), "bytes_before": bytes_before, "bytes_after": os.path.getsize(db_path)}
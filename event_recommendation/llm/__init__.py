@@ -0,0 +1,21 @@
+"""Unified LLM client interface used by chat and ingestion."""
+
+from .client import (
+    LLMClient,
+    LLMCallRecord,
+    RetryPolicy,
+    GroqLLMClient,
+    OllamaLLMClient,
+    FakeLLMClient,
+    as_llm_client,
+)
+
+__all__ = [
+    "LLMClient",
+    "LLMCallRecord",
+    "RetryPolicy",
+    "GroqLLMClient",
+    "OllamaLLMClient",
+    "FakeLLMClient",
+    "as_llm_client",
+]
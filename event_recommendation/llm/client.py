@@ -0,0 +1,297 @@
+"""LLM client abstraction with sync/async calls, concurrency limits, retries and timing hooks."""
+
+import os
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import groq
+import ollama
+from tenacity import (
+    Retrying,
+    stop_after_attempt,
+    wait_exponential,
+    retry_if_exception,
+)
+
+# (system_prompt, user_prompt)
+Prompt = Tuple[str, str]
+
+DEFAULT_GROQ_MODEL = "openai/gpt-oss-120b"
+DEFAULT_OLLAMA_MODEL = "llama3.2:latest"
+DEFAULT_OLLAMA_HOST = "http://localhost:11434"
+
+DEFAULT_RETRY_EXCEPTIONS: Tuple[type, ...] = (
+    groq.RateLimitError,          # Rate limit exceeded
+    groq.APIConnectionError,       # Connection issues
+    groq.APITimeoutError,          # Request timeout
+    groq.InternalServerError,      # Server errors (5xx)
+    ConnectionError,               # Python connection errors
+    TimeoutError,                  # Python timeout errors
+)
+
+# A local Ollama server that refuses connections is not coming back between
+# attempts, so only error responses from a running server are retried, and
+# of those only transient ones (see is_transient_ollama_error).
+OLLAMA_RETRY_EXCEPTIONS: Tuple[type, ...] = (ollama.ResponseError,)
+
+
+def is_transient_ollama_error(exc: BaseException) -> bool:
+    """True for Ollama responses worth retrying: 429 and 5xx (not e.g. 404 model not found)."""
+    status = getattr(exc, "status_code", -1)
+    return status == 429 or status >= 500
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential-backoff retry settings applied to every LLM call."""
+    max_attempts: int = 3
+    min_wait: float = 2
+    max_wait: float = 10
+    retry_on: Tuple[type, ...] = DEFAULT_RETRY_EXCEPTIONS
+    # Optional extra check on a retry_on exception (e.g. its status code)
+    retry_if: Optional[Callable[[BaseException], bool]] = None
+
+    def should_retry(self, exc: BaseException) -> bool:
+        """True if an exception is retried under this policy."""
+        return isinstance(exc, self.retry_on) and (self.retry_if is None or self.retry_if(exc))
+
+
+@dataclass
+class LLMCallRecord:
+    """Timing record passed to hooks after every call (including failed ones)."""
+    backend: str
+    model: str
+    seconds: float
+    attempts: int
+    ok: bool
+    prompt_chars: int
+    response_chars: int
+
+
+class LLMClient:
+    """
+    Backend-independent LLM client.
+
+    Subclasses implement _complete() for a single chat call. This class adds:
+    - retries per RetryPolicy (backoff waits do not hold a concurrency slot)
+    - a concurrency limit shared by sync, threaded and async callers
+    - batch helpers (complete_many / acomplete_many) that preserve input order
+    - timing hooks and aggregate stats
+    """
+
+    backend = "base"
+
+    def __init__(
+        self,
+        model: str,
+        max_concurrency: int = 4,
+        retry_policy: Optional[RetryPolicy] = None,
+        hooks: Optional[List[Callable[[LLMCallRecord], None]]] = None,
+    ):
+        self.model = model
+        self.max_concurrency = max(1, max_concurrency)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.hooks: List[Callable[[LLMCallRecord], None]] = list(hooks or [])
+        self.stats: Dict[str, float] = {"calls": 0, "errors": 0, "retries": 0, "seconds": 0.0}
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._stats_lock = threading.Lock()
+
+    def add_hook(self, hook: Callable[[LLMCallRecord], None]) -> None:
+        """Register a callable invoked with an LLMCallRecord after each call."""
+        self.hooks.append(hook)
+
+    def _complete(self, system_prompt: str, user_prompt: str, model: str) -> str:
+        raise NotImplementedError
+
+    def _record(self, record: LLMCallRecord) -> None:
+        with self._stats_lock:
+            self.stats["calls"] += 1
+            self.stats["retries"] += record.attempts - 1
+            self.stats["seconds"] += record.seconds
+            if not record.ok:
+                self.stats["errors"] += 1
+        for hook in self.hooks:
+            hook(record)
+
+    def complete(self, system_prompt: str, user_prompt: str, model: Optional[str] = None) -> str:
+        """
+        Run one chat call and return the raw response text.
+        
+        Args:
+            system_prompt: System prompt for the LLM
+            user_prompt: User prompt for the LLM
+            model: Optional model override (defaults to the client's model)
+            
+        Returns:
+            Raw text response from LLM
+            
+        Raises:
+            The backend's exception once retries are exhausted (or immediately
+            for exceptions not listed in the retry policy)
+        """
+        model = model or self.model
+        policy = self.retry_policy
+        attempts = 0
+        text = ""
+        ok = False
+        start = time.perf_counter()
+        try:
+            for attempt in Retrying(
+                stop=stop_after_attempt(policy.max_attempts),
+                wait=wait_exponential(multiplier=1, min=policy.min_wait, max=policy.max_wait),
+                retry=retry_if_exception(policy.should_retry),
+                reraise=True,
+            ):
+                with attempt:
+                    attempts += 1
+                    with self._slots:
+                        text = self._complete(system_prompt, user_prompt, model)
+            ok = True
+            return text
+        finally:
+            self._record(LLMCallRecord(
+                backend=self.backend,
+                model=model,
+                seconds=time.perf_counter() - start,
+                attempts=attempts,
+                ok=ok,
+                prompt_chars=len(system_prompt) + len(user_prompt),
+                response_chars=len(text or ""),
+            ))
+
+    def complete_many(self, prompts: Sequence[Prompt], model: Optional[str] = None) -> List[str]:
+        """Run several calls concurrently (up to max_concurrency); results keep input order."""
+        if len(prompts) <= 1 or self.max_concurrency == 1:
+            return [self.complete(system, user, model) for system, user in prompts]
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            return list(pool.map(lambda p: self.complete(p[0], p[1], model), prompts))
+
+    async def acomplete(self, system_prompt: str, user_prompt: str, model: Optional[str] = None) -> str:
+        """Async variant of complete(); runs the blocking call in a worker thread."""
+        return await asyncio.to_thread(self.complete, system_prompt, user_prompt, model)
+
+    async def acomplete_many(self, prompts: Sequence[Prompt], model: Optional[str] = None) -> List[str]:
+        """Async variant of complete_many()."""
+        return list(await asyncio.gather(*(self.acomplete(s, u, model) for s, u in prompts)))
+
+
+class GroqLLMClient(LLMClient):
+    """Groq chat-completions backend."""
+
+    backend = "groq"
+
+    def __init__(
+        self,
+        client: Optional[groq.Groq] = None,
+        model: str = DEFAULT_GROQ_MODEL,
+        temperature: float = 0,
+        **kwargs: Any,
+    ):
+        super().__init__(model=model, **kwargs)
+        # Initialize Groq client if not provided
+        self.client = client or groq.Groq(api_key=os.getenv("GROQ_API_KEY"))
+        self.temperature = temperature
+
+    def _complete(self, system_prompt: str, user_prompt: str, model: str) -> str:
+        resp = self.client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=self.temperature,
+        )
+        return resp.choices[0].message.content
+
+
+class OllamaLLMClient(LLMClient):
+    """Ollama /api/chat backend."""
+
+    backend = "ollama"
+
+    def __init__(
+        self,
+        client: Optional[ollama.Client] = None,
+        model: str = DEFAULT_OLLAMA_MODEL,
+        **kwargs: Any,
+    ):
+        kwargs.setdefault(
+            "retry_policy", RetryPolicy(retry_on=OLLAMA_RETRY_EXCEPTIONS, retry_if=is_transient_ollama_error)
+        )
+        super().__init__(model=model, **kwargs)
+        self.client = client or ollama.Client(host=DEFAULT_OLLAMA_HOST)
+
+    def _complete(self, system_prompt: str, user_prompt: str, model: str) -> str:
+        response = self.client.chat(
+            model=model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+        )
+        return response["message"]["content"]
+
+
+class FakeLLMClient(LLMClient):
+    """
+    In-process backend for tests and offline benchmarks.
+
+    responder is either a fixed response string or a callable
+    (system_prompt, user_prompt) -> str. Every call is appended to self.calls.
+    """
+
+    backend = "fake"
+
+    def __init__(
+        self,
+        responder: Union[str, Callable[[str, str], str]] = "{}",
+        model: str = "fake",
+        latency: float = 0.0,
+        **kwargs: Any,
+    ):
+        kwargs.setdefault("retry_policy", RetryPolicy(min_wait=0, max_wait=0))
+        super().__init__(model=model, **kwargs)
+        self.responder = responder
+        self.latency = latency
+        self.calls: List[Prompt] = []
+        self._calls_lock = threading.Lock()
+
+    def _complete(self, system_prompt: str, user_prompt: str, model: str) -> str:
+        with self._calls_lock:
+            self.calls.append((system_prompt, user_prompt))
+        if self.latency:
+            time.sleep(self.latency)
+        if callable(self.responder):
+            return self.responder(system_prompt, user_prompt)
+        return self.responder
+
+
+def as_llm_client(client: Any = None, model: Optional[str] = None, **kwargs: Any) -> LLMClient:
+    """
+    Wrap a raw groq.Groq / ollama.Client (or pass through an LLMClient).
+    
+    Args:
+        client: LLMClient, groq.Groq, ollama.Client, or None (Groq from GROQ_API_KEY)
+        model: Default model for a newly wrapped client
+        **kwargs: Extra LLMClient options (max_concurrency, retry_policy, hooks)
+        
+    Returns:
+        LLMClient instance
+        
+    Raises:
+        ValueError: If client is not a recognized type
+    """
+    if isinstance(client, LLMClient):
+        return client
+    if client is None or isinstance(client, groq.Groq):
+        return GroqLLMClient(client, model=model or DEFAULT_GROQ_MODEL, **kwargs)
+    if isinstance(client, ollama.Client):
+        return OllamaLLMClient(client, model=model or DEFAULT_OLLAMA_MODEL, **kwargs)
+    raise ValueError(
+        f"Unsupported LLM client type: {type(client).__name__}. "
+        "Expected LLMClient, groq.Groq or ollama.Client"
+    )
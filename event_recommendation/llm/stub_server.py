@@ -0,0 +1,358 @@
+"""Local stub LLM server speaking the Groq/OpenAI chat-completions and Ollama /api/chat shapes.
+
+Used to run chat and ingestion benchmarks offline and reproducibly:
+
+    python -m llm.stub_server --port 8089 --latency lognormal --latency-ms 300 --rate-limit 0.05
+
+    GROQ_BASE_URL=http://127.0.0.1:8089 GROQ_API_KEY=stub python main.py
+    ollama.Client(host="http://127.0.0.1:8089")
+"""
+
+import re
+import json
+import math
+import time
+import random
+import argparse
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+import groq
+import ollama
+
+OPENAI_CHAT_PATHS = ("/openai/v1/chat/completions", "/v1/chat/completions")
+OLLAMA_CHAT_PATH = "/api/chat"
+
+_REVIEW_ID_RE = re.compile(r"^Review (R\d+):\n(.*?)(?=\n\nReview R\d+:|\n\nReturn |\Z)", re.MULTILINE | re.DOTALL)
+_SINGLE_REVIEW_RE = re.compile(r'Extract metadata from this review text:\s*"(.*?)"\s*\n', re.DOTALL)
+_CAPS_PHRASE_RE = re.compile(r"\b([A-Z]{2,}(?:(?:\s*[/&+]\s*|\s+)[A-Z]{2,})*)\b")
+_VENUE_RE = re.compile(r"\b((?:[A-Z][a-z]+\s+){1,3}(?:YMCA|Library|Center))\b")
+_NEW_MESSAGE_RE = re.compile(r'New user message:\s*"(.*?)"', re.DOTALL)
+_PROFILE_INTERESTS = ("aquatics", "athletics", "dancing", "cooking", "drawing")
+_PROFILE_TIME_PREFS = ("mornings", "afternoons", "evenings", "weekends")
+_POSITIVE_WORDS = ("great", "loved", "love", "excellent", "amazing", "fun", "5 stars")
+_NEGATIVE_WORDS = ("rough", "bad", "crowded", "disappoint", "needs improvement", "late")
+
+CANNED_ANSWER = (
+    "Based on your profile, here are two activities that fit well:\n\n"
+    "1. **AQUA FIT** (moderate intensity, 45 minutes, 2-3 times per week) - low impact and social.\n"
+    "2. **BEGINNER COOKING** (low intensity, 60 minutes, once a week) - relaxed and hands-on.\n\n"
+    "[stub | AQUA FIT]"
+)
+
+
+@dataclass
+class StubConfig:
+    """
+    Stub server behaviour.
+
+    latency: "fixed", "uniform" (latency_ms +/- latency_jitter_ms) or
+        "lognormal" (median latency_ms, shape latency_sigma)
+    tokens_per_second: simulated decode speed; adds completion_tokens / tps
+        to each response (0 disables)
+    rate_limit_probability: chance of answering any request with a 429
+    requests_per_second: token-bucket limit; requests over it get a 429 (0 disables)
+    seed: RNG seed, so latency and 429 sequences are reproducible
+    """
+    latency: str = "fixed"
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    latency_sigma: float = 0.5
+    tokens_per_second: float = 0.0
+    rate_limit_probability: float = 0.0
+    requests_per_second: float = 0.0
+    seed: int = 0
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _review_metadata(review_text: str) -> Dict[str, Optional[str]]:
+    """Cheap, deterministic stand-in for LLM review metadata extraction."""
+    event = _CAPS_PHRASE_RE.search(review_text)
+    venue = _VENUE_RE.search(review_text)
+    lowered = review_text.lower()
+    if any(word in lowered for word in _NEGATIVE_WORDS):
+        sentiment = "negative"
+    elif any(word in lowered for word in _POSITIVE_WORDS):
+        sentiment = "positive"
+    else:
+        sentiment = "neutral"
+    return {
+        "event_type": event.group(1) if event else None,
+        "location": venue.group(1) if venue else None,
+        "sentiment": sentiment,
+    }
+
+
+def _profile(user_prompt: str) -> Dict[str, Any]:
+    match = _NEW_MESSAGE_RE.search(user_prompt)
+    message = (match.group(1) if match else user_prompt).lower()
+    return {
+        "location": None,
+        "age_focus": "seniors" if "senior" in message else ("kids" if "kid" in message else None),
+        "interests": [i for i in _PROFILE_INTERESTS if i[:-1] in message or i in message],
+        "time_prefs": [t for t in _PROFILE_TIME_PREFS if t[:-1] in message],
+        "city": None,
+        "state": None,
+        "budget_sensitivity": None,
+    }
+
+
+def canned_response(system_prompt: str, user_prompt: str) -> str:
+    """
+    Build a deterministic response for the prompts this repo sends.
+
+    Batched review prompts get a JSON array echoing every review ID,
+    single-review prompts a JSON object, profile prompts a profile JSON
+    object and anything else a fixed recommendation answer.
+    """
+    batch = _REVIEW_ID_RE.findall(user_prompt)
+    if batch:
+        return json.dumps([
+            {"id": review_id, **_review_metadata(text)} for review_id, text in batch
+        ])
+    single = _SINGLE_REVIEW_RE.search(user_prompt)
+    if single:
+        return json.dumps(_review_metadata(single.group(1)))
+    if "profile extraction" in system_prompt.lower():
+        return json.dumps(_profile(user_prompt))
+    return CANNED_ANSWER
+
+
+def _split_messages(messages: List[Dict[str, Any]]) -> Tuple[str, str]:
+    system = "\n".join(m.get("content", "") for m in messages if m.get("role") == "system")
+    user = "\n".join(m.get("content", "") for m in messages if m.get("role") != "system")
+    return system, user
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server_version = "StubLLM/1.0"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Keep benchmark output clean
+        pass
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            self._send_json(200, self.server.stub.snapshot_stats())
+        else:
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        stub: StubLLMServer = self.server.stub
+        openai_shape = self.path in OPENAI_CHAT_PATHS
+        if not openai_shape and self.path != OLLAMA_CHAT_PATH:
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": "invalid JSON body"})
+            return
+
+        if stub.should_rate_limit():
+            message = "Rate limit reached (stub server)"
+            error = (
+                {"error": {"message": message, "type": "tokens", "code": "rate_limit_exceeded"}}
+                if openai_shape else {"error": message}
+            )
+            self._send_json(429, error, headers={"retry-after": "0"})
+            return
+
+        model = request.get("model", "stub")
+        system_prompt, user_prompt = _split_messages(request.get("messages") or [])
+        content = canned_response(system_prompt, user_prompt)
+        prompt_tokens = _estimate_tokens(system_prompt + user_prompt)
+        completion_tokens = _estimate_tokens(content)
+        seconds = stub.response_delay(completion_tokens)
+        time.sleep(seconds)
+        stub.record(prompt_tokens, completion_tokens)
+
+        if openai_shape:
+            self._send_json(200, {
+                "id": f"chatcmpl-stub-{stub.stats['requests']}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            })
+        else:
+            self._send_json(200, {
+                "model": model,
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "message": {"role": "assistant", "content": content},
+                "done": True,
+                "done_reason": "stop",
+                "total_duration": int(seconds * 1e9),
+                "prompt_eval_count": prompt_tokens,
+                "eval_count": completion_tokens,
+            })
+
+
+class StubLLMServer:
+    """
+    Threaded stub server; use as a context manager in tests and benchmarks.
+
+        with StubLLMServer(StubConfig(latency_ms=50)) as server:
+            client = GroqLLMClient(server.groq_client())
+    """
+
+    def __init__(self, config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StubConfig()
+        self._httpd = ThreadingHTTPServer((host, port), _StubHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        self._bucket = self.config.requests_per_second
+        self._bucket_time = time.monotonic()
+        self.stats: Dict[str, int] = {
+            "requests": 0, "rate_limited": 0, "prompt_tokens": 0, "completion_tokens": 0,
+        }
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def groq_client(self) -> groq.Groq:
+        """Groq SDK client pointed at the stub (SDK retries off; LLMClient retries instead)."""
+        return groq.Groq(base_url=self.url, api_key="stub", max_retries=0)
+
+    def ollama_client(self) -> ollama.Client:
+        """Ollama SDK client pointed at the stub."""
+        return ollama.Client(host=self.url)
+
+    def start(self) -> "StubLLMServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            # shutdown() blocks until serve_forever() exits, so only call it when serving
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def should_rate_limit(self) -> bool:
+        """Decide whether the next request gets a 429 (random injection, then token bucket)."""
+        config = self.config
+        with self._lock:
+            limited = config.rate_limit_probability > 0 and self._rng.random() < config.rate_limit_probability
+            if not limited and config.requests_per_second > 0:
+                now = time.monotonic()
+                self._bucket = min(
+                    config.requests_per_second,
+                    self._bucket + (now - self._bucket_time) * config.requests_per_second,
+                )
+                self._bucket_time = now
+                if self._bucket >= 1:
+                    self._bucket -= 1
+                else:
+                    limited = True
+            if limited:
+                self.stats["requests"] += 1
+                self.stats["rate_limited"] += 1
+            return limited
+
+    def response_delay(self, completion_tokens: int) -> float:
+        """Sample the response delay in seconds (latency plus simulated decode time)."""
+        config = self.config
+        with self._lock:
+            if config.latency == "uniform":
+                ms = self._rng.uniform(
+                    config.latency_ms - config.latency_jitter_ms, config.latency_ms + config.latency_jitter_ms
+                )
+            elif config.latency == "lognormal":
+                ms = config.latency_ms * math.exp(self._rng.gauss(0.0, config.latency_sigma)) if config.latency_ms else 0.0
+            else:
+                ms = config.latency_ms
+        seconds = max(0.0, ms) / 1000
+        if config.tokens_per_second > 0:
+            seconds += completion_tokens / config.tokens_per_second
+        return seconds
+
+    def record(self, prompt_tokens: int, completion_tokens: int) -> None:
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["prompt_tokens"] += prompt_tokens
+            self.stats["completion_tokens"] += completion_tokens
+
+    def snapshot_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local Groq/Ollama-compatible stub LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default="fixed")
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="Fixed/mean/median latency (default: 200)")
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0, help="Half-width for --latency uniform")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Shape for --latency lognormal")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="Simulated decode speed (0 disables)")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Probability of a 429 per request")
+    parser.add_argument("--rps", type=float, default=0.0, help="Token-bucket requests/sec limit (0 disables)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        latency_sigma=args.latency_sigma,
+        tokens_per_second=args.tokens_per_second,
+        rate_limit_probability=args.rate_limit,
+        requests_per_second=args.rps,
+        seed=args.seed,
+    )
+    server = StubLLMServer(config, host=args.host, port=args.port)
+    print(f"Stub LLM server listening on {server.url}")
+    print(f"  Groq:   GROQ_BASE_URL={server.url} GROQ_API_KEY=stub")
+    print(f"  Ollama: ollama.Client(host=\"{server.url}\")")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nStats: {server.snapshot_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,28 @@
 import os
 import groq
 from dotenv import load_dotenv
+from langchain_openai import OpenAIEmbeddings
 
 # Load environment variables
 load_dotenv()
 
 from rag.input_documents.loader import load_documents
+from rag.parse_cache import ParseCache, parse_activity_types
+from rag.query_cache import (
+    CachedQueryEmbeddings,
+    QueryEmbeddingCache,
+    cache_query_embeddings,
+    embeddings_model_name,
+)
+from rag.event_index import build_event_index
+from rag.serving import serving_stores, snapshot_is_servable
+from database.activity_db import ActivityTypeDB
+from database.review_db import ReviewDB
+from database.snapshot import chroma_embeddings, open_snapshot, write_snapshot
+from rag.watcher import watch_documents
 from vector_db.chroma_store import build_vectorstores, load_vectorstores
 from chat_ui.chat_interface import launch_chat_interface
+from llm import GroqLLMClient
 
 
 def main():
@@ -17,9 +32,9 @@ def main():
     # Load environment variables
     load_dotenv()
     
-    # Initialize Groq client and model
-    groq_client = groq.Groq(api_key=os.getenv("GROQ_API_KEY"))
+    # Initialize Groq client and model (shared by ingestion and chat)
     model = "openai/gpt-oss-120b"
+    groq_client = GroqLLMClient(groq.Groq(api_key=os.getenv("GROQ_API_KEY")), model=model)
     
     print("GROQ_API_KEY set:", bool(os.getenv("GROQ_API_KEY")))
     print("OPENAI_API_KEY set:", bool(os.getenv("OPENAI_API_KEY")))
@@ -35,8 +50,27 @@ def main():
     persist_dir = os.path.join(project_root, "rag_chroma")
     db_path = os.path.join(project_root, "events.db")
     reviews_db_path = os.path.join(project_root, "reviews.db")
+    snapshot_path = os.path.join(project_root, "serving.snapshot")
     reviews_csv_path = os.path.join(project_root, "documents", "Reviews", "reviews_rag_2000.csv")
 
+    query_cache = QueryEmbeddingCache(os.path.join(project_root, "query_cache.db"))
+    watch = os.getenv("WATCH_DOCUMENTS", "").lower() in ("1", "true", "yes")
+    quantize = os.getenv("VECTOR_QUANTIZATION", "").lower() == "int8"
+
+    # Fast path: a current snapshot answers everything the chat needs, so
+    # skip Chroma, the catalog setup and the event index build. Anything
+    # that changes the databases makes the snapshot stale and takes the
+    # full path below (TEXT_COMPRESSION is applied on that next full start)
+    reviews_source = reviews_db_path if os.path.exists(reviews_db_path) else None
+    snapshot = None if watch else open_snapshot(snapshot_path, db_path, reviews_source)
+    if snapshot_is_servable(snapshot, db_path, quantize):
+        print("Serving from the current snapshot...")
+        embeddings = CachedQueryEmbeddings(OpenAIEmbeddings(model=snapshot.embedding_model), query_cache)
+        stores = serving_stores(snapshot, db_path, ReviewDB(reviews_source) if reviews_source else None, embeddings)
+        print("Launching chat interface...")
+        launch_chat_interface(stores, groq_client=groq_client, model=model)
+        return
+
     # Load documents
     print("Loading documents...")
     events_files, activity_files = load_documents(documents_path)
@@ -61,6 +95,52 @@ def main():
             reviews_db_path=reviews_db_path
         )
 
+    # Repeated retrieval queries skip the embedding call
+    cache_query_embeddings(stores.activity_types, query_cache)
+
+    # Activity type catalog and its interest routing table next to the
+    # events table (populated once)
+    parse_cache = ParseCache(os.path.join(project_root, "parse_cache.db"))
+    activity_catalog = ActivityTypeDB(db_path)
+    if activity_catalog.count_activity_types() == 0:
+        activity_catalog.replace_activity_types(parse_activity_types(activity_files, parse_cache).activity_records())
+    if activity_catalog.count_routes() == 0:
+        activity_catalog.rebuild_routes()
+
+    # Embed new event block bodies (each distinct body once) and refresh the
+    # memory-mapped vector and BM25 indexes that rank SQL event candidates by
+    # the question; VECTOR_QUANTIZATION=int8 scores from int8 codes instead
+    build_event_index(stores.events, stores.activity_types.embeddings.embed_documents, quantize=quantize)
+
+    # Optionally store page_content / review_text dictionary-compressed
+    # (TEXT_COMPRESSION=auto|zstd|zlib); already compressed rows are skipped
+    text_compression = os.getenv("TEXT_COMPRESSION", "").lower()
+    if text_compression:
+        stores.events.compress_text(text_compression)
+        if stores.reviews is not None:
+            stores.reviews.compress_text(text_compression)
+
+    # Optionally keep the stores in sync with documents/ while serving;
+    # otherwise (re)write the snapshot and serve from it like the fast path
+    if watch:
+        watch_documents(stores, documents_path, parse_cache)
+    else:
+        snapshot_sources = (db_path, reviews_db_path if stores.reviews is not None else None)
+        snapshot = open_snapshot(snapshot_path, *snapshot_sources)
+        if not snapshot_is_servable(snapshot, db_path, quantize):
+            write_snapshot(
+                snapshot_path,
+                stores.events,
+                stores.reviews,
+                activity_catalog,
+                chroma_embeddings(stores.activity_types, activity_catalog.get_activity_types()),
+                embeddings_model_name(stores.activity_types.embeddings),
+            )
+            snapshot = open_snapshot(snapshot_path, *snapshot_sources)
+        stores = serving_stores(
+            snapshot, db_path, stores.reviews, stores.activity_types.embeddings, stores.activity_types
+        )
+
     # Launch chat interface
     print("Launching chat interface...")
     launch_chat_interface(stores, groq_client=groq_client, model=model)
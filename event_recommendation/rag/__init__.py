@@ -2,7 +2,9 @@
 
 from .retrieval import (
     retrieve_activity_types,
+    route_activity_types,
     retrieve_events_for_activity_type,
+    load_event_contents,
     retrieve_reviews,
     answer_user,
     build_context_block,
@@ -10,11 +12,14 @@ from .retrieval import (
     rerank,
     get_review_scores,
     rerank_events_by_reviews,
+    get_activity_definitions,
 )
 
 __all__ = [
     "retrieve_activity_types",
+    "route_activity_types",
     "retrieve_events_for_activity_type",
+    "load_event_contents",
     "retrieve_reviews",
     "answer_user",
     "build_context_block",
@@ -22,5 +27,6 @@ __all__ = [
     "rerank",
     "get_review_scores",
     "rerank_events_by_reviews",
+    "get_activity_definitions",
 ]
 
@@ -2,7 +2,8 @@
 
 import re
 import os
-from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 
 from langchain_core.documents import Document
 from langchain_text_splitters import MarkdownHeaderTextSplitter
@@ -14,6 +15,7 @@ from utils.normalizers import (
 )
 from utils.extractors import extract_age_range, extract_age_groups, infer_intensity_from_text
 from database.event_db import EventRecord
+from database.activity_db import ActivityTypeRecord
 
 
 # Regex patterns for parsing
@@ -35,6 +37,38 @@ TYPE_RE = re.compile(r"^\*\*Type:\*\*\s*(.+?)\s*$", re.MULTILINE)
 PAGE_RE = re.compile(r"^#\s+PAGE\s+\d+\s+—\s+(.+?)\s*$", re.MULTILINE)
 _EVENT_BLOCK_RE = re.compile(r"(?m)^###\s+(.+?)\s*$")
 _INTENSITY_RE = re.compile(r"(?mi)^\s*\*\*Intensity:\*\*\s*(.+?)\s*$")
+# Activity type fields; Session/Frequency share the Intensity line, separated by '|'
+_ACTIVITY_FIELD_RE = {
+    "session_length": re.compile(r"(?i)\*\*Session:\*\*\s*([^|\n]*?)\s*(?:\||$)", re.MULTILINE),
+    "frequency": re.compile(r"(?i)\*\*Frequency:\*\*\s*([^|\n]*?)\s*(?:\||$)", re.MULTILINE),
+    "benefits": re.compile(r"(?i)\*\*Benefits:\*\*\s*([^|\n]*?)\s*(?:\||$)", re.MULTILINE),
+    "ailments": re.compile(r"(?i)\*\*Ailments:\*\*\s*([^|\n]*?)\s*(?:\||$)", re.MULTILINE),
+}
+
+# Line tokenizer equivalents of FIELD_RE: lower-cased bullet key -> EventBlock attribute
+_BULLET_FIELDS = {
+    "event type": "event_type_raw",
+    "category": "category",
+    "age tags": "age_tags",
+    "instructor": "instructor",
+    "facilitator": "instructor",
+    "date range": "date_range",
+    "time slots": "time_slots",
+    "duration": "duration",
+    "spots": "spots",
+}
+# Line tokenizer equivalents of LOCATION_RE / TYPE_RE
+_HEADER_FIELDS = (("**Location:**", "location"), ("**Type:**", "center_type"))
+
+
+class _AmbiguousLine(Exception):
+    """
+    A line the tokenizer cannot resolve on its own.
+
+    The regexes' whitespace matches run across newlines, so a recognized key
+    with an empty value (or a bare '-' / '###' line) takes its value from the
+    next line. Callers fall back to the regex parser to reproduce that exactly.
+    """
 
 
 def _safe_find(regex: re.Pattern, text: str) -> Optional[str]:
@@ -51,10 +85,20 @@ def _safe_find2(regex: re.Pattern, text: str) -> Optional[str]:
 
 def parse_center_metadata(md_text: str, source: str) -> Dict[str, Optional[str]]:
     """Parse center metadata from markdown text."""
-    center_name = _safe_find(CENTER_RE, md_text)
-    location = _safe_find(LOCATION_RE, md_text)
-    center_type = _safe_find(TYPE_RE, md_text)
+    return _center_metadata(
+        source,
+        center_name=_safe_find(CENTER_RE, md_text),
+        location=_safe_find(LOCATION_RE, md_text),
+        center_type=_safe_find(TYPE_RE, md_text),
+    )
+
 
+def _center_metadata(
+    source: str,
+    center_name: Optional[str],
+    location: Optional[str],
+    center_type: Optional[str],
+) -> Dict[str, Optional[str]]:
     city, state = None, None
     if location:
         # "Salem, Massachusetts" or "Plymouth, Massachusetts"
@@ -71,43 +115,375 @@ def parse_center_metadata(md_text: str, source: str) -> Dict[str, Optional[str]]
     }
 
 
-def split_event_blocks(md_text: str) -> List[Tuple[str, str]]:
+@dataclass
+class EventBlock:
     """
-    Returns list of (event_title, event_block_text).
-    Event blocks start with '### ' and continue until next '### ' or end.
+    One '### ...' event block, parsed once.
+
+    Chroma documents, SQL records and the legacy metadata dict are all
+    projections of this structure, so a brochure is scanned a single time.
     """
-    matches = list(EVENT_HEADING_RE.finditer(md_text))
-    blocks: List[Tuple[str, str]] = []
+    event_name: str
+    page_content: str
+    event_type_raw: Optional[str] = None  # "- Event Type:" value
+    category: Optional[str] = None  # "- Category:" value (older file style)
+    age_tags: Optional[str] = None
+    instructor: Optional[str] = None
+    date_range: Optional[str] = None
+    time_slots: Optional[str] = None
+    duration: Optional[str] = None
+    spots: Optional[str] = None
+    event_type: Optional[str] = None  # normalized event_type_raw
+    age_min: Optional[int] = None
+    age_max: Optional[int] = None
+    age_contains: Optional[str] = None  # comma-separated string like "kids, teens"
+    intensity: Optional[str] = None  # low/moderate/high
+
+
+@dataclass
+class ParsedBrochure:
+    """Center metadata plus parsed event blocks for one brochure file."""
+    source: str
+    center: Dict[str, Optional[str]]
+    blocks: List[EventBlock] = field(default_factory=list)
+
+    def documents(self) -> List[Document]:
+        """Project the blocks to Chroma event Documents."""
+        return [
+            event_block_to_document(block, self.source, self.center["city"], self.center["state"])
+            for block in self.blocks
+        ]
+
+    def records(self) -> List[EventRecord]:
+        """Project the blocks to EventRecords for the SQL database."""
+        return [
+            event_block_to_record(
+                block,
+                self.source,
+                city=self.center["city"],
+                state=self.center["state"],
+                center_name=self.center["center_name"],
+                center_type=self.center["center_type"],
+            )
+            for block in self.blocks
+        ]
+
+    def with_intensity_map(self, activity_intensity_map: Optional[Dict[str, str]]) -> "ParsedBrochure":
+        """
+        Re-apply an activity intensity map to a brochure parsed without one.
+
+        Blocks keep their text-inferred intensity where the map has no entry,
+        matching a parse that was given the map up front.
+        """
+        if not activity_intensity_map:
+            return self
+        blocks = [
+            replace(block, intensity=activity_intensity_map.get(block.event_type) or block.intensity)
+            if block.event_type else block
+            for block in self.blocks
+        ]
+        return ParsedBrochure(source=self.source, center=self.center, blocks=blocks)
+
+
+def _iter_event_spans(md_text: str) -> Iterator[Tuple[str, str]]:
+    """Yield (event_title, event_block_text) for each '### ' heading in one regex pass."""
+    matches = list(_EVENT_BLOCK_RE.finditer(md_text))
     for i, m in enumerate(matches):
-        title = m.group(1).strip()
         start = m.start()
         end = matches[i + 1].start() if i + 1 < len(matches) else len(md_text)
-        block = md_text[start:end].strip()
-        blocks.append((title, block))
-    return blocks
+        yield m.group(1).strip(), md_text[start:end].strip()
+
+
+def _bullet_field(line: str) -> Optional[Tuple[str, str]]:
+    """Return (EventBlock attribute, value) for a recognized '- Key: value' line."""
+    stripped = line.lstrip()
+    if stripped[:1] != "-":
+        return None
+    rest = stripped[1:].lstrip()
+    if not rest:
+        raise _AmbiguousLine(line)
+    colon = rest.find(":")
+    if colon <= 0:
+        return None
+    attr = _BULLET_FIELDS.get(rest[:colon].lower())
+    if attr is None:
+        return None
+    value = rest[colon + 1:].strip()
+    if not value:
+        raise _AmbiguousLine(line)
+    return attr, value
+
+
+def _scan_bullet_fields(lines: Iterable[str]) -> Dict[str, str]:
+    """Fill every bullet field from one sweep over the lines (first occurrence wins)."""
+    fields: Dict[str, str] = {}
+    for line in lines:
+        hit = _bullet_field(line)
+        if hit is not None and hit[0] not in fields:
+            fields[hit[0]] = hit[1]
+    return fields
+
+
+def _parse_event_fields_regex(event_title: str, block: str) -> EventBlock:
+    """Reference implementation: one FIELD_RE scan of the block per field."""
+    return EventBlock(
+        event_name=event_title,
+        page_content=block,
+        event_type_raw=_safe_find(FIELD_RE["event_type"], block),
+        category=_safe_find(FIELD_RE["category"], block),
+        age_tags=_safe_find(FIELD_RE["age_tags"], block),
+        instructor=_safe_find2(FIELD_RE["instructor"], block),
+        date_range=_safe_find(FIELD_RE["date_range"], block),
+        time_slots=_safe_find(FIELD_RE["time_slots"], block),
+        duration=_safe_find(FIELD_RE["duration"], block),
+        spots=_safe_find(FIELD_RE["spots"], block),
+    )
 
 
-def parse_event_metadata(event_title: str, block: str) -> Dict[str, Optional[str]]:
-    """Parse event metadata from event block."""
-    # Event Type may appear as "Event Type:" or "Category:" depending on file style
-    event_type = _safe_find(FIELD_RE["event_type"], block) or _safe_find(FIELD_RE["category"], block)
+def _parse_event_fields(event_title: str, block: str) -> EventBlock:
+    """Extract the bullet fields of a block (no normalization or age/intensity inference)."""
+    try:
+        fields = _scan_bullet_fields(block.split("\n"))
+    except _AmbiguousLine:
+        return _parse_event_fields_regex(event_title, block)
+    return EventBlock(event_name=event_title, page_content=block, **fields)
+
+
+def _tokenize_brochure(
+    md_text: str,
+) -> Tuple[Dict[str, str], List[Tuple[str, str, Dict[str, str]]]]:
+    """
+    Single sweep over brochure lines.
+
+    Recognizes the '## ' center heading, '**Location:**' / '**Type:**' lines,
+    '### ' event headings and '- Key: value' bullets in one pass.
+
+    Returns:
+        - header: center_name / location / center_type values found
+        - events: (event_title, event_block_text, bullet_fields) per block
+
+    Raises:
+        _AmbiguousLine: if a line needs the regex parser (see _AmbiguousLine)
+    """
+    header: Dict[str, str] = {}
+    spans: List[Tuple[str, int, Dict[str, str]]] = []
+    fields: Optional[Dict[str, str]] = None
+    offset = 0
+    for line in md_text.split("\n"):
+        first = line[:1]
+        if first == "#":
+            # A bare '###' / '##' is ambiguous too: \s+ would match the newline
+            if line.startswith("###"):
+                if line[3:4].isspace() or len(line) == 3:
+                    title = line[3:].strip()
+                    if not title:
+                        raise _AmbiguousLine(line)
+                    fields = {}
+                    spans.append((title, offset, fields))
+            elif line.startswith("##") and (line[2:3].isspace() or len(line) == 2) and "center_name" not in header:
+                name = line[2:].strip()
+                if not name:
+                    raise _AmbiguousLine(line)
+                header["center_name"] = name
+        elif first == "*":
+            for prefix, key in _HEADER_FIELDS:
+                if line.startswith(prefix):
+                    if key not in header:
+                        value = line[len(prefix):].strip()
+                        if not value:
+                            raise _AmbiguousLine(line)
+                        header[key] = value
+                    break
+        elif fields is not None:
+            hit = _bullet_field(line)
+            if hit is not None and hit[0] not in fields:
+                fields[hit[0]] = hit[1]
+        offset += len(line) + 1
+
+    events = []
+    for i, (title, start, block_fields) in enumerate(spans):
+        end = spans[i + 1][1] if i + 1 < len(spans) else len(md_text)
+        events.append((title, md_text[start:end].strip(), block_fields))
+    return header, events
+
+
+def parse_event_block(
+    event_title: str,
+    block: str,
+    activity_intensity_map: Optional[Dict[str, str]] = None,
+) -> EventBlock:
+    """
+    Parse one event block into the shared EventBlock intermediate.
+
+    Args:
+        event_title: Text of the '### ' heading
+        block: Full block text (heading included)
+        activity_intensity_map: Map of normalized event_type -> intensity
+
+    Returns:
+        EventBlock with bullet fields, normalized event type, ages and intensity
+    """
+    return _finish_event_block(_parse_event_fields(event_title, block), activity_intensity_map)
+
+
+def _finish_event_block(
+    parsed: EventBlock,
+    activity_intensity_map: Optional[Dict[str, str]] = None,
+) -> EventBlock:
+    """Fill the normalized event type, ages and intensity of a tokenized block."""
+    block = parsed.page_content
+    parsed.event_type = normalize_event_type(parsed.event_type_raw)
+
+    # Ages numeric + buckets (range computed once and reused for the buckets)
+    age_range = extract_age_range(block)
+    parsed.age_min, parsed.age_max = age_range
+    age_contains_list = extract_age_groups(block, age_range=age_range)
+    # Convert list to string for ChromaDB (which doesn't support list metadata)
+    parsed.age_contains = ", ".join(age_contains_list) if age_contains_list else None
+
+    # Intensity: prefer map from activityType docs (keyed by normalized event_type)
+    intensity = None
+    if activity_intensity_map and parsed.event_type:
+        intensity = activity_intensity_map.get(parsed.event_type)
+    if not intensity:
+        intensity = infer_intensity_from_text(block)
+    parsed.intensity = intensity
+    return parsed
+
+
+def parse_event_blocks(
+    md_text: str,
+    activity_intensity_map: Optional[Dict[str, str]] = None,
+) -> List[EventBlock]:
+    """Parse every event block of a brochure exactly once."""
+    return _parse_tokens(md_text, activity_intensity_map)[1]
+
+
+def _parse_tokens(
+    md_text: str,
+    activity_intensity_map: Optional[Dict[str, str]] = None,
+) -> Tuple[Optional[Dict[str, str]], List[EventBlock]]:
+    """Tokenize a brochure; header is None when the regex fallback was needed."""
+    try:
+        header, events = _tokenize_brochure(md_text)
+    except _AmbiguousLine:
+        blocks = [
+            parse_event_block(title, block, activity_intensity_map)
+            for title, block in _iter_event_spans(md_text)
+        ]
+        return None, blocks
+    blocks = [
+        _finish_event_block(EventBlock(event_name=title, page_content=block, **fields), activity_intensity_map)
+        for title, block, fields in events
+    ]
+    return header, blocks
+
+
+def parse_brochure(
+    md_text: str,
+    source: str,
+    activity_intensity_map: Optional[Dict[str, str]] = None,
+) -> ParsedBrochure:
+    """
+    Parse a brochure once into center metadata and event blocks.
+
+    Use ParsedBrochure.documents() and ParsedBrochure.records() to build the
+    Chroma documents and SQL records from the same parse.
+
+    Args:
+        md_text: Brochure markdown
+        source: Source file name stored on documents and records
+        activity_intensity_map: Map of normalized event_type -> intensity
+
+    Returns:
+        ParsedBrochure
+    """
+    header, blocks = _parse_tokens(md_text, activity_intensity_map)
+    if header is None:
+        center = parse_center_metadata(md_text, source)
+    else:
+        center = _center_metadata(
+            source, header.get("center_name"), header.get("location"), header.get("center_type")
+        )
+    return ParsedBrochure(source=source, center=center, blocks=blocks)
+
+
+def event_block_to_document(
+    block: EventBlock,
+    source: str,
+    city: Optional[str] = None,
+    state: Optional[str] = None,
+) -> Document:
+    """Project an EventBlock to a Chroma event Document."""
+    return Document(
+        page_content=block.page_content,
+        metadata={
+            "source": source,
+            "event_name": block.event_name,
+            "event_type": block.event_type,  # normalized (e.g., "AQUA ZUMBA")
+            "event_type_raw": block.event_type_raw,  # optional debugging
+            "age_min": block.age_min,
+            "age_max": block.age_max,
+            "city": city,
+            "state": state,
+            "age_contains": block.age_contains,  # comma-separated string
+            "intensity": block.intensity,  # low/moderate/high or None
+        },
+    )
+
+
+def event_block_to_record(
+    block: EventBlock,
+    source: str,
+    city: Optional[str] = None,
+    state: Optional[str] = None,
+    center_name: Optional[str] = None,
+    center_type: Optional[str] = None,
+) -> EventRecord:
+    """Project an EventBlock to an EventRecord for the SQL database."""
+    return EventRecord(
+        event_name=block.event_name,
+        event_type=block.event_type,
+        event_type_raw=block.event_type_raw,
+        source=source,
+        city=city,
+        state=state,
+        age_min=block.age_min,
+        age_max=block.age_max,
+        age_contains=block.age_contains,
+        intensity=block.intensity,
+        instructor=block.instructor,
+        date_range=block.date_range,
+        time_slots=block.time_slots,
+        duration=block.duration,
+        spots=block.spots,
+        center_name=center_name,
+        center_type=center_type,
+        page_content=block.page_content,
+    )
+
+
+def split_event_blocks(md_text: str) -> List[Tuple[str, str]]:
+    """
+    Returns list of (event_title, event_block_text).
+    Event blocks start with '### ' and continue until next '### ' or end.
+    """
+    return list(_iter_event_spans(md_text))
 
-    age_tags = _safe_find(FIELD_RE["age_tags"], block)
-    instructor = _safe_find2(FIELD_RE["instructor"], block)
-    date_range = _safe_find(FIELD_RE["date_range"], block)
-    time_slots = _safe_find(FIELD_RE["time_slots"], block)
-    duration = _safe_find(FIELD_RE["duration"], block)
-    spots = _safe_find(FIELD_RE["spots"], block)
 
+def parse_event_metadata(event_title: str, block: str) -> Dict[str, Optional[str]]:
+    """Parse event metadata from event block."""
+    parsed = _parse_event_fields(event_title, block)
     return {
         "event_title": event_title,
-        "event_type": event_type,
-        "age_tags": age_tags,
-        "instructor": instructor,
-        "date_range": date_range,
-        "time_slots": time_slots,
-        "duration": duration,
-        "spots": spots,
+        # Event Type may appear as "Event Type:" or "Category:" depending on file style
+        "event_type": parsed.event_type_raw or parsed.category,
+        "age_tags": parsed.age_tags,
+        "instructor": parsed.instructor,
+        "date_range": parsed.date_range,
+        "time_slots": parsed.time_slots,
+        "duration": parsed.duration,
+        "spots": parsed.spots,
     }
 
 
@@ -167,6 +543,35 @@ def build_activitytype_documents(
     return docs, intensity_map
 
 
+def activity_documents_to_records(docs: List[Document]) -> List[ActivityTypeRecord]:
+    """
+    Project activity type Documents to catalog records for the activity_types table.
+
+    Args:
+        docs: Documents from build_activitytype_documents()
+
+    Returns:
+        One ActivityTypeRecord per document, in the same order
+    """
+    records = []
+    for doc in docs:
+        fields = {}
+        for name, regex in _ACTIVITY_FIELD_RE.items():
+            m = regex.search(doc.page_content)
+            fields[name] = (m.group(1).strip() or None) if m else None
+        records.append(
+            ActivityTypeRecord(
+                heading_norm=doc.metadata["activity_heading_norm"],
+                source=doc.metadata["source"],
+                activity_heading=doc.metadata.get("activity_heading"),
+                intensity=doc.metadata.get("intensity"),
+                page_content=doc.page_content,
+                **fields,
+            )
+        )
+    return records
+
+
 def build_event_documents(
     md_text: str,
     source: str,
@@ -184,59 +589,13 @@ def build_event_documents(
     - age_contains (bucketed groups)
     - city, state if present
     - intensity (low/moderate/high) [prefer from activity_intensity_map]
-    """
-    matches = list(_EVENT_BLOCK_RE.finditer(md_text))
-    if not matches:
-        return []
 
-    docs: List[Document] = []
-
-    for i, m in enumerate(matches):
-        event_name = m.group(1).strip()
-        start = m.start()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(md_text)
-        block = md_text[start:end].strip()
-
-        # Extract Event Type
-        event_type_raw = None
-        mt = re.search(r"(?mi)^\s*-\s*Event Type:\s*(.+?)\s*$", block)
-        if mt:
-            event_type_raw = mt.group(1).strip()
-
-        event_type = normalize_event_type(event_type_raw)
-
-        # Ages numeric + buckets
-        age_min, age_max = extract_age_range(block)
-        age_contains_list = extract_age_groups(block)
-        # Convert list to string for ChromaDB (which doesn't support list metadata)
-        age_contains = ", ".join(age_contains_list) if age_contains_list else None
-
-        # Intensity: prefer map from activityType docs (keyed by normalized event_type)
-        intensity = None
-        if activity_intensity_map and event_type:
-            intensity = activity_intensity_map.get(event_type)
-        if not intensity:
-            intensity = infer_intensity_from_text(block)
-
-        docs.append(
-            Document(
-                page_content=block,
-                metadata={
-                    "source": source,
-                    "event_name": event_name,
-                    "event_type": event_type,  # normalized (e.g., "AQUA ZUMBA")
-                    "event_type_raw": event_type_raw,  # optional debugging
-                    "age_min": age_min,
-                    "age_max": age_max,
-                    "city": city,
-                    "state": state,
-                    "age_contains": age_contains,  # comma-separated string
-                    "intensity": intensity,  # low/moderate/high or None
-                },
-            )
-        )
-
-    return docs
+    To also build SQL records from the same parse, use parse_brochure().
+    """
+    return [
+        event_block_to_document(block, source, city, state)
+        for block in parse_event_blocks(md_text, activity_intensity_map)
+    ]
 
 
 def build_event_records(
@@ -262,67 +621,10 @@ def build_event_records(
         
     Returns:
         List of EventRecord objects
-    """
-    matches = list(_EVENT_BLOCK_RE.finditer(md_text))
-    if not matches:
-        return []
-
-    records: List[EventRecord] = []
-
-    for i, m in enumerate(matches):
-        event_name = m.group(1).strip()
-        start = m.start()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(md_text)
-        block = md_text[start:end].strip()
-
-        # Extract Event Type
-        event_type_raw = None
-        mt = re.search(r"(?mi)^\s*-\s*Event Type:\s*(.+?)\s*$", block)
-        if mt:
-            event_type_raw = mt.group(1).strip()
-
-        event_type = normalize_event_type(event_type_raw)
-
-        # Ages numeric + buckets
-        age_min, age_max = extract_age_range(block)
-        age_contains_list = extract_age_groups(block)
-        age_contains = ", ".join(age_contains_list) if age_contains_list else None
-
-        # Intensity: prefer map from activityType docs (keyed by normalized event_type)
-        intensity = None
-        if activity_intensity_map and event_type:
-            intensity = activity_intensity_map.get(event_type)
-        if not intensity:
-            intensity = infer_intensity_from_text(block)
-
-        # Extract additional fields
-        instructor = _safe_find2(FIELD_RE["instructor"], block)
-        date_range = _safe_find(FIELD_RE["date_range"], block)
-        time_slots = _safe_find(FIELD_RE["time_slots"], block)
-        duration = _safe_find(FIELD_RE["duration"], block)
-        spots = _safe_find(FIELD_RE["spots"], block)
-
-        record = EventRecord(
-            event_name=event_name,
-            event_type=event_type,
-            event_type_raw=event_type_raw,
-            source=source,
-            city=city,
-            state=state,
-            age_min=age_min,
-            age_max=age_max,
-            age_contains=age_contains,
-            intensity=intensity,
-            instructor=instructor,
-            date_range=date_range,
-            time_slots=time_slots,
-            duration=duration,
-            spots=spots,
-            center_name=center_name,
-            center_type=center_type,
-            page_content=block,
-        )
-        records.append(record)
-
-    return records
 
+    To also build Chroma documents from the same parse, use parse_brochure().
+    """
+    return [
+        event_block_to_record(block, source, city, state, center_name, center_type)
+        for block in parse_event_blocks(md_text, activity_intensity_map)
+    ]
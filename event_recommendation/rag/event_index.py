@@ -0,0 +1,187 @@
+"""Embedding index over event block bodies for semantic event scoring.
+
+Event retrieval filters with SQL first; the index only has to score the
+candidates that come back. It is a float32 matrix of L2-normalized body
+embeddings saved next to the events database (`events.vectors.npy`) and
+memory-mapped, with row i holding event_contents id i (zeros where a body
+has no embedding yet). Scoring a candidate set gathers just those rows, and
+each distinct body is scored once however many events share it.
+
+A BM25 index over the same bodies (`events.lexical.npz`, rows also by
+event_contents id) is written alongside for the lexical leg of hybrid
+retrieval (see rag.hybrid). With quantize=True, int8 codes of the matrix
+are written too and open_event_index() serves scores from them (see
+rag.quantized_index).
+"""
+
+import os
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from rag.lexical_index import BM25Index
+from rag.quantized_index import QuantizedVectorIndex, quantized_paths, remove_quantized, write_quantized
+
+VECTORS_SUFFIX = ".vectors.npy"
+LEXICAL_SUFFIX = ".lexical.npz"
+
+
+def event_index_path(db_path: str) -> str:
+    """Index file of an events database (events.db -> events.vectors.npy)."""
+    return os.path.splitext(db_path)[0] + VECTORS_SUFFIX
+
+
+def event_lexical_path(db_path: str) -> str:
+    """BM25 index file of an events database (events.db -> events.lexical.npz)."""
+    return os.path.splitext(db_path)[0] + LEXICAL_SUFFIX
+
+
+def build_event_index(
+    event_db,
+    embed_documents: Optional[Callable[[List[str]], List[List[float]]]] = None,
+    batch_size: int = 256,
+    quantize: Optional[bool] = None,
+) -> Dict[str, int]:
+    """
+    Embed new block bodies and (re)write the vector and BM25 index files
+    next to the events database.
+
+    Each file is only rewritten when bodies were embedded or it is missing.
+
+    Args:
+        event_db: EventDB to read embeddings from
+        embed_documents: Batch embedding function for bodies without an embedding
+            (None only indexes what is already stored)
+        batch_size: Bodies per embedding call
+        quantize: Also write int8 codes of the vector index (False removes them;
+            None keeps quantizing if codes exist)
+
+    Returns:
+        Dictionary with bodies 'embedded', vector index 'rows' and 'lexical_rows' (0 if unchanged)
+    """
+    path = event_index_path(event_db.db_path)
+    lexical_path = event_lexical_path(event_db.db_path)
+    embedded = event_db.embed_contents(embed_documents, batch_size) if embed_documents is not None else 0
+    stats = {"embedded": embedded, "rows": 0, "lexical_rows": 0}
+    if embedded or not os.path.exists(lexical_path):
+        stats["lexical_rows"] = _write_lexical_index(event_db, lexical_path)
+    quantized = all(os.path.exists(p) for p in quantized_paths(path))
+    quantize = quantized if quantize is None else quantize
+    rebuilt = embedded or not os.path.exists(path)
+    if rebuilt:
+        stats["rows"] = _write_vector_index(event_db, path)
+    if not quantize:
+        remove_quantized(path)
+    elif rebuilt or not quantized:
+        rows = write_quantized(path)
+        print(f"Wrote int8 event embedding codes: {rows} rows, {os.path.getsize(quantized_paths(path)[0]):,} bytes")
+    return stats
+
+
+def _write_vector_index(event_db, path: str) -> int:
+    """Write the normalized embedding matrix; returns the number of embedded bodies."""
+    ids, vectors = event_db.get_content_embeddings()
+    matrix = np.zeros((max(ids) + 1 if ids else 0, vectors.shape[1]), dtype=np.float32)
+    if ids:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        matrix[ids] = vectors / np.where(norms == 0, 1, norms)
+
+    # Write then rename, so a serving process never maps a half-written file
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, matrix)
+    os.replace(tmp_path, path)
+    print(f"Wrote event embedding index: {len(ids)} bodies, {matrix.nbytes:,} bytes")
+    return len(ids)
+
+
+def _write_lexical_index(event_db, path: str) -> int:
+    """BM25-index every stored block body; returns the number of bodies."""
+    contents = list(event_db.iter_contents())
+    index = BM25Index.from_texts((text for _, text in contents), (content_id for content_id, _ in contents))
+    tmp_path = path + ".tmp"
+    index.save(tmp_path)
+    os.replace(tmp_path, path)
+    print(f"Wrote event BM25 index: {len(contents)} bodies, {len(index.terms)} terms")
+    return len(contents)
+
+
+class EventEmbeddingIndex:
+    """Memory-mapped body embeddings, addressed by event_contents id."""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Index file written by build_event_index()
+        """
+        self.path = path
+        self.matrix = np.load(path, mmap_mode="r")
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    def score(self, query_vector: Sequence[float], content_ids: Sequence[Optional[int]]) -> np.ndarray:
+        """
+        Cosine similarity of a query to the bodies of some candidates.
+
+        Args:
+            query_vector: Query embedding
+            content_ids: 'content_id' of each candidate (None for legacy rows)
+
+        Returns:
+            float32 array aligned with content_ids (0.0 where there is no embedding)
+        """
+        scores = np.zeros(len(content_ids), dtype=np.float32)
+        if not len(content_ids) or not len(self) or len(query_vector) != self.matrix.shape[1]:
+            return scores
+        ids = np.array([-1 if c is None else c for c in content_ids], dtype=np.int64)
+        valid = (ids >= 0) & (ids < len(self))
+        unique, inverse = np.unique(ids[valid], return_inverse=True)
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+        scores[valid] = (self.matrix[unique] @ query)[inverse]
+        return scores
+
+
+@lru_cache(maxsize=4)
+def _load_index(path: str, mtime: float, quantized_mtime: Optional[float]) -> EventEmbeddingIndex:
+    if quantized_mtime is not None:
+        return QuantizedVectorIndex(path)
+    return EventEmbeddingIndex(path)
+
+
+@lru_cache(maxsize=4)
+def _load_lexical_index(path: str, mtime: float) -> BM25Index:
+    return BM25Index.load(path)
+
+
+def open_event_index(db_path: str) -> Optional[Union[EventEmbeddingIndex, QuantizedVectorIndex]]:
+    """
+    Index of an events database, or None if it has not been built.
+
+    The int8 QuantizedVectorIndex is used when its codes were written.
+    Reopened when a file changes (keyed by the mtimes).
+    """
+    path = event_index_path(db_path)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    try:
+        quantized_mtime = max(os.path.getmtime(p) for p in quantized_paths(path))
+    except OSError:
+        quantized_mtime = None
+    return _load_index(path, mtime, quantized_mtime)
+
+
+def open_event_lexical_index(db_path: str) -> Optional[BM25Index]:
+    """BM25 index of an events database (reopened when the file changes), or None if not built."""
+    path = event_lexical_path(db_path)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    return _load_lexical_index(path, mtime)
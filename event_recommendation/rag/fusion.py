@@ -0,0 +1,33 @@
+"""Rank fusion of several result lists."""
+
+from typing import Dict, Hashable, List, Optional, Sequence
+
+# Standard RRF constant: damps the weight of the very first ranks
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]],
+    k: int = RRF_K,
+    weights: Optional[Sequence[float]] = None,
+) -> List[Hashable]:
+    """
+    Merge rankings with reciprocal-rank fusion.
+
+    Each item scores sum(weight / (k + rank)) over the rankings it appears in
+    (rank starting at 1). Ties keep the order of first appearance.
+
+    Args:
+        rankings: Item keys, best first, one list per ranking
+        k: RRF constant
+        weights: Optional weight per ranking (default 1.0 each)
+
+    Returns:
+        Item keys ordered by fused score
+    """
+    weights = weights if weights is not None else [1.0] * len(rankings)
+    scores: Dict[Hashable, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, item in enumerate(ranking, start=1):
+            scores[item] = scores.get(item, 0.0) + weight / (k + rank)
+    return sorted(scores, key=scores.get, reverse=True)
@@ -0,0 +1,167 @@
+"""Hybrid lexical + vector retrieval.
+
+Exact-term queries ("Zumba", "Aqua Rumba") favour BM25 and fuzzy ones
+("something gentle for my knees") favour embeddings, so both legs run in
+parallel and their rankings are merged with reciprocal-rank fusion.
+HybridVectorIndex does this for the activity type index;
+retrieve_events_for_activity_type() runs the same legs over SQL event
+candidates. Per-leg timings of the last query are kept in `timings`.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from rag.fusion import reciprocal_rank_fusion
+from rag.lexical_index import BM25Index
+from rag.vector_index import NumpyVectorIndex
+
+# Legs of one query run on this shared pool (the vector leg mostly waits on
+# the embedding call or in NumPy, both of which release the GIL)
+_LEG_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="retrieval-leg")
+
+
+def run_legs(legs: Dict[str, Callable[[], Any]]) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """
+    Run retrieval legs in parallel.
+
+    Args:
+        legs: Leg name -> function returning its results
+
+    Returns:
+        (leg name -> results, timings in ms: '<leg>_ms' per leg and 'total_ms')
+    """
+    start = time.perf_counter()
+
+    def timed(fn):
+        leg_start = time.perf_counter()
+        result = fn()
+        return result, (time.perf_counter() - leg_start) * 1000
+
+    if len(legs) == 1:
+        outcomes = {name: timed(fn) for name, fn in legs.items()}
+    else:
+        futures = {name: _LEG_POOL.submit(timed, fn) for name, fn in legs.items()}
+        outcomes = {name: future.result() for name, future in futures.items()}
+    results = {name: outcome[0] for name, outcome in outcomes.items()}
+    timings = {f"{name}_ms": outcome[1] for name, outcome in outcomes.items()}
+    timings["total_ms"] = (time.perf_counter() - start) * 1000
+    return results, timings
+
+
+def lexical_order(scores: np.ndarray) -> List[int]:
+    """Positions with a positive BM25 score, best first (non-matching rows are left out)."""
+    matched = np.flatnonzero(scores > 0)
+    return matched[np.argsort(-scores[matched], kind="stable")].tolist()
+
+
+class HybridVectorIndex:
+    """NumpyVectorIndex plus BM25 over the same documents, fused with RRF."""
+
+    def __init__(
+        self,
+        vector_index: NumpyVectorIndex,
+        weights: Sequence[float] = (1.0, 1.0),
+        pool: int = 20,
+    ):
+        """
+        Args:
+            vector_index: Index to pair with BM25 (its group_by applies to both legs)
+            weights: RRF weight of the (vector, lexical) rankings
+            pool: Results taken from each leg before fusion (at least k)
+        """
+        self.vector_index = vector_index
+        self.weights = tuple(weights)
+        self.pool = pool
+        self.timings: Dict[str, float] = {}
+        self._index_lexical()
+
+    def _index_lexical(self) -> None:
+        result = self.vector_index.get()
+        self._documents = [
+            Document(id=doc_id, page_content=text, metadata=metadata)
+            for doc_id, text, metadata in zip(result["ids"], result["documents"], result["metadatas"])
+        ]
+        self.lexical = BM25Index.from_texts(result["documents"])
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self.vector_index.embeddings
+
+    @property
+    def group_by(self) -> Optional[str]:
+        return self.vector_index.group_by
+
+    def __len__(self) -> int:
+        return len(self.vector_index)
+
+    def _key(self, doc: Document) -> str:
+        if self.group_by is not None:
+            return (doc.metadata.get(self.group_by) or "").strip().lower()
+        return doc.id
+
+    def lexical_search(self, query: str, k: int, filter: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """BM25 matches among the rows passing the filter, one per group if grouped."""
+        mask = self.vector_index.filter_mask(filter)
+        rows = None if mask is None else np.flatnonzero(mask)
+        seen, results = set(), []
+        for row, _score in self.lexical.search(query, len(self._documents), rows):
+            doc = self._documents[row]
+            key = self._key(doc)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            results.append(doc)
+            if len(results) >= k:
+                break
+        return results
+
+    def similarity_search(
+        self, query: str, k: int = 4, filter: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> List[Document]:
+        """
+        Top-k by RRF of the vector and BM25 rankings (Chroma.similarity_search() interface).
+
+        Args:
+            query: Query text
+            k: Number of results
+            filter: Chroma-style `where` filter, applied to both legs
+
+        Returns:
+            Documents, best first
+        """
+        pool = max(k, self.pool)
+        legs, timings = run_legs({
+            "vector": lambda: self.vector_index.similarity_search(query, k=pool, filter=filter),
+            "lexical": lambda: self.lexical_search(query, pool, filter),
+        })
+        start = time.perf_counter()
+        documents: Dict[str, Document] = {}
+        rankings = []
+        for leg in ("vector", "lexical"):
+            keys = []
+            for doc in legs[leg]:
+                key = self._key(doc)
+                documents.setdefault(key, doc)
+                keys.append(key)
+            rankings.append(keys)
+        fused = reciprocal_rank_fusion(rankings, weights=self.weights)
+        timings["fusion_ms"] = (time.perf_counter() - start) * 1000
+        self.timings = timings
+        return [documents[key] for key in fused[:k]]
+
+    def get(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        return self.vector_index.get(*args, **kwargs)
+
+    def add_documents(self, documents: List[Document], **kwargs: Any) -> List[str]:
+        ids = self.vector_index.add_documents(documents, **kwargs)
+        self._index_lexical()
+        return ids
+
+    def delete(self, ids: Optional[Iterable[str]] = None) -> None:
+        self.vector_index.delete(ids)
+        self._index_lexical()
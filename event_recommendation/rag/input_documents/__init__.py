@@ -1,6 +1,5 @@
 """Document loading utilities."""
 
-from .loader import load_documents
-
-__all__ = ["load_documents"]
+from .loader import DocumentFile, discover_documents, load_documents
 
+__all__ = ["DocumentFile", "discover_documents", "load_documents"]
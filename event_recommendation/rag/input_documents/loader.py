@@ -1,48 +1,101 @@
 """Load documents from filesystem."""
 
 import os
-import glob
-from typing import List
+import mmap
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
 
-from langchain_community.document_loaders import DirectoryLoader, TextLoader
+
+@dataclass(frozen=True)
+class DocumentFile:
+    """A discovered document: path plus the stat fields needed for caching."""
+    path: str
+    size: int
+    mtime_ns: int
+
+    def read_text(self) -> str:
+        """Read the file content (only when it is actually needed)."""
+        with open(self.path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    @contextmanager
+    def mmap(self) -> Iterator[bytes]:
+        """
+        Memory-map the file read-only.
+
+        Lets callers scan or slice large files without copying them into
+        Python memory up front. Empty files yield b"" (mmap rejects them).
+        """
+        if self.size == 0:
+            yield b""
+            return
+        with open(self.path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield mapped
+            finally:
+                mapped.close()
+
+
+def _scan_files(folder: str, suffixes: Tuple[str, ...]) -> Iterator[DocumentFile]:
+    """
+    Recursively yield files with the given suffixes under folder using os.scandir (no content reads).
+
+    Hidden entries (editor temp / backup files, .git, ...) are skipped, as
+    DirectoryLoader does by default, and symlinked directories are not
+    followed, so a link loop cannot recurse forever.
+    """
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_files(entry.path, suffixes)
+            elif entry.is_file() and entry.name.endswith(suffixes):
+                st = entry.stat()
+                yield DocumentFile(entry.path, st.st_size, st.st_mtime_ns)
+
+
+def discover_documents(
+    documents_path: str,
+    suffixes: Tuple[str, ...] = (".md",),
+) -> Dict[str, List[DocumentFile]]:
+    """
+    Discover markdown files per top-level folder without reading them.
+
+    Args:
+        documents_path: Path to the documents directory
+        suffixes: File name suffixes to include
+
+    Returns:
+        Dict of folder name (e.g. "Events", "activityType") -> DocumentFiles sorted by path
+    """
+    discovered: Dict[str, List[DocumentFile]] = {}
+    with os.scandir(documents_path) as folders:
+        for folder in folders:
+            if folder.is_dir() and not folder.name.startswith("."):
+                discovered[folder.name] = sorted(_scan_files(folder.path, suffixes), key=lambda d: d.path)
+    return discovered
 
 
 def load_documents(documents_path: str) -> tuple[List[str], List[str]]:
     """
     Load markdown documents from the documents directory.
-    
+
+    Only paths are collected; read content with DocumentFile.read_text() or
+    the parsers when it is needed.
+
     Args:
         documents_path: Path to the documents directory
-        
+
     Returns:
         Tuple of (events_md_files, activitytype_md_files) - lists of file paths
     """
-    # Create list of events md file list
-    events_md_files: List[str] = []
-    # Create list of activity type md file list
-    activitytype_md_files: List[str] = []
-
-    folders = glob.glob(os.path.join(documents_path, "*"))
-
-    for folder in folders:
-        if os.path.isdir(folder):
-            doc_type = os.path.basename(folder)
-            loader = DirectoryLoader(
-                folder,
-                glob="**/*.md",
-                loader_cls=TextLoader,
-                loader_kwargs={"encoding": "utf-8"},
-            )
-            folder_docs = loader.load()
-            print(f"Loaded {len(folder_docs)} documents from {doc_type}")
-            for doc in folder_docs:
-                # Load events in events_md_files list (append file path, not Document object)
-                if doc_type == "Events":
-                    events_md_files.append(doc.metadata.get("source", ""))
-                # Load activity types in activitytype_md_files list (append file path, not Document object)
-                elif doc_type == "activityType":
-                    activitytype_md_files.append(doc.metadata.get("source", ""))
-                doc.metadata["doc_type"] = doc_type
+    discovered = discover_documents(documents_path)
+    for doc_type, files in sorted(discovered.items()):
+        print(f"Loaded {len(files)} documents from {doc_type}")
 
+    events_md_files = [doc.path for doc in discovered.get("Events", [])]
+    activitytype_md_files = [doc.path for doc in discovered.get("activityType", [])]
     return events_md_files, activitytype_md_files
-
@@ -0,0 +1,202 @@
+"""BM25 lexical index.
+
+Exact-term queries ("Zumba", "Aqua Rumba") are what embeddings handle
+worst, so the hybrid retriever pairs the vector index with BM25 over the
+same texts. Postings are kept in CSR arrays (term -> rows, term counts);
+a query touches only the postings of its terms. Rows are caller-defined
+ids (document positions, or event_contents ids with gaps), and the index
+can be saved to / loaded from an .npz file next to the event index.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Okapi BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased alphanumeric tokens, a trailing plural 's' removed ('Knees' matches 'knee')."""
+    tokens = []
+    for token in _TOKEN_RE.findall(text.casefold()):
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+class BM25Index:
+    """Okapi BM25 over CSR postings."""
+
+    def __init__(
+        self,
+        terms: Sequence[str],
+        indptr: np.ndarray,
+        rows: np.ndarray,
+        counts: np.ndarray,
+        lengths: np.ndarray,
+        k1: float = K1,
+        b: float = B,
+    ):
+        """
+        Create an index from its arrays (see from_texts() and load()).
+
+        Args:
+            terms: Vocabulary; postings of terms[i] are rows/counts[indptr[i]:indptr[i + 1]]
+            indptr: Posting offsets per term
+            rows: Row id of each posting
+            counts: Term count of each posting
+            lengths: Token count per row id (0 for ids without text)
+            k1: BM25 term frequency saturation
+            b: BM25 length normalization
+        """
+        self.terms = {term: i for i, term in enumerate(terms)}
+        self.indptr = indptr
+        self.rows = rows
+        self.counts = counts
+        self.lengths = lengths
+        self.k1 = k1
+        self.b = b
+        documents = int(np.count_nonzero(lengths))
+        self._average_length = float(lengths.sum()) / documents if documents else 0.0
+        document_frequency = np.diff(indptr)
+        self._idf = np.log1p((documents - document_frequency + 0.5) / (document_frequency + 0.5))
+        self._norms = (
+            k1 * (1 - b + b * lengths / self._average_length) if self._average_length else np.ones(len(lengths))
+        ).astype(np.float32)
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str], row_ids: Optional[Iterable[int]] = None, **kwargs) -> "BM25Index":
+        """
+        Index texts.
+
+        Args:
+            texts: Texts to index
+            row_ids: Row id of each text (default: 0, 1, 2, ...)
+            **kwargs: k1 / b
+
+        Returns:
+            BM25Index
+        """
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        lengths: Dict[int, int] = {}
+        row_ids = iter(row_ids) if row_ids is not None else None
+        for position, text in enumerate(texts):
+            row = next(row_ids) if row_ids is not None else position
+            tokens = tokenize(text)
+            lengths[row] = len(tokens)
+            for term, count in Counter(tokens).items():
+                postings.setdefault(term, []).append((row, count))
+
+        # Postings sorted by row, so score_rows() can binary-search them
+        terms = sorted(postings)
+        for term in terms:
+            postings[term].sort()
+        indptr = np.zeros(len(terms) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(postings[t]) for t in terms])
+        pairs = np.array([pair for t in terms for pair in postings[t]], dtype=np.int64).reshape(-1, 2)
+        length_array = np.zeros(max(lengths) + 1 if lengths else 0, dtype=np.int32)
+        if lengths:
+            length_array[list(lengths)] = list(lengths.values())
+        return cls(terms, indptr, pairs[:, 0].copy(), pairs[:, 1].astype(np.int32), length_array, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def scores(self, query: str) -> np.ndarray:
+        """
+        BM25 score of every row id for a query.
+
+        Returns:
+            float32 array indexed by row id (0.0 where no query term occurs)
+        """
+        scores = np.zeros(len(self.lengths), dtype=np.float32)
+        for term in set(tokenize(query)):
+            t = self.terms.get(term)
+            if t is None:
+                continue
+            start, end = self.indptr[t], self.indptr[t + 1]
+            rows, counts = self.rows[start:end], self.counts[start:end]
+            scores[rows] += self._idf[t] * counts * (self.k1 + 1) / (counts + self._norms[rows])
+        return scores
+
+    def score_rows(self, query: str, row_ids: Sequence[Optional[int]]) -> np.ndarray:
+        """
+        BM25 scores of some rows only (e.g. SQL candidates).
+
+        Each query term's postings are binary-searched for the rows, so the
+        cost depends on the number of rows rather than on the corpus size.
+
+        Args:
+            query: Query text
+            row_ids: Row ids (None or unknown ids score 0.0)
+
+        Returns:
+            float32 array aligned with row_ids
+        """
+        scores = np.zeros(len(row_ids), dtype=np.float32)
+        if not len(row_ids):
+            return scores
+        ids = np.array([-1 if r is None else r for r in row_ids], dtype=np.int64)
+        valid = (ids >= 0) & (ids < len(self.lengths))
+        unique, inverse = np.unique(ids[valid], return_inverse=True)
+        unique_scores = np.zeros(len(unique), dtype=np.float32)
+        norms = self._norms[unique]
+        for term in set(tokenize(query)):
+            t = self.terms.get(term)
+            if t is None:
+                continue
+            postings = self.rows[self.indptr[t]:self.indptr[t + 1]]
+            found = np.minimum(np.searchsorted(postings, unique), len(postings) - 1)
+            hit = postings[found] == unique
+            counts = self.counts[self.indptr[t] + found[hit]]
+            unique_scores[hit] += self._idf[t] * counts * (self.k1 + 1) / (counts + norms[hit])
+        scores[valid] = unique_scores[inverse]
+        return scores
+
+    def search(self, query: str, k: int, rows: Optional[np.ndarray] = None) -> List[Tuple[int, float]]:
+        """
+        Best matching rows (only rows containing a query term).
+
+        Args:
+            query: Query text
+            k: Maximum number of results
+            rows: Restrict to these row ids (e.g. a filter's matches)
+
+        Returns:
+            (row id, score) pairs, best first
+        """
+        scores = self.scores(query)
+        if rows is not None:
+            rows = np.asarray(rows, dtype=np.int64)
+            rows = rows[(rows >= 0) & (rows < len(scores))]
+            candidate_scores = scores[rows]
+        else:
+            rows, candidate_scores = np.arange(len(scores)), scores
+        matched = np.flatnonzero(candidate_scores > 0)
+        best = matched[np.argsort(-candidate_scores[matched], kind="stable")[:max(k, 0)]]
+        return [(int(rows[i]), float(candidate_scores[i])) for i in best]
+
+    def save(self, path: str) -> None:
+        """Write the index arrays to an .npz file."""
+        terms = sorted(self.terms, key=self.terms.get)
+        with open(path, "wb") as f:
+            np.savez(
+                f, terms=np.array(terms, dtype=str), indptr=self.indptr, rows=self.rows,
+                counts=self.counts, lengths=self.lengths, params=np.array([self.k1, self.b]),
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        """Read an index written by save()."""
+        with np.load(path) as data:
+            k1, b = data["params"].tolist()
+            return cls(
+                data["terms"].tolist(), data["indptr"], data["rows"], data["counts"], data["lengths"], k1=k1, b=b
+            )
@@ -0,0 +1,178 @@
+"""Parallel brochure parsing and event ingestion.
+
+Brochure parsing is pure-CPU regex work, so it is spread over a process pool.
+Each task is a whole brochure file or, for very large files, a contiguous
+range of its event blocks. Results come back in task order, so the merged
+output (and the row order in the events table) is identical to a serial
+parse regardless of worker count or scheduling.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from database.event_db import EventDB, EventRecord
+from database.activity_db import ActivityTypeDB
+from rag.document_processing import (
+    _EVENT_BLOCK_RE,
+    ParsedBrochure,
+    parse_brochure,
+    parse_center_metadata,
+    parse_event_blocks,
+)
+
+# Files above this size are split into event-block ranges
+DEFAULT_SPLIT_BYTES = 4 * 2**20
+# Event blocks per range task when a file is split
+DEFAULT_BLOCKS_PER_TASK = 2000
+
+# Per-worker intensity map, set once by the pool initializer
+_WORKER_INTENSITY_MAP: Optional[Dict[str, str]] = None
+
+# Task shapes: ("file", path, source) | ("range", source, md_slice)
+_Task = Tuple[str, str, str]
+
+
+def _init_worker(activity_intensity_map: Optional[Dict[str, str]]) -> None:
+    global _WORKER_INTENSITY_MAP
+    _WORKER_INTENSITY_MAP = activity_intensity_map
+
+
+def _run_task(task: _Task):
+    """Parse one task: a full brochure (ParsedBrochure) or a block range (List[EventBlock])."""
+    kind, a, b = task
+    if kind == "file":
+        with open(a, "r", encoding="utf-8") as f:
+            return parse_brochure(f.read(), b, _WORKER_INTENSITY_MAP)
+    return parse_event_blocks(b, _WORKER_INTENSITY_MAP)
+
+
+def _plan_tasks(
+    events_files: List[str],
+    split_bytes: int,
+    blocks_per_task: int,
+) -> Iterator[Tuple[int, Optional[Dict[str, Optional[str]]], _Task]]:
+    """
+    Yield (file index, center or None, task) in file order.
+
+    Small files are read by the worker. Large files are read here once to
+    find block boundaries; their center metadata is parsed here too, since
+    range tasks never see the brochure header.
+    """
+    for index, path in enumerate(events_files):
+        source = os.path.basename(path)
+        if os.path.getsize(path) <= split_bytes:
+            yield index, None, ("file", path, source)
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            md_text = f.read()
+        center = parse_center_metadata(md_text, source)
+        starts = [m.start() for m in _EVENT_BLOCK_RE.finditer(md_text)]
+        for i in range(0, len(starts), blocks_per_task):
+            end = starts[i + blocks_per_task] if i + blocks_per_task < len(starts) else len(md_text)
+            yield index, center, ("range", source, md_text[starts[i]:end])
+        if not starts:
+            yield index, center, ("range", source, "")
+
+
+def parse_brochures_parallel(
+    events_files: List[str],
+    activity_intensity_map: Optional[Dict[str, str]] = None,
+    max_workers: Optional[int] = None,
+    split_bytes: int = DEFAULT_SPLIT_BYTES,
+    blocks_per_task: int = DEFAULT_BLOCKS_PER_TASK,
+) -> Iterator[ParsedBrochure]:
+    """
+    Parse brochures across a process pool, yielding them in input order.
+
+    Args:
+        events_files: Brochure markdown paths
+        activity_intensity_map: Map of normalized event_type -> intensity
+        max_workers: Worker processes (default: CPU count); 1 parses in-process
+        split_bytes: Files larger than this are split into event-block ranges
+        blocks_per_task: Event blocks per range task
+
+    Returns:
+        Iterator of ParsedBrochure, one per file, in the order given
+    """
+    plan = list(_plan_tasks(events_files, split_bytes, blocks_per_task))
+    tasks = [task for _index, _center, task in plan]
+
+    if max_workers == 1:
+        _init_worker(activity_intensity_map)
+        results = map(_run_task, tasks)
+        pool = None
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(activity_intensity_map,)
+        )
+        # Ordered map: results are merged in task order, not completion order
+        results = pool.map(_run_task, tasks, chunksize=max(1, len(tasks) // (workers * 8)))
+
+    try:
+        current: Optional[ParsedBrochure] = None
+        current_index = -1
+        for (index, center, _task), result in zip(plan, results):
+            if index != current_index:
+                if current is not None:
+                    yield current
+                current_index = index
+                current = result if center is None else ParsedBrochure(
+                    source=center["source"], center=center, blocks=[]
+                )
+            if center is not None:
+                current.blocks.extend(result)
+        if current is not None:
+            yield current
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def ingest_events_parallel(
+    events_files: List[str],
+    event_db: EventDB,
+    activity_intensity_map: Optional[Dict[str, str]] = None,
+    max_workers: Optional[int] = None,
+    batch_size: int = 5000,
+    split_bytes: int = DEFAULT_SPLIT_BYTES,
+    blocks_per_task: int = DEFAULT_BLOCKS_PER_TASK,
+) -> int:
+    """
+    Parse brochures in parallel and stream their records into the events table.
+
+    Records are inserted with EventDB.insert_events in batches of
+    `batch_size` as parsed brochures arrive, so the full corpus is never
+    held in memory.
+
+    Args:
+        events_files: Brochure markdown paths
+        event_db: EventDB to insert into
+        activity_intensity_map: Map of normalized event_type -> intensity
+            (default: read from the activity_types catalog in the events database)
+        max_workers: Worker processes (default: CPU count); 1 parses in-process
+        batch_size: Records per insert_events call
+        split_bytes: Files larger than this are split into event-block ranges
+        blocks_per_task: Event blocks per range task
+
+    Returns:
+        Number of events inserted
+    """
+    if activity_intensity_map is None:
+        activity_intensity_map = ActivityTypeDB(event_db.db_path).get_intensity_map()
+
+    batch: List[EventRecord] = []
+    total = 0
+    for brochure in parse_brochures_parallel(
+        events_files, activity_intensity_map, max_workers, split_bytes, blocks_per_task
+    ):
+        batch.extend(brochure.records())
+        if len(batch) >= batch_size:
+            event_db.insert_events(batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        event_db.insert_events(batch)
+        total += len(batch)
+    return total
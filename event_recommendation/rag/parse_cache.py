@@ -0,0 +1,294 @@
+"""Parsed-corpus cache for brochure and activity type markdown files.
+
+Entries are keyed by (path, size, mtime, content hash, parser version) and
+hold the parsed EventBlocks or activity type chunks as zlib-compressed
+compact JSON in a SQLite table. On rebuild, files whose size and mtime are
+unchanged are served without being read; files that were touched but whose
+content hash still matches are served without being parsed.
+"""
+
+import os
+import json
+import zlib
+import sqlite3
+import hashlib
+from contextlib import contextmanager
+from dataclasses import astuple, dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from langchain_core.documents import Document
+
+from database.event_db import EventRecord
+from database.activity_db import ActivityTypeRecord
+
+from rag.document_processing import (
+    EventBlock,
+    ParsedBrochure,
+    activity_documents_to_records,
+    build_activitytype_documents,
+    parse_brochure,
+)
+
+# Bump whenever parsing output changes so stale entries are re-parsed
+PARSER_VERSION = "1"
+
+_CENTER_KEYS = ("center_name", "center_type", "city", "state")
+
+
+@dataclass
+class ParsedCorpus:
+    """Parsed activity types and brochures for a full build."""
+    activity_documents: List[Document] = field(default_factory=list)
+    intensity_map: Dict[str, str] = field(default_factory=dict)
+    brochures: List[ParsedBrochure] = field(default_factory=list)
+    changed_sources: Set[str] = field(default_factory=set)  # sources whose documents may have changed
+
+    def event_documents(self) -> List[Document]:
+        """Chroma event Documents for every brochure."""
+        return [doc for brochure in self.brochures for doc in brochure.documents()]
+
+    def event_records(self) -> List[EventRecord]:
+        """EventRecords for every brochure."""
+        return [record for brochure in self.brochures for record in brochure.records()]
+
+    def activity_records(self) -> List[ActivityTypeRecord]:
+        """Catalog records for the activity_types table."""
+        return activity_documents_to_records(self.activity_documents)
+
+
+def _file_sha256(path: str) -> Tuple[str, str]:
+    """Return (text, sha256 hex digest) of a UTF-8 file."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return raw.decode("utf-8"), hashlib.sha256(raw).hexdigest()
+
+
+def _encode(payload: Any) -> bytes:
+    return zlib.compress(json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+
+def _decode(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def _encode_brochure(brochure: ParsedBrochure) -> bytes:
+    return _encode({
+        "center": [brochure.center.get(key) for key in _CENTER_KEYS],
+        "blocks": [list(astuple(block)) for block in brochure.blocks],
+    })
+
+
+def _decode_brochure(blob: bytes, source: str) -> ParsedBrochure:
+    payload = _decode(blob)
+    center = {"source": source, **dict(zip(_CENTER_KEYS, payload["center"]))}
+    blocks = [EventBlock(*values) for values in payload["blocks"]]
+    return ParsedBrochure(source=source, center=center, blocks=blocks)
+
+
+def _encode_activity(docs: List[Document], intensity_map: Dict[str, str]) -> bytes:
+    return _encode({
+        "docs": [[doc.page_content, doc.metadata] for doc in docs],
+        "intensity_map": intensity_map,
+    })
+
+
+def _decode_activity(blob: bytes) -> Tuple[List[Document], Dict[str, str]]:
+    payload = _decode(blob)
+    docs = [Document(page_content=content, metadata=metadata) for content, metadata in payload["docs"]]
+    return docs, payload["intensity_map"]
+
+
+class ParseCache:
+    """SQLite-backed cache of parsed markdown files."""
+
+    def __init__(self, cache_path: str = "./parse_cache.db", parser_version: str = PARSER_VERSION):
+        """
+        Initialize the parse cache.
+
+        Args:
+            cache_path: Path to the SQLite cache file
+            parser_version: Entries written by another parser version are ignored
+        """
+        self.cache_path = cache_path
+        self.parser_version = parser_version
+        self.stats = {"hits": 0, "misses": 0, "rehashed": 0}
+        with self._connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS parse_cache (
+                    path TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    parser_version TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    PRIMARY KEY (path, kind)
+                )
+            """)
+
+    @contextmanager
+    def _connection(self):
+        conn = sqlite3.connect(self.cache_path)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _lookup(self, path: str, kind: str, parse):
+        """
+        Return (payload blob, cache hit) for a file.
+
+        `parse(text)` is only called when the cached entry is missing or stale,
+        and returns the blob to store.
+        """
+        key = os.path.abspath(path)
+        st = os.stat(path)
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT size, mtime_ns, sha256, parser_version, payload FROM parse_cache WHERE path = ? AND kind = ?",
+                (key, kind),
+            ).fetchone()
+            current = row is not None and row[3] == self.parser_version
+            if current and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+                self.stats["hits"] += 1
+                return row[4], True
+
+            text, digest = _file_sha256(path)
+            if current and row[2] == digest:
+                # Touched but unchanged: refresh the stat key, keep the parse
+                conn.execute(
+                    "UPDATE parse_cache SET size = ?, mtime_ns = ? WHERE path = ? AND kind = ?",
+                    (st.st_size, st.st_mtime_ns, key, kind),
+                )
+                self.stats["hits"] += 1
+                self.stats["rehashed"] += 1
+                return row[4], True
+
+            blob = parse(text)
+            conn.execute(
+                "INSERT OR REPLACE INTO parse_cache "
+                "(path, kind, size, mtime_ns, sha256, parser_version, payload) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, kind, st.st_size, st.st_mtime_ns, digest, self.parser_version, blob),
+            )
+            self.stats["misses"] += 1
+            return blob, False
+
+    def get_brochure(self, path: str) -> Tuple[ParsedBrochure, bool]:
+        """
+        Parse (or load) a brochure without an intensity map.
+
+        Apply the activity intensity map with ParsedBrochure.with_intensity_map().
+
+        Args:
+            path: Brochure markdown path
+
+        Returns:
+            Tuple of (ParsedBrochure, cache hit)
+        """
+        source = os.path.basename(path)
+        blob, hit = self._lookup(path, "event", lambda text: _encode_brochure(parse_brochure(text, source)))
+        return _decode_brochure(blob, source), hit
+
+    def get_activity_documents(self, path: str) -> Tuple[Tuple[List[Document], Dict[str, str]], bool]:
+        """
+        Parse (or load) an activity type file.
+
+        Args:
+            path: Activity type markdown path
+
+        Returns:
+            Tuple of ((activity_docs, intensity_map), cache hit)
+        """
+        source = os.path.basename(path)
+        blob, hit = self._lookup(
+            path, "activity", lambda text: _encode_activity(*build_activitytype_documents(text, source))
+        )
+        return _decode_activity(blob), hit
+
+    def prune(self, keep_paths: List[str]) -> int:
+        """
+        Drop entries for files no longer in the corpus.
+
+        Args:
+            keep_paths: Paths still present
+
+        Returns:
+            Number of entries removed
+        """
+        keep = {os.path.abspath(p) for p in keep_paths}
+        with self._connection() as conn:
+            stale = [(p,) for (p,) in conn.execute("SELECT DISTINCT path FROM parse_cache") if p not in keep]
+            conn.executemany("DELETE FROM parse_cache WHERE path = ?", stale)
+        return len(stale)
+
+
+def parse_activity_types(
+    activity_files: List[str],
+    cache: Optional[ParseCache] = None,
+) -> ParsedCorpus:
+    """
+    Parse only the activity type files (documents, intensity map, catalog records).
+
+    Unlike parse_corpus(), cache entries of other files are left alone.
+
+    Args:
+        activity_files: Activity type markdown paths
+        cache: ParseCache to use; None parses everything
+
+    Returns:
+        ParsedCorpus without brochures
+    """
+    corpus = ParsedCorpus()
+    for path in activity_files:
+        if cache is None:
+            with open(path, "r", encoding="utf-8") as f:
+                (docs, intensity_map), hit = build_activitytype_documents(f.read(), os.path.basename(path)), False
+        else:
+            (docs, intensity_map), hit = cache.get_activity_documents(path)
+        corpus.activity_documents.extend(docs)
+        corpus.intensity_map.update(intensity_map)
+        if not hit:
+            corpus.changed_sources.add(os.path.basename(path))
+    return corpus
+
+
+def parse_corpus(
+    events_files: List[str],
+    activity_files: List[str],
+    cache: Optional[ParseCache] = None,
+) -> ParsedCorpus:
+    """
+    Parse activity types and brochures, reusing cached parses where possible.
+
+    Activity types are parsed first so their intensity map can be applied to
+    every brochure (cached or not). `changed_sources` lists the files whose
+    documents may differ from the previous build, so callers can re-embed
+    only those.
+
+    Args:
+        events_files: Brochure markdown paths
+        activity_files: Activity type markdown paths
+        cache: ParseCache to use; None parses everything
+
+    Returns:
+        ParsedCorpus
+    """
+    corpus = parse_activity_types(activity_files, cache)
+
+    activity_changed = bool(corpus.changed_sources)
+    for path in events_files:
+        if cache is None:
+            with open(path, "r", encoding="utf-8") as f:
+                brochure, hit = parse_brochure(f.read(), os.path.basename(path)), False
+        else:
+            brochure, hit = cache.get_brochure(path)
+        corpus.brochures.append(brochure.with_intensity_map(corpus.intensity_map))
+        # A changed intensity map changes event metadata even for cached brochures
+        if not hit or activity_changed:
+            corpus.changed_sources.add(brochure.source)
+
+    if cache is not None:
+        cache.prune(list(events_files) + list(activity_files))
+        print(f"Parse cache: {cache.stats['hits']} hits, {cache.stats['misses']} parsed")
+    return corpus
@@ -0,0 +1,182 @@
+"""Int8 scalar-quantized, memory-mapped embedding store.
+
+Embeddings at event / review scale cost gigabytes as float32. Here each
+L2-normalized row is stored as int8 codes with one float32 scale
+(x ~ code * scale, scale = max|x| / 127) in `<base>.i8.npy` and
+`<base>.scales.npy`, next to the float32 matrix `<base>.npy` they were
+built from. Queries scan only the int8 codes, a quarter of the float32
+bytes, and then re-score the best candidates against their float32 rows,
+so only those rows of the float file are ever paged in.
+"""
+
+import os
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from rag.vector_index import top_k
+
+CODES_SUFFIX = ".i8.npy"
+SCALES_SUFFIX = ".scales.npy"
+# Rows converted to float32 at a time while scanning codes; small enough that
+# the temporary buffer stays in cache (larger chunks measured slower)
+SCAN_ROWS = 256
+# Candidates re-scored with float32 per result
+RESCORE_FACTOR = 4
+
+
+def quantize(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Symmetric per-row int8 quantization.
+
+    Args:
+        matrix: float32 rows
+
+    Returns:
+        (int8 codes, float32 scale per row); all-zero rows get scale 0
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    scales = np.abs(matrix).max(axis=1) / 127 if len(matrix) else np.zeros(0, dtype=np.float32)
+    safe = np.where(scales == 0, 1, scales)[:, None]
+    codes = np.clip(np.rint(matrix / safe), -127, 127).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def quantized_paths(path: str) -> Tuple[str, str]:
+    """Codes and scales files of a float32 .npy matrix (events.vectors.npy -> events.vectors.i8.npy, ...)."""
+    base = path[:-4] if path.endswith(".npy") else path
+    return base + CODES_SUFFIX, base + SCALES_SUFFIX
+
+
+def write_quantized(path: str, chunk_rows: int = 65536) -> int:
+    """
+    Quantize a float32 .npy matrix into its codes and scales files.
+
+    The matrix is read memory-mapped in chunks, so building needs no more
+    than one chunk of extra memory.
+
+    Args:
+        path: float32 matrix file
+        chunk_rows: Rows quantized at a time
+
+    Returns:
+        Number of rows
+    """
+    matrix = np.load(path, mmap_mode="r")
+    codes_path, scales_path = quantized_paths(path)
+    codes = np.lib.format.open_memmap(codes_path + ".tmp", mode="w+", dtype=np.int8, shape=matrix.shape)
+    scales = np.zeros(len(matrix), dtype=np.float32)
+    for start in range(0, len(matrix), chunk_rows):
+        end = min(start + chunk_rows, len(matrix))
+        codes[start:end], scales[start:end] = quantize(matrix[start:end])
+    codes.flush()
+    del codes
+    with open(scales_path + ".tmp", "wb") as f:
+        np.save(f, scales)
+    os.replace(codes_path + ".tmp", codes_path)
+    os.replace(scales_path + ".tmp", scales_path)
+    return len(matrix)
+
+
+def remove_quantized(path: str) -> None:
+    """Delete the codes and scales files of a matrix, if any."""
+    for quantized_path in quantized_paths(path):
+        if os.path.exists(quantized_path):
+            os.remove(quantized_path)
+
+
+class QuantizedVectorIndex:
+    """Cosine scoring over memory-mapped int8 codes, re-scored with the float32 rows."""
+
+    def __init__(self, path: str, rescore_factor: int = RESCORE_FACTOR):
+        """
+        Args:
+            path: float32 matrix file whose codes were written by write_quantized()
+            rescore_factor: Candidates re-scored in float32 per requested result
+        """
+        self.path = path
+        self.rescore_factor = rescore_factor
+        self.matrix = np.load(path, mmap_mode="r")
+        codes_path, scales_path = quantized_paths(path)
+        self.codes = np.load(codes_path, mmap_mode="r")
+        self.scales = np.load(scales_path, mmap_mode="r")
+
+    def __len__(self) -> int:
+        return self.codes.shape[0]
+
+    def _query(self, query_vector: Sequence[float]) -> Optional[np.ndarray]:
+        query = np.asarray(query_vector, dtype=np.float32)
+        if not len(self) or query.shape != (self.codes.shape[1],):
+            return None
+        norm = np.linalg.norm(query)
+        return query / norm if norm else query
+
+    def _approximate(self, query: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Cosine scores from the int8 codes (all rows, or the given ones)."""
+        count = len(self) if rows is None else len(rows)
+        scores = np.empty(count, dtype=np.float32)
+        for start in range(0, count, SCAN_ROWS):
+            end = min(start + SCAN_ROWS, count)
+            if rows is None:
+                codes, scales = self.codes[start:end], self.scales[start:end]
+            else:
+                codes, scales = self.codes[rows[start:end]], self.scales[rows[start:end]]
+            scores[start:end] = (codes.astype(np.float32) @ query) * scales
+        return scores
+
+    def _rescore(self, query: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Exact cosine scores of some rows (sorted reads from the float32 file)."""
+        order = np.argsort(rows)
+        exact = np.empty(len(rows), dtype=np.float32)
+        exact[order] = self.matrix[rows[order]] @ query
+        return exact
+
+    def search(self, query_vector: Sequence[float], k: int, rescore: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Approximate top-k over every row.
+
+        Args:
+            query_vector: Query embedding
+            k: Number of results
+            rescore: Candidates re-scored in float32 (default: k * rescore_factor)
+
+        Returns:
+            (row, cosine similarity) pairs, best first
+        """
+        query = self._query(query_vector)
+        if query is None or k <= 0:
+            return []
+        candidates = top_k(self._approximate(query), max(rescore or k * self.rescore_factor, k))
+        exact = self._rescore(query, candidates)
+        best = top_k(exact, k)
+        return [(int(candidates[i]), float(exact[i])) for i in best]
+
+    def score(
+        self, query_vector: Sequence[float], content_ids: Sequence[Optional[int]], rescore: int = 100
+    ) -> np.ndarray:
+        """
+        Cosine similarity of a query to some rows, as EventEmbeddingIndex.score().
+
+        Every row is scored from its codes; the best `rescore` distinct rows
+        get their exact float32 score, so the head of the ranking is exact.
+
+        Args:
+            query_vector: Query embedding
+            content_ids: Row ids (None or unknown ids score 0.0)
+            rescore: Distinct rows re-scored in float32
+
+        Returns:
+            float32 array aligned with content_ids
+        """
+        scores = np.zeros(len(content_ids), dtype=np.float32)
+        query = self._query(query_vector) if len(content_ids) else None
+        if query is None:
+            return scores
+        ids = np.array([-1 if c is None else c for c in content_ids], dtype=np.int64)
+        valid = (ids >= 0) & (ids < len(self))
+        unique, inverse = np.unique(ids[valid], return_inverse=True)
+        unique_scores = self._approximate(query, unique)
+        head = top_k(unique_scores, rescore)
+        unique_scores[head] = self._rescore(query, unique[head])
+        scores[valid] = unique_scores[inverse]
+        return scores
@@ -0,0 +1,194 @@
+"""Two-tier cache of query embeddings.
+
+Retrieval queries built by build_retrieval_query() repeat heavily across
+users and turns. QueryEmbeddingCache keeps query text -> embedding vector
+in an in-process LRU backed by a SQLite table, keyed by embedding model and
+the canonical query text (case-folded, whitespace collapsed), so exact
+repeats never reach the embedding API. CachedQueryEmbeddings wraps any
+LangChain Embeddings and answers embed_query() from the cache.
+"""
+
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Vectors kept in process (1536 float32 dims is 6 KB per entry)
+MEMORY_CAPACITY = 2048
+
+
+def canonicalize_query(text: str) -> str:
+    """Case-fold and collapse whitespace so trivially different queries share an entry."""
+    return _WHITESPACE_RE.sub(" ", text.casefold()).strip()
+
+
+def embeddings_model_name(embeddings: Any) -> str:
+    """Model identifier of a LangChain Embeddings object (its class name if it has none)."""
+    for attr in ("model", "model_name"):
+        value = getattr(embeddings, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    return type(embeddings).__name__
+
+
+class QueryEmbeddingCache:
+    """In-process LRU over a SQLite table of query embeddings."""
+
+    def __init__(self, cache_path: str = "./query_cache.db", memory_capacity: int = MEMORY_CAPACITY):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_path: Path to the SQLite cache file
+            memory_capacity: Entries kept in the in-process LRU
+        """
+        self.cache_path = cache_path
+        self.memory_capacity = memory_capacity
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self._memory: "OrderedDict[tuple, List[float]]" = OrderedDict()
+        # embed_query() runs on several threads (server workers, hybrid
+        # search legs): one connection, the LRU and the stats are all
+        # guarded by this lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS query_embeddings (
+                    model TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (model, query)
+                )
+            """)
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _remember(self, key: tuple, vector: List[float]) -> None:
+        # Caller holds self._lock
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_capacity:
+            self._memory.popitem(last=False)
+
+    def get(self, model: str, query: str) -> Optional[List[float]]:
+        """
+        Cached embedding of a query, or None.
+
+        Args:
+            model: Embedding model identifier
+            query: Query text (canonicalized here)
+
+        Returns:
+            Embedding vector, or None on a miss
+        """
+        key = (model, canonicalize_query(query))
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return vector
+            row = self._conn.execute(
+                "SELECT embedding FROM query_embeddings WHERE model = ? AND query = ?", key
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            vector = np.frombuffer(row[0], dtype=np.float32).tolist()
+            self._remember(key, vector)
+            self.stats["disk_hits"] += 1
+            return vector
+
+    def put(self, model: str, query: str, vector: List[float]) -> None:
+        """Store the embedding of a query in both tiers."""
+        key = (model, canonicalize_query(query))
+        vector = np.asarray(vector, dtype=np.float32)
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO query_embeddings (model, query, embedding) VALUES (?, ?, ?)",
+                    key + (vector.tobytes(),),
+                )
+            self._remember(key, vector.tolist())
+
+    def embed_query(self, model: str, query: str, embed: Callable[[str], List[float]]) -> List[float]:
+        """
+        Embedding of a query, calling `embed(canonical query)` only on a miss.
+
+        Args:
+            model: Embedding model identifier
+            query: Query text
+            embed: Embedding function for a single text
+
+        Returns:
+            Embedding vector
+        """
+        vector = self.get(model, query)
+        if vector is None:
+            vector = embed(canonicalize_query(query))
+            self.put(model, query, vector)
+        return vector
+
+    def hit_ratios(self) -> Dict[str, float]:
+        """Share of lookups answered in process ('memory'), from SQLite ('disk') and overall ('total')."""
+        with self._lock:
+            stats = dict(self.stats)
+        lookups = sum(stats.values())
+        if not lookups:
+            return {"memory": 0.0, "disk": 0.0, "total": 0.0}
+        return {
+            "memory": stats["memory_hits"] / lookups,
+            "disk": stats["disk_hits"] / lookups,
+            "total": (stats["memory_hits"] + stats["disk_hits"]) / lookups,
+        }
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """Embeddings whose embed_query() goes through a QueryEmbeddingCache."""
+
+    def __init__(self, embeddings: Embeddings, cache: QueryEmbeddingCache, model: Optional[str] = None):
+        """
+        Args:
+            embeddings: Embeddings to wrap (documents are passed through uncached)
+            cache: Query embedding cache
+            model: Cache key for the model (default: embeddings_model_name(embeddings))
+        """
+        self.embeddings = embeddings
+        self.cache = cache
+        self.model = model or embeddings_model_name(embeddings)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.cache.embed_query(self.model, text, self.embeddings.embed_query)
+
+
+def cache_query_embeddings(store: Any, cache: QueryEmbeddingCache) -> Any:
+    """
+    Route a vector store's query embeddings through a cache.
+
+    LangChain's Chroma embeds queries with its `_embedding_function`, which
+    has no public setter, so it is wrapped in place.
+
+    Args:
+        store: Vector store (e.g. RagStores.activity_types)
+        cache: Query embedding cache
+
+    Returns:
+        The same store
+    """
+    embeddings = getattr(store, "_embedding_function", None)
+    if embeddings is not None and not isinstance(embeddings, CachedQueryEmbeddings):
+        store._embedding_function = CachedQueryEmbeddings(embeddings, cache)
+    return store
@@ -1,10 +1,18 @@
 """RAG retrieval functions."""
 
+import os
+import time
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
+import numpy as np
 from langchain_core.documents import Document
 
 from vector_db.chroma_store import RagStores, build_chroma_where
+from database.activity_db import ROUTE_AGE_BUCKETS, ActivityTypeDB
+from rag.event_index import open_event_index, open_event_lexical_index
+from rag.fusion import reciprocal_rank_fusion
+from rag.hybrid import lexical_order, run_legs
 from utils.normalizers import (
     normalize_intensity,
     normalize_age_focus,
@@ -28,12 +36,16 @@ def retrieve_activity_types(
         user_question: User query string
         input_filter: Filter dictionary for metadata
         k: Number of results to return
-        oversample: Multiplier for initial retrieval (for deduplication)
+        oversample: Multiplier for initial retrieval (for deduplication); not
+            needed when the store already returns one result per heading
         
     Returns:
         List of deduplicated activity type documents
     """
-    raw_k = max(k * oversample, 20)
+    if getattr(stores.activity_types, "group_by", None) == "activity_heading_norm":
+        raw_k = k
+    else:
+        raw_k = max(k * oversample, 20)
     print(f"In retrieve_activity_types **** input_filter: {input_filter}")
 
     # Build filter for chroma dict with and clause
@@ -43,6 +55,12 @@ def retrieve_activity_types(
         user_question, k=raw_k, filter=filter_dict
     )
     print(f"In retrieve_activity_types **** raw: {raw}")
+    timings = getattr(stores.activity_types, "timings", None)
+    if timings:
+        print(f"Hybrid search timings (ms): {timings}")
+    query_cache = getattr(getattr(stores.activity_types, "embeddings", None), "cache", None)
+    if query_cache is not None:
+        print(f"Query embedding cache: {query_cache.stats}, hit ratios {query_cache.hit_ratios()}")
 
     seen = set()
     out: List[Document] = []
@@ -65,15 +83,25 @@ def retrieve_events_for_activity_type(
     user_question: str,
     input_filter: Dict[str, Any],
     k: int = 50,  # Increased from 10 to 50 for better recall before re-ranking
+    include_content: bool = True,
+    candidates: int = 1000,
 ) -> List[Document]:
     """
     Retrieve events matching activity type and filters using SQL database.
     
+    When the event embedding and/or BM25 index has been built (see
+    rag.event_index), up to `candidates` SQL matches are scored against the
+    question by both legs in parallel and their rankings are fused with the
+    structured one (event_types order, then SQL order); otherwise the first k
+    SQL matches are returned.
+    
     Args:
         stores: RagStores containing events database and activity_types vector store
-        user_question: User query string (not used for SQL queries, kept for compatibility)
+        user_question: User query string (ranks the SQL candidates semantically and lexically)
         input_filter: Filter dictionary with keys: event_type, city, state, age_contains, intensity
         k: Number of results to return (increased for re-ranking)
+        include_content: Load page_content; False leaves it empty (see load_event_contents)
+        candidates: SQL matches scored when an index is available
         
     Returns:
         List of event documents
@@ -94,6 +122,15 @@ def retrieve_events_for_activity_type(
 
     print(f"In retrieve_events_for_activity_type **** SQL query filters: event_types={event_types}, city={city}, state={state}, age_contains={age_contains}, intensity={intensity}")
 
+    # The question embeds with the activity type store's (cached) embeddings
+    db_path = getattr(stores.events, "db_path", None)
+    index = open_event_index(db_path) if db_path and user_question else None
+    lexical = open_event_lexical_index(db_path) if db_path and user_question else None
+    embeddings = getattr(getattr(stores, "activity_types", None), "embeddings", None)
+    if embeddings is None:
+        index = None
+    ranked = index is not None or lexical is not None
+
     # Query SQL database with larger limit for re-ranking
     events = stores.events.query_events(
         event_types=event_types,
@@ -101,9 +138,40 @@ def retrieve_events_for_activity_type(
         state=state,
         age_contains=age_contains,
         intensity=intensity,
-        limit=k,
+        limit=max(k, candidates) if ranked else k,
+        include_content=include_content and not ranked,
     )
     print(f"In retrieve_events_for_activity_type **** events: {len(events)} found")
+    if not ranked:
+        return events
+
+    content_ids = [e.metadata.get("content_id") for e in events]
+    legs = {}
+    if index is not None:
+        legs["semantic"] = lambda: index.score(embeddings.embed_query(user_question), content_ids)
+    if lexical is not None:
+        legs["lexical"] = lambda: lexical.score_rows(user_question, content_ids)
+    scores, timings = run_legs(legs)
+
+    start = time.perf_counter()
+    # Structured ranking: events of the best matching activity type first
+    # (event_types is ordered by relevance), then SQL order
+    type_rank = {et.lower(): i for i, et in enumerate(event_types or [])}
+    rankings = [sorted(
+        range(len(events)),
+        key=lambda i: type_rank.get((events[i].metadata.get("event_type") or "").lower(), len(type_rank)),
+    )]
+    if "semantic" in scores:
+        rankings.append(np.argsort(-scores["semantic"], kind="stable").tolist())
+    if "lexical" in scores:
+        rankings.append(lexical_order(scores["lexical"]))
+    fused = reciprocal_rank_fusion(rankings)
+    events = [events[i] for i in fused[:k]]
+    timings["fusion_ms"] = (time.perf_counter() - start) * 1000
+    print(f"In retrieve_events_for_activity_type **** ranked {len(content_ids)} candidates (ms): "
+          + ", ".join(f"{name[:-3]} {ms:.2f}" for name, ms in timings.items()))
+    if include_content:
+        load_event_contents(stores, events)
     return events
 
 
@@ -168,6 +236,28 @@ def get_review_scores(
     return scores
 
 
+def load_event_contents(stores: RagStores, events: List[Document]) -> List[Document]:
+    """
+    Fill in page_content of events retrieved with include_content=False.
+
+    Only these rows are read (and decompressed), so call it on the events
+    that are actually rendered.
+
+    Args:
+        stores: RagStores containing the events database
+        events: Event documents carrying an 'event_id'
+
+    Returns:
+        The same documents, with page_content set
+    """
+    missing = [e.metadata["event_id"] for e in events if not e.page_content and "event_id" in e.metadata]
+    contents = stores.events.get_page_contents(missing)
+    for e in events:
+        if not e.page_content and e.metadata.get("event_id") in contents:
+            e.page_content = contents[e.metadata["event_id"]]
+    return events
+
+
 def rerank_events_by_reviews(
     events: List[Document],
     review_scores: Dict[str, Dict[str, float]],
@@ -268,6 +358,103 @@ def format_event_card(d: Document) -> str:
     )
 
 
+@lru_cache(maxsize=8)
+def _activity_catalog(db_path: str) -> ActivityTypeDB:
+    return ActivityTypeDB(db_path)
+
+
+def _catalog_for(stores: RagStores):
+    """
+    Activity type catalog of the events store: its snapshot when serving from
+    one (SnapshotEventStore), else the activity_types table next to the events.
+
+    Returns:
+        Object with get_routes() / get_activity_documents(), or None
+    """
+    snapshot = getattr(stores.events, "snapshot", None)
+    if snapshot is not None:
+        return snapshot
+    db_path = getattr(stores.events, "db_path", None)
+    if isinstance(db_path, str) and os.path.exists(db_path):
+        return _activity_catalog(db_path)
+    return None
+
+
+def route_activity_types(
+    stores: RagStores,
+    user_profile: Dict[str, Any],
+    k: int = 5,
+) -> Optional[List[Document]]:
+    """
+    Answer stage 1 from the precomputed routing table instead of a vector search.
+
+    Used when the profile names interests (the chat profile's allowed
+    interests are the activityType file stems the routes are keyed by); an
+    intensity, when given, and an age focus of a single bucket narrow the
+    route, otherwise the "any intensity" / "any age" routes are used.
+    Returns None (use retrieve_activity_types) when the profile names no
+    interests or no routed heading has events.
+
+    Args:
+        stores: RagStores containing the events database
+        user_profile: User profile dictionary (merge_profiles output)
+        k: Number of headings to return
+
+    Returns:
+        Activity type documents of the best headings, or None
+    """
+    interests = [i for i in user_profile.get("interests") or [] if i]
+    intensity = normalize_intensity(user_profile.get("intensity", "")) or None
+    catalog = _catalog_for(stores) if interests else None
+    if catalog is None:
+        return None
+    ages = (normalize_age_focus(user_profile.get("age_focus")) or "").split(",")
+    age = ages[0] if len(ages) == 1 and ages[0] in ROUTE_AGE_BUCKETS else None
+
+    routes = catalog.get_routes()
+    best: Dict[str, int] = {}
+    for interest in interests:
+        for heading, count in routes.get((interest, intensity, age), []):
+            best[heading] = max(best.get(heading, 0), count)
+    ranked = sorted(best, key=lambda h: -best[h])[:k]  # stable: keeps route order on ties
+    if not ranked or best[ranked[0]] == 0:
+        return None
+    print(f"Routed {interests}/{intensity}/{age} -> {ranked}")
+    return catalog.get_activity_documents(ranked)
+
+
+def get_activity_definitions(
+    stores: RagStores,
+    chosen_headings: List[str],
+    activity_type_docs: List[Document],
+) -> List[Document]:
+    """
+    Activity definitions for the chosen headings.
+
+    Reads the activity_types catalog stored with the events (joined on
+    event_type = heading_norm), or its copy in the serving snapshot. Falls back to the retrieved activity type
+    documents when the catalog is not populated.
+
+    Args:
+        stores: RagStores containing the events database
+        chosen_headings: Normalized headings used as event_type filters
+        activity_type_docs: Documents returned by retrieve_activity_types
+
+    Returns:
+        Activity definition documents
+    """
+    catalog = _catalog_for(stores)
+    if catalog is not None:
+        defs = catalog.get_activity_documents(chosen_headings)
+        if defs:
+            return defs
+    return [
+        d
+        for d in activity_type_docs
+        if (d.metadata.get("activity_heading") or "").strip() in chosen_headings
+    ]
+
+
 def build_context_block(
     events: List[Document], activity_defs: List[Document]
 ) -> str:
@@ -359,10 +546,14 @@ def answer_user(
 
     print(f"activity_query_parts: {activity_query_parts}")
 
-    # Retrieve more than 5 so dedupe returns multiple headings
-    activity_type_docs = retrieve_activity_types(
-        stores, user_question, activity_query_parts, k=5
-    )
+    # Specific profiles are answered from the routing table; free-form ones
+    # go through the vector search (retrieving more than 5 so dedupe
+    # returns multiple headings)
+    activity_type_docs = route_activity_types(stores, profile, k=5)
+    if activity_type_docs is None:
+        activity_type_docs = retrieve_activity_types(
+            stores, user_question, activity_query_parts, k=5
+        )
 
     print(f"**** activity_type_docs: {activity_type_docs}")
 
@@ -411,12 +602,14 @@ def answer_user(
     if state:
         events_query_parts["state"] = state
 
-    # Retrieve events with larger K for re-ranking
+    # Retrieve events with larger K for re-ranking; event cards only use
+    # metadata, so page_content is not read (see load_event_contents)
     events = retrieve_events_for_activity_type(
         stores=stores,
         user_question=user_question,
         input_filter=events_query_parts,
         k=RETRIEVAL_K,
+        include_content=False,
     )
 
     print(f"Retrieved events: {len(events)}")
@@ -484,11 +677,7 @@ def answer_user(
         print(f"Using original order (no re-ranking): {len(top_events)} events")
 
     # Include activity definitions for reasoning (intensity/benefits)
-    activity_defs = [
-        d
-        for d in activity_type_docs
-        if (d.metadata.get("activity_heading") or "").strip() in chosen_headings
-    ]
+    activity_defs = get_activity_definitions(stores, chosen_headings, activity_type_docs)
 
     return build_context_block(top_events, activity_defs)
 
@@ -4,12 +4,18 @@ import csv
 import re
 import json
 import os
-from typing import List, Optional, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple, Iterator
 from langchain_core.documents import Document
 
-import groq
+import pandas as pd
+
 import ollama
 
+from llm import LLMClient, as_llm_client
+from utils.gazetteer import Gazetteer
+
 
 def ollama_call(
     system_prompt: str,
@@ -23,20 +29,13 @@ def ollama_call(
     Args:
         system_prompt: System prompt for the LLM
         user_prompt: User prompt for the LLM
-        ollama_client: Ollama client instance
+        ollama_client: Ollama client instance (or any LLMClient)
         model: Model name to use
         
     Returns:
         Raw text response from LLM
     """
-    response = ollama_client.chat(
-        model=model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-    )
-    return response["message"]["content"]
+    return as_llm_client(ollama_client, model=model).complete(system_prompt, user_prompt, model=model)
 
 
 def build_review_documents(csv_path: str) -> List[Document]:
@@ -101,6 +100,155 @@ def build_review_documents(csv_path: str) -> List[Document]:
     return documents
 
 
+# Deterministic extraction patterns used by the cascade extractor
+# e.g. "AQUA ZUMBA", "SALSA / LATIN DANCE", "CIRCUIT CARDIO & STRENGTH"
+_REVIEW_EVENT_RE = re.compile(r"\b[A-Z]{2,}(?:(?:\s*[/&+]\s*|\s+|-)[A-Z]{2,})*\b")
+# e.g. "Pinecrest YMCA", "Seabrook Commons YMCA", "Concord Public Library"
+_REVIEW_VENUE_RE = re.compile(
+    r"\b((?:[A-Z][a-z]+\s+){1,3}(?:YMCA|Library|Center|Centre|Cinema|Playhouse|Theatre|Theater))\b"
+)
+# e.g. "in Lexington", "(Plymouth)"
+_REVIEW_CITY_RE = re.compile(
+    r"(?:\bin\s+|\()([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b"
+)
+# Reviews that deliberately name no specific class ("a class at ...")
+_REVIEW_GENERIC_EVENT_RE = re.compile(r"(?i)\ba (?:class|session|program|workshop)\b")
+# "BOOT CAMP at ...", "AQUA FIT @ ..." right after an upper-case phrase
+_REVIEW_AT_RE = re.compile(r"\s*(?:,\s*)?(?:at|@)\s", re.IGNORECASE)
+_VENUE_WORDS = {"YMCA"}
+# Upper-case words reviewers use for emphasis, never activity names on their own
+_EMPHASIS_WORDS = {
+    "ALL", "ALWAYS", "AMAZING", "AND", "AWESOME", "AWFUL", "BAD", "BEST", "BUT", "DO", "EVER",
+    "EXCELLENT", "FANTASTIC", "FUN", "GOOD", "GREAT", "HIGHLY", "HORRIBLE", "IS", "IT", "LOL",
+    "LOVE", "LOVED", "MUST", "NEVER", "NICE", "NO", "NOT", "OK", "OKAY", "OMG", "PERFECT",
+    "RECOMMEND", "REALLY", "SO", "SUPER", "TERRIBLE", "THE", "TOO", "VERY", "WAS", "WORST", "WOW", "YES",
+}
+# Characters between an upper-case phrase and a named venue for them to count as related
+_VENUE_PROXIMITY = 40
+
+# Reviews scoring below this go to the LLM in cascade mode
+CASCADE_CONFIDENCE_THRESHOLD = 0.7
+
+
+def _rule_event_type(review_text: str) -> Tuple[Optional[str], bool]:
+    """
+    Best upper-case event type candidate of a review, without a catalog.
+
+    Candidates made only of emphasis or venue words, and single words under
+    four letters, are skipped. A candidate followed by "at" / "@" or close to
+    a named venue ("BOOT CAMP at Pinecrest YMCA") is preferred over the first
+    one found.
+
+    Args:
+        review_text: The review text
+
+    Returns:
+        (event type or None, whether it is next to "at" or a venue)
+    """
+    venue_match = _REVIEW_VENUE_RE.search(review_text)
+    first = None
+    for match in _REVIEW_EVENT_RE.finditer(review_text):
+        phrase = match.group(0)
+        words = re.findall(r"[A-Z]+", phrase)
+        if all(w in _VENUE_WORDS or w in _EMPHASIS_WORDS for w in words):
+            continue
+        if len(words) == 1 and len(phrase) < 4:
+            continue
+        near = _REVIEW_AT_RE.match(review_text, match.end()) is not None or (
+            venue_match is not None
+            and (
+                0 <= venue_match.start() - match.end() <= _VENUE_PROXIMITY
+                or 0 <= match.start() - venue_match.end() <= _VENUE_PROXIMITY
+            )
+        )
+        if near:
+            return phrase, True
+        first = first or phrase
+    return first, False
+
+
+def _sentiment_from_rating(rating: Optional[str]) -> Optional[str]:
+    """Map a 1-5 star rating to positive/neutral/negative."""
+    try:
+        value = float(rating) if rating else None
+    except (ValueError, TypeError):
+        value = None
+    if value is None:
+        return None
+    if value >= 4:
+        return "positive"
+    if value <= 2:
+        return "negative"
+    return "neutral"
+
+
+def _extract_metadata_with_rules(
+    review_text: str,
+    rating: Optional[str] = None,
+    gazetteer: Optional[Gazetteer] = None,
+) -> Dict[str, Any]:
+    """
+    Extract metadata from a single review without calling an LLM.
+
+    Confidence is a weighted score in [0, 1]:
+    - event_type (0.4): a catalog (gazetteer) match; an upper-case phrase
+      only gets 0.2 next to "at" or a venue and 0.1 elsewhere, since
+      reviewers also capitalize for emphasis. An explicit generic mention
+      like "a class" (confidently no event type) gets 0.3
+    - location (0.4): a named venue ("Pinecrest YMCA"), or half credit for a city only
+    - sentiment (0.2): derived from the star rating
+
+    Args:
+        review_text: The review text to extract metadata from
+        rating: Optional star rating from the CSV, used for sentiment
+        gazetteer: Optional catalog gazetteer; its matches take precedence over
+                   the regex patterns and are returned in catalog spelling
+
+    Returns:
+        Dictionary with 'event_type', 'location', 'sentiment' and 'confidence' keys
+    """
+    confidence = 0.0
+
+    found = gazetteer.extract(review_text) if gazetteer is not None else {}
+
+    event_type = found.get("event_type")
+    if event_type:
+        confidence += 0.4
+    else:
+        event_type, near = _rule_event_type(review_text)
+        if event_type:
+            confidence += 0.2 if near else 0.1
+        elif _REVIEW_GENERIC_EVENT_RE.search(review_text):
+            confidence += 0.3
+
+    location = found.get("venue")
+    if not location:
+        venue_match = _REVIEW_VENUE_RE.search(review_text)
+        if venue_match:
+            location = venue_match.group(1).strip()
+    if location:
+        confidence += 0.4
+    else:
+        location = found.get("city")
+        if not location:
+            city_match = _REVIEW_CITY_RE.search(review_text)
+            if city_match:
+                location = city_match.group(1).strip()
+        if location:
+            confidence += 0.2
+
+    sentiment = _sentiment_from_rating(rating)
+    if sentiment:
+        confidence += 0.2
+
+    return {
+        "event_type": event_type,
+        "location": location,
+        "sentiment": sentiment,
+        "confidence": round(confidence, 2),
+    }
+
+
 
 REVIEW_METADATA_SYSTEM_PROMPT = """
 You are a metadata extraction assistant for activity reviews.
@@ -138,23 +286,21 @@ Rules:
 """
 
 
-def _extract_metadata_with_llm(review_text: str, groq_client: groq.Groq, model: str) -> Dict[str, Optional[str]]:
+def _extract_metadata_with_llm(review_text: str, llm_client: LLMClient, model: str) -> Dict[str, Optional[str]]:
     """
     Extract metadata from a single review using LLM.
     
     Args:
         review_text: The review text to extract metadata from
-        batch_mode: If True, expects review_text to contain multiple reviews
+        llm_client: LLMClient (raw groq.Groq / ollama.Client are wrapped)
+        model: Model name to use
         
     Returns:
         Dictionary with 'event_type', 'location', and 'sentiment' keys
     """
-    if not groq_client:
+    if not llm_client:
         return {"event_type": None, "location": None, "sentiment": None}
     
-    # Import here to avoid circular imports
-    from chat_ui.profile import llm_call_profile
-    
     user_prompt = f"""
 Extract metadata from this review text:
 
@@ -165,14 +311,10 @@ Example: {{"event_type": "BEGINNER COOKING", "location": "Pinecrest YMCA", "sent
 If a field cannot be determined, use null.
 """
     
-    if not groq_client:
-        return {"event_type": None, "location": None, "sentiment": None}
-    
     try:
-        result_text = llm_call_profile(
+        result_text = as_llm_client(llm_client, model=model).complete(
             REVIEW_METADATA_SYSTEM_PROMPT,
             user_prompt,
-            groq_client=groq_client,
             model=model
         ).strip()
         
@@ -196,22 +338,98 @@ If a field cannot be determined, use null.
         print(f"Warning: LLM metadata extraction failed for review: {e}")
         return {"event_type": None, "location": None, "sentiment": None}
 
-# Import moved inside function to avoid circular imports
+# Adaptive batching: batches are sized by an estimated token budget, not a fixed count
+BATCH_TOKEN_BUDGET = 2000
+# Rough per-review allowance for the JSON object the model returns
+_OUTPUT_TOKENS_PER_REVIEW = 30
+
+
+def _empty_metadata() -> Dict[str, Optional[str]]:
+    return {"event_type": None, "location": None, "sentiment": None}
+
 
-def _extract_metadata_batch_with_llm(reviews: List[str], ollama_client: ollama.Client, model: str) -> List[Dict[str, Optional[str]]]:
+def _estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token) used for batch sizing."""
+    return len(text) // 4 + 1
+
+
+def _plan_batches(
+    reviews: List[str],
+    token_budget: int = BATCH_TOKEN_BUDGET,
+    max_batch_size: Optional[int] = None,
+) -> List[Tuple[int, int]]:
     """
-    Extract metadata from multiple reviews in a single LLM call (more efficient).
+    Split reviews into contiguous batches that fit an estimated token budget.
     
     Args:
         reviews: List of review texts
+        token_budget: Estimated prompt + completion tokens allowed per batch
+        max_batch_size: Optional hard cap on reviews per batch
         
     Returns:
-        List of metadata dictionaries with 'event_type', 'location', and 'sentiment' keys
+        List of (start, end) index ranges into reviews
+    """
+    batches: List[Tuple[int, int]] = []
+    start = 0
+    used = 0
+    for i, review in enumerate(reviews):
+        cost = _estimate_tokens(review) + _OUTPUT_TOKENS_PER_REVIEW
+        full = max_batch_size is not None and i - start >= max_batch_size
+        if i > start and (used + cost > token_budget or full):
+            batches.append((start, i))
+            start, used = i, 0
+        used += cost
+    if start < len(reviews):
+        batches.append((start, len(reviews)))
+    return batches
+
+
+def _parse_batch_response(result_text: str, review_ids: List[str]) -> Dict[str, Dict[str, Optional[str]]]:
     """
+    Parse a batch response into metadata keyed by review ID.
     
-    # Format reviews for batch processing
+    Raises:
+        ValueError: If the response contains no parseable JSON array
+    """
+    json_start = result_text.find('[')
+    json_end = result_text.rfind(']') + 1
+    if json_start < 0 or json_end <= json_start:
+        raise ValueError("No JSON array in batch response")
+    
+    metadata_list = json.loads(result_text[json_start:json_end])
+    if not isinstance(metadata_list, list):
+        raise ValueError("Batch response is not a JSON array")
+    
+    wanted = set(review_ids)
+    results: Dict[str, Dict[str, Optional[str]]] = {}
+    for metadata in metadata_list:
+        if not isinstance(metadata, dict):
+            continue
+        review_id = str(metadata.get("id", "")).strip()
+        if review_id in wanted and review_id not in results:
+            results[review_id] = {
+                "event_type": metadata.get("event_type"),
+                "location": metadata.get("location"),
+                "sentiment": metadata.get("sentiment"),
+            }
+    return results
+
+
+def _extract_with_bisection(
+    items: List[Tuple[str, str]],
+    llm_client: LLMClient,
+    model: str,
+    metrics: Dict[str, int],
+) -> Dict[str, Dict[str, Optional[str]]]:
+    """
+    Run one batch call and heal failures instead of dropping the batch.
+    
+    Unparseable responses are bisected and each half retried. Reviews whose IDs
+    are missing from an otherwise valid response are retried as a smaller batch.
+    A single review that still fails is left out (caller fills nulls).
+    """
     reviews_text = "\n\n".join([
-        f"Review {i+1}:\n{review}" for i, review in enumerate(reviews)
+        f"Review {review_id}:\n{review}" for review_id, review in items
     ])
     
     user_prompt = f"""
@@ -219,56 +437,176 @@ Extract metadata from these reviews:
 
 {reviews_text}
 
-Return a JSON array with one object per review, each with event_type, location, and sentiment fields.
-Example: [{{"event_type": "BEGINNER COOKING", "location": "Pinecrest YMCA", "sentiment": "positive"}}, {{"event_type": null, "location": "Boston", "sentiment": "negative"}}]
+Return a JSON array with one object per review, each with id, event_type, location, and sentiment fields.
+The id must be copied exactly from the review label (e.g. "R1").
+Example: [{{"id": "R1", "event_type": "BEGINNER COOKING", "location": "Pinecrest YMCA", "sentiment": "positive"}}, {{"id": "R2", "event_type": null, "location": "Boston", "sentiment": "negative"}}]
 If a field cannot be determined, use null.
 """
     
-    if not ollama_client or not reviews:
-        return [{"event_type": None, "location": None, "sentiment": None} for _ in reviews]
-    
+    metrics["llm_calls"] += 1
     try:
-        result_text = ollama_call(
+        result_text = llm_client.complete(
             REVIEW_METADATA_SYSTEM_PROMPT, 
             user_prompt, 
-            ollama_client=ollama_client,
             model=model
         ).strip()
-        print(f"In _extract_metadata_batch_with_llm **** PRINT result_text: {result_text}")
-        # Try to extract JSON array from the response
-        json_start = result_text.find('[')
-        json_end = result_text.rfind(']') + 1
-        
-        if json_start >= 0 and json_end > json_start:
-            result_text = result_text[json_start:json_end]
+        results = _parse_batch_response(result_text, [review_id for review_id, _ in items])
+    except ValueError as e:
+        # Malformed JSON: bisect and retry both halves
+        metrics["failed_batches"] += 1
+        if len(items) == 1:
+            print(f"Warning: Batch LLM metadata extraction failed for review {items[0][0]}: {e}")
+            metrics["dropped_reviews"] += 1
+            return {}
+        mid = len(items) // 2
+        metrics["retries"] += 2
+        results = _extract_with_bisection(items[:mid], llm_client, model, metrics)
+        results.update(_extract_with_bisection(items[mid:], llm_client, model, metrics))
+        return results
+    except Exception as e:
+        # Transport/API errors are not fixed by smaller batches
+        print(f"Warning: Batch LLM metadata extraction failed: {e}")
+        metrics["failed_batches"] += 1
+        metrics["dropped_reviews"] += len(items)
+        return {}
+    
+    missing = [item for item in items if item[0] not in results]
+    if missing:
+        metrics["failed_batches"] += 1
+        if len(missing) < len(items):
+            metrics["retries"] += 1
+            results.update(_extract_with_bisection(missing, llm_client, model, metrics))
+        elif len(items) > 1:
+            mid = len(items) // 2
+            metrics["retries"] += 2
+            results.update(_extract_with_bisection(items[:mid], llm_client, model, metrics))
+            results.update(_extract_with_bisection(items[mid:], llm_client, model, metrics))
+        else:
+            metrics["dropped_reviews"] += 1
+    return results
+
+
+def _new_batch_metrics() -> Dict[str, int]:
+    return {"batches": 0, "llm_calls": 0, "failed_batches": 0, "retries": 0, "dropped_reviews": 0}
+
+
+def _extract_metadata_batch_with_llm(
+    reviews: List[str],
+    ollama_client: Any,
+    model: str,
+    metrics: Optional[Dict[str, int]] = None,
+) -> List[Dict[str, Optional[str]]]:
+    """
+    Extract metadata from multiple reviews in a single LLM call (more efficient).
+    
+    Each review is labelled with an explicit ID (R1, R2, ...) in the prompt and
+    results are aligned by that ID, never by position. Failed or partial batches
+    are bisected and retried (see _extract_with_bisection).
+    
+    Args:
+        reviews: List of review texts
+        ollama_client: LLMClient, or a raw ollama.Client / groq.Groq to wrap
+        model: Model name to use
+        metrics: Optional counters dict (see _new_batch_metrics) updated in place
         
-        metadata_list = json.loads(result_text)
+    Returns:
+        List of metadata dictionaries with 'event_type', 'location', and 'sentiment' keys
+    """
+    if not ollama_client or not reviews:
+        return [_empty_metadata() for _ in reviews]
+    
+    if metrics is None:
+        metrics = _new_batch_metrics()
+    metrics["batches"] += 1
+    
+    items = [(f"R{i+1}", review) for i, review in enumerate(reviews)]
+    results = _extract_with_bisection(items, as_llm_client(ollama_client, model=model), model, metrics)
+    return [results.get(review_id, _empty_metadata()) for review_id, _ in items]
+
+
+def extract_metadata_adaptive(
+    reviews: List[str],
+    ollama_client: Any,
+    model: str,
+    token_budget: int = BATCH_TOKEN_BUDGET,
+    max_batch_size: Optional[int] = None,
+) -> Tuple[List[Dict[str, Optional[str]]], Dict[str, Any]]:
+    """
+    Extract metadata for any number of reviews using token-budgeted batches.
+    
+    Batches run concurrently, up to the client's max_concurrency.
+    
+    Args:
+        reviews: List of review texts
+        ollama_client: LLMClient, or a raw ollama.Client / groq.Groq to wrap
+        model: Model name to use
+        token_budget: Estimated tokens allowed per batch call
+        max_batch_size: Optional hard cap on reviews per batch
         
-        # Ensure we have the expected structure
-        results = []
-        for metadata in metadata_list:
-            results.append({
-                "event_type": metadata.get("event_type"),
-                "location": metadata.get("location"),
-                "sentiment": metadata.get("sentiment"),
+    Returns:
+        - metadata list aligned with reviews
+        - metrics: batch/call counters plus failure_rate, retry_rate and reviews_per_call
+    """
+    llm_client = as_llm_client(ollama_client, model=model)
+    batches = _plan_batches(reviews, token_budget, max_batch_size)
+    
+    def run_batch(bounds: Tuple[int, int]) -> Tuple[List[Dict[str, Optional[str]]], Dict[str, int]]:
+        # Per-batch counters avoid sharing a mutable dict across threads
+        batch_metrics = _new_batch_metrics()
+        start, end = bounds
+        return _extract_metadata_batch_with_llm(reviews[start:end], llm_client, model, batch_metrics), batch_metrics
+    
+    if len(batches) > 1 and llm_client.max_concurrency > 1:
+        with ThreadPoolExecutor(max_workers=llm_client.max_concurrency) as pool:
+            batch_results = list(pool.map(run_batch, batches))
+    else:
+        batch_results = [run_batch(bounds) for bounds in batches]
+    
+    metrics = _new_batch_metrics()
+    all_metadata: List[Dict[str, Optional[str]]] = []
+    for batch_metadata, batch_metrics in batch_results:
+        all_metadata.extend(batch_metadata)
+        for key, value in batch_metrics.items():
+            metrics[key] += value
+    
+    report: Dict[str, Any] = dict(metrics)
+    report["failure_rate"] = metrics["failed_batches"] / metrics["llm_calls"] if metrics["llm_calls"] else 0.0
+    report["retry_rate"] = metrics["retries"] / metrics["batches"] if metrics["batches"] else 0.0
+    report["reviews_per_call"] = len(reviews) / metrics["llm_calls"] if metrics["llm_calls"] else 0.0
+    if metrics["llm_calls"]:
+        print(
+            f"Batch extraction: {metrics['batches']} batches, {metrics['llm_calls']} LLM calls, "
+            f"failure rate {report['failure_rate']:.1%}, retry rate {report['retry_rate']:.2f}, "
+            f"{report['reviews_per_call']:.1f} reviews/call"
+        )
+    return all_metadata, report
+
+
+def _read_reviews_csv(csv_path: str) -> List[Dict[str, str]]:
+    """Read non-empty reviews from the CSV as review_text/created_at/rating dicts."""
+    reviews_data = []
+    with open(csv_path, "r", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            review_text = row.get("review_text", "").strip()
+            if not review_text:
+                continue
+            
+            reviews_data.append({
+                "review_text": review_text,
+                "created_at": row.get("created_at", "").strip(),
+                "rating": row.get("rating", "").strip(),
             })
-        
-        # Pad if needed
-        while len(results) < len(reviews):
-            results.append({"event_type": None, "location": None, "sentiment": None})
-        
-        return results[:len(reviews)]
-    except Exception as e:
-        print(f"Warning: Batch LLM metadata extraction failed: {e}")
-        return [{"event_type": None, "location": None, "sentiment": None} for _ in reviews]
+    return reviews_data
 
 
 def build_review_documents_using_llm(
     csv_path: str,
-    ollama_client: ollama.Client,
+    ollama_client: Any,
     model: str,
     batch_size: int = 10,
     use_batch: bool = True,
+    token_budget: int = BATCH_TOKEN_BUDGET,
 ) -> List[Document]:
     """
     Build Document objects from reviews CSV file using LLM to extract metadata.
@@ -278,8 +616,11 @@ def build_review_documents_using_llm(
     
     Args:
         csv_path: Path to the reviews CSV file
-        batch_size: Number of reviews to process in a single LLM call (when use_batch=True)
-        use_batch: If True, process reviews in batches for efficiency. If False, process one at a time.
+        ollama_client: LLMClient, or a raw ollama.Client / groq.Groq to wrap
+        model: Model name to use
+        batch_size: Maximum number of reviews in a single LLM call (when use_batch=True)
+        use_batch: If True, process reviews in batches for efficiency. If False, one review per call.
+        token_budget: Estimated tokens allowed per batch call (batches are sized to fit)
         
     Returns:
         List of Document objects with review text and metadata
@@ -288,43 +629,29 @@ def build_review_documents_using_llm(
         print("Warning: GROQ_API_KEY not set. Falling back to regex-based extraction.")
         return build_review_documents(csv_path)
     
+    llm_client = as_llm_client(ollama_client, model=model)
     documents: List[Document] = []
-    reviews_data = []
     
     # First pass: read all reviews from CSV
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            review_text = row.get("review_text", "").strip()
-            if not review_text:
-                continue
-            
-            reviews_data.append({
-                "review_text": review_text,
-                "created_at": row.get("created_at", "").strip(),
-                "rating": row.get("rating", "").strip(),
-            })
+    reviews_data = _read_reviews_csv(csv_path)
     
     print(f"Processing {len(reviews_data)} reviews with LLM...")
     
     # Extract metadata using LLM
     if use_batch and batch_size > 1:
-        # Process in batches
-        all_metadata = []
-        for i in range(0, len(reviews_data), batch_size):
-            batch = reviews_data[i:i + batch_size]
-            review_texts = [r["review_text"] for r in batch]
-            batch_metadata = _extract_metadata_batch_with_llm(review_texts, ollama_client, model)
-            all_metadata.extend(batch_metadata)
+        # Process in token-budgeted batches of at most batch_size reviews
+        review_texts = [r["review_text"] for r in reviews_data]
+        all_metadata, _metrics = extract_metadata_adaptive(
+            review_texts, llm_client, model,
+            token_budget=token_budget, max_batch_size=batch_size,
+        )
     else:
-        # Process one at a time
-        all_metadata = []
-        for i, review_data in enumerate(reviews_data):
-            if (i + 1) % 10 == 0:
-                print(f"Processing review {i + 1}/{len(reviews_data)}...")
-            
-            metadata = _extract_metadata_with_llm(review_data["review_text"], ollama_client, model)
-            all_metadata.append(metadata)
+        # One review per call, run concurrently up to the client's limit
+        with ThreadPoolExecutor(max_workers=llm_client.max_concurrency) as pool:
+            all_metadata = list(pool.map(
+                lambda review_data: _extract_metadata_with_llm(review_data["review_text"], llm_client, model),
+                reviews_data,
+            ))
     
     # Create documents with extracted metadata
     for review_data, metadata in zip(reviews_data, all_metadata):
@@ -346,11 +673,106 @@ def build_review_documents_using_llm(
     print(f"Loaded {len(documents)} reviews from {csv_path} (using LLM for metadata extraction)")
     return documents
 
+def build_review_documents_cascade(
+    csv_path: str,
+    llm_client: Optional[Any] = None,
+    model: str = "openai/gpt-oss-120b",
+    batch_size: int = 10,
+    confidence_threshold: float = CASCADE_CONFIDENCE_THRESHOLD,
+    token_budget: int = BATCH_TOKEN_BUDGET,
+    gazetteer: Optional[Gazetteer] = None,
+) -> Tuple[List[Document], Dict[str, Any]]:
+    """
+    Build Document objects from reviews CSV using a rules-first extraction cascade.
+    
+    Every review goes through the deterministic extractor first. Only reviews whose
+    confidence is below the threshold are sent to the LLM in token-budgeted
+    batches. LLM fields override rule fields only when the LLM returns a value.
+    
+    Args:
+        csv_path: Path to the reviews CSV file
+        llm_client: LLMClient (raw groq.Groq / ollama.Client are wrapped). If None,
+                    rule results are kept as-is
+        model: Model name to use for LLM calls
+        batch_size: Maximum number of reviews in a single LLM call
+        confidence_threshold: Minimum rule confidence to skip the LLM
+        token_budget: Estimated tokens per batched LLM call
+        gazetteer: Optional catalog gazetteer (e.g. Gazetteer.from_event_db) used
+                   by the deterministic stage
+        
+    Returns:
+        - documents: Document objects with review text and metadata
+        - stats: per-stage counts and timings (seconds)
+    """
+    reviews_data = _read_reviews_csv(csv_path)
+    
+    # Stage 1: deterministic extraction
+    rules_start = time.perf_counter()
+    all_metadata = [
+        _extract_metadata_with_rules(r["review_text"], r["rating"], gazetteer) for r in reviews_data
+    ]
+    rules_seconds = time.perf_counter() - rules_start
+    
+    leftover = [
+        i for i, metadata in enumerate(all_metadata)
+        if metadata["confidence"] < confidence_threshold
+    ]
+    methods = ["rules"] * len(reviews_data)
+    
+    # Stage 2: LLM for low-confidence leftovers only
+    llm_start = time.perf_counter()
+    if llm_client is not None and leftover:
+        print(f"Sending {len(leftover)}/{len(reviews_data)} low-confidence reviews to LLM...")
+        leftover_texts = [reviews_data[i]["review_text"] for i in leftover]
+        llm_metadata, _metrics = extract_metadata_adaptive(
+            leftover_texts, llm_client, model,
+            token_budget=token_budget, max_batch_size=batch_size,
+        )
+        
+        for i, metadata in zip(leftover, llm_metadata):
+            for key in ("event_type", "location", "sentiment"):
+                if metadata.get(key):
+                    all_metadata[i][key] = metadata[key]
+            methods[i] = "llm"
+    llm_seconds = time.perf_counter() - llm_start
+    
+    documents: List[Document] = []
+    for review_data, metadata, method in zip(reviews_data, all_metadata, methods):
+        doc = Document(
+            page_content=review_data["review_text"],
+            metadata={
+                "source": os.path.basename(csv_path),
+                "created_at": review_data["created_at"],
+                "rating": review_data["rating"],
+                "event_type": metadata["event_type"],
+                "location": metadata["location"],
+                "sentiment": metadata["sentiment"],
+                "doc_type": "review",
+                "extraction_method": method,
+            }
+        )
+        documents.append(doc)
+    
+    stats = {
+        "total": len(reviews_data),
+        "rules_resolved": len(reviews_data) - len(leftover),
+        "llm_candidates": len(leftover),
+        "llm_processed": methods.count("llm"),
+        "rules_seconds": rules_seconds,
+        "llm_seconds": llm_seconds,
+    }
+    print(
+        f"Cascade extraction: {stats['rules_resolved']}/{stats['total']} resolved by rules "
+        f"in {rules_seconds:.3f}s, {stats['llm_processed']} sent to LLM in {llm_seconds:.3f}s"
+    )
+    return documents, stats
+
+
 from database.review_db import ReviewDB, ReviewRecord, init_reviews_database
 def process_and_store_reviews_using_llm(
     reviews_csv_path: str,
     reviews_db_path: str,
-    ollama_client: ollama.Client,
+    ollama_client: Any,
     model: str,
     use_llm: bool = True,
     batch_size: int = 10,
@@ -361,7 +783,7 @@ def process_and_store_reviews_using_llm(
     Args:
         reviews_csv_path: Path to reviews CSV file
         reviews_db_path: Path to SQLite database for reviews
-        groq_client: Groq client instance for LLM calls
+        ollama_client: LLMClient, or a raw ollama.Client / groq.Groq to wrap
         model: Model name to use for LLM calls
         use_llm: If True, use LLM for metadata extraction; otherwise use regex
         batch_size: Number of reviews to process in a single LLM call (when use_llm=True)
@@ -414,4 +836,143 @@ def process_and_store_reviews_using_llm(
         reviews_db.insert_reviews(review_records)
     
     print(f"Stored {len(review_records)} reviews in SQL database")
-    return reviews_db
\ No newline at end of file
+    return reviews_db
+
+
+# Rows per pandas chunk in the bulk ingestion path; bounds peak memory
+BULK_CHUNK_SIZE = 50_000
+
+
+def _none_for_missing(column: pd.Series) -> pd.Series:
+    """Convert NaN to None so sqlite3 stores NULL."""
+    return column.astype(object).where(column.notna(), None)
+
+
+def _extract_metadata_columns(
+    texts: pd.Series,
+    ratings: pd.Series,
+    gazetteer: Optional[Gazetteer] = None,
+) -> pd.DataFrame:
+    """
+    Column-wise equivalent of _extract_metadata_with_rules (without confidence).
+    
+    Args:
+        texts: Review texts
+        ratings: Star ratings as strings
+        gazetteer: Optional catalog gazetteer; its matches take precedence
+        
+    Returns:
+        DataFrame with event_type, location and sentiment columns
+    """
+    event_type = texts.map(lambda text: _rule_event_type(text)[0])
+    venue = texts.str.extract(_REVIEW_VENUE_RE, expand=False).str.strip()
+    
+    if gazetteer is not None:
+        found = pd.DataFrame(texts.map(gazetteer.extract).tolist(), index=texts.index)
+        event_type = found["event_type"].combine_first(event_type)
+        venue = found["venue"].combine_first(venue)
+        city = found["city"]
+    else:
+        city = pd.Series(None, index=texts.index, dtype=object)
+    
+    # City is only a fallback, so only scan rows that still lack a location
+    needs_city = venue.isna() & city.isna()
+    if needs_city.any():
+        city = city.combine_first(
+            texts[needs_city].str.extract(_REVIEW_CITY_RE, expand=False).str.strip()
+        )
+    
+    numeric = pd.to_numeric(ratings, errors="coerce")
+    sentiment = pd.Series(None, index=texts.index, dtype=object)
+    sentiment[numeric.notna()] = "neutral"
+    sentiment[numeric >= 4] = "positive"
+    sentiment[numeric <= 2] = "negative"
+    
+    return pd.DataFrame({
+        "event_type": event_type,
+        "location": venue.combine_first(city),
+        "sentiment": sentiment,
+    })
+
+
+def iter_review_row_chunks(
+    csv_path: str,
+    chunksize: int = BULK_CHUNK_SIZE,
+    gazetteer: Optional[Gazetteer] = None,
+) -> Iterator[List[tuple]]:
+    """
+    Read the reviews CSV in chunks and yield database row tuples.
+    
+    Extraction runs column-wise per chunk; no Document or ReviewRecord objects
+    are created. Rows match ReviewDB.insert_review_rows column order.
+    
+    Args:
+        csv_path: Path to the reviews CSV file
+        chunksize: Number of CSV rows per chunk
+        gazetteer: Optional catalog gazetteer for event type/venue matching
+        
+    Yields:
+        Lists of (review_text, rating, created_at, event_type, location, sentiment, source)
+    """
+    source = os.path.basename(csv_path)
+    reader = pd.read_csv(
+        csv_path,
+        usecols=["created_at", "rating", "review_text"],
+        dtype=str,
+        keep_default_na=False,
+        chunksize=chunksize,
+        encoding="utf-8",
+    )
+    for chunk in reader:
+        texts = chunk["review_text"].str.strip()
+        keep = texts != ""
+        texts = texts[keep]
+        ratings = chunk["rating"][keep].str.strip()
+        created_at = chunk["created_at"][keep].str.strip()
+        
+        metadata = _extract_metadata_columns(texts, ratings, gazetteer)
+        # tolist() materializes each column in one C-level pass
+        yield list(zip(
+            texts.tolist(),
+            ratings.tolist(),
+            created_at.tolist(),
+            _none_for_missing(metadata["event_type"]).tolist(),
+            _none_for_missing(metadata["location"]).tolist(),
+            _none_for_missing(metadata["sentiment"]).tolist(),
+            [source] * len(texts),
+        ))
+
+
+def bulk_store_reviews(
+    reviews_csv_path: str,
+    reviews_db_path: str,
+    chunksize: int = BULK_CHUNK_SIZE,
+    gazetteer: Optional[Gazetteer] = None,
+) -> ReviewDB:
+    """
+    Load a reviews CSV into the database using the vectorized bulk path.
+    
+    Rule-based extraction only (no LLM). All chunks are inserted in one
+    transaction; peak memory is bounded by chunksize.
+    
+    Args:
+        reviews_csv_path: Path to reviews CSV file
+        reviews_db_path: Path to SQLite database for reviews
+        chunksize: Number of CSV rows per chunk
+        gazetteer: Optional catalog gazetteer for event type/venue matching
+        
+    Returns:
+        ReviewDB instance
+    """
+    init_reviews_database(reviews_db_path)
+    reviews_db = ReviewDB(reviews_db_path)
+    reviews_db.clear_reviews()
+    
+    start = time.perf_counter()
+    count = reviews_db.insert_review_rows(
+        iter_review_row_chunks(reviews_csv_path, chunksize=chunksize, gazetteer=gazetteer)
+    )
+    seconds = time.perf_counter() - start
+    rate = count / seconds if seconds > 0 else 0.0
+    print(f"Bulk ingested {count} reviews in {seconds:.2f}s ({rate:,.0f} rows/sec)")
+    return reviews_db
@@ -0,0 +1,84 @@
+"""Serving stores answered from the snapshot.
+
+When serving.snapshot is current, the chat server needs neither the Chroma
+collections nor the startup maintenance of the databases: events, review
+scores and the activity catalog come from the snapshot, activity type
+searches from an in-process index over the snapshot's embeddings, and only
+query embedding needs the embedding model.
+"""
+
+import os
+from typing import Any, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from database.review_db import ReviewDB
+from database.snapshot import Snapshot, SnapshotEventStore, SnapshotReviewStore
+from rag.event_index import event_index_path
+from rag.hybrid import HybridVectorIndex
+from rag.quantized_index import quantized_paths
+from rag.vector_index import NumpyVectorIndex
+from vector_db.chroma_store import RagStores
+
+
+def snapshot_is_servable(snapshot: Optional[Snapshot], db_path: str, quantize: bool = False) -> bool:
+    """
+    Whether a server can start from a snapshot alone.
+
+    The snapshot must be current (see open_snapshot()) and hold the
+    activity type embeddings and their model, and the event index must
+    exist in the requested form (float32, or with int8 codes).
+
+    Args:
+        snapshot: Snapshot from open_snapshot(), or None
+        db_path: Events database the snapshot was written from
+        quantize: Whether VECTOR_QUANTIZATION=int8 is requested
+
+    Returns:
+        True if the startup maintenance can be skipped
+    """
+    if snapshot is None or snapshot.embeddings is None or not snapshot.embedding_model:
+        return False
+    index_path = event_index_path(db_path)
+    if not os.path.exists(index_path):
+        return False
+    return all(os.path.exists(p) for p in quantized_paths(index_path)) == quantize
+
+
+def serving_stores(
+    snapshot: Snapshot,
+    db_path: str,
+    review_db: Optional[ReviewDB],
+    embeddings: Embeddings,
+    activity_store: Any = None,
+) -> RagStores:
+    """
+    Stores answering events, review scores and activity type searches from a snapshot.
+
+    Args:
+        snapshot: Current snapshot
+        db_path: Events database (page_content of rendered events, event index)
+        review_db: Reviews database, or None when there are no reviews
+        embeddings: Query embeddings of the activity type index (same model as the snapshot's)
+        activity_store: Chroma activity type store, read only if the snapshot has no embeddings
+
+    Returns:
+        RagStores for retrieval
+    """
+    # The activity type catalog is small: exact in-process search instead of
+    # Chroma, returning one result per heading, fused with BM25 so exact
+    # activity names match too
+    activity_embeddings = snapshot.activity_embedding_documents()
+    if activity_embeddings is not None:
+        documents, vectors = activity_embeddings
+        vector_index = NumpyVectorIndex(
+            embeddings, documents, vectors=vectors,
+            ids=[d.id for d in documents], group_by="activity_heading_norm",
+        )
+    else:
+        vector_index = NumpyVectorIndex.from_chroma(activity_store, group_by="activity_heading_norm")
+    return RagStores(
+        events=SnapshotEventStore(snapshot, db_path),
+        activity_types=HybridVectorIndex(vector_index),
+        reviews=SnapshotReviewStore(snapshot, review_db) if review_db is not None else None,
+    )
@@ -0,0 +1,350 @@
+"""Exact in-process vector index for small corpora (the activity type catalog).
+
+NumpyVectorIndex holds L2-normalized float32 embeddings in one matrix and
+answers similarity_search() with a matrix-vector product and argpartition
+(exact cosine top-k). Chroma `where` filters are evaluated first against
+per-value boolean bitmaps of the indexed metadata fields, so only matching
+rows are scored. It implements the parts of the LangChain Chroma interface
+the pipeline uses (similarity_search*, get, add_documents, delete) and can
+replace RagStores.activity_types.
+
+With group_by set (e.g. activity_heading_norm), rows are scored per group
+(best chunk, or one centroid vector per group) and a top-k search returns k
+distinct groups, so callers need not oversample and de-duplicate.
+"""
+
+import threading
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+# Metadata fields with precomputed bitmaps; other fields are matched by scanning
+BITMAP_FIELDS = ("intensity", "activity_heading", "activity_heading_norm", "source")
+# How rows of a group are scored: best chunk ('max') or the normalized mean vector ('centroid')
+AGGREGATIONS = ("max", "centroid")
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first (argpartition, then sort only those k)."""
+    if k <= 0 or not len(scores):
+        return np.zeros(0, dtype=np.int64)
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class NumpyVectorIndex:
+    """Exact cosine similarity index over a float32 matrix, with bitmap metadata filters."""
+
+    def __init__(
+        self,
+        embedding_function: Embeddings,
+        documents: Sequence[Document] = (),
+        vectors: Optional[np.ndarray] = None,
+        ids: Optional[Sequence[str]] = None,
+        group_by: Optional[str] = None,
+        aggregation: str = "max",
+    ):
+        """
+        Create an index.
+
+        Args:
+            embedding_function: Embeddings used for queries (and documents added later)
+            documents: Documents to index
+            vectors: Their embeddings (computed with embedding_function if omitted)
+            ids: Their ids (default: Document.id, else a new uuid)
+            group_by: Metadata field whose distinct values (case-insensitive) are the
+                search results; rows without a value are never returned
+            aggregation: 'max' or 'centroid' score of a group
+        """
+        if aggregation not in AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation {aggregation!r}; expected one of {AGGREGATIONS}")
+        # Same attribute as Chroma, so cache_query_embeddings() can wrap it
+        self._embedding_function = embedding_function
+        self.group_by = group_by
+        self.aggregation = aggregation
+        self._lock = threading.Lock()
+        self._ids: List[str] = []
+        self._documents: List[Document] = []
+        self._raw = np.zeros((0, 0), dtype=np.float32)
+        self._matrix = self._raw
+        self._bitmaps: Dict[str, Dict[Any, np.ndarray]] = {}
+        # Grouped rows are stored contiguously per group: _groups = (row order, segment starts,
+        # row-ordered matrix, centroid per group)
+        self._groups: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None
+        if documents:
+            self.add_documents(list(documents), ids=ids, vectors=vectors)
+
+    @classmethod
+    def from_chroma(cls, store: Any, group_by: Optional[str] = None, aggregation: str = "max") -> "NumpyVectorIndex":
+        """
+        Copy the documents, metadata and embeddings of a LangChain Chroma store.
+
+        Args:
+            store: Chroma vector store (e.g. RagStores.activity_types)
+            group_by: See NumpyVectorIndex
+            aggregation: See NumpyVectorIndex
+
+        Returns:
+            Index using the store's embedding function
+        """
+        result = store.get(include=["embeddings", "documents", "metadatas"])
+        documents = [
+            Document(id=doc_id, page_content=text or "", metadata=metadata or {})
+            for doc_id, text, metadata in zip(result["ids"], result["documents"], result["metadatas"])
+        ]
+        vectors = np.asarray(result["embeddings"], dtype=np.float32) if documents else None
+        return cls(
+            store.embeddings, documents, vectors=vectors, ids=result["ids"],
+            group_by=group_by, aggregation=aggregation,
+        )
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embedding_function
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _rebuild(self) -> None:
+        """Recompute the normalized matrix and the metadata bitmaps (caller holds the lock)."""
+        self._matrix = _normalize_rows(self._raw) if len(self._raw) else self._raw
+        bitmaps: Dict[str, Dict[Any, np.ndarray]] = {name: {} for name in BITMAP_FIELDS}
+        for i, doc in enumerate(self._documents):
+            for name in BITMAP_FIELDS:
+                value = doc.metadata.get(name)
+                if value is None:
+                    continue
+                bitmap = bitmaps[name].get(value)
+                if bitmap is None:
+                    bitmap = bitmaps[name][value] = np.zeros(len(self._documents), dtype=bool)
+                bitmap[i] = True
+        self._bitmaps = bitmaps
+
+        if self.group_by is not None:
+            codes: Dict[str, int] = {}
+            keys = [(doc.metadata.get(self.group_by) or "").strip().lower() for doc in self._documents]
+            group_codes = np.array([codes.setdefault(key, len(codes)) if key else -1 for key in keys], dtype=np.int64)
+            order = np.flatnonzero(group_codes >= 0)
+            order = order[np.argsort(group_codes[order], kind="stable")]
+            starts = np.flatnonzero(np.r_[True, np.diff(group_codes[order]) != 0]) if len(order) else order
+            grouped_matrix = self._matrix[order] if len(order) else self._matrix
+            if self.aggregation == "centroid" and len(order):
+                centroids = _normalize_rows(np.add.reduceat(grouped_matrix, starts, axis=0))
+            else:
+                centroids = grouped_matrix[:0]
+            self._groups = (order, starts, grouped_matrix, centroids)
+
+    def add_documents(
+        self,
+        documents: List[Document],
+        ids: Optional[Sequence[str]] = None,
+        vectors: Optional[np.ndarray] = None,
+    ) -> List[str]:
+        """
+        Add documents (embedding them unless vectors are given).
+
+        Returns:
+            Ids of the added documents
+        """
+        if not documents:
+            return []
+        if ids is None:
+            ids = [doc.id or str(uuid.uuid4()) for doc in documents]
+        if vectors is None:
+            vectors = np.asarray(
+                self._embedding_function.embed_documents([doc.page_content for doc in documents]), dtype=np.float32
+            )
+        documents = [
+            Document(id=doc_id, page_content=doc.page_content, metadata=dict(doc.metadata))
+            for doc_id, doc in zip(ids, documents)
+        ]
+        with self._lock:
+            self._raw = np.vstack([self._raw, vectors]) if len(self._raw) else np.array(vectors, dtype=np.float32)
+            self._ids.extend(ids)
+            self._documents.extend(documents)
+            self._rebuild()
+        return list(ids)
+
+    def delete(self, ids: Optional[Iterable[str]] = None) -> None:
+        """Remove documents by id."""
+        drop = set(ids or ())
+        with self._lock:
+            keep = [i for i, doc_id in enumerate(self._ids) if doc_id not in drop]
+            self._raw = self._raw[keep] if keep else np.zeros((0, 0), dtype=np.float32)
+            self._ids = [self._ids[i] for i in keep]
+            self._documents = [self._documents[i] for i in keep]
+            self._rebuild()
+
+    def _mask(self, where: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Boolean row mask of a Chroma `where` filter (None: every row)."""
+        if not where:
+            return None
+        n = len(self._documents)
+        masks = []
+        for key, condition in where.items():
+            if key == "$and":
+                mask = np.ones(n, dtype=bool)
+                for clause in condition:
+                    sub = self._mask(clause)
+                    if sub is not None:
+                        mask &= sub
+            elif key == "$or":
+                mask = np.zeros(n, dtype=bool)
+                for clause in condition:
+                    sub = self._mask(clause)
+                    mask |= np.ones(n, dtype=bool) if sub is None else sub
+            elif isinstance(condition, dict):
+                (op, value), = condition.items()
+                if op == "$eq":
+                    mask = self._equals(key, value)
+                elif op == "$ne":
+                    mask = ~self._equals(key, value)
+                elif op == "$in":
+                    mask = np.zeros(n, dtype=bool)
+                    for v in value:
+                        mask |= self._equals(key, v)
+                elif op == "$nin":
+                    mask = np.ones(n, dtype=bool)
+                    for v in value:
+                        mask &= ~self._equals(key, v)
+                else:
+                    raise ValueError(f"Unsupported filter operator {op!r}")
+            else:
+                mask = self._equals(key, condition)
+            masks.append(mask)
+        result = masks[0]
+        for mask in masks[1:]:
+            result = result & mask
+        return result
+
+    def filter_mask(self, where: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Boolean row mask of a Chroma `where` filter, rows in get() order (None: every row)."""
+        with self._lock:
+            return self._mask(where)
+
+    def _equals(self, key: str, value: Any) -> np.ndarray:
+        n = len(self._documents)
+        if key in self._bitmaps:
+            bitmap = self._bitmaps[key].get(value)
+            return bitmap.copy() if bitmap is not None else np.zeros(n, dtype=bool)
+        return np.fromiter((doc.metadata.get(key) == value for doc in self._documents), dtype=bool, count=n)
+
+    def similarity_search_by_vector_with_score(
+        self, embedding: Sequence[float], k: int = 4, filter: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        """
+        Exact top-k by cosine similarity among rows matching the filter.
+
+        Args:
+            embedding: Query embedding
+            k: Number of results
+            filter: Chroma-style `where` filter (see build_chroma_where)
+
+        Returns:
+            (document, cosine distance) pairs, nearest first
+        """
+        with self._lock:
+            matrix, documents = self._matrix, self._documents
+            groups = self._groups
+            mask = self._mask(filter)
+        if not len(documents):
+            return []
+        query = np.asarray(embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query)
+        if query_norm:
+            query = query / query_norm
+        if self.group_by is not None:
+            return self._grouped_search(documents, groups, mask, query, k)
+        if mask is None:
+            rows = None
+            scores = matrix @ query
+        else:
+            rows = np.flatnonzero(mask)
+            scores = matrix[rows] @ query
+        best = top_k(scores, k)
+        indices = best if rows is None else rows[best]
+        return [(documents[i], float(1.0 - scores[j])) for i, j in zip(indices.tolist(), best.tolist())]
+
+    def _grouped_search(self, documents, groups, mask, query, k):
+        """Top-k distinct groups; each is returned as its best-scoring matching row."""
+        order, starts, grouped_matrix, centroids = groups
+        if not len(order):
+            return []
+        ends = np.r_[starts[1:], len(order)]
+        allowed = None if mask is None else mask[order]
+        if self.aggregation == "centroid":
+            # One vector per group; a group matches the filter if any of its rows does
+            group_scores = centroids @ query
+            if allowed is not None:
+                group_scores[~np.logical_or.reduceat(allowed, starts)] = -np.inf
+            row_scores = None
+        else:
+            row_scores = grouped_matrix @ query
+            if allowed is not None:
+                row_scores[~allowed] = -np.inf
+            group_scores = np.maximum.reduceat(row_scores, starts)
+        valid = np.flatnonzero(group_scores > -np.inf)
+        results = []
+        for g in valid[top_k(group_scores[valid], k)].tolist():
+            start, end = starts[g], ends[g]
+            if row_scores is None:
+                segment = grouped_matrix[start:end] @ query
+                if allowed is not None:
+                    segment[~allowed[start:end]] = -np.inf
+            else:
+                segment = row_scores[start:end]
+            row = order[start + int(np.argmax(segment))]
+            results.append((documents[row], float(1.0 - group_scores[g])))
+        return results
+
+    def similarity_search_by_vector(
+        self, embedding: Sequence[float], k: int = 4, filter: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_by_vector_with_score(embedding, k, filter)]
+
+    def similarity_search_with_score(
+        self, query: str, k: int = 4, filter: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        return self.similarity_search_by_vector_with_score(self._embedding_function.embed_query(query), k, filter)
+
+    def similarity_search(
+        self, query: str, k: int = 4, filter: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> List[Document]:
+        """Same interface as Chroma.similarity_search()."""
+        return self.similarity_search_by_vector(self._embedding_function.embed_query(query), k, filter)
+
+    def get(
+        self,
+        ids: Optional[Sequence[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        include: Sequence[str] = ("documents", "metadatas"),
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Stored entries, as Chroma.get() (ids, and the included fields)."""
+        with self._lock:
+            mask = self._mask(where)
+            rows = range(len(self._ids)) if mask is None else np.flatnonzero(mask).tolist()
+            if ids is not None:
+                wanted = set(ids)
+                rows = [i for i in rows if self._ids[i] in wanted]
+            rows = list(rows)
+            result: Dict[str, Any] = {"ids": [self._ids[i] for i in rows]}
+            if "documents" in include:
+                result["documents"] = [self._documents[i].page_content for i in rows]
+            if "metadatas" in include:
+                result["metadatas"] = [dict(self._documents[i].metadata) for i in rows]
+            if "embeddings" in include:
+                result["embeddings"] = self._raw[rows] if rows else np.zeros((0, 0), dtype=np.float32)
+        return result
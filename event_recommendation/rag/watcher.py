@@ -0,0 +1,340 @@
+"""Watch the documents tree and re-index changed files incrementally.
+
+DocumentWatcher notices added, modified and removed markdown/CSV files,
+using Linux inotify when available (via ctypes, no extra dependency) and
+periodic stat polling otherwise. Either way, changes are found by diffing
+(size, mtime) snapshots, so inotify only decides when to look.
+
+IncrementalIndexer applies those changes to the live stores: each source
+file is replaced in its own transaction, so the chat server keeps answering
+from the previous data until a file's update commits.
+"""
+
+import os
+import time
+import ctypes
+import ctypes.util
+import select
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+from database.activity_db import ActivityTypeDB
+from rag.document_processing import activity_documents_to_records
+from rag.event_index import build_event_index, event_index_path
+from rag.input_documents.loader import discover_documents
+from rag.parse_cache import ParseCache, parse_corpus
+from rag.reviews_processing import iter_review_row_chunks
+
+WATCHED_SUFFIXES = (".md", ".csv")
+EVENTS_FOLDER = "Events"
+ACTIVITY_FOLDER = "activityType"
+REVIEWS_FOLDER = "Reviews"
+
+# inotify(7) event masks
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM
+    | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+)
+
+Snapshot = Dict[str, Tuple[int, int]]  # path -> (size, mtime_ns)
+
+
+@dataclass
+class DocumentChanges:
+    """Files added, modified or removed between two snapshots."""
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+
+def take_snapshot(documents_path: str) -> Snapshot:
+    """Stat every watched file under documents_path (no content reads)."""
+    return {
+        doc.path: (doc.size, doc.mtime_ns)
+        for files in discover_documents(documents_path, WATCHED_SUFFIXES).values()
+        for doc in files
+    }
+
+
+def diff_snapshots(previous: Snapshot, current: Snapshot) -> DocumentChanges:
+    """Compare two snapshots."""
+    return DocumentChanges(
+        added=sorted(p for p in current if p not in previous),
+        modified=sorted(p for p in current if p in previous and current[p] != previous[p]),
+        removed=sorted(p for p in previous if p not in current),
+    )
+
+
+class _InotifyWaiter:
+    """Block until a watched directory changes (Linux inotify through libc)."""
+
+    def __init__(self):
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def watch_tree(self, root: str) -> None:
+        """Watch root and every directory below it (re-adding a watch is a no-op)."""
+        for directory, _dirs, _files in os.walk(root):
+            self._libc.inotify_add_watch(self._fd, directory.encode(), _IN_MASK)
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to timeout seconds; return True if any event arrived (events are drained)."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            while os.read(self._fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class DocumentWatcher:
+    """Background thread that reports document changes to a callback."""
+
+    def __init__(
+        self,
+        documents_path: str,
+        on_changes: Callable[[DocumentChanges], Any],
+        interval: float = 2.0,
+        settle: float = 0.25,
+        use_inotify: bool = True,
+    ):
+        """
+        Initialize the watcher (call start() to begin watching).
+
+        Args:
+            documents_path: Path to the documents directory
+            on_changes: Called with DocumentChanges from the watcher thread
+            interval: Poll interval in seconds (upper bound on wait with inotify)
+            settle: Delay after an inotify event so writers can finish
+            use_inotify: Try inotify before falling back to polling
+        """
+        self.documents_path = documents_path
+        self.on_changes = on_changes
+        self.interval = interval
+        self.settle = settle
+        self._snapshot = take_snapshot(documents_path)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._waiter: Optional[_InotifyWaiter] = None
+        if use_inotify:
+            try:
+                self._waiter = _InotifyWaiter()
+                self._waiter.watch_tree(documents_path)
+            except (OSError, AttributeError):
+                # Not Linux, or inotify unavailable: poll instead
+                self._waiter = None
+        self.backend = "inotify" if self._waiter else "polling"
+
+    def poll_once(self) -> DocumentChanges:
+        """Diff against the last snapshot and report any changes."""
+        current = take_snapshot(self.documents_path)
+        changes = diff_snapshots(self._snapshot, current)
+        if changes:
+            if self._waiter is not None and changes.added:
+                self._waiter.watch_tree(self.documents_path)
+            self.on_changes(changes)
+        # Only advance after a successful callback, so failed changes are reported again
+        self._snapshot = current
+        return changes
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            if self._waiter is not None:
+                if self._waiter.wait(self.interval) and not self._stop.is_set():
+                    time.sleep(self.settle)
+            else:
+                self._stop.wait(self.interval)
+            if self._stop.is_set():
+                break
+            try:
+                self.poll_once()
+            except Exception as e:
+                # Keep watching; the same changes are reported on the next poll
+                print(f"Document watcher error: {e}")
+
+    def start(self) -> "DocumentWatcher":
+        """Start the watcher thread."""
+        self._thread = threading.Thread(target=self._run, name="document-watcher", daemon=True)
+        self._thread.start()
+        print(f"Watching {self.documents_path} for changes ({self.backend})")
+        return self
+
+    def stop(self) -> None:
+        """Stop the watcher thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._waiter is not None:
+            self._waiter.close()
+            self._waiter = None
+
+
+def _replace_activity_documents(store: Any, source: str, docs: List[Document]) -> None:
+    """
+    Swap one source's documents in the activity type vector store.
+
+    New documents are added before the old ids are deleted, so a concurrent
+    query briefly sees duplicates (which retrieval de-duplicates by heading)
+    rather than a missing activity type.
+    """
+    old_ids = store.get(where={"source": source}).get("ids", [])
+    if docs:
+        store.add_documents(docs)
+    if old_ids:
+        store.delete(ids=old_ids)
+
+
+class IncrementalIndexer:
+    """Apply DocumentChanges to EventDB, the activity type store and catalog, and ReviewDB."""
+
+    def __init__(
+        self,
+        stores: Any,
+        documents_path: str,
+        parse_cache: Optional[ParseCache] = None,
+        gazetteer: Optional[Any] = None,
+    ):
+        """
+        Initialize the indexer and prime the parse cache from the current files.
+
+        Args:
+            stores: RagStores (events EventDB, activity_types vector store, reviews ReviewDB)
+            documents_path: Path to the documents directory
+            parse_cache: Parse cache used to find which files really changed
+            gazetteer: Optional catalog gazetteer for review extraction
+        """
+        self.stores = stores
+        self.documents_path = documents_path
+        self.parse_cache = parse_cache or ParseCache()
+        self.gazetteer = gazetteer
+        self.activity_catalog = ActivityTypeDB(stores.events.db_path)
+        self._lock = threading.Lock()
+        self.stats = {"updates": 0, "events_sources": 0, "activity_sources": 0, "review_sources": 0}
+        # The stores were built from the current files; only later edits are deltas
+        parse_corpus(*self._corpus_files(), cache=self.parse_cache)
+
+    def _folder(self, path: str) -> str:
+        return os.path.relpath(path, self.documents_path).split(os.sep)[0]
+
+    def _corpus_files(self) -> Tuple[List[str], List[str]]:
+        discovered = discover_documents(self.documents_path)
+        return (
+            [doc.path for doc in discovered.get(EVENTS_FOLDER, [])],
+            [doc.path for doc in discovered.get(ACTIVITY_FOLDER, [])],
+        )
+
+    def apply(self, changes: DocumentChanges) -> Dict[str, int]:
+        """
+        Re-parse changed files and update the stores source by source.
+
+        Args:
+            changes: Changes reported by DocumentWatcher
+
+        Returns:
+            Counts of updated sources per store for this batch
+        """
+        with self._lock:
+            start = time.perf_counter()
+            updated = {"events_sources": 0, "activity_sources": 0, "review_sources": 0}
+
+            # Parsing happens before any store is touched
+            corpus = parse_corpus(*self._corpus_files(), cache=self.parse_cache)
+
+            # Files the watcher saw change count even if a previous failed apply already cached them
+            changed = corpus.changed_sources | {
+                os.path.basename(p) for p in changes.added + changes.modified
+                if self._folder(p) in (EVENTS_FOLDER, ACTIVITY_FOLDER)
+            }
+            for brochure in corpus.brochures:
+                if brochure.source in changed:
+                    self.stores.events.replace_source_events(brochure.source, brochure.records())
+                    updated["events_sources"] += 1
+            activity_sources = {
+                doc.metadata["source"] for doc in corpus.activity_documents
+            } & changed
+            for source in sorted(activity_sources):
+                docs = [d for d in corpus.activity_documents if d.metadata["source"] == source]
+                _replace_activity_documents(self.stores.activity_types, source, docs)
+                self.activity_catalog.replace_source_activity_types(source, activity_documents_to_records(docs))
+                updated["activity_sources"] += 1
+
+            for path in changes.added + changes.modified:
+                if self._folder(path) == REVIEWS_FOLDER and path.endswith(".csv"):
+                    self.stores.reviews.replace_source_review_rows(
+                        os.path.basename(path), iter_review_row_chunks(path, gazetteer=self.gazetteer)
+                    )
+                    updated["review_sources"] += 1
+
+            for path in changes.removed:
+                folder, source = self._folder(path), os.path.basename(path)
+                if folder == EVENTS_FOLDER:
+                    self.stores.events.replace_source_events(source, [])
+                    updated["events_sources"] += 1
+                elif folder == ACTIVITY_FOLDER:
+                    _replace_activity_documents(self.stores.activity_types, source, [])
+                    self.activity_catalog.replace_source_activity_types(source, [])
+                    updated["activity_sources"] += 1
+                elif folder == REVIEWS_FOLDER and path.endswith(".csv"):
+                    self.stores.reviews.replace_source_review_rows(source, [])
+                    updated["review_sources"] += 1
+
+            if updated["events_sources"] or updated["activity_sources"]:
+                self.activity_catalog.rebuild_routes()
+            # Embed new block bodies if semantic event ranking is enabled
+            embeddings = getattr(self.stores.activity_types, "embeddings", None)
+            if updated["events_sources"] and embeddings is not None and os.path.exists(
+                event_index_path(self.stores.events.db_path)
+            ):
+                build_event_index(self.stores.events, embeddings.embed_documents)
+
+            self.stats["updates"] += 1
+            for key, value in updated.items():
+                self.stats[key] += value
+            print(f"Re-indexed {updated} in {time.perf_counter() - start:.2f}s")
+            return updated
+
+
+def watch_documents(
+    stores: Any,
+    documents_path: str,
+    parse_cache: Optional[ParseCache] = None,
+    interval: float = 2.0,
+    use_inotify: bool = True,
+) -> DocumentWatcher:
+    """
+    Start a watcher that keeps stores in sync with the documents tree.
+
+    Args:
+        stores: RagStores to update
+        documents_path: Path to the documents directory
+        parse_cache: Parse cache (default: ./parse_cache.db)
+        interval: Poll interval in seconds
+        use_inotify: Try inotify before falling back to polling
+
+    Returns:
+        The started DocumentWatcher (call stop() to end it)
+    """
+    indexer = IncrementalIndexer(stores, documents_path, parse_cache)
+    return DocumentWatcher(documents_path, indexer.apply, interval=interval, use_inotify=use_inotify).start()
@@ -0,0 +1,120 @@
+"""Tests for the activity type catalog."""
+
+import glob
+from types import SimpleNamespace
+
+from database.activity_db import ActivityTypeDB
+from database.event_db import EventDB, db_connection
+from rag.document_processing import activity_documents_to_records
+from rag.parallel_ingest import ingest_events_parallel
+from rag.parse_cache import parse_activity_types, parse_corpus
+from rag.retrieval import route_activity_types
+
+ACTIVITY_FILES = sorted(glob.glob("documents/activityType/*.md"))
+
+
+def _catalog(tmp_path):
+    catalog = ActivityTypeDB(str(tmp_path / "events.db"))
+    catalog.replace_activity_types(parse_activity_types(ACTIVITY_FILES).activity_records())
+    return catalog
+
+
+def test_activity_records_extract_fields():
+    """Test session, frequency, benefits and ailments are split off the '|' lines."""
+    corpus = parse_activity_types(ACTIVITY_FILES)
+    records = activity_documents_to_records(corpus.activity_documents)
+    aqua_fit = next(r for r in records if r.heading_norm == "AQUA FIT")
+    assert aqua_fit.source == "aquatics.md"
+    assert aqua_fit.intensity == "moderate"
+    assert aqua_fit.session_length == "45–60 min"
+    assert aqua_fit.frequency == "2–4/week"
+    assert aqua_fit.benefits == "Muscle tone, endurance, joint mobility"
+    assert aqua_fit.ailments == "Arthritis, osteoporosis risk"
+
+
+def test_catalog_intensity_map_matches_parsed_map(tmp_path):
+    """Test the persisted intensity map equals the one built from the markdown."""
+    catalog = _catalog(tmp_path)
+    assert catalog.count_activity_types() == len(parse_activity_types(ACTIVITY_FILES).activity_documents)
+    assert catalog.get_intensity_map() == parse_corpus([], ACTIVITY_FILES).intensity_map
+
+
+def test_catalog_activity_documents(tmp_path):
+    """Test catalog lookups return store-shaped Documents in the requested order."""
+    catalog = _catalog(tmp_path)
+    docs = catalog.get_activity_documents(["AQUA FIT", "NOT A HEADING", "AQUA CARDIO"])
+    assert [d.metadata["activity_heading_norm"] for d in docs] == ["AQUA FIT", "AQUA CARDIO"]
+    assert docs[0].metadata["source"] == "aquatics.md"
+    assert catalog.get_activity_types([]) == []
+
+
+def test_ingest_reads_intensity_from_catalog(tmp_path):
+    """Test ingestion defaults to the catalog's intensity map and events join the catalog."""
+    brochure = tmp_path / "ymca.md"
+    brochure.write_text("## YMCA\n\n### AQUA FIT (Ages 18+)\n- Event Type: AQUA FIT\n", encoding="utf-8")
+    _catalog(tmp_path)
+    event_db = EventDB(str(tmp_path / "events.db"))
+    assert ingest_events_parallel([str(brochure)], event_db, max_workers=1) == 1
+    assert event_db.query_events(event_types=["AQUA FIT"])[0].metadata["intensity"] == "moderate"
+    with db_connection(event_db.db_path) as conn:
+        row = conn.execute("SELECT event_type, frequency FROM events_with_activity").fetchone()
+    assert row == ("AQUA FIT", "2–4/week")
+
+
+def test_replace_source_activity_types(tmp_path):
+    """Test replacing one source leaves other sources untouched."""
+    catalog = _catalog(tmp_path)
+    before = catalog.count_activity_types()
+    aquatics = len(catalog.get_activity_types()) - len(
+        [r for r in catalog.get_activity_types() if r.source != "aquatics.md"]
+    )
+    catalog.replace_source_activity_types("aquatics.md", [])
+    assert catalog.count_activity_types() == before - aquatics
+    assert all(r.source != "aquatics.md" for r in catalog.get_activity_types())
+
+
+def _routed_catalog(tmp_path):
+    catalog = _catalog(tmp_path)
+    event_db = EventDB(catalog.db_path)
+    ingest_events_parallel(sorted(glob.glob("documents/Events/*.md")), event_db, max_workers=1)
+    catalog.rebuild_routes()
+    return catalog, event_db
+
+
+def test_routes_rank_headings_by_matching_events(tmp_path):
+    """Test routes list an interest's headings of one intensity, most events for the age first."""
+    catalog, event_db = _routed_catalog(tmp_path)
+    routes = catalog.get_routes()
+    intensities = {r.heading_norm: r.intensity for r in catalog.get_activity_types()}
+
+    for (interest, intensity, age), headings in routes.items():
+        counts = [count for _, count in headings]
+        assert counts == sorted(counts, reverse=True)
+        if intensity is not None:
+            assert all(intensities[h] == intensity for h, _ in headings)
+    aquatics = routes[("aquatics", "moderate", "seniors")]
+    for heading, count in aquatics:
+        assert count == len(event_db.query_events(event_types=[heading], age_contains="seniors", limit=1000))
+    assert {h for h, _ in routes[("aquatics", None, None)]} >= {h for h, _ in aquatics}
+
+
+def test_route_activity_types(tmp_path):
+    """Test profiles naming interests are routed and vague ones fall back to vector search."""
+    catalog, event_db = _routed_catalog(tmp_path)
+    stores = SimpleNamespace(events=event_db)
+
+    docs = route_activity_types(stores, {"interests": ["aquatics", "dancing"], "intensity": "moderate"}, k=3)
+    routes = catalog.get_routes()
+    candidates = routes[("aquatics", "moderate", None)] + routes[("dancing", "moderate", None)]
+    expected = [h for h, _ in sorted(candidates, key=lambda route: -route[1])][:3]
+    assert [d.metadata["activity_heading_norm"] for d in docs] == expected
+    assert docs[0].metadata["source"] == "aquatics.md" and docs[0].page_content
+
+    # No moderate aquatics event is tagged for adults: let the vector search decide
+    assert route_activity_types(stores, {"interests": ["aquatics"], "intensity": "moderate", "age_focus": "adults"}) is None
+
+    # The chat profile has no intensity: interests alone use the "any intensity" routes
+    profile = {"location": None, "age_focus": None, "interests": ["aquatics"], "time_prefs": []}
+    docs = route_activity_types(stores, profile, k=3)
+    assert [d.metadata["activity_heading_norm"] for d in docs] == [h for h, _ in routes[("aquatics", None, None)][:3]]
+    assert route_activity_types(stores, {"intensity": "low"}) is None
@@ -0,0 +1,60 @@
+"""Tests for the slotted EventRecord and the columnar EventCatalog."""
+
+import pickle
+
+import pytest
+
+from database import event_catalog
+from database.event_catalog import EventCatalog
+from database.event_db import EventRecord
+from rag.document_processing import build_event_records
+
+
+def _records():
+    with open("documents/Events/ymca_riverstone_framingham.md", "r", encoding="utf-8") as f:
+        md = f.read()
+    return build_event_records(md, "ymca_riverstone_framingham.md", None, "Framingham", "Massachusetts")
+
+
+def test_event_record_is_slotted_and_interned():
+    """Test records have no __dict__, share categorical strings and still pickle."""
+    records = _records()
+    assert not hasattr(records[0], "__dict__")
+    a = EventRecord(*[("x" * 3 + "y") if f == "city" else None for f in EventRecord.__slots__])
+    b = EventRecord(*[("xxx" + "y") if f == "city" else None for f in EventRecord.__slots__])
+    assert a.city is b.city
+    assert pickle.loads(pickle.dumps(records[0])) == records[0]
+
+
+def test_catalog_round_trips_records(monkeypatch):
+    """Test every field survives encoding, across several sealed text chunks."""
+    monkeypatch.setattr(event_catalog, "CHUNK_BYTES", 512)
+    records = _records() + [EventRecord(*[None] * 18)]
+    catalog = EventCatalog(records)
+    assert len(catalog) == len(records)
+    assert catalog.records() == [
+        EventRecord(**{**{f: getattr(r, f) for f in EventRecord.__slots__},
+                       "event_name": r.event_name or "", "page_content": r.page_content or ""})
+        for r in records
+    ]
+    assert len(catalog._chunks) > 1
+    assert catalog[-1].age_min is None
+    assert "Framingham" in catalog.distinct("city")
+
+
+def test_catalog_views_are_zero_copy():
+    """Test views decode lazily and text views point into the shared chunk."""
+    records = _records()
+    catalog = EventCatalog(records)
+    view = catalog[3]
+    assert view.event_name == records[3].event_name
+    assert view.city == "Framingham"
+    text = view.text_view()
+    assert text.readonly and bytes(text).decode("utf-8") == records[3].page_content
+    assert text.obj is catalog._chunks[catalog._chunk_ids[3]]
+    catalog.append(records[0])
+    assert catalog[len(records)].to_record() == records[0]
+    with pytest.raises(AttributeError):
+        view.not_a_field
+    with pytest.raises(IndexError):
+        catalog[len(catalog)]
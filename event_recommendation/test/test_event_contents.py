@@ -0,0 +1,102 @@
+"""Tests for content-addressed storage of event block bodies."""
+
+import glob
+import sqlite3
+
+import numpy as np
+
+from database.event_db import EventDB, content_hash
+from database.snapshot import SnapshotEventStore, open_snapshot, write_snapshot
+from rag.document_processing import parse_brochure
+
+
+def _records():
+    records = []
+    for path in sorted(glob.glob("documents/Events/*.md")):
+        with open(path, "r", encoding="utf-8") as f:
+            records.extend(parse_brochure(f.read(), path.split("/")[-1]).records())
+    return records
+
+
+def test_content_hash_ignores_case_and_whitespace():
+    """Test near-identical bodies hash the same and different ones do not."""
+    body = "### AQUA FIT\n- Time: 9:00 AM  \n- Spots: 12"
+    assert content_hash(body) == content_hash("### Aqua Fit\n\n- Time:   9:00 AM\n- Spots: 12   ")
+    assert content_hash(body) != content_hash("### AQUA FIT\n- Time: 10:00 AM\n- Spots: 12")
+
+
+def test_shared_bodies_are_stored_once(tmp_path):
+    """Test repeated bodies share one event_contents row and read back unchanged."""
+    records = _records()
+    db = EventDB(str(tmp_path / "events.db"))
+    db.insert_events(records)
+    db.insert_events(records[:20])
+
+    assert db.count_events() == len(records) + 20
+    assert db.count_contents() == len({content_hash(r.page_content) for r in records})
+    docs = db.query_events(limit=1000)
+    assert [content_hash(d.page_content) for d in docs[:len(records)]] == [content_hash(r.page_content) for r in records]
+
+    lazy = db.query_events(limit=1000, include_content=False)
+    assert lazy[0].metadata["content_id"] == lazy[len(records)].metadata["content_id"]
+    contents = db.get_page_contents([d.metadata["event_id"] for d in lazy])
+    assert [contents[d.metadata["event_id"]] for d in lazy] == [d.page_content for d in docs]
+
+
+def test_replace_source_prunes_unreferenced_bodies(tmp_path):
+    """Test bodies no event references anymore are deleted."""
+    records = _records()
+    source = records[0].source
+    db = EventDB(str(tmp_path / "events.db"))
+    db.insert_events(records)
+    db.replace_source_events(source, [])
+    remaining = [r for r in records if r.source != source]
+    assert db.count_contents() == len({content_hash(r.page_content) for r in remaining})
+    db.clear_events()
+    assert db.count_contents() == 0
+
+
+def test_embed_contents_once_per_body(tmp_path):
+    """Test each distinct body is embedded once and only new bodies later."""
+    calls = []
+
+    def embed_documents(texts):
+        calls.append(len(texts))
+        return [[float(len(t)), 1.0, 0.0] for t in texts]
+
+    db = EventDB(str(tmp_path / "events.db"))
+    db.insert_events(_records() * 3)
+    assert db.embed_contents(embed_documents, batch_size=50) == db.count_contents()
+    assert sum(calls) == db.count_contents() and max(calls) <= 50
+    assert db.embed_contents(embed_documents) == 0
+
+    ids, matrix = db.get_content_embeddings()
+    assert len(ids) == db.count_contents()
+    assert matrix.dtype == np.float32 and matrix.shape == (len(ids), 3)
+
+
+def test_legacy_rows_and_compression(tmp_path):
+    """Test rows stored before dedup keep working next to shared bodies, compressed or not."""
+    records = _records()
+    db_path = str(tmp_path / "events.db")
+    db = EventDB(db_path)
+    db.insert_events(records[:5])
+    with sqlite3.connect(db_path) as conn:
+        # Rows written before event_contents existed carry their own text
+        conn.execute("UPDATE events SET page_content = (SELECT page_content FROM event_contents "
+                     "WHERE event_contents.id = events.content_id), content_id = NULL")
+        conn.execute("DELETE FROM event_contents")
+    db.insert_events(records[5:10])
+    expected = [r.page_content for r in records[:10]]
+    assert [d.page_content for d in db.query_events(limit=100)] == expected
+
+    stats = db.compress_text("zlib")
+    assert stats["rows"] == 5 + db.count_contents()
+    assert [d.page_content for d in db.query_events(limit=100)] == expected
+
+    write_snapshot(str(tmp_path / "serving.snapshot"), db)
+    store = SnapshotEventStore(open_snapshot(str(tmp_path / "serving.snapshot"), db_path, None), db_path)
+    assert [d.page_content for d in store.query_events(limit=100)] == expected
+    lazy = store.query_events(limit=100, include_content=False)
+    assert [d.metadata["content_id"] for d in lazy[:5]] == [None] * 5
+    assert all(d.metadata["content_id"] for d in lazy[5:])
@@ -0,0 +1,98 @@
+"""Tests for semantic ranking of SQL event candidates."""
+
+import glob
+import os
+from types import SimpleNamespace
+
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from database.event_db import EventDB
+from rag.document_processing import parse_brochure
+from rag.event_index import (
+    EventEmbeddingIndex,
+    build_event_index,
+    event_index_path,
+    event_lexical_path,
+    open_event_index,
+)
+from rag.fusion import reciprocal_rank_fusion
+from rag.retrieval import retrieve_events_for_activity_type
+
+
+def _event_db(tmp_path):
+    records = []
+    for path in sorted(glob.glob("documents/Events/*.md")):
+        with open(path, "r", encoding="utf-8") as f:
+            records.extend(parse_brochure(f.read(), path.split("/")[-1]).records())
+    db = EventDB(str(tmp_path / "events.db"))
+    db.insert_events(records)
+    return db
+
+
+def test_reciprocal_rank_fusion():
+    """Test items ranked well in both lists win and ties keep first appearance."""
+    assert reciprocal_rank_fusion([["a", "b", "c"], ["c", "b", "a"]]) == ["a", "c", "b"]
+    assert reciprocal_rank_fusion([["a", "b"], ["b", "x"]]) == ["b", "a", "x"]
+    assert reciprocal_rank_fusion([["a", "b"], ["b", "a"]], weights=[2.0, 1.0]) == ["a", "b"]
+
+
+def test_index_scores_candidates_by_cosine(tmp_path):
+    """Test scores equal cosine similarity per body, 0 for bodies without an embedding."""
+    db = _event_db(tmp_path)
+    embedding = DeterministicFakeEmbedding(size=32)
+    stats = build_event_index(db, embedding.embed_documents)
+    n = db.count_contents()
+    assert stats == {"embedded": n, "rows": n, "lexical_rows": n}
+    assert build_event_index(db, embedding.embed_documents) == {"embedded": 0, "rows": 0, "lexical_rows": 0}
+
+    path = event_index_path(db.db_path)
+    assert path == str(tmp_path / "events.vectors.npy")
+    index = open_event_index(db.db_path)
+    assert isinstance(index.matrix, np.memmap)
+    assert open_event_index(str(tmp_path / "other.db")) is None
+
+    ids, vectors = db.get_content_embeddings()
+    query = np.asarray(embedding.embed_query("swim lessons"))
+    candidates = [ids[3], ids[0], ids[3], None, len(index) + 5]
+    expected = [
+        float(vectors[i] @ query / np.linalg.norm(vectors[i]) / np.linalg.norm(query)) for i in (3, 0, 3)
+    ]
+    scores = index.score(query, candidates)
+    assert np.allclose(scores[:3], expected, atol=1e-5)
+    assert scores[3:].tolist() == [0.0, 0.0]
+    assert index.score(query[:4], candidates).tolist() == [0.0] * 5
+
+
+def test_retrieval_fuses_sql_and_semantic_order(tmp_path):
+    """Test the question pulls a matching event from further down the SQL order into the top k."""
+    db = _event_db(tmp_path)
+    embedding = DeterministicFakeEmbedding(size=32)
+    stores = SimpleNamespace(events=db, activity_types=SimpleNamespace(embeddings=embedding))
+
+    sql_order = retrieve_events_for_activity_type(stores, "anything", {}, k=200)
+    assert [d.page_content for d in sql_order] == [d.page_content for d in db.query_events(limit=200)]
+
+    build_event_index(db, embedding.embed_documents)
+    os.remove(event_lexical_path(db.db_path))  # semantic leg only (see test_hybrid)
+    target = sql_order[30]
+    question = target.page_content
+    events = retrieve_events_for_activity_type(stores, question, {}, k=10)
+    assert len(events) == 10 and all(d.page_content for d in events)
+    assert target.page_content in [d.page_content for d in events]
+
+    # Same result as fusing event type order with exact cosine order by hand
+    event_types = ["SENIOR CIRCUITS", "AQUA FIT"]
+    lazy = db.query_events(event_types=event_types, limit=1000, include_content=False)
+    structured = sorted(range(len(lazy)), key=lambda i: lazy[i].metadata["event_type"] != "SENIOR CIRCUITS")
+    index = EventEmbeddingIndex(event_index_path(db.db_path))
+    scores = index.score(embedding.embed_query(question), [d.metadata["content_id"] for d in lazy])
+    fused = reciprocal_rank_fusion([structured, np.argsort(-scores, kind="stable").tolist()])
+    assert [d.metadata["event_id"] for d in retrieve_events_for_activity_type(
+        stores, question, {"event_type": event_types}, k=10, include_content=False
+    )] == [lazy[i].metadata["event_id"] for i in fused[:10]]
+
+    # No index file or no question: plain SQL order
+    os.remove(event_index_path(db.db_path))
+    assert [d.page_content for d in retrieve_events_for_activity_type(stores, question, {}, k=10)] == \
+        [d.page_content for d in sql_order[:10]]
@@ -0,0 +1,78 @@
+"""Tests for the catalog gazetteer extractor."""
+
+from database.event_db import EventDB, EventRecord
+from utils.gazetteer import Gazetteer
+
+
+def _gazetteer() -> Gazetteer:
+    return Gazetteer(
+        event_types=["BOOT CAMP", "BOOT CAMP BURN", "SALSA / LATIN DANCE", "CIRCUIT CARDIO & STRENGTH", "AQUA FIT"],
+        venues=["Pinecrest YMCA", "Concord Public Library (East Boston Branch)"],
+        cities=["Lexington", "Boston", "East Boston"],
+    )
+
+
+def test_extract_event_and_venue():
+    """Test event type and venue are returned in catalog spelling."""
+    result = _gazetteer().extract("Loved boot camp burn at pinecrest ymca in Lexington!")
+    assert result["event_type"] == "BOOT CAMP BURN"
+    assert result["venue"] == "Pinecrest YMCA"
+    assert result["city"] == "Lexington"
+    assert result["location"] == "Pinecrest YMCA"
+
+
+def test_extract_punctuated_patterns():
+    """Test '/' and '&' joiners match with or without surrounding spaces."""
+    gazetteer = _gazetteer()
+    assert gazetteer.extract("Took SALSA/LATIN DANCE today")["event_type"] == "SALSA / LATIN DANCE"
+    assert gazetteer.extract("CIRCUIT CARDIO & STRENGTH rocks")["event_type"] == "CIRCUIT CARDIO & STRENGTH"
+
+
+def test_extract_respects_word_boundaries():
+    """Test patterns never match inside longer words."""
+    result = _gazetteer().extract("The AQUA FITNESS class and BOOTCAMPS were fine")
+    assert result["event_type"] is None
+
+
+def test_extract_prefers_longest_city_and_parenthetical_alias():
+    """Test longest match wins and venue aliases map to the canonical name."""
+    result = _gazetteer().extract("Concord Public Library in East Boston has great workshops")
+    assert result["venue"] == "Concord Public Library (East Boston Branch)"
+    assert result["city"] == "East Boston"
+
+
+def test_find_all_reports_overlapping_matches():
+    """Test all matches, including nested ones, are reported with token offsets."""
+    matches = _gazetteer().find_all("BOOT CAMP BURN")
+    assert {(m.value, m.start, m.end) for m in matches} == {
+        ("BOOT CAMP", 0, 2),
+        ("BOOT CAMP BURN", 0, 3),
+    }
+
+
+def test_extract_without_matches():
+    """Test text with no catalog terms returns nulls."""
+    result = _gazetteer().extract("Nice staff, parking was easy.")
+    assert result == {"event_type": None, "venue": None, "city": None, "location": None}
+
+
+def test_from_event_db(tmp_path):
+    """Test building a gazetteer from the events catalog."""
+    db = EventDB(str(tmp_path / "events.db"))
+    db.insert_events([
+        EventRecord(
+            event_name="Morning Aqua", event_type="AQUA FIT", event_type_raw="Aqua Fit",
+            source="test.md", city="Lexington", state="Massachusetts", age_min=None,
+            age_max=None, age_contains="adults", intensity="moderate", instructor=None,
+            date_range=None, time_slots=None, duration=None, spots=None,
+            center_name="Pinecrest YMCA", center_type="YMCA", page_content="### Morning Aqua",
+        )
+    ])
+    assert db.get_catalog_vocabulary() == {
+        "event_types": ["AQUA FIT"],
+        "venues": ["Pinecrest YMCA"],
+        "cities": ["Lexington"],
+    }
+    result = Gazetteer.from_event_db(db).extract("AQUA FIT at Pinecrest YMCA")
+    assert result["event_type"] == "AQUA FIT"
+    assert result["location"] == "Pinecrest YMCA"
@@ -0,0 +1,117 @@
+"""Tests for BM25 and hybrid lexical + vector retrieval."""
+
+import glob
+import math
+from types import SimpleNamespace
+
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from database.event_db import EventDB
+from rag.document_processing import parse_brochure
+from rag.event_index import EventEmbeddingIndex, build_event_index, event_index_path, open_event_lexical_index
+from rag.fusion import reciprocal_rank_fusion
+from rag.hybrid import HybridVectorIndex, lexical_order, run_legs
+from rag.lexical_index import BM25Index, tokenize
+from rag.parse_cache import parse_activity_types
+from rag.retrieval import retrieve_activity_types, retrieve_events_for_activity_type
+from rag.vector_index import NumpyVectorIndex
+from vector_db.chroma_store import build_chroma_where
+
+TEXTS = ["Aqua Zumba in the pool", "Gentle yoga for knees and backs", "Zumba Zumba dance party", ""]
+
+
+def test_bm25_scores_match_formula(tmp_path):
+    """Test scores, candidate scoring, search and save/load agree with Okapi BM25."""
+    assert tokenize("Knees, BACKS & class") == ["knee", "back", "class"]
+    index = BM25Index.from_texts(TEXTS, row_ids=[0, 2, 5, 7])
+    lengths = {0: 5, 2: 6, 5: 4}
+    average = sum(lengths.values()) / 3
+
+    def expected(row, tf, df):
+        idf = math.log(1 + (3 - df + 0.5) / (df + 0.5))
+        return idf * tf * 2.2 / (tf + 1.2 * (1 - 0.75 + 0.75 * lengths[row] / average))
+
+    scores = index.scores("zumba knee")
+    assert len(scores) == 8
+    assert np.allclose(scores[[0, 2, 5]], [expected(0, 1, 2), expected(2, 1, 1), expected(5, 2, 2)])
+    assert scores[[1, 3, 4, 6, 7]].tolist() == [0.0] * 5
+
+    rows = [5, None, 0, 5, 42, 7]
+    assert np.allclose(index.score_rows("zumba knee", rows), [scores[5], 0, scores[0], scores[5], 0, 0])
+    assert scores[2] > scores[5] > scores[0]
+    assert [row for row, _ in index.search("zumba knee", 10)] == [2, 5, 0]
+    assert [row for row, _ in index.search("zumba", 10, rows=np.array([0, 2]))] == [0]
+    assert index.search("tango", 10) == []
+
+    path = str(tmp_path / "lexical.npz")
+    index.save(path)
+    assert np.allclose(BM25Index.load(path).scores("zumba knee"), scores)
+
+
+def test_run_legs_times_each_leg():
+    """Test legs return their results with per-leg and total timings."""
+    results, timings = run_legs({"a": lambda: 1, "b": lambda: [2]})
+    assert results == {"a": 1, "b": [2]}
+    assert set(timings) == {"a_ms", "b_ms", "total_ms"}
+    assert lexical_order(np.array([0.0, 2.0, 0.5, 0.0], dtype=np.float32)) == [1, 2]
+
+
+def test_hybrid_activity_index_fuses_both_legs():
+    """Test an exact activity name the vector leg misses is found, and filters apply to both legs."""
+    documents = parse_activity_types(sorted(glob.glob("documents/activityType/*.md"))).activity_documents
+    vector_index = NumpyVectorIndex(DeterministicFakeEmbedding(size=32), documents, group_by="activity_heading_norm")
+    hybrid = HybridVectorIndex(vector_index)
+
+    def headings(docs):
+        return [d.metadata["activity_heading_norm"] for d in docs]
+
+    # Fake embeddings are noise: the vector leg alone misses the exact name
+    assert "AQUA ZUMBA" not in headings(vector_index.similarity_search("zumba", k=5))
+    results = hybrid.similarity_search("zumba", k=5)
+    assert "AQUA ZUMBA" in headings(results) and len(set(headings(results))) == 5
+    assert set(hybrid.timings) == {"vector_ms", "lexical_ms", "total_ms", "fusion_ms"}
+
+    fused = reciprocal_rank_fusion([
+        [h.lower() for h in headings(vector_index.similarity_search("aqua rumba", k=20))],
+        [h.lower() for h in headings(hybrid.lexical_search("aqua rumba", 20, None))],
+    ])
+    assert [h.lower() for h in headings(hybrid.similarity_search("aqua rumba", k=8))] == fused[:8]
+
+    where = build_chroma_where({"activity_heading": "dancing"})
+    results = hybrid.similarity_search("salsa", k=5, filter=where)
+    assert results[0].metadata["activity_heading_norm"] == "SALSA / LATIN DANCE"
+    assert all(d.metadata["activity_heading"] == "dancing" for d in results)
+
+    stores = SimpleNamespace(activity_types=hybrid)
+    assert "AQUA ZUMBA" in headings(retrieve_activity_types(stores, "zumba", {}, k=5))
+
+
+def test_event_retrieval_fuses_three_rankings(tmp_path):
+    """Test events are ranked by RRF of event type order, cosine order and BM25 order."""
+    records = []
+    for path in sorted(glob.glob("documents/Events/*.md")):
+        with open(path, "r", encoding="utf-8") as f:
+            records.extend(parse_brochure(f.read(), path.split("/")[-1]).records())
+    db = EventDB(str(tmp_path / "events.db"))
+    db.insert_events(records)
+    embedding = DeterministicFakeEmbedding(size=32)
+    build_event_index(db, embedding.embed_documents)
+    stores = SimpleNamespace(events=db, activity_types=SimpleNamespace(embeddings=embedding))
+
+    events = retrieve_events_for_activity_type(stores, "zumba", {}, k=5)
+    assert "AQUA ZUMBA" in [d.metadata["event_type"] for d in events]
+
+    event_types = ["AQUA ZUMBA", "AQUA FIT", "BOOT CAMP"]
+    question = "gentle water workout"
+    lazy = db.query_events(event_types=event_types, limit=1000, include_content=False)
+    content_ids = [d.metadata["content_id"] for d in lazy]
+    structured = sorted(range(len(lazy)), key=lambda i: event_types.index(lazy[i].metadata["event_type"]))
+    cosine = EventEmbeddingIndex(event_index_path(db.db_path)).score(embedding.embed_query(question), content_ids)
+    bm25 = open_event_lexical_index(db.db_path).score_rows(question, content_ids)
+    fused = reciprocal_rank_fusion([
+        structured, np.argsort(-cosine, kind="stable").tolist(), lexical_order(bm25),
+    ])
+    assert [d.metadata["event_id"] for d in retrieve_events_for_activity_type(
+        stores, question, {"event_type": event_types}, k=10, include_content=False
+    )] == [lazy[i].metadata["event_id"] for i in fused[:10]]
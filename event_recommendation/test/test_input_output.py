@@ -1,13 +1,22 @@
 """Tests for input/output processing."""
 
+import glob
+import os
+
 import pytest
 from rag.document_processing import (
+    _finish_event_block,
+    _iter_event_spans,
+    _parse_event_fields_regex,
     parse_center_metadata,
     split_event_blocks,
     parse_event_metadata,
     build_activitytype_documents,
     build_event_documents,
+    build_event_records,
+    parse_brochure,
 )
+from rag.input_documents.loader import discover_documents, load_documents
 
 
 def test_parse_center_metadata():
@@ -89,3 +98,118 @@ def test_build_event_documents():
     assert docs[0].metadata["event_name"] == "Swimming Class"
     assert docs[0].metadata["city"] == "Framingham"
 
+
+
+def test_parse_brochure_matches_builders():
+    """Test documents and records projected from one parse match the builders."""
+    md_text = """
+## YMCA Riverstone
+**Location:** Framingham, Massachusetts
+**Type:** YMCA
+
+### Swimming Class
+- Event Type: Aqua Fit
+- Age Tags: Ages 8-12
+- Instructor: John Doe
+- Spots: 20
+
+### Chair Yoga
+- Category: Yoga
+- Facilitator: Jane Roe
+"""
+    intensity_map = {"AQUA FIT": "moderate"}
+    brochure = parse_brochure(md_text, "test.md", intensity_map)
+    assert brochure.center["city"] == "Framingham"
+    assert [b.event_name for b in brochure.blocks] == ["Swimming Class", "Chair Yoga"]
+    assert brochure.blocks[0].event_type == "AQUA FIT"
+    assert brochure.blocks[0].intensity == "moderate"
+    assert brochure.blocks[1].intensity == "low"
+    assert brochure.blocks[1].instructor == "Jane Roe"
+
+    docs = build_event_documents(md_text, "test.md", intensity_map, "Framingham", "Massachusetts")
+    records = build_event_records(
+        md_text, "test.md", intensity_map, "Framingham", "Massachusetts", "YMCA Riverstone", "YMCA"
+    )
+    assert [(d.page_content, d.metadata) for d in brochure.documents()] == [
+        (d.page_content, d.metadata) for d in docs
+    ]
+    assert brochure.records() == records
+
+
+def _regex_blocks(md_text):
+    return [_finish_event_block(_parse_event_fields_regex(t, b)) for t, b in _iter_event_spans(md_text)]
+
+
+@pytest.mark.skipif(not os.path.isdir("documents/Events"), reason="Events documents not found")
+def test_line_tokenizer_matches_regex_parser_on_documents():
+    """Test the line tokenizer reproduces the per-field regex output on every brochure."""
+    paths = glob.glob("documents/Events/*.md")
+    assert paths
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            md_text = f.read()
+        brochure = parse_brochure(md_text, os.path.basename(path))
+        assert brochure.center == parse_center_metadata(md_text, os.path.basename(path))
+        assert brochure.blocks == _regex_blocks(md_text)
+
+
+def test_line_tokenizer_falls_back_on_ambiguous_lines():
+    """Test empty-valued keys keep the regex behaviour of reading the next line."""
+    md_text = """## Center
+**Location:** Salem, Massachusetts
+
+### Open Swim
+- Instructor:
+- Spots: 12
+- event type:  aqua fit
+- Event Type: Ignored
+
+### Chair Yoga
+- Category: Yoga
+"""
+    brochure = parse_brochure(md_text, "test.md")
+    assert brochure.blocks == _regex_blocks(md_text)
+    assert brochure.blocks[0].instructor == "- Spots: 12"
+    assert brochure.blocks[0].event_type_raw == "aqua fit"
+    assert brochure.center["city"] == "Salem"
+
+
+def test_load_documents_discovers_paths_without_reading(tmp_path):
+    """Test scandir discovery returns sorted paths with stat fields, recursing into subfolders."""
+    (tmp_path / "Events" / "nested").mkdir(parents=True)
+    (tmp_path / "activityType").mkdir()
+    (tmp_path / "Events" / "b.md").write_text("## B\n", encoding="utf-8")
+    (tmp_path / "Events" / "nested" / "a.md").write_text("## A\n", encoding="utf-8")
+    (tmp_path / "Events" / "notes.txt").write_text("skip", encoding="utf-8")
+    (tmp_path / "activityType" / "empty.md").write_text("", encoding="utf-8")
+
+    events_files, activity_files = load_documents(str(tmp_path))
+    assert events_files == [str(tmp_path / "Events" / "b.md"), str(tmp_path / "Events" / "nested" / "a.md")]
+    assert activity_files == [str(tmp_path / "activityType" / "empty.md")]
+
+    events = discover_documents(str(tmp_path))["Events"]
+    assert events[0].size == 5
+    assert events[0].read_text() == "## B\n"
+    with events[0].mmap() as mapped:
+        assert mapped[:4] == b"## B"
+    with discover_documents(str(tmp_path))["activityType"][0].mmap() as mapped:
+        assert mapped == b""
+
+
+def test_discover_documents_skips_hidden_files_and_directory_links(tmp_path):
+    """Test hidden files and folders are skipped and symlinked directories are not followed."""
+    events = tmp_path / "Events"
+    (events / ".cache").mkdir(parents=True)
+    (events / "a.md").write_text("## A\n", encoding="utf-8")
+    (events / ".#a.md").write_text("lock", encoding="utf-8")
+    (events / ".a.md.swp").write_text("swap", encoding="utf-8")
+    (events / ".cache" / "b.md").write_text("## B\n", encoding="utf-8")
+    (tmp_path / ".trash").mkdir()
+    try:
+        (events / "loop").symlink_to(events, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported")
+
+    discovered = discover_documents(str(tmp_path))
+    assert set(discovered) == {"Events"}
+    assert [d.path for d in discovered["Events"]] == [str(events / "a.md")]
@@ -0,0 +1,132 @@
+"""Tests for the unified LLM client abstraction."""
+
+import asyncio
+import threading
+import time
+
+import groq
+import ollama
+import pytest
+
+from llm import (
+    FakeLLMClient,
+    GroqLLMClient,
+    LLMCallRecord,
+    OllamaLLMClient,
+    RetryPolicy,
+    as_llm_client,
+)
+
+
+def test_complete_records_stats_and_hooks():
+    """Test a call returns the response and reports timing to hooks."""
+    records = []
+    client = FakeLLMClient(lambda s, u: u.upper(), hooks=[records.append])
+    assert client.complete("sys", "hello") == "HELLO"
+    assert client.calls == [("sys", "hello")]
+    assert client.stats["calls"] == 1
+    assert len(records) == 1
+    assert isinstance(records[0], LLMCallRecord)
+    assert records[0].ok and records[0].attempts == 1 and records[0].backend == "fake"
+
+
+def test_retries_transient_errors():
+    """Test errors listed in the retry policy are retried."""
+    attempts = []
+
+    def flaky(system_prompt, user_prompt):
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("down")
+        return "ok"
+
+    client = FakeLLMClient(flaky)
+    assert client.complete("s", "u") == "ok"
+    assert client.stats["retries"] == 2
+    assert client.stats["errors"] == 0
+
+
+def test_non_retryable_errors_raise_immediately():
+    """Test errors outside the retry policy are raised without retrying."""
+    def broken(system_prompt, user_prompt):
+        raise KeyError("bad")
+
+    client = FakeLLMClient(broken, retry_policy=RetryPolicy(max_attempts=5, min_wait=0, max_wait=0))
+    with pytest.raises(KeyError):
+        client.complete("s", "u")
+    assert len(client.calls) == 1
+    assert client.stats["errors"] == 1
+
+
+class _FailingOllama:
+    """ollama.Client stand-in whose chat() raises a ResponseError with a given status."""
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.calls = 0
+
+    def chat(self, model, messages):
+        self.calls += 1
+        raise ollama.ResponseError("error", status_code=self.status_code)
+
+
+def test_ollama_permanent_errors_are_not_retried():
+    """Test a 404 (model not found) is raised after one attempt with the default policy."""
+    backend = _FailingOllama(404)
+    client = OllamaLLMClient(backend, model="missing")
+    with pytest.raises(ollama.ResponseError):
+        client.complete("s", "u")
+    assert backend.calls == 1
+    assert client.stats["retries"] == 0
+
+
+def test_ollama_transient_errors_are_retried():
+    """Test 429 / 5xx responses are retried under the Ollama policy."""
+    from llm.client import OLLAMA_RETRY_EXCEPTIONS, is_transient_ollama_error
+
+    for status in (429, 503):
+        backend = _FailingOllama(status)
+        policy = RetryPolicy(min_wait=0, max_wait=0, retry_on=OLLAMA_RETRY_EXCEPTIONS, retry_if=is_transient_ollama_error)
+        client = OllamaLLMClient(backend, retry_policy=policy)
+        with pytest.raises(ollama.ResponseError):
+            client.complete("s", "u")
+        assert backend.calls == policy.max_attempts
+
+
+def test_concurrency_limit():
+    """Test no more than max_concurrency calls are in flight."""
+    lock = threading.Lock()
+    active = [0, 0]  # current, peak
+
+    def slow(system_prompt, user_prompt):
+        with lock:
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        return user_prompt
+
+    client = FakeLLMClient(slow, max_concurrency=2)
+    prompts = [("s", str(i)) for i in range(8)]
+    assert client.complete_many(prompts) == [str(i) for i in range(8)]
+    assert active[1] <= 2
+
+
+def test_acomplete_many_preserves_order():
+    """Test async batch calls return results in input order."""
+    client = FakeLLMClient(lambda s, u: u, latency=0.005, max_concurrency=3)
+    prompts = [("s", str(i)) for i in range(6)]
+    assert asyncio.run(client.acomplete_many(prompts)) == [str(i) for i in range(6)]
+
+
+def test_as_llm_client_wraps_known_clients():
+    """Test raw SDK clients are wrapped and unknown types rejected."""
+    fake = FakeLLMClient()
+    assert as_llm_client(fake) is fake
+    assert isinstance(as_llm_client(groq.Groq(api_key="test")), GroqLLMClient)
+    wrapped = as_llm_client(ollama.Client(host="http://localhost:11434"))
+    assert isinstance(wrapped, OllamaLLMClient)
+    assert wrapped.model == "llama3.2:latest"
+    with pytest.raises(ValueError):
+        as_llm_client(object())
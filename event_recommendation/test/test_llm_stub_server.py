@@ -0,0 +1,71 @@
+"""Tests for the local Groq/Ollama-compatible stub LLM server."""
+
+import json
+
+import groq
+import ollama
+import pytest
+
+from llm import GroqLLMClient, OllamaLLMClient, RetryPolicy
+from llm.stub_server import StubConfig, StubLLMServer, canned_response
+
+
+def test_canned_batch_response_echoes_review_ids():
+    """Test batched review prompts get one object per review ID."""
+    prompt = (
+        "Extract metadata from these reviews:\n\n"
+        "Review R1:\nLoved AQUA FIT at Pinecrest YMCA.\n\n"
+        "Review R2:\nBOOT CAMP was rough.\n\n"
+        "Return a JSON array with one object per review"
+    )
+    result = json.loads(canned_response("", prompt))
+    assert [r["id"] for r in result] == ["R1", "R2"]
+    assert result[0]["event_type"] == "AQUA FIT"
+    assert result[0]["location"] == "Pinecrest YMCA"
+    assert result[1]["sentiment"] == "negative"
+
+
+def test_openai_shape_through_groq_sdk():
+    """Test the Groq SDK can talk to the stub's chat-completions endpoint."""
+    with StubLLMServer() as server:
+        client = GroqLLMClient(server.groq_client())
+        text = client.complete("You are a profile extraction assistant.", 'New user message:\n"I love cooking"')
+        assert json.loads(text)["interests"] == ["cooking"]
+        assert server.snapshot_stats()["requests"] == 1
+
+
+def test_ollama_shape_through_ollama_sdk():
+    """Test the Ollama SDK can talk to the stub's /api/chat endpoint."""
+    with StubLLMServer() as server:
+        client = OllamaLLMClient(server.ollama_client())
+        assert "AQUA FIT" in client.complete("system", "What should I try?")
+
+
+def test_rate_limit_injection_is_retried():
+    """Test injected 429s surface as rate-limit errors and are retried by LLMClient."""
+    with StubLLMServer(StubConfig(rate_limit_probability=1.0)) as server:
+        with pytest.raises(groq.RateLimitError):
+            server.groq_client().chat.completions.create(
+                model="m", messages=[{"role": "user", "content": "hi"}]
+            )
+        with pytest.raises(ollama.ResponseError):
+            server.ollama_client().chat(model="m", messages=[{"role": "user", "content": "hi"}])
+
+    with StubLLMServer(StubConfig(rate_limit_probability=0.5, seed=3)) as server:
+        client = GroqLLMClient(server.groq_client(), retry_policy=RetryPolicy(max_attempts=20, min_wait=0, max_wait=0))
+        for _ in range(5):
+            client.complete("system", "hi")
+        assert client.stats["retries"] == server.snapshot_stats()["rate_limited"]
+
+
+def test_latency_and_token_throughput_simulation():
+    """Test response delay combines sampled latency and decode time."""
+    server = StubLLMServer(StubConfig(latency_ms=100, tokens_per_second=50))
+    try:
+        assert server.response_delay(completion_tokens=10) == pytest.approx(0.3)
+        server.config.latency = "uniform"
+        server.config.latency_jitter_ms = 50
+        delays = [server.response_delay(0) for _ in range(50)]
+        assert all(0.05 <= d <= 0.15 for d in delays)
+    finally:
+        server.stop()
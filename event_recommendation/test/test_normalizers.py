@@ -0,0 +1,70 @@
+"""Tests for the precompiled / memoized normalizers and extractors."""
+
+import io
+import random
+import re
+
+import pandas as pd
+
+from utils.extractors import extract_age_range, extract_age_ranges
+from utils.normalizers import (
+    normalize_activity_heading,
+    normalize_age_focus,
+    normalize_column,
+    normalize_event_type,
+    normalize_intensity,
+)
+
+
+def _reference_age_range(text):
+    """Original four-pattern extract_age_range."""
+    for pattern, open_ended in (
+        (r"(?i)\bages?\s*[:–-]?\s*(\d{1,2})\s*[–—-]\s*(\d{1,2})\b", False),
+        (r"(?i)\bage\s*[:–-]?\s*(\d{1,2})\s*[–—-]\s*(\d{1,2})\b", False),
+        (r"(?i)\bages?\s*[:–-]?\s*(\d{1,2})\s*\+\b", True),
+        (r"(?i)\b(\d{2})\s*\+\b", True),
+    ):
+        m = re.search(pattern, text)
+        if m:
+            return (int(m.group(1)), None) if open_ended else (int(m.group(1)), int(m.group(2)))
+    return None, None
+
+
+def test_extract_age_range_matches_reference_on_fuzzed_text():
+    """Test the precompiled patterns give the original results."""
+    rng = random.Random(0)
+    pieces = ["Ages", "age", "AGE:", " ", "  ", "-", "–", "—", "+", ":", "6", "12", "55", "x", "\n", "Kids (7–12)"]
+    for _ in range(5000):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+        assert extract_age_range(text) == _reference_age_range(text), text
+
+
+def test_extract_age_ranges_batch():
+    """Test the batch API keeps input order and duplicates."""
+    texts = ["Ages: 6-10", "Age 8-12", "Ages: 6-10", "no ages"]
+    assert extract_age_ranges(texts) == [(6, 10), (8, 12), (6, 10), (None, None)]
+
+
+def test_normalize_column():
+    """Test column normalization maps every value, including None and duplicates."""
+    values = ["Aqua Zumba®", None, "aqua   zumba", "", "Yoga / Pilates!"]
+    assert normalize_column(values) == ["AQUA ZUMBA", None, "AQUA ZUMBA", None, "YOGA / PILATES"]
+    assert normalize_column(["Low", "HIGH"], normalize_intensity) == ["low", "high"]
+    assert normalize_column(values, normalize_activity_heading) == normalize_column(values)
+
+
+def test_memoized_normalizers_are_bounded():
+    """Test memoized normalizers expose bounded LRU caches."""
+    normalize_event_type("Aqua Fit")
+    normalize_event_type("Aqua Fit")
+    assert normalize_intensity.cache_info().maxsize is not None
+    assert normalize_age_focus("teens") == "teens"
+    assert normalize_age_focus.cache_info().hits + normalize_age_focus.cache_info().misses >= 1
+
+
+def test_normalize_column_with_blank_csv_cells():
+    """Test blank cells read by pandas (NaN) normalize to None."""
+    frame = pd.read_csv(io.StringIO("event_type,intensity\nAqua Zumba,Low\n,\nSalsa,High\n"))
+    assert frame["event_type"].isna().any()
+    assert normalize_column(frame["event_type"]) == ["AQUA ZUMBA", None, "SALSA"]
+    assert normalize_column(frame["intensity"], normalize_intensity) == ["low", None, "high"]
@@ -0,0 +1,49 @@
+"""Tests for parallel brochure parsing and event ingestion."""
+
+import glob
+import os
+
+import pytest
+
+from database.event_db import EventDB, db_connection
+from rag.document_processing import parse_brochure
+from rag.parallel_ingest import ingest_events_parallel, parse_brochures_parallel
+
+EVENTS_FILES = sorted(glob.glob("documents/Events/*.md"))
+INTENSITY_MAP = {"AQUA FIT": "moderate", "ZUMBA": "high"}
+
+pytestmark = pytest.mark.skipif(not EVENTS_FILES, reason="Sample documents not found")
+
+
+def _serial():
+    brochures = []
+    for path in EVENTS_FILES:
+        with open(path, "r", encoding="utf-8") as f:
+            brochures.append(parse_brochure(f.read(), os.path.basename(path), INTENSITY_MAP))
+    return brochures
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_parallel_parse_matches_serial(max_workers):
+    """Test pooled parsing returns the serial result in input order."""
+    result = list(parse_brochures_parallel(EVENTS_FILES, INTENSITY_MAP, max_workers=max_workers))
+    assert result == _serial()
+
+
+def test_parallel_parse_block_ranges_match_serial():
+    """Test files split into event-block ranges merge back to the serial parse."""
+    result = list(parse_brochures_parallel(
+        EVENTS_FILES, INTENSITY_MAP, max_workers=2, split_bytes=0, blocks_per_task=3
+    ))
+    assert result == _serial()
+
+
+def test_ingest_events_parallel_batches(tmp_path):
+    """Test records stream into the events table in batches, in order."""
+    db = EventDB(str(tmp_path / "events.db"))
+    total = ingest_events_parallel(EVENTS_FILES, db, INTENSITY_MAP, max_workers=2, batch_size=7)
+    expected = [record for brochure in _serial() for record in brochure.records()]
+    assert total == len(expected) == db.count_events()
+    with db_connection(db.db_path) as conn:
+        names = [row[0] for row in conn.execute("SELECT event_name FROM events ORDER BY id")]
+    assert names == [r.event_name for r in expected]
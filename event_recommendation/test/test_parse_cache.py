@@ -0,0 +1,129 @@
+"""Tests for the parsed-corpus cache."""
+
+import glob
+import os
+
+import pytest
+
+from rag.document_processing import build_activitytype_documents, build_event_documents, build_event_records
+from rag.parse_cache import ParseCache, parse_corpus
+
+BROCHURE = """## YMCA Riverstone
+**Location:** Framingham, Massachusetts
+**Type:** YMCA
+
+### AQUA FIT (Ages 18+)
+- Event Type: AQUA FIT
+- Instructor: Jane Doe
+- Spots: 12
+
+### TEEN DANCE (Ages 13-17)
+- Event Type: TEEN DANCE
+- Time Slots: Sat 10:00
+"""
+
+ACTIVITY = """## AQUA FIT
+**Intensity:** Moderate
+Water-based cardio.
+"""
+
+
+def _write_corpus(tmp_path):
+    events = tmp_path / "Events"
+    activity = tmp_path / "activityType"
+    events.mkdir()
+    activity.mkdir()
+    (events / "ymca.md").write_text(BROCHURE, encoding="utf-8")
+    (activity / "aquatics.md").write_text(ACTIVITY, encoding="utf-8")
+    return [str(events / "ymca.md")], [str(activity / "aquatics.md")]
+
+
+def test_parse_cache_hits_and_matches_fresh_parse(tmp_path):
+    """Test cached parses round-trip to the same documents and records."""
+    events_files, activity_files = _write_corpus(tmp_path)
+    cache_path = str(tmp_path / "parse_cache.db")
+
+    first = parse_corpus(events_files, activity_files, ParseCache(cache_path))
+    assert first.changed_sources == {"ymca.md", "aquatics.md"}
+
+    cache = ParseCache(cache_path)
+    second = parse_corpus(events_files, activity_files, cache)
+    assert cache.stats == {"hits": 2, "misses": 0, "rehashed": 0}
+    assert second.changed_sources == set()
+
+    _docs, intensity_map = build_activitytype_documents(ACTIVITY, "aquatics.md")
+    assert second.intensity_map == intensity_map == {"AQUA FIT": "moderate"}
+    assert second.event_documents() == build_event_documents(
+        BROCHURE, "ymca.md", intensity_map, "Framingham", "Massachusetts"
+    )
+    assert second.event_records() == build_event_records(
+        BROCHURE, "ymca.md", intensity_map, "Framingham", "Massachusetts", "YMCA Riverstone", "YMCA"
+    )
+    assert second.activity_documents == first.activity_documents
+
+
+def test_parse_cache_detects_changes(tmp_path):
+    """Test touched files are rehashed and edited files re-parsed."""
+    events_files, activity_files = _write_corpus(tmp_path)
+    cache_path = str(tmp_path / "parse_cache.db")
+    parse_corpus(events_files, activity_files, ParseCache(cache_path))
+
+    # Same content, new mtime: served from cache after a hash check
+    st = os.stat(events_files[0])
+    os.utime(events_files[0], ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    cache = ParseCache(cache_path)
+    corpus = parse_corpus(events_files, activity_files, cache)
+    assert cache.stats == {"hits": 2, "misses": 0, "rehashed": 1}
+    assert corpus.changed_sources == set()
+
+    # Edited brochure is re-parsed
+    with open(events_files[0], "a", encoding="utf-8") as f:
+        f.write("\n### YOGA (Ages 18+)\n- Event Type: YOGA\n")
+    cache = ParseCache(cache_path)
+    corpus = parse_corpus(events_files, activity_files, cache)
+    assert cache.stats["misses"] == 1
+    assert corpus.changed_sources == {"ymca.md"}
+    assert [b.event_name for b in corpus.brochures[0].blocks][-1] == "YOGA (Ages 18+)"
+
+    # Parser version bump invalidates every entry
+    cache = ParseCache(cache_path, parser_version="test")
+    parse_corpus(events_files, activity_files, cache)
+    assert cache.stats["misses"] == 2
+
+
+def test_parse_cache_intensity_change_marks_brochures(tmp_path):
+    """Test an edited activity type file re-applies intensity to cached brochures."""
+    events_files, activity_files = _write_corpus(tmp_path)
+    cache_path = str(tmp_path / "parse_cache.db")
+    parse_corpus(events_files, activity_files, ParseCache(cache_path))
+
+    with open(activity_files[0], "w", encoding="utf-8") as f:
+        f.write(ACTIVITY.replace("Moderate", "High"))
+    corpus = parse_corpus(events_files, activity_files, ParseCache(cache_path))
+    assert corpus.changed_sources == {"aquatics.md", "ymca.md"}
+    assert corpus.brochures[0].blocks[0].intensity == "high"
+
+
+def test_parse_cache_prunes_removed_files(tmp_path):
+    """Test entries for deleted files are dropped."""
+    events_files, activity_files = _write_corpus(tmp_path)
+    cache = ParseCache(str(tmp_path / "parse_cache.db"))
+    parse_corpus(events_files, activity_files, cache)
+    assert cache.prune(events_files) == 1
+
+
+@pytest.mark.skipif(not os.path.isdir("documents/Events"), reason="Sample documents not found")
+def test_parse_cache_matches_sample_corpus(tmp_path):
+    """Test cached parses of the sample corpus equal an uncached parse."""
+    events_files = sorted(glob.glob("documents/Events/*.md"))
+    activity_files = sorted(glob.glob("documents/activityType/*.md"))
+    expected = parse_corpus(events_files, activity_files)
+
+    cache_path = str(tmp_path / "parse_cache.db")
+    parse_corpus(events_files, activity_files, ParseCache(cache_path))
+    cached = parse_corpus(events_files, activity_files, ParseCache(cache_path))
+    assert cached.changed_sources == set()
+    assert cached.event_documents() == expected.event_documents()
+    assert cached.event_records() == expected.event_records()
+    assert cached.activity_documents == expected.activity_documents
+    assert cached.intensity_map == expected.intensity_map
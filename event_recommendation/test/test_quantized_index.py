@@ -0,0 +1,82 @@
+"""Tests for the int8-quantized, memory-mapped embedding store."""
+
+import glob
+import os
+
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from database.event_db import EventDB
+from rag.document_processing import parse_brochure
+from rag.event_index import EventEmbeddingIndex, build_event_index, event_index_path, open_event_index
+from rag.quantized_index import QuantizedVectorIndex, quantize, quantized_paths, write_quantized
+
+
+def _normalized(rows, dim, seed=0):
+    matrix = np.random.default_rng(seed).standard_normal((rows, dim)).astype(np.float32)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+def test_quantize_error_is_bounded():
+    """Test each value decodes to within half a quantization step; zero rows stay zero."""
+    matrix = _normalized(50, 32)
+    matrix[7] = 0
+    codes, scales = quantize(matrix)
+    assert codes.dtype == np.int8 and scales.dtype == np.float32
+    assert np.all(np.abs(codes.astype(np.float32) * scales[:, None] - matrix) <= scales[:, None] / 2 + 1e-7)
+    assert scales[7] == 0 and not codes[7].any()
+    assert np.abs(codes).max() == 127
+
+
+def test_search_recall_against_exact(tmp_path):
+    """Test re-scored int8 search finds (almost) the exact top-k, with exact scores."""
+    matrix = _normalized(3000, 64)
+    path = str(tmp_path / "vectors.npy")
+    np.save(path, matrix)
+    assert write_quantized(path, chunk_rows=1000) == 3000
+    index = QuantizedVectorIndex(path)
+    assert isinstance(index.codes, np.memmap) and index.codes.nbytes * 4 == matrix.nbytes
+
+    queries = _normalized(20, 64, seed=1)
+    recalls = []
+    for query in queries:
+        exact = np.argsort(-(matrix @ query))[:10]
+        results = index.search(query, k=10)
+        recalls.append(len(set(exact) & {row for row, _ in results}) / 10)
+        assert all(abs(score - float(matrix[row] @ query)) < 1e-5 for row, score in results)
+    assert np.mean(recalls) >= 0.95
+
+    # A stored vector finds itself first
+    assert index.search(matrix[123], k=1)[0][0] == 123
+    assert index.search(queries[0][:5], k=3) == []
+
+
+def test_event_index_quantized(tmp_path):
+    """Test build_event_index(quantize=True) serves scores close to the float index, exact at the head."""
+    records = []
+    for path in sorted(glob.glob("documents/Events/*.md")):
+        with open(path, "r", encoding="utf-8") as f:
+            records.extend(parse_brochure(f.read(), path.split("/")[-1]).records())
+    db = EventDB(str(tmp_path / "events.db"))
+    db.insert_events(records)
+    embedding = DeterministicFakeEmbedding(size=64)
+    build_event_index(db, embedding.embed_documents, quantize=True)
+    path = event_index_path(db.db_path)
+    assert all(os.path.exists(p) for p in quantized_paths(path))
+
+    index = open_event_index(db.db_path)
+    assert isinstance(index, QuantizedVectorIndex)
+    content_ids = [d.metadata["content_id"] for d in db.query_events(limit=1000, include_content=False)]
+    query = embedding.embed_query("swim lessons")
+    exact = EventEmbeddingIndex(path).score(query, content_ids)
+    approximate = index.score(query, content_ids, rescore=10)
+    assert np.allclose(approximate, exact, atol=0.02)
+    head = np.argsort(-exact, kind="stable")[:5]
+    assert np.allclose(approximate[head], exact[head], atol=1e-6)
+
+    # Rebuilding with quantize left at None keeps the codes; quantize=False removes them
+    build_event_index(db, embedding.embed_documents)
+    assert isinstance(open_event_index(db.db_path), QuantizedVectorIndex)
+    build_event_index(db, embedding.embed_documents, quantize=False)
+    assert not any(os.path.exists(p) for p in quantized_paths(path))
+    assert isinstance(open_event_index(db.db_path), EventEmbeddingIndex)
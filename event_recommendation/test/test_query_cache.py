@@ -0,0 +1,103 @@
+"""Tests for the two-tier query embedding cache."""
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from langchain_core.embeddings import Embeddings
+
+from rag.query_cache import (
+    CachedQueryEmbeddings,
+    QueryEmbeddingCache,
+    cache_query_embeddings,
+    canonicalize_query,
+)
+from rag.retrieval import retrieve_activity_types
+
+
+class CountingEmbeddings(Embeddings):
+    """Deterministic embeddings that count embed_query calls."""
+
+    def __init__(self, model="fake-embedding"):
+        self.model = model
+        self.query_calls = []
+
+    def embed_documents(self, texts):
+        return [self.embed_query(t) for t in texts]
+
+    def embed_query(self, text):
+        self.query_calls.append(text)
+        return [float(len(text)), float(text.count(" ")), 0.5]
+
+
+def test_canonicalize_query():
+    assert canonicalize_query("  Swimming\n for KIDS\t ") == "swimming for kids"
+
+
+def test_repeats_skip_embedding_across_tiers(tmp_path):
+    """Test exact and canonical repeats hit memory, then SQLite after a restart."""
+    path = str(tmp_path / "query_cache.db")
+    inner = CountingEmbeddings()
+    cached = CachedQueryEmbeddings(inner, QueryEmbeddingCache(path, memory_capacity=1))
+
+    first = cached.embed_query("Swimming for kids")
+    assert cached.embed_query("swimming  FOR kids") == first
+    assert inner.query_calls == ["swimming for kids"]
+    assert cached.cache.stats == {"memory_hits": 1, "disk_hits": 0, "misses": 1}
+
+    cached.embed_query("dance classes")  # evicts the first query from memory
+    assert cached.embed_query("Swimming for kids") == first
+    assert cached.cache.stats["disk_hits"] == 1
+
+    restarted = CachedQueryEmbeddings(inner, QueryEmbeddingCache(path))
+    assert restarted.embed_query("dance classes") == cached.embed_query("dance classes")
+    assert len(inner.query_calls) == 2
+    assert restarted.cache.hit_ratios() == {"memory": 0.0, "disk": 1.0, "total": 1.0}
+
+
+def test_entries_are_keyed_by_model(tmp_path):
+    """Test another embedding model does not reuse cached vectors."""
+    cache = QueryEmbeddingCache(str(tmp_path / "query_cache.db"))
+    small, large = CountingEmbeddings("small"), CountingEmbeddings("large")
+    CachedQueryEmbeddings(small, cache).embed_query("yoga")
+    CachedQueryEmbeddings(large, cache).embed_query("yoga")
+    assert small.query_calls == large.query_calls == ["yoga"]
+
+
+def test_concurrent_lookups_are_all_counted(tmp_path):
+    """Test lookups from many threads share one connection and every one is counted."""
+    cache = QueryEmbeddingCache(str(tmp_path / "query_cache.db"), memory_capacity=4)
+    cached = CachedQueryEmbeddings(CountingEmbeddings(), cache)
+    queries = [f"query {i % 20}" for i in range(400)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        vectors = list(pool.map(cached.embed_query, queries))
+    assert vectors == [[6.0 + len(str(i % 20)), 1.0, 0.5] for i in range(400)]
+    assert sum(cache.stats.values()) == len(queries)
+    assert cache.stats["disk_hits"] > 0
+    cache.close()
+
+
+def test_store_queries_go_through_cache(tmp_path):
+    """Test a wrapped store embeds a repeated retrieval query once."""
+    inner = CountingEmbeddings()
+
+    class FakeStore:
+        def __init__(self):
+            self._embedding_function = inner
+
+        @property
+        def embeddings(self):
+            return self._embedding_function
+
+        def similarity_search(self, query, k=4, filter=None):
+            self._embedding_function.embed_query(query)
+            return []
+
+    cache = QueryEmbeddingCache(str(tmp_path / "query_cache.db"))
+    store = cache_query_embeddings(FakeStore(), cache)
+    assert cache_query_embeddings(store, cache).embeddings.embeddings is inner  # not wrapped twice
+
+    stores = SimpleNamespace(activity_types=store)
+    for _ in range(3):
+        retrieve_activity_types(stores, "Something gentle\nLocation: Salem", {"intensity": "low"})
+    assert len(inner.query_calls) == 1
+    assert cache.hit_ratios()["memory"] == 2 / 3
@@ -0,0 +1,107 @@
+"""Tests for self-healing adaptive batching of LLM review extraction."""
+
+import json
+import re
+
+from llm import FakeLLMClient
+from rag.reviews_processing import (
+    _plan_batches,
+    _extract_metadata_batch_with_llm,
+    extract_metadata_adaptive,
+)
+
+
+def _answer(user_prompt: str, order=None):
+    """Build a well-formed response echoing each review ID in the prompt."""
+    ids = re.findall(r"^Review (R\d+):", user_prompt, re.MULTILINE)
+    if order == "reversed":
+        ids = list(reversed(ids))
+    return json.dumps([
+        {"id": review_id, "event_type": f"EVENT {review_id}", "location": None, "sentiment": "positive"}
+        for review_id in ids
+    ])
+
+
+def test_plan_batches_respects_token_budget():
+    """Test batches are cut when the estimated token budget is exceeded."""
+    reviews = ["x" * 400] * 10  # ~101 + 30 tokens each
+    batches = _plan_batches(reviews, token_budget=300)
+    assert batches[0] == (0, 2)
+    assert batches[-1][1] == 10
+    assert all(end - start <= 2 for start, end in batches)
+
+
+def test_plan_batches_respects_max_batch_size():
+    """Test the hard cap on reviews per batch."""
+    batches = _plan_batches(["short"] * 7, token_budget=10_000, max_batch_size=3)
+    assert batches == [(0, 3), (3, 6), (6, 7)]
+
+
+def test_plan_batches_oversized_review_gets_own_batch():
+    """Test a review larger than the budget is still emitted, alone."""
+    batches = _plan_batches(["a", "x" * 10_000, "b"], token_budget=100)
+    assert batches == [(0, 1), (1, 2), (2, 3)]
+
+
+def test_results_aligned_by_id_not_position():
+    """Test out-of-order responses are aligned using review IDs."""
+    client = FakeLLMClient(lambda s, u: _answer(u, "reversed"))
+    results = _extract_metadata_batch_with_llm(["a", "b", "c"], ollama_client=client, model="m")
+    assert [r["event_type"] for r in results] == ["EVENT R1", "EVENT R2", "EVENT R3"]
+
+
+def test_malformed_batch_is_bisected_and_retried():
+    """Test an unparseable batch is split and both halves recovered."""
+    calls = []
+
+    def fake_call(system_prompt, user_prompt):
+        calls.append(user_prompt)
+        if len(calls) == 1:
+            return "Sorry, here is some broken JSON: [{"
+        return _answer(user_prompt)
+
+    client = FakeLLMClient(fake_call, max_concurrency=1)
+    results, metrics = extract_metadata_adaptive(["a", "b", "c", "d"], ollama_client=client, model="m")
+
+    assert [r["event_type"] for r in results] == ["EVENT R1", "EVENT R2", "EVENT R3", "EVENT R4"]
+    assert metrics["llm_calls"] == 3
+    assert metrics["failed_batches"] == 1
+    assert metrics["retries"] == 2
+    assert metrics["dropped_reviews"] == 0
+
+
+def test_missing_ids_are_retried():
+    """Test reviews missing from a response are retried instead of padded."""
+    calls = []
+
+    def fake_call(system_prompt, user_prompt):
+        calls.append(user_prompt)
+        answer = json.loads(_answer(user_prompt))
+        if len(calls) == 1:
+            answer = answer[:1]
+        return json.dumps(answer)
+
+    client = FakeLLMClient(fake_call, max_concurrency=1)
+    results, metrics = extract_metadata_adaptive(["a", "b", "c"], ollama_client=client, model="m")
+
+    assert all(r["event_type"] for r in results)
+    assert metrics["llm_calls"] == 2
+    assert "Review R2" in calls[1] and "Review R1" not in calls[1]
+
+
+def test_single_review_failure_returns_nulls():
+    """Test a review that never parses yields nulls and is counted as dropped."""
+    results, metrics = extract_metadata_adaptive(["a", "b"], ollama_client=FakeLLMClient("not json"), model="m")
+    assert results == [{"event_type": None, "location": None, "sentiment": None}] * 2
+    assert metrics["dropped_reviews"] == 2
+    assert metrics["failure_rate"] == 1.0
+
+
+def test_batches_run_concurrently_in_order():
+    """Test concurrent batches keep results aligned with the input order."""
+    client = FakeLLMClient(lambda s, u: _answer(u), latency=0.01, max_concurrency=4)
+    reviews = [f"review {i}" for i in range(12)]
+    results, metrics = extract_metadata_adaptive(reviews, ollama_client=client, model="m", max_batch_size=1)
+    assert metrics["batches"] == 12
+    assert len(client.calls) == 12
+    assert [r["event_type"] for r in results] == ["EVENT R1"] * 12
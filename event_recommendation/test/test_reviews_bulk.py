@@ -0,0 +1,68 @@
+"""Tests for the vectorized bulk reviews ingestion path."""
+
+import os
+
+import pytest
+
+from database.review_db import ReviewDB
+from rag.reviews_processing import (
+    _extract_metadata_with_rules,
+    _read_reviews_csv,
+    bulk_store_reviews,
+    iter_review_row_chunks,
+)
+
+
+def _write_csv(tmp_path):
+    csv_path = tmp_path / "reviews.csv"
+    csv_path.write_text(
+        "created_at,,rating,review_text\n"
+        "2026-01-01,,5,AQUA FIT at Riverstone YMCA was great.\n"
+        "2026-01-02,,,\n"
+        "2026-01-03,,2,\"Wanted to like SALSA / LATIN DANCE (Pittsfield), too crowded.\"\n"
+        "2026-01-04,,3,Decent a class at Harborlight YMCA.\n",
+        encoding="utf-8",
+    )
+    return str(csv_path)
+
+
+def test_iter_review_row_chunks(tmp_path):
+    """Test chunks yield insert-ready tuples and skip empty reviews."""
+    chunks = list(iter_review_row_chunks(_write_csv(tmp_path), chunksize=2))
+    rows = [row for chunk in chunks for row in chunk]
+    assert len(chunks) == 2
+    assert rows == [
+        ("AQUA FIT at Riverstone YMCA was great.", "5", "2026-01-01",
+         "AQUA FIT", "Riverstone YMCA", "positive", "reviews.csv"),
+        ("Wanted to like SALSA / LATIN DANCE (Pittsfield), too crowded.", "2", "2026-01-03",
+         "SALSA / LATIN DANCE", "Pittsfield", "negative", "reviews.csv"),
+        ("Decent a class at Harborlight YMCA.", "3", "2026-01-04",
+         None, "Harborlight YMCA", "neutral", "reviews.csv"),
+    ]
+
+
+def test_bulk_store_reviews(tmp_path):
+    """Test bulk ingestion stores every non-empty review."""
+    db_path = str(tmp_path / "reviews.db")
+    reviews_db = bulk_store_reviews(_write_csv(tmp_path), db_path, chunksize=1)
+    assert isinstance(reviews_db, ReviewDB)
+    assert reviews_db.count_reviews() == 3
+    docs = reviews_db.query_reviews(event_types=["AQUA FIT"])
+    assert len(docs) == 1
+    assert docs[0].metadata["location"] == "Riverstone YMCA"
+    assert docs[0].metadata["sentiment"] == "positive"
+
+
+@pytest.mark.skipif(
+    not os.path.exists("documents/Reviews/reviews_rag_2000.csv"),
+    reason="Reviews CSV not found",
+)
+def test_bulk_matches_row_rules_on_sample():
+    """Test column-wise extraction matches the per-row rules extractor."""
+    csv_path = "documents/Reviews/reviews_rag_2000.csv"
+    rows = [row for chunk in iter_review_row_chunks(csv_path, chunksize=500) for row in chunk]
+    reviews = _read_reviews_csv(csv_path)
+    assert len(rows) == len(reviews)
+    for row, review in zip(rows, reviews):
+        expected = _extract_metadata_with_rules(review["review_text"], review["rating"])
+        assert row[3:6] == (expected["event_type"], expected["location"], expected["sentiment"])
@@ -0,0 +1,112 @@
+"""Tests for rules-first cascade extraction of review metadata."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from llm import FakeLLMClient
+from rag.reviews_processing import (
+    CASCADE_CONFIDENCE_THRESHOLD,
+    _extract_metadata_with_rules,
+    build_review_documents_cascade,
+)
+
+
+def test_rules_extract_event_and_venue():
+    """Test rule extraction of a fully specified review."""
+    result = _extract_metadata_with_rules(
+        "If you're in Lexington, try BEGINNER COOKING at Pinecrest YMCA. Easy 5 stars.",
+        rating="5",
+    )
+    assert result["event_type"] == "BEGINNER COOKING"
+    assert result["location"] == "Pinecrest YMCA"
+    assert result["sentiment"] == "positive"
+    assert result["confidence"] >= CASCADE_CONFIDENCE_THRESHOLD
+
+
+def test_rules_extract_punctuated_event_type():
+    """Test rule extraction keeps '/' and '&' inside event types."""
+    result = _extract_metadata_with_rules(
+        "Wanted to like SALSA / LATIN DANCE at Summit Reach YMCA (Pittsfield).", rating="2"
+    )
+    assert result["event_type"] == "SALSA / LATIN DANCE"
+    assert result["location"] == "Summit Reach YMCA"
+    assert result["sentiment"] == "negative"
+
+
+def test_rules_low_confidence_without_location():
+    """Test reviews with no venue or city fall below the cascade threshold."""
+    result = _extract_metadata_with_rules("Decent SENIOR CIRCUITS, but it started late.", rating="3")
+    assert result["event_type"] == "SENIOR CIRCUITS"
+    assert result["location"] is None
+    assert result["sentiment"] == "neutral"
+    assert result["confidence"] < CASCADE_CONFIDENCE_THRESHOLD
+
+
+def test_cascade_sends_only_leftovers_to_llm(tmp_path):
+    """Test only low-confidence reviews reach the LLM batch extractor."""
+    csv_path = tmp_path / "reviews.csv"
+    csv_path.write_text(
+        "created_at,,rating,review_text\n"
+        "2026-01-01,,5,AQUA FIT at Riverstone YMCA was great.\n"
+        "2026-01-02,,1,Had a rough experience with BOOT CAMP. Needs improvement.\n",
+        encoding="utf-8",
+    )
+    llm_result = [{"event_type": "BOOT CAMP", "location": "Harborlight YMCA", "sentiment": None}]
+
+    with patch(
+        "rag.reviews_processing._extract_metadata_batch_with_llm", return_value=llm_result
+    ) as batch_llm:
+        docs, stats = build_review_documents_cascade(str(csv_path), llm_client=FakeLLMClient(), model="m")
+
+    batch_llm.assert_called_once()
+    assert batch_llm.call_args[0][0] == ["Had a rough experience with BOOT CAMP. Needs improvement."]
+    assert stats["total"] == 2
+    assert stats["rules_resolved"] == 1
+    assert stats["llm_processed"] == 1
+    assert docs[0].metadata["extraction_method"] == "rules"
+    assert docs[1].metadata["extraction_method"] == "llm"
+    assert docs[1].metadata["location"] == "Harborlight YMCA"
+    # Rule-derived sentiment is kept when the LLM returns null
+    assert docs[1].metadata["sentiment"] == "negative"
+
+
+@pytest.mark.skipif(
+    not os.path.exists("documents/Reviews/reviews_rag_2000.csv"),
+    reason="Reviews CSV not found",
+)
+def test_cascade_resolves_most_sample_reviews_without_llm():
+    """Test most rows of the sample CSV resolve in the rules stage."""
+    docs, stats = build_review_documents_cascade("documents/Reviews/reviews_rag_2000.csv")
+    assert len(docs) == stats["total"]
+    assert stats["rules_resolved"] / stats["total"] > 0.8
+    assert stats["llm_processed"] == 0
+
+
+def test_rules_prefer_gazetteer_matches():
+    """Test catalog gazetteer matches take precedence and use catalog spelling."""
+    from utils.gazetteer import Gazetteer
+
+    gazetteer = Gazetteer(event_types=["AQUA FIT"], venues=["Riverstone YMCA"], cities=["Framingham"])
+    result = _extract_metadata_with_rules("Loved aqua fit at riverstone ymca!", rating="5", gazetteer=gazetteer)
+    assert result["event_type"] == "AQUA FIT"
+    assert result["location"] == "Riverstone YMCA"
+    assert result["confidence"] == 1.0
+
+
+def test_rules_ignore_emphasis_words():
+    """Test upper-case emphasis is not taken as an event type and leaves the review to the LLM."""
+    result = _extract_metadata_with_rules("The class was GREAT at Downtown YMCA, loved it", rating="5")
+    assert result["event_type"] is None
+    assert result["location"] == "Downtown YMCA"
+    assert result["confidence"] < CASCADE_CONFIDENCE_THRESHOLD
+
+
+def test_rules_discount_upper_case_phrases_without_catalog():
+    """Test a bare upper-case phrase scores less than one next to its venue or a catalog match."""
+    near = _extract_metadata_with_rules("BOOT CAMP at Harborlight YMCA.")
+    far = _extract_metadata_with_rules("Harborlight YMCA is clean, the staff are friendly and parking is easy. BOOT CAMP was fine.")
+    assert near["event_type"] == far["event_type"] == "BOOT CAMP"
+    assert near["confidence"] == 0.6
+    assert far["confidence"] == 0.5
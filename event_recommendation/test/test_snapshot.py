@@ -0,0 +1,187 @@
+"""Tests for the memory-mapped serving snapshot."""
+
+import glob
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from database.activity_db import ActivityTypeDB
+from database.event_db import EventDB
+from database.snapshot import (
+    SNAPSHOT_VERSION,
+    Snapshot,
+    SnapshotEventStore,
+    SnapshotReviewStore,
+    chroma_embeddings,
+    open_snapshot,
+    write_snapshot,
+)
+from rag.parallel_ingest import ingest_events_parallel
+from rag.parse_cache import parse_activity_types
+from rag.event_index import build_event_index
+from rag.retrieval import get_activity_definitions, route_activity_types
+from rag.serving import serving_stores, snapshot_is_servable
+from rag.reviews_processing import bulk_store_reviews
+
+
+class _FakeChroma:
+    """Chroma.get() over documents with one embedding each, in reverse catalog order."""
+
+    def __init__(self, documents):
+        self.documents = documents[::-1]
+
+    def get(self, include):
+        return {
+            "ids": [f"id-{i}" for i in range(len(self.documents))],
+            "documents": [d.page_content for d in self.documents],
+            # Chroma drops None metadata values
+            "metadatas": [{k: v for k, v in d.metadata.items() if v is not None} for d in self.documents],
+            "embeddings": np.arange(len(self.documents) * 4, dtype=np.float32).reshape(-1, 4),
+        }
+
+
+@pytest.fixture(scope="module")
+def sources(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("snapshot")
+    db_path = str(tmp_path / "events.db")
+    catalog = ActivityTypeDB(db_path)
+    corpus = parse_activity_types(sorted(glob.glob("documents/activityType/*.md")))
+    catalog.replace_activity_types(corpus.activity_records())
+    event_db = EventDB(db_path)
+    ingest_events_parallel(sorted(glob.glob("documents/Events/*.md")), event_db, max_workers=1)
+    catalog.rebuild_routes()
+    review_db = bulk_store_reviews("documents/Reviews/reviews_rag_2000.csv", str(tmp_path / "reviews.db"))
+    embeddings = chroma_embeddings(_FakeChroma(corpus.activity_documents), catalog.get_activity_types())
+    path = str(tmp_path / "serving.snapshot")
+    write_snapshot(path, event_db, review_db, catalog, embeddings, "fake-4")
+    return path, event_db, review_db, catalog
+
+
+def test_snapshot_events_match_database(sources):
+    """Test every filter combination returns the same documents as SQLite."""
+    path, event_db, _review_db, _catalog = sources
+    store = SnapshotEventStore(Snapshot(path), event_db.db_path)
+    assert store.count_events() == event_db.count_events()
+    assert store.get_catalog_vocabulary() == event_db.get_catalog_vocabulary()
+    for filters in (
+        {"limit": 10_000},
+        {"event_types": ["aqua fit", "STORY TIME"], "limit": 50},
+        {"city": "framingham", "age_contains": "adults, seniors", "limit": 20},
+        {"state": "massachusetts", "limit": 5},
+        {"intensity": "Moderate", "limit": 30},
+        {"age_contains": ["kids"], "limit": 100},
+        {"city": "Nowhere"},
+    ):
+        expected = event_db.query_events(**filters)
+        assert expected or filters.get("city") == "Nowhere", filters
+        actual = store.query_events(**filters)
+        assert [(d.page_content, d.metadata) for d in actual] == [
+            (d.page_content, d.metadata) for d in expected
+        ], filters
+
+
+def test_snapshot_review_scores_match_database(sources):
+    """Test the stored aggregates give the same averages as ReviewDB."""
+    path, _event_db, review_db, _catalog = sources
+    store = SnapshotReviewStore(Snapshot(path), review_db)
+    for filters in ({}, {"event_types": ["AQUA FIT", "salsa / latin dance"]}, {"locations": ["Pittsfield"]}):
+        assert store.get_review_scores(**filters) == review_db.get_review_scores(**filters)
+    assert store.count_reviews() == review_db.count_reviews()
+
+
+def test_snapshot_catalog_and_embeddings(sources):
+    """Test the activity catalog, routes and catalog-aligned embeddings round-trip."""
+    path, _event_db, _review_db, catalog = sources
+    snapshot = Snapshot(path)
+    records = catalog.get_activity_types()
+    assert snapshot.activity_records() == records
+    assert snapshot.get_intensity_map() == catalog.get_intensity_map()
+    assert snapshot.get_routes() == catalog.get_routes()
+
+    # Row i is the embedding of record i: the fake store lists documents in reverse
+    ids, matrix = snapshot.embeddings
+    last = len(records) - 1
+    assert ids[0] == f"id-{last}" and ids[last] == "id-0"
+    assert matrix.dtype == np.float32 and matrix[0, 3] == last * 4 + 3
+    assert not matrix.flags.writeable
+
+    documents, vectors = snapshot.activity_embedding_documents()
+    assert vectors is not None and len(documents) == len(records)
+    assert documents[0].id == ids[0]
+    assert documents[0].page_content == records[0].page_content
+    assert documents[0].metadata["activity_heading_norm"] == records[0].heading_norm
+
+
+def test_snapshot_serves_catalog_lookups(sources):
+    """Test routing and activity definitions read the snapshot, with the database's answers."""
+    path, event_db, _review_db, _catalog = sources
+    from_db = SimpleNamespace(events=event_db)
+    from_snapshot = SimpleNamespace(events=SnapshotEventStore(Snapshot(path)))
+    profile = {"interests": ["aquatics", "dancing"], "age_focus": "seniors"}
+
+    expected = route_activity_types(from_db, profile)
+    assert expected
+    actual = route_activity_types(from_snapshot, profile)
+    assert [(d.page_content, d.metadata) for d in actual] == [(d.page_content, d.metadata) for d in expected]
+    headings = [d.metadata["activity_heading_norm"] for d in expected]
+    assert [d.metadata for d in get_activity_definitions(from_snapshot, headings, [])] == [
+        d.metadata for d in get_activity_definitions(from_db, headings, [])
+    ]
+
+
+def test_chroma_embeddings_requires_every_record(sources, tmp_path):
+    """Test embeddings are only stored with one row per catalog record."""
+    _path, event_db, _review_db, catalog = sources
+    records = catalog.get_activity_types()
+    documents = [
+        SimpleNamespace(page_content=r.page_content, metadata={"source": r.source, "activity_heading_norm": r.heading_norm})
+        for r in records[1:]
+    ]
+    assert chroma_embeddings(_FakeChroma(documents), records) is None
+    with pytest.raises(ValueError):
+        write_snapshot(str(tmp_path / "bad.snapshot"), event_db, None, catalog, (["a"], np.zeros((1, 4), dtype=np.float32)))
+
+
+def test_serving_stores_start_from_snapshot(sources, tmp_path):
+    """Test a current snapshot with embeddings and an event index serves without Chroma."""
+    path, event_db, review_db, _catalog = sources
+    snapshot = open_snapshot(path, event_db.db_path, review_db.db_path)
+    assert snapshot.embedding_model == "fake-4"
+    embedding = DeterministicFakeEmbedding(size=4)
+
+    # Copy the events database so building its event index leaves the fixture's snapshot current
+    db_copy = tmp_path / "events.db"
+    db_copy.write_bytes(open(event_db.db_path, "rb").read())
+    assert not snapshot_is_servable(snapshot, str(db_copy))
+    build_event_index(EventDB(str(db_copy)), embedding.embed_documents)
+    assert snapshot_is_servable(snapshot, str(db_copy))
+    assert not snapshot_is_servable(snapshot, str(db_copy), quantize=True)
+    assert not snapshot_is_servable(None, str(db_copy))
+
+    stores = serving_stores(snapshot, str(db_copy), review_db, embedding)
+    assert isinstance(stores.events, SnapshotEventStore)
+    assert isinstance(stores.reviews, SnapshotReviewStore)
+    headings = [d.metadata["activity_heading_norm"] for d in stores.activity_types.similarity_search("aqua fit", k=5)]
+    assert len(headings) == len(set(headings)) == 5
+    assert stores.events.query_events(event_types=["AQUA FIT"], limit=5)
+    assert serving_stores(snapshot, str(db_copy), None, embedding).reviews is None
+
+
+def test_open_snapshot_rejects_stale_or_foreign_files(sources, tmp_path):
+    """Test open_snapshot returns None for stale, missing or other-version files."""
+    path, event_db, review_db, _catalog = sources
+    assert open_snapshot(path, event_db.db_path, review_db.db_path) is not None
+    assert open_snapshot(str(tmp_path / "missing.snapshot")) is None
+
+    with open(path, "rb") as f:
+        data = bytearray(f.read())
+    data[8:12] = (SNAPSHOT_VERSION + 1).to_bytes(4, "little")
+    other = tmp_path / "other.snapshot"
+    other.write_bytes(bytes(data))
+    assert open_snapshot(str(other)) is None
+
+    copied = tmp_path / "events.db"
+    copied.write_bytes(open(event_db.db_path, "rb").read())
+    assert open_snapshot(path, str(copied), review_db.db_path) is None
@@ -0,0 +1,92 @@
+"""Tests for dictionary-compressed page_content / review_text storage."""
+
+import glob
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from database import text_codec
+from database.event_db import EventDB
+from database.review_db import ReviewDB
+from database.text_codec import TextCodec, train_dictionary
+from rag.document_processing import parse_brochure
+from rag.retrieval import load_event_contents, retrieve_events_for_activity_type
+
+
+def _records():
+    records = []
+    for path in sorted(glob.glob("documents/Events/*.md")):
+        with open(path, "r", encoding="utf-8") as f:
+            records.extend(parse_brochure(f.read(), path.split("/")[-1]).records())
+    return records
+
+
+METHODS = ["zlib"] + (["zstd"] if text_codec.zstandard is not None else [])
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_codec_round_trip(method):
+    """Test texts round-trip and the trained dictionary helps on short blocks."""
+    samples = [r.page_content for r in _records()]
+    codec = TextCodec(method, train_dictionary(samples, method))
+    plain = TextCodec(method)
+    for text in samples[:20] + ["", "naïve — ünïcode"]:
+        assert codec.decompress(codec.compress(text)) == text
+    assert sum(len(codec.compress(t)) for t in samples) < sum(len(plain.compress(t)) for t in samples)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_compressed_event_db_matches_plain(tmp_path, method):
+    """Test compressed rows read back identically, lazily or eagerly."""
+    records = _records()
+    plain = EventDB(str(tmp_path / "plain.db"))
+    plain.insert_events(records)
+    packed = EventDB(str(tmp_path / "packed.db"), compression=method)
+    packed.insert_events(records[:10])
+    packed.insert_events(records[10:])
+
+    expected = plain.query_events(limit=1000)
+    assert packed.query_events(limit=1000) == expected
+    with sqlite3.connect(packed.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM text_dictionaries").fetchone()[0] == 1
+        assert conn.execute("SELECT COUNT(*) FROM events WHERE page_content != ''").fetchone()[0] == 0
+
+    stores = SimpleNamespace(events=packed)
+    lazy = retrieve_events_for_activity_type(stores, "", {}, k=1000, include_content=False)
+    assert all(d.page_content == "" for d in lazy)
+    top = load_event_contents(stores, lazy[:3])
+    assert [d.page_content for d in top] == [d.page_content for d in expected[:3]]
+
+
+def test_compress_text_in_place(tmp_path):
+    """Test existing plain rows (events and reviews) are compressed and the file shrinks."""
+    events = EventDB(str(tmp_path / "events.db"))
+    events.insert_events(_records() * 5)
+    before = events.query_events(limit=5)
+    stats = events.compress_text("zlib")
+    assert stats["rows"] == events.count_contents()
+    assert stats["bytes_after"] < stats["bytes_before"]
+    assert events.query_events(limit=5) == before
+    assert events.compress_text("zlib")["rows"] == 0
+
+    reviews = ReviewDB(str(tmp_path / "reviews.db"))
+    reviews.insert_review_rows([[("AQUA FIT was great.", "5", None, "AQUA FIT", "Salem", "positive", "r.csv")] * 50])
+    reviews.compress_text("zlib")
+    reviews.insert_review_rows([[("Too crowded.", "2", None, None, None, "negative", "r.csv")]])
+    docs = reviews.query_reviews(limit=100)
+    assert [d.page_content for d in docs] == ["AQUA FIT was great."] * 50 + ["Too crowded."]
+
+
+def test_existing_database_gets_compression_columns(tmp_path):
+    """Test a database created before compression support is migrated on open."""
+    db_path = str(tmp_path / "old.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY AUTOINCREMENT, event_name TEXT NOT NULL, "
+                     "event_type TEXT, event_type_raw TEXT, source TEXT NOT NULL, city TEXT, state TEXT, "
+                     "age_min INTEGER, age_max INTEGER, age_contains TEXT, intensity TEXT, instructor TEXT, "
+                     "date_range TEXT, time_slots TEXT, duration TEXT, spots TEXT, center_name TEXT, "
+                     "center_type TEXT, page_content TEXT NOT NULL, created_at TIMESTAMP)")
+    db = EventDB(db_path, compression="zlib")
+    db.insert_events(_records()[:3])
+    assert len(db.query_events()) == 3
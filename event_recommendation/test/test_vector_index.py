@@ -0,0 +1,126 @@
+"""Tests for the exact NumPy vector index."""
+
+import glob
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from langchain_chroma import Chroma
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from rag.parse_cache import parse_activity_types
+from rag.retrieval import retrieve_activity_types
+from rag.vector_index import NumpyVectorIndex, top_k
+from vector_db.chroma_store import build_chroma_where
+
+
+@pytest.fixture
+def activity_documents():
+    documents = parse_activity_types(sorted(glob.glob("documents/activityType/*.md"))).activity_documents
+    # Give the catalog a few intensities to filter on
+    for i, doc in enumerate(documents):
+        doc.metadata["intensity"] = ("low", "moderate", "high")[i % 3]
+    return documents
+
+
+def test_top_k_matches_full_sort():
+    scores = np.random.default_rng(0).normal(size=500).astype(np.float32)
+    assert top_k(scores, 7).tolist() == np.argsort(-scores)[:7].tolist()
+    assert top_k(scores[:3], 10).tolist() == np.argsort(-scores[:3]).tolist()
+
+
+def test_search_is_exact_and_filtered(activity_documents):
+    """Test results equal brute-force cosine ranking among the filtered rows."""
+    embedding = DeterministicFakeEmbedding(size=64)
+    index = NumpyVectorIndex(embedding, activity_documents)
+    vectors = np.asarray(embedding.embed_documents([d.page_content for d in activity_documents]))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    query = np.asarray(embedding.embed_query("swimming for seniors"))
+    scores = vectors @ (query / np.linalg.norm(query))
+
+    results = index.similarity_search("swimming for seniors", k=5)
+    assert [d.page_content for d in results] == [activity_documents[i].page_content for i in np.argsort(-scores)[:5]]
+
+    where = build_chroma_where({"intensity": "low", "source": ["aquatics.md", "dancing.md"]})
+    expected = [
+        i for i in np.argsort(-scores)
+        if activity_documents[i].metadata["intensity"] == "low"
+        and activity_documents[i].metadata["source"] in ("aquatics.md", "dancing.md")
+    ]
+    results = index.similarity_search_with_score("swimming for seniors", k=50, filter=where)
+    assert [d.page_content for d, _ in results] == [activity_documents[i].page_content for i in expected]
+    assert [round(dist, 5) for _, dist in results] == [round(1 - scores[i], 5) for i in expected]
+    assert index.similarity_search("x", k=3, filter={"intensity": "extreme"}) == []
+    assert len(index.similarity_search("x", k=3, filter={"intensity": {"$in": ["low", "high"]}})) == 3
+
+
+def test_add_delete_and_get(activity_documents):
+    """Test the Chroma-compatible maintenance calls used by the watcher."""
+    index = NumpyVectorIndex(DeterministicFakeEmbedding(size=32))
+    assert index.similarity_search("anything") == []
+    index.add_documents(activity_documents)
+    aquatics = index.get(where={"source": "aquatics.md"})["ids"]
+    assert aquatics and len(index) == len(activity_documents)
+
+    index.delete(ids=aquatics)
+    assert len(index) == len(activity_documents) - len(aquatics)
+    assert all(d.metadata["source"] != "aquatics.md" for d in index.similarity_search("pool", k=100))
+    assert index.get(include=["embeddings"])["embeddings"].shape == (len(index), 32)
+
+
+def test_from_chroma_matches_chroma_ranking(activity_documents):
+    """Test an index copied from Chroma returns the same top-k as Chroma (cosine space)."""
+    embedding = DeterministicFakeEmbedding(size=64)
+    store = Chroma(
+        collection_name="activity_index_test",
+        embedding_function=embedding,
+        collection_metadata={"hnsw:space": "cosine"},
+    )
+    try:
+        store.add_documents([d.model_copy(update={"metadata": dict(d.metadata)}) for d in activity_documents])
+        index = NumpyVectorIndex.from_chroma(store)
+        for query in ("aqua fitness", "line dancing for kids", "drawing"):
+            expected = [d.id for d in store.similarity_search(query, k=5, filter={"intensity": "moderate"})]
+            assert [d.id for d in index.similarity_search(query, k=5, filter={"intensity": "moderate"})] == expected
+    finally:
+        store.delete_collection()
+
+
+@pytest.mark.parametrize("aggregation", ["max", "centroid"])
+def test_grouped_search_returns_distinct_headings(activity_documents, aggregation):
+    """Test a grouped top-k returns k distinct headings, ranked by their aggregate score."""
+    embedding = DeterministicFakeEmbedding(size=64)
+    # Two chunks per heading
+    documents = activity_documents + [
+        d.model_copy(update={"page_content": d.page_content + "\nMore details.", "metadata": dict(d.metadata)})
+        for d in activity_documents
+    ]
+    index = NumpyVectorIndex(embedding, documents, group_by="activity_heading_norm", aggregation=aggregation)
+    flat = NumpyVectorIndex(embedding, documents)
+
+    results = index.similarity_search_with_score("water exercise", k=5)
+    headings = [d.metadata["activity_heading_norm"] for d, _ in results]
+    assert len(headings) == 5 == len(set(headings))
+    assert [dist for _, dist in results] == sorted(dist for _, dist in results)
+
+    if aggregation == "max":
+        # Same headings as oversampling the flat index and de-duplicating
+        expected = []
+        for d in flat.similarity_search("water exercise", k=len(documents)):
+            if d.metadata["activity_heading_norm"] not in expected:
+                expected.append(d.metadata["activity_heading_norm"])
+        assert headings == expected[:5]
+
+    low = index.similarity_search("water exercise", k=100, filter={"intensity": "low"})
+    assert all(d.metadata["intensity"] == "low" for d in low)
+    assert len(low) == len({d.metadata["activity_heading_norm"] for d in documents if d.metadata["intensity"] == "low"})
+
+
+def test_retrieve_activity_types_skips_oversampling(activity_documents):
+    """Test retrieval asks a grouped index for exactly k results."""
+    index = NumpyVectorIndex(DeterministicFakeEmbedding(size=64), activity_documents, group_by="activity_heading_norm")
+    calls = []
+    search = index.similarity_search
+    index.similarity_search = lambda query, k, filter=None: calls.append(k) or search(query, k=k, filter=filter)
+    docs = retrieve_activity_types(SimpleNamespace(activity_types=index), "dance", {}, k=3)
+    assert calls == [3] and len(docs) == 3
@@ -0,0 +1,148 @@
+"""Tests for the document watcher and incremental re-indexing."""
+
+import os
+import threading
+import uuid
+from types import SimpleNamespace
+
+from database.event_db import EventDB, db_connection
+from database.review_db import ReviewDB
+from rag.parse_cache import ParseCache
+from rag.watcher import DocumentWatcher, IncrementalIndexer, diff_snapshots, take_snapshot
+
+BROCHURE = """## YMCA Riverstone
+**Location:** Framingham, Massachusetts
+
+### AQUA FIT (Ages 18+)
+- Event Type: AQUA FIT
+"""
+
+ACTIVITY = """## AQUA FIT
+**Intensity:** Moderate
+"""
+
+
+class FakeActivityStore:
+    """Minimal stand-in for the Chroma activity type store."""
+
+    def __init__(self):
+        self.docs = {}
+
+    def get(self, where):
+        return {"ids": [i for i, d in self.docs.items() if d.metadata["source"] == where["source"]]}
+
+    def add_documents(self, docs):
+        for doc in docs:
+            self.docs[str(uuid.uuid4())] = doc
+
+    def delete(self, ids):
+        for i in ids:
+            del self.docs[i]
+
+
+def _setup(tmp_path):
+    docs = tmp_path / "documents"
+    for folder in ("Events", "activityType", "Reviews"):
+        (docs / folder).mkdir(parents=True)
+    (docs / "Events" / "ymca.md").write_text(BROCHURE, encoding="utf-8")
+    (docs / "activityType" / "aquatics.md").write_text(ACTIVITY, encoding="utf-8")
+    stores = SimpleNamespace(
+        events=EventDB(str(tmp_path / "events.db")),
+        activity_types=FakeActivityStore(),
+        reviews=ReviewDB(str(tmp_path / "reviews.db")),
+    )
+    indexer = IncrementalIndexer(stores, str(docs), ParseCache(str(tmp_path / "parse_cache.db")))
+    return docs, stores, indexer
+
+
+def _event_names(db):
+    with db_connection(db.db_path) as conn:
+        return [row[0] for row in conn.execute("SELECT event_name FROM events ORDER BY id")]
+
+
+def test_diff_snapshots():
+    """Test added, modified and removed paths are reported."""
+    changes = diff_snapshots({"a": (1, 1), "b": (1, 1)}, {"b": (2, 1), "c": (1, 1)})
+    assert (changes.added, changes.modified, changes.removed) == (["c"], ["b"], ["a"])
+    assert not diff_snapshots({"a": (1, 1)}, {"a": (1, 1)})
+
+
+def test_incremental_reindex_applies_deltas(tmp_path):
+    """Test added, edited and removed files update only their sources."""
+    docs, stores, indexer = _setup(tmp_path)
+    watcher = DocumentWatcher(str(docs), indexer.apply, use_inotify=False)
+    assert not watcher.poll_once()
+
+    (docs / "Events" / "library.md").write_text(
+        "## Library\n\n### STORY TIME (Ages 3-5)\n- Event Type: STORY TIME\n", encoding="utf-8"
+    )
+    (docs / "Reviews" / "reviews.csv").write_text(
+        "created_at,rating,review_text\n2026-01-01,5,AQUA FIT was great.\n", encoding="utf-8"
+    )
+    changes = watcher.poll_once()
+    assert len(changes.added) == 2
+    assert _event_names(stores.events) == ["STORY TIME (Ages 3-5)"]
+    assert stores.reviews.count_reviews() == 1
+
+    # Activity intensity edit re-indexes the activity source and re-applies intensity to brochures
+    (docs / "activityType" / "aquatics.md").write_text(ACTIVITY.replace("Moderate", "High"), encoding="utf-8")
+    watcher.poll_once()
+    assert [d.metadata["intensity"] for d in stores.activity_types.docs.values()] == ["high"]
+    aqua = stores.events.query_events(event_types=["AQUA FIT"])
+    assert aqua[0].metadata["intensity"] == "high"
+    assert sorted(_event_names(stores.events)) == ["AQUA FIT (Ages 18+)", "STORY TIME (Ages 3-5)"]
+
+    os.remove(docs / "Events" / "library.md")
+    os.remove(docs / "Reviews" / "reviews.csv")
+    watcher.poll_once()
+    assert _event_names(stores.events) == ["AQUA FIT (Ages 18+)"]
+    assert stores.reviews.count_reviews() == 0
+    assert indexer.stats["updates"] == 3
+
+
+def test_failed_apply_is_retried(tmp_path):
+    """Test a failing callback leaves the snapshot so the change is reported again."""
+    docs, _stores, _indexer = _setup(tmp_path)
+    calls = []
+
+    def flaky(changes):
+        calls.append(changes)
+        if len(calls) == 1:
+            raise RuntimeError("store unavailable")
+
+    watcher = DocumentWatcher(str(docs), flaky, use_inotify=False)
+    (docs / "Events" / "new.md").write_text(BROCHURE, encoding="utf-8")
+    try:
+        watcher.poll_once()
+    except RuntimeError:
+        pass
+    watcher.poll_once()
+    assert [c.added for c in calls] == [[str(docs / "Events" / "new.md")]] * 2
+
+
+def test_watcher_thread_reports_changes(tmp_path):
+    """Test the background thread (inotify or polling) picks up a new file."""
+    docs = tmp_path / "documents" / "Events"
+    docs.mkdir(parents=True)
+    seen = threading.Event()
+    watcher = DocumentWatcher(str(tmp_path / "documents"), lambda changes: seen.set(), interval=0.1, settle=0.01)
+    watcher.start()
+    try:
+        (docs / "new.md").write_text(BROCHURE, encoding="utf-8")
+        assert seen.wait(5)
+    finally:
+        watcher.stop()
+    assert take_snapshot(str(tmp_path / "documents"))
+
+
+def test_incremental_reindex_updates_activity_catalog(tmp_path):
+    """Test activity file edits and removals are mirrored in the activity_types catalog."""
+    docs, stores, indexer = _setup(tmp_path)
+    watcher = DocumentWatcher(str(docs), indexer.apply, use_inotify=False)
+    watcher.poll_once()
+    (docs / "activityType" / "aquatics.md").write_text(ACTIVITY.replace("Moderate", "High"), encoding="utf-8")
+    watcher.poll_once()
+    assert indexer.activity_catalog.get_intensity_map() == {"AQUA FIT": "high"}
+    os.remove(docs / "activityType" / "aquatics.md")
+    watcher.poll_once()
+    assert indexer.activity_catalog.count_activity_types() == 0
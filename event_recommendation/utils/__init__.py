@@ -7,15 +7,18 @@ from .normalizers import (
     normalize_age_focus,
     normalize_city,
     normalize_state,
+    normalize_column,
 )
 
 from .extractors import (
     extract_age_range,
     extract_age_groups,
+    extract_age_ranges,
     infer_intensity_from_text,
 )
 
 from .helpers import to_str_safe
+from .gazetteer import Gazetteer, GazetteerMatch
 # Note: build_reviews_database is not imported here to avoid circular imports
 # Import it directly: from utils.build_reviews_db import build_reviews_database
 
@@ -26,10 +29,14 @@ __all__ = [
     "normalize_age_focus",
     "normalize_city",
     "normalize_state",
+    "normalize_column",
     "extract_age_range",
     "extract_age_groups",
+    "extract_age_ranges",
     "infer_intensity_from_text",
     "to_str_safe",
+    "Gazetteer",
+    "GazetteerMatch",
     # "build_reviews_database",  # Import directly from utils.build_reviews_db to avoid circular imports
 ]
 
@@ -51,6 +51,34 @@ def main():
         default=10,
         help="Number of reviews to process in a single LLM call (default: 10)"
     )
+    parser.add_argument(
+        "--token-budget",
+        type=int,
+        default=None,
+        help="Estimated tokens per batched LLM call; batches are sized to fit"
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of LLM calls in flight at once (default: 4)"
+    )
+    parser.add_argument(
+        "--events-db",
+        type=str,
+        default=None,
+        help="Events database whose catalog seeds the gazetteer in --cascade/--bulk mode (e.g. events.db)"
+    )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Vectorized chunked ingestion with rule-based extraction (no LLM)"
+    )
+    parser.add_argument(
+        "--cascade",
+        action="store_true",
+        help="Extract with rules first and send only low-confidence reviews to the LLM"
+    )
     
     args = parser.parse_args()
     
@@ -65,6 +93,7 @@ def main():
             args.model = "llama3.2:latest"
     
     # Initialize client
+    from llm import GroqLLMClient, OllamaLLMClient
     if args.client == "groq":
         import groq
         api_key = os.getenv("GROQ_API_KEY")
@@ -72,11 +101,15 @@ def main():
             print("ERROR: GROQ_API_KEY not found in environment variables.")
             print("Please set it in your .env file or environment.")
             sys.exit(1)
-        client = groq.Groq(api_key=api_key)
+        client = GroqLLMClient(
+            groq.Groq(api_key=api_key), model=args.model, max_concurrency=args.max_concurrency
+        )
         print(f"Using Groq client with model: {args.model}")
     else:  # ollama
         import ollama
-        client = ollama.Client(host="http://localhost:11434")
+        client = OllamaLLMClient(
+            ollama.Client(host="http://localhost:11434"), model=args.model, max_concurrency=args.max_concurrency
+        )
         print(f"Using Ollama client with model: {args.model}")
         print("Make sure Ollama server is running at http://localhost:11434")
     
@@ -89,6 +122,10 @@ def main():
             model=args.model,
             use_llm=not args.no_llm,
             batch_size=args.batch_size,
+            cascade=args.cascade,
+            token_budget=args.token_budget,
+            events_db_path=args.events_db,
+            bulk=args.bulk,
         )
         
         review_count = reviews_db.count_reviews()
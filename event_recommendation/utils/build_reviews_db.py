@@ -1,7 +1,6 @@
 """Utility to build reviews database from CSV using either Groq or Ollama client."""
 
 import os
-import json
 from typing import Optional, Any
 from database.review_db import ReviewDB, ReviewRecord, init_reviews_database
 
@@ -13,6 +12,10 @@ def build_reviews_database(
     model: str = "openai/gpt-oss-120b",
     use_llm: bool = True,
     batch_size: int = 10,
+    cascade: bool = False,
+    token_budget: Optional[int] = None,
+    events_db_path: Optional[str] = None,
+    bulk: bool = False,
 ) -> ReviewDB:
     """
     Build reviews database from CSV file using either Groq or Ollama client.
@@ -24,10 +27,18 @@ def build_reviews_database(
     Args:
         reviews_csv_path: Path to reviews CSV file
         reviews_db_path: Path to SQLite database for reviews (will be created if doesn't exist)
-        llm_client: Either groq.Groq or ollama.Client instance. If None, uses regex-based extraction
+        llm_client: LLMClient, groq.Groq or ollama.Client instance. If None, uses regex-based extraction
         model: Model name to use for LLM calls (default: "openai/gpt-oss-120b" for Groq, "llama3.2:latest" for Ollama)
         use_llm: If True, use LLM for metadata extraction; otherwise use regex
         batch_size: Number of reviews to process in a single LLM call (when use_llm=True)
+        cascade: If True, run rule-based extraction first and send only low-confidence
+                 reviews to the LLM
+        token_budget: Estimated tokens per batched LLM call; defaults to
+                      rag.reviews_processing.BATCH_TOKEN_BUDGET
+        events_db_path: Optional events database; in cascade and bulk mode its
+                        event types, venues and cities seed the catalog gazetteer
+        bulk: If True, ingest with the vectorized chunked path (rule-based
+              extraction only, ignores llm_client)
         
     Returns:
         ReviewDB instance
@@ -47,83 +58,49 @@ def build_reviews_database(
             print(f"Reviews database already exists with {review_count} reviews. Reusing existing database.")
             return reviews_db
     
+    gazetteer = None
+    if events_db_path and os.path.exists(events_db_path):
+        from database.event_db import EventDB
+        from utils.gazetteer import Gazetteer
+        gazetteer = Gazetteer.from_event_db(EventDB(events_db_path))
+    
+    if bulk:
+        # Import here to avoid circular imports
+        from rag.reviews_processing import bulk_store_reviews
+        return bulk_store_reviews(reviews_csv_path, reviews_db_path, gazetteer=gazetteer)
+    
     # Initialize reviews database
     init_reviews_database(reviews_db_path)
     reviews_db = ReviewDB(reviews_db_path)
     reviews_db.clear_reviews()  # Clear existing reviews
     
-    # Determine client type and process reviews
-    if use_llm and llm_client is not None:
+    # Extract metadata and build review documents
+    if use_llm and cascade:
         # Import here to avoid circular imports
-        from rag.reviews_processing import build_review_documents, REVIEW_METADATA_SYSTEM_PROMPT
-        from langchain_core.documents import Document
-        
-        # Check client type
-        client_type = type(llm_client).__name__
+        from rag.reviews_processing import build_review_documents_cascade, BATCH_TOKEN_BUDGET
+        review_docs, _stats = build_review_documents_cascade(
+            reviews_csv_path,
+            llm_client=llm_client,
+            model=model,
+            batch_size=batch_size,
+            token_budget=token_budget or BATCH_TOKEN_BUDGET,
+            gazetteer=gazetteer,
+        )
+    elif use_llm and llm_client is not None:
+        # Import here to avoid circular imports
+        from rag.reviews_processing import build_review_documents_using_llm, BATCH_TOKEN_BUDGET
+        from llm import as_llm_client
         
-        if client_type == "Groq":
-            # Use Groq client - use existing function that processes with Groq
-            from rag.reviews_processing import _extract_metadata_with_llm
-            import csv
-            
-            reviews_data = []
-            with open(reviews_csv_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    review_text = row.get("review_text", "").strip()
-                    if not review_text:
-                        continue
-                    reviews_data.append({
-                        "review_text": review_text,
-                        "created_at": row.get("created_at", "").strip(),
-                        "rating": row.get("rating", "").strip(),
-                    })
-            
-            print(f"Processing {len(reviews_data)} reviews with Groq LLM...")
-            all_metadata = []
-            for i, review_data in enumerate(reviews_data):
-                if (i + 1) % 10 == 0:
-                    print(f"Processing review {i + 1}/{len(reviews_data)}...")
-                
-                metadata = _extract_metadata_with_llm(
-                    review_data["review_text"],
-                    groq_client=llm_client,
-                    model=model
-                )
-                all_metadata.append(metadata)
-            
-            # Create documents
-            review_docs = []
-            for review_data, metadata in zip(reviews_data, all_metadata):
-                doc = Document(
-                    page_content=review_data["review_text"],
-                    metadata={
-                        "source": os.path.basename(reviews_csv_path),
-                        "created_at": review_data["created_at"],
-                        "rating": review_data["rating"],
-                        "event_type": metadata["event_type"],
-                        "location": metadata["location"],
-                        "sentiment": metadata["sentiment"],
-                        "doc_type": "review",
-                        "extraction_method": "llm",
-                    }
-                )
-                review_docs.append(doc)
-                
-        elif client_type == "Client" and hasattr(llm_client, "chat"):
-            # Use Ollama client
-            from rag.reviews_processing import build_review_documents_using_llm
-            review_docs = build_review_documents_using_llm(
-                reviews_csv_path,
-                ollama_client=llm_client,
-                model=model,
-                batch_size=batch_size,
-            )
-        else:
-            raise ValueError(
-                f"Unsupported LLM client type: {client_type}. "
-                "Expected groq.Groq or ollama.Client"
-            )
+        # Raises ValueError for unrecognized client types
+        client = as_llm_client(llm_client, model=model)
+        print(f"Processing reviews with {client.backend} LLM client...")
+        review_docs = build_review_documents_using_llm(
+            reviews_csv_path,
+            ollama_client=client,
+            model=model,
+            batch_size=batch_size,
+            token_budget=token_budget or BATCH_TOKEN_BUDGET,
+        )
     else:
         # Import here to avoid circular imports
         from rag.reviews_processing import build_review_documents
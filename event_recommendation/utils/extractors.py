@@ -1,7 +1,7 @@
 """Extraction functions for parsing text data."""
 
 import re
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # Age keywords for classification
 AGE_KEYWORDS = {
@@ -13,6 +13,11 @@ AGE_KEYWORDS = {
     "all": ["all ages", "family"],
 }
 
+# Intensity cues for infer_intensity_from_text, checked in this order
+_LOW_INTENSITY_CUES = ("low impact", "gentle", "restorative", "beginner", "chair", "arthritis")
+_HIGH_INTENSITY_CUES = ("high intensity", "interval", "boot camp", "fast-paced", "challenging")
+_MODERATE_INTENSITY_CUES = ("moderate", "all levels", "level 2", "level 2/3")
+
 
 def _bucket_from_age_range(
     min_age: Optional[int], max_age: Optional[int]
@@ -55,6 +60,14 @@ def _bucket_from_age_range(
     return sorted(groups)
 
 
+# Ages: 6–10 / 6-10 / 6 — 10 (also covers "Age: 8-12")
+_AGE_SPAN_RE = re.compile(r"(?i)\bages?\s*[:–-]?\s*(\d{1,2})\s*[–—-]\s*(\d{1,2})\b")
+# Ages: 18+
+_AGE_PLUS_RE = re.compile(r"(?i)\bages?\s*[:–-]?\s*(\d{1,2})\s*\+\b")
+# Standalone 55+ / 60+
+_STANDALONE_PLUS_RE = re.compile(r"\b(\d{2})\s*\+\b")
+
+
 def extract_age_range(text: str) -> Tuple[Optional[int], Optional[int]]:
     """
     Extracts numeric age range from patterns like:
@@ -65,39 +78,48 @@ def extract_age_range(text: str) -> Tuple[Optional[int], Optional[int]]:
       - "55+"
     Returns (min_age, max_age) where max_age can be None for open-ended.
     """
-    t = text
-
-    # Ages: 6–10 / 6-10 / 6 — 10
-    m = re.search(r"(?i)\bages?\s*[:–-]?\s*(\d{1,2})\s*[–—-]\s*(\d{1,2})\b", t)
+    m = _AGE_SPAN_RE.search(text)
     if m:
         return int(m.group(1)), int(m.group(2))
 
-    # Age: 8-12
-    m = re.search(r"(?i)\bage\s*[:–-]?\s*(\d{1,2})\s*[–—-]\s*(\d{1,2})\b", t)
-    if m:
-        return int(m.group(1)), int(m.group(2))
+    # Both open-ended patterns need a literal '+'; most blocks have none
+    if "+" not in text:
+        return None, None
 
-    # Ages: 18+
-    m = re.search(r"(?i)\bages?\s*[:–-]?\s*(\d{1,2})\s*\+\b", t)
+    m = _AGE_PLUS_RE.search(text)
     if m:
         return int(m.group(1)), None
 
-    # Standalone 55+ / 60+
-    m = re.search(r"(?i)\b(\d{2})\s*\+\b", t)
+    m = _STANDALONE_PLUS_RE.search(text)
     if m:
         return int(m.group(1)), None
 
     return None, None
 
 
-def extract_age_groups(text: str) -> List[str]:
+def extract_age_ranges(texts: Iterable[str]) -> List[Tuple[Optional[int], Optional[int]]]:
+    """Batch extract_age_range over a column, extracting each distinct text once."""
+    texts = list(texts)
+    seen: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+    for text in texts:
+        if text not in seen:
+            seen[text] = extract_age_range(text)
+    return [seen[text] for text in texts]
+
+
+def extract_age_groups(
+    text: str,
+    age_range: Optional[Tuple[Optional[int], Optional[int]]] = None,
+) -> List[str]:
     """
     Prefer numeric extraction if present; fall back to keyword detection.
     Default to adults if nothing found.
+
+    age_range: extract_age_range(text) if the caller already computed it
     """
     text_l = text.lower()
 
-    min_age, max_age = extract_age_range(text)
+    min_age, max_age = age_range if age_range is not None else extract_age_range(text)
     groups = set(_bucket_from_age_range(min_age, max_age))
 
     # keyword-based additions
@@ -122,33 +144,10 @@ def infer_intensity_from_text(text: str) -> Optional[str]:
     """
     t = text.lower()
     # Strong cues first
-    if any(
-        x in t
-        for x in [
-            "low impact",
-            "gentle",
-            "restorative",
-            "beginner",
-            "chair",
-            "arthritis",
-        ]
-    ):
+    if any(x in t for x in _LOW_INTENSITY_CUES):
         return "low"
-    if any(
-        x in t
-        for x in [
-            "high intensity",
-            "interval",
-            "boot camp",
-            "fast-paced",
-            "challenging",
-        ]
-    ):
+    if any(x in t for x in _HIGH_INTENSITY_CUES):
         return "high"
-    if any(
-        x in t
-        for x in ["moderate", "all levels", "level 2", "level 2/3"]
-    ):
+    if any(x in t for x in _MODERATE_INTENSITY_CUES):
         return "moderate"
     return None
-
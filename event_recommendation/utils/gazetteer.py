@@ -0,0 +1,154 @@
+"""Catalog gazetteer: multi-pattern matching of known event types and venues."""
+
+import re
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Words and the joiners kept by normalize_event_type ("/", "&", "+")
+_TOKEN_RE = re.compile(r"[A-Z0-9]+|[/&+]")
+# "Concord Public Library (East Boston Branch)" -> also match "Concord Public Library"
+_PARENTHETICAL_RE = re.compile(r"\s*\([^)]*\)\s*")
+
+EVENT_TYPE = "event_type"
+VENUE = "venue"
+CITY = "city"
+
+
+class GazetteerMatch(NamedTuple):
+    """A catalog term found in text (token offsets, end exclusive)."""
+    kind: str
+    value: str
+    start: int
+    end: int
+
+
+def _tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.upper())
+
+
+class Gazetteer:
+    """
+    Word-level Aho-Corasick automaton over catalog vocabulary.
+
+    Text is tokenized once (upper-cased words plus "/", "&", "+") and scanned
+    in a single pass over the tokens, so all event types, venue names and
+    cities are found together regardless of how many patterns there are.
+    Matching on whole words gives word boundaries for free ("BOOT CAMP" never
+    matches inside "BOOTCAMPS"), and tokens outside the vocabulary reset the
+    automaton without walking failure links.
+    """
+
+    def __init__(
+        self,
+        event_types: Iterable[str] = (),
+        venues: Iterable[str] = (),
+        cities: Iterable[str] = (),
+    ):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, str, int]]] = [[]]
+        self._vocab = set()
+
+        for value in event_types:
+            self._add(value, EVENT_TYPE, value)
+        for value in venues:
+            self._add(value, VENUE, value)
+            short = _PARENTHETICAL_RE.sub(" ", value).strip()
+            if short and short != value:
+                self._add(short, VENUE, value)
+        for value in cities:
+            self._add(value, CITY, value)
+
+        self._build()
+
+    @classmethod
+    def from_event_db(cls, event_db) -> "Gazetteer":
+        """Build a gazetteer from the distinct event types, venues and cities in EventDB."""
+        vocabulary = event_db.get_catalog_vocabulary()
+        return cls(
+            event_types=vocabulary["event_types"],
+            venues=vocabulary["venues"],
+            cities=vocabulary["cities"],
+        )
+
+    def _add(self, value: Optional[str], kind: str, canonical: str) -> None:
+        if not value:
+            return
+        tokens = _tokenize(value)
+        if not tokens:
+            return
+        state = 0
+        for token in tokens:
+            nxt = self._goto[state].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][token] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        entry = (kind, canonical, len(tokens))
+        if entry not in self._out[state]:
+            self._out[state].append(entry)
+        self._vocab.update(tokens)
+
+    def _build(self) -> None:
+        """Compute failure links and merge outputs breadth-first."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(token, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        """Number of automaton states."""
+        return len(self._goto)
+
+    def find_all(self, text: str) -> List[GazetteerMatch]:
+        """Return every catalog term occurring in text, in order of end position."""
+        goto, fail, out, vocab = self._goto, self._fail, self._out, self._vocab
+        matches: List[GazetteerMatch] = []
+        state = 0
+        for i, token in enumerate(_tokenize(text)):
+            if token not in vocab:
+                state = 0
+                continue
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for kind, value, length in out[state]:
+                matches.append(GazetteerMatch(kind, value, i - length + 1, i + 1))
+        return matches
+
+    def extract(self, text: str) -> Dict[str, Optional[str]]:
+        """
+        Extract normalized catalog metadata from text.
+
+        For each kind the longest match wins, ties going to the earliest.
+
+        Returns:
+            Dictionary with 'event_type', 'venue', 'city' and 'location'
+            (venue if found, otherwise city) keys
+        """
+        best: Dict[str, GazetteerMatch] = {}
+        for match in self.find_all(text):
+            current = best.get(match.kind)
+            if current is None or (match.end - match.start, -match.start) > (
+                current.end - current.start, -current.start
+            ):
+                best[match.kind] = match
+
+        event_type = best[EVENT_TYPE].value if EVENT_TYPE in best else None
+        venue = best[VENUE].value if VENUE in best else None
+        city = best[CITY].value if CITY in best else None
+        return {
+            "event_type": event_type,
+            "venue": venue,
+            "city": city,
+            "location": venue or city,
+        }
@@ -1,35 +1,44 @@
 """Normalization functions for text processing."""
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Dict, Hashable, Iterable, List, Optional
+
+
+# Precompiled once; these run on every event block at ingest and every profile at query time
+_WHITESPACE_RE = re.compile(r"\s+")
+# Keep alphanumerics, spaces, '/', '&', '-', '+'
+_LABEL_DROP_RE = re.compile(r"[^A-Z0-9 /&\-+]")
+
+# Event types, headings and intensities come from small vocabularies
+NORMALIZER_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE)
+def _normalize_label(s: str) -> Optional[str]:
+    """Shared body of normalize_event_type / normalize_activity_heading."""
+    s = s.strip().upper().replace("®", "").replace("™", "")
+    s = _WHITESPACE_RE.sub(" ", s)
+    s = _LABEL_DROP_RE.sub("", s)
+    s = _WHITESPACE_RE.sub(" ", s).strip()
+    return s or None
 
 
 def normalize_event_type(s: Optional[str]) -> Optional[str]:
     """Upper-case and strip symbols like ® / ™ and extra punctuation."""
     if not s:
         return None
-    s = s.strip().upper()
-    s = s.replace("®", "").replace("™", "")
-    s = re.sub(r"\s+", " ", s)
-    # Keep alphanumerics, spaces, '/', '&', '-', '+'
-    s = re.sub(r"[^A-Z0-9 /&\-+]", "", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s or None
+    return _normalize_label(s)
 
 
 def normalize_activity_heading(s: Optional[str]) -> Optional[str]:
     """Normalize activity heading for robust matching."""
     if not s:
         return None
-    s = s.strip().upper()
-    s = s.replace("®", "").replace("™", "")
-    s = re.sub(r"\s+", " ", s)
-    # Keep alphanumerics, spaces, '/', '&', '-', '+'
-    s = re.sub(r"[^A-Z0-9 /&\-+]", "", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s or None
+    return _normalize_label(s)
 
 
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE)
 def normalize_intensity(raw: Optional[str]) -> Optional[str]:
     """
     Map text like 'Low–Moderate', 'Level 2/3', etc. to low/moderate/high.
@@ -53,6 +62,7 @@ def normalize_intensity(raw: Optional[str]) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE)
 def normalize_age_focus(age_focus: Optional[str]) -> Optional[str]:
     """Normalize age focus to comma-separated string."""
     if not age_focus:
@@ -74,3 +84,26 @@ def normalize_state(state: Optional[str]) -> Optional[str]:
         return None
     return state.strip().lower()
 
+
+
+def normalize_column(
+    values: Iterable[Optional[str]],
+    normalizer: Callable[[Optional[str]], Optional[str]] = normalize_event_type,
+) -> List[Optional[str]]:
+    """
+    Normalize a whole column, running the normalizer once per distinct value.
+
+    Args:
+        values: Column values (list, tuple or pandas Series); missing values
+            (None, NaN from blank CSV cells, other non-strings) normalize to None
+        normalizer: Any single-value normalizer from this module
+
+    Returns:
+        Normalized values in input order
+    """
+    values = [value if isinstance(value, str) else None for value in values]
+    seen: Dict[Hashable, Optional[str]] = {}
+    for value in values:
+        if value not in seen:
+            seen[value] = normalizer(value)
+    return [seen[value] for value in values]